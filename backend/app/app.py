@@ -1,11 +1,17 @@
 import sys
 import os
+import json
+import hmac
+import hashlib
+import uuid
+import importlib
+import functools
 
 # Add the project root to sys.path to allow imports from backend.src
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(PROJECT_ROOT)
 
-from flask import Flask, request, jsonify, send_from_directory, render_template
+from flask import Flask, request, jsonify, send_from_directory, render_template, g, abort
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
@@ -18,12 +24,21 @@ from backend.src.memory_store import memory
 from backend.src.interview_engine import engine
 from backend.src.whisper_stt import transcribe_audio
 from backend.src.edge_tts_client import generate_audio_sync
-from backend.src.spacy_parser import parse_resume
-from backend.src.scoring import get_semantic_score, calculate_final_score
+from backend.src.resume_cache import get_candidate_info, get_spacy_parse
+from backend.src.scoring import get_semantic_score, calculate_final_score, session_averages
 import backend.src.resume_analyzer as resume_analyzer
+import backend.src.pdf_ingest as pdf_ingest
+from backend.src.job_queue import job_queue, JobError
 import backend.src.resume_recreator as resume_recreator
-import backend.src.pdf_generator as pdf_generator
+from backend.src.resume_ast import parse_resume
+from backend.src.render_cache import render_cache
+from backend.src.render_service import render_service, RenderQueueFull, RenderTimeout
 from backend.src.template_registry import registry
+from backend.src.components import components, PRELOAD_MODELS
+from backend.src.tracing import tracer
+from backend.src.admission import admission, Overloaded
+from backend.src.profiler import sampling_profiler, route_cpu, allocation_diff, dumps_speedscope, ProfilerBusy
+import backend.src.spacy_parser  # noqa: F401  (registers the 'spacy' component)
 
 # Define paths relative to this file (backend/app/app.py)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -40,6 +55,23 @@ AUDIO_FOLDER = os.path.join(STATIC_FOLDER, 'audio')
 ensure_directory(UPLOAD_FOLDER)
 ensure_directory(AUDIO_FOLDER)
 
+# Heavy components load on first use or in a background warm-up
+# (gunicorn_config.post_worker_init). With PRELOAD_MODELS=1 they load here, once,
+# in the gunicorn master, and preload_app forks share them copy-on-write.
+components.register('pdf_renderer', lambda: importlib.import_module('backend.src.pdf_generator'))
+components.register('templates', registry.get_all_templates)
+if PRELOAD_MODELS:
+    components.warm_up(background=False)
+
+@app.before_request
+def start_route_cpu():
+    g.route_cpu = route_cpu.begin()
+
+@app.after_request
+def record_route_cpu(response):
+    route_cpu.end(request.url_rule.rule if request.url_rule else '<unmatched>', g.pop('route_cpu', None))
+    return response
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -95,12 +127,81 @@ def template_card_preview(template_id):
 
 @app.route('/api/templates', methods=['GET'])
 def get_templates():
-    category = request.args.get('category')
-    if category and category != 'all':
-        templates = registry.get_templates_by_category(category)
+    # Pre-serialized per category; clients revalidate with the ETag
+    payload, etag = registry.get_payload(request.args.get('category'))
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
     else:
-        templates = registry.get_all_templates()
-    return jsonify({"templates": templates})
+        response = app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def analyze_saved_resume(filepath, filename, progress=None):
+    """
+    Parses and analyzes an uploaded resume that is already on disk.
+    
+    Args:
+        filepath: Saved upload path
+        filename: Sanitized upload filename
+        progress: Optional callback(percent, message)
+    
+    Returns:
+        Analysis dict, or a dict with 'error' (and 'status' code) on failure
+    """
+    report = progress or (lambda percent, message: None)
+    
+    report(10, "Extracting resume text")
+    text_content = resume_analyzer.parse_resume(filepath)
+    if not text_content:
+        logger.error("Failed to parse resume")
+        return {"error": "Could not parse resume file. Please try a different PDF or TXT file.", "status": 400}
+
+    logger.info(f"Resume parsed, length: {len(text_content)} characters")
+    
+    # Analyze with Grok
+    report(30, "Analyzing resume")
+    analysis_result = resume_analyzer.analyze_resume_content(text_content)
+    
+    logger.info(f"Analysis result: {analysis_result}")
+    
+    if "error" in analysis_result:
+        logger.error(f"Analysis error: {analysis_result['error']}")
+        return {**analysis_result, "status": 400}
+    
+    # Add original filename and file URL to result
+    original_name = os.path.splitext(filename)[0]
+    analysis_result['original_filename'] = original_name
+    analysis_result['file_url'] = f'/static/uploads/{filename}'
+    analysis_result['file_type'] = 'pdf' if filename.lower().endswith('.pdf') else 'txt'
+    return analysis_result
+
+def _run_analyze_resume_job(payload, report):
+    result = analyze_saved_resume(payload['filepath'], payload['filename'], report)
+    if "error" in result:
+        raise JobError(result["error"])
+    return result
+
+def _run_recreate_resume_job(payload, report):
+    result = resume_recreator.recreate_resume_with_ai(
+        resume_text=payload['resume_text'],
+        current_score=payload['current_score'],
+        analysis_data=payload['analysis'],
+        progress=report
+    )
+    if "error" in result:
+        raise JobError(result["error"])
+    return result
+
+job_queue.register('analyze_resume', _run_analyze_resume_job)
+job_queue.register('recreate_resume', _run_recreate_resume_job)
+
+def _job_response(job):
+    """Serializes a job for polling clients (202 until finished)."""
+    body = {**job, "status_url": f"/api/jobs/{job['job_id']}"}
+    if job['status'] == 'error':
+        return jsonify(body), 422
+    return jsonify(body), 200 if job['status'] == 'done' else 202
 
 @app.route('/api/analyze_resume', methods=['POST'])
 def api_analyze_resume():
@@ -120,28 +221,10 @@ def api_analyze_resume():
         
         logger.info(f"Resume file saved: {filename}")
         
-        # Parse text
-        text_content = resume_analyzer.parse_resume(filepath)
-        if not text_content:
-            logger.error("Failed to parse resume")
-            return jsonify({"error": "Could not parse resume file. Please try a different PDF or TXT file."}), 400
-
-        logger.info(f"Resume parsed, length: {len(text_content)} characters")
-        
-        # Analyze with Grok
-        analysis_result = resume_analyzer.analyze_resume_content(text_content)
-        
-        logger.info(f"Analysis result: {analysis_result}")
-        
+        analysis_result = analyze_saved_resume(filepath, filename)
         if "error" in analysis_result:
-            logger.error(f"Analysis error: {analysis_result['error']}")
-            return jsonify(analysis_result), 400
-        
-        # Add original filename and file URL to result
-        original_name = os.path.splitext(filename)[0]
-        analysis_result['original_filename'] = original_name
-        analysis_result['file_url'] = f'/static/uploads/{filename}'
-        analysis_result['file_type'] = 'pdf' if filename.lower().endswith('.pdf') else 'txt'
+            status = analysis_result.pop("status", 400)
+            return jsonify(analysis_result), status
              
         return jsonify(analysis_result)
         
@@ -149,6 +232,110 @@ def api_analyze_resume():
         logger.error(f"Error in resume analysis API: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/jobs/analyze_resume', methods=['POST'])
+def api_enqueue_analyze_resume():
+    """Saves an uploaded resume and queues its analysis; poll /api/jobs/<job_id>."""
+    try:
+        resume_file = request.files.get('resume')
+        if not resume_file or resume_file.filename == '':
+            return jsonify({"error": "No resume file provided"}), 400
+        
+        content = resume_file.read()
+        digest = hashlib.sha256(content).hexdigest()
+        # Content-addressed filename so concurrent uploads of different files never collide
+        filename = secure_filename(resume_file.filename)
+        stored_name = f"{digest[:12]}_{filename}"
+        filepath = os.path.join(UPLOAD_FOLDER, stored_name)
+        with open(filepath, 'wb') as f:
+            f.write(content)
+        
+        idempotency_key = request.headers.get('Idempotency-Key') or digest
+        job = job_queue.enqueue('analyze_resume', {"filepath": filepath, "filename": stored_name}, idempotency_key)
+        return _job_response(job)
+        
+    except Exception as e:
+        logger.error(f"Error queuing resume analysis: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/jobs/recreate_resume', methods=['POST'])
+def api_enqueue_recreate_resume():
+    """Queues an AI resume recreation; poll /api/jobs/<job_id>."""
+    try:
+        data = request.json or {}
+        resume_text = data.get('resume_text', '')
+        if not resume_text:
+            return jsonify({"error": "No resume text provided. Please upload and analyze a resume first."}), 400
+        
+        payload = {
+            "resume_text": resume_text,
+            "current_score": data.get('current_score', 70),
+            "analysis": data.get('analysis', {})
+        }
+        idempotency_key = request.headers.get('Idempotency-Key') or hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        job = job_queue.enqueue('recreate_resume', payload, idempotency_key)
+        return _job_response(job)
+        
+    except Exception as e:
+        logger.error(f"Error queuing resume recreation: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def api_job_status(job_id):
+    """Returns job status, progress events and (when finished) the result."""
+    job = job_queue.get(job_id, include_events=request.args.get('events', '1') != '0')
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+    return _job_response(job)
+
+@app.route('/api/resume_text', methods=['POST'])
+def api_submit_resume_text():
+    """Saves an uploaded resume and extracts its text in the background."""
+    try:
+        resume_file = request.files.get('resume')
+        if not resume_file or resume_file.filename == '':
+            return jsonify({"error": "No resume file provided"}), 400
+        
+        filename = secure_filename(resume_file.filename)
+        if not filename.lower().endswith(('.pdf', '.txt')):
+            return jsonify({"error": "Only PDF and TXT resumes are supported"}), 400
+        
+        # Unique per upload: two users' "resume.pdf" must never share a file;
+        # the upload is deleted once its text is extracted
+        filepath = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex[:12]}_{filename}")
+        resume_file.save(filepath)
+        
+        if not filename.lower().endswith('.pdf'):
+            # Plain text needs no extraction stage
+            try:
+                text_content = resume_analyzer.parse_resume(filepath)
+            finally:
+                os.remove(filepath)
+            return jsonify({"status": "done", "filename": filename, "text": text_content or ""})
+        
+        job_id = pdf_ingest.submit_extraction(filepath, delete_after=True)
+        
+        return jsonify({
+            "job_id": job_id,
+            "status": "pending",
+            "status_url": f"/api/resume_text/{job_id}"
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"Error submitting resume extraction: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@app.route('/api/resume_text/<job_id>', methods=['GET'])
+def api_resume_text_status(job_id):
+    """Polls a background resume text extraction."""
+    job = pdf_ingest.get_extraction(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+    if job["status"] == "error":
+        return jsonify(job), 422
+    return jsonify(job), 200 if job["status"] == "done" else 202
+
 @app.route('/api/recreate_resume', methods=['POST'])
 def api_recreate_resume():
     try:
@@ -208,53 +395,12 @@ def api_download_resume_pdf():
             return jsonify({"error": "No resume content provided"}), 400
         
         # Validate template_id
-        allowed_templates = [
-            'classic', 'modern', 'creative', 'professional', 'minimal',
-            'template-1', 'template-2', 'template-3', 'template-4', 'template-5',
-            'template-6', 'template-7', 'template-8', 'template-9', 'template-10',
-            'template-11', 'template-12', 'template-13', 'template-14', 'template-15'
-        ]
-        if template_id not in allowed_templates:
-            logger.warning(f"Invalid template_id '{template_id}', defaulting to 'modern'")
-            template_id = 'modern'
+        template_id = registry.resolve_render_template(template_id)
         
         logger.info(f"Generating PDF with template '{template_id}' (length: {len(markdown_text)} chars)...")
-        logger.info(f"First 100 chars: {markdown_text[:100]}")
         
-        try:
-            # Try template-based PDF generation
-            logger.info(f"Attempting template-based PDF generation with '{template_id}' template...")
-            pdf_bytes = pdf_generator.markdown_to_pdf(markdown_text, template_id=template_id)
-            logger.info(f"✅ PDF generated successfully, size: {len(pdf_bytes)} bytes")
-        except Exception as pdf_error:
-            logger.error(f"Fancy PDF generation failed: {pdf_error}", exc_info=True)
-            # Fallback to simple PDF
-            logger.info("Attempting fallback simple PDF generation...")
-            try:
-                pdf_bytes = generate_simple_pdf(markdown_text)
-                logger.info(f"✅ Simple PDF generated, size: {len(pdf_bytes)} bytes")
-            except Exception as fallback_error:
-                logger.error(f"Simple PDF also failed: {fallback_error}", exc_info=True)
-                # Emergency fallback - super minimal PDF
-                logger.info("Attempting emergency minimal PDF...")
-                try:
-                    pdf_bytes = generate_emergency_pdf(markdown_text)
-                    logger.info(f"✅ Emergency PDF generated, size: {len(pdf_bytes)} bytes")
-                except Exception as emergency_error:
-                    logger.error(f"All PDF generation methods failed: {emergency_error}", exc_info=True)
-                    return jsonify({"error": f"PDF generation failed: {str(emergency_error)}"}), 500
-        
-        # Send PDF as downloadable file
-        from flask import send_file
-        import io
-        
-        logger.info("Creating PDF buffer for download...")
-        pdf_buffer = io.BytesIO(pdf_bytes)
-        pdf_buffer.seek(0)
-        
-        logger.info("Sending PDF file...")
-        return send_file(
-            pdf_buffer,
+        return rendered_document_response(
+            markdown_text, template_id, 'pdf', components.get('pdf_renderer').GENERATOR_VERSION,
             mimetype='application/pdf',
             as_attachment=True,
             download_name=f'optimized_resume_{template_id}.pdf'
@@ -279,33 +425,11 @@ def api_generate_preview_pdf():
             return jsonify({"error": "No resume content provided"}), 400
         
         # Consistent template validation
-        allowed_templates = [
-            'classic', 'modern', 'creative', 'professional', 'minimal',
-            'template-1', 'template-2', 'template-3', 'template-4', 'template-5',
-            'template-6', 'template-7', 'template-8', 'template-9', 'template-10',
-            'template-11', 'template-12', 'template-13', 'template-14', 'template-15'
-        ]
-        if template_id not in allowed_templates:
-            template_id = 'modern'
+        template_id = registry.resolve_render_template(template_id)
             
-        # Generate PDF bytes (reusing logic or calling generator directly)
-        try:
-            pdf_bytes = pdf_generator.markdown_to_pdf(markdown_text, template_id=template_id)
-        except Exception:
-            try:
-                pdf_bytes = generate_simple_pdf(markdown_text)
-            except Exception:
-                pdf_bytes = generate_emergency_pdf(markdown_text)
-
-        # Send PDF inline
-        from flask import send_file
-        import io
-        
-        pdf_buffer = io.BytesIO(pdf_bytes)
-        pdf_buffer.seek(0)
-        
-        return send_file(
-            pdf_buffer,
+        # Preview and download share the cached render
+        return rendered_document_response(
+            markdown_text, template_id, 'pdf', components.get('pdf_renderer').GENERATOR_VERSION,
             mimetype='application/pdf',
             as_attachment=False, # Inline for preview
             download_name=f'preview_{template_id}.pdf'
@@ -330,21 +454,15 @@ def api_download_resume_docx():
         
         if not markdown_text:
             return jsonify({"error": "No resume content provided"}), 400
+        
+        # Same validation as the PDF routes (the id keys caches and the file name)
+        template_id = registry.resolve_render_template(template_id)
             
         # Import here to avoid circular imports or startup errors if missing
-        from backend.src.docx_generator import markdown_to_docx
-        
-        docx_bytes = markdown_to_docx(markdown_text, template_id)
+        from backend.src.docx_generator import GENERATOR_VERSION
         
-        # Send DOCX as downloadable file
-        from flask import send_file
-        import io
-        
-        docx_buffer = io.BytesIO(docx_bytes)
-        docx_buffer.seek(0)
-        
-        return send_file(
-            docx_buffer,
+        return rendered_document_response(
+            markdown_text, template_id, 'docx', GENERATOR_VERSION,
             mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
             as_attachment=True,
             download_name=f'optimized_resume_{template_id}.docx'
@@ -354,117 +472,152 @@ def api_download_resume_docx():
         logger.error(f"Error generating DOCX: {e}", exc_info=True)
         return jsonify({"error": f"Failed to generate DOCX: {str(e)}"}), 500
 
-def generate_simple_pdf(markdown_text):
-    """Fallback simple PDF generator using reportlab basics"""
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        import io
-        
-        logger.info("Starting simple PDF generation...")
-        
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        width, height = letter
-        
-        # Simple text rendering
-        y = height - 50
-        c.setFont("Helvetica-Bold", 16)
-        c.drawString(50, y, "Optimized Resume")
-        
-        y -= 30
-        c.setFont("Helvetica", 10)
-        
-        # Split text into lines
-        lines = markdown_text.split('\n')
-        logger.info(f"Processing {len(lines)} lines...")
-        
-        for i, line in enumerate(lines):
-            if y < 50:  # New page if needed
-                c.showPage()
-                y = height - 50
-                c.setFont("Helvetica", 10)
-            
-            # Remove markdown formatting for simple display
-            clean_line = line.replace('#', '').replace('**', '').replace('*', '').strip()
-            
-            # Handle special characters that might cause issues
-            clean_line = clean_line.encode('ascii', 'ignore').decode('ascii')
-            
-            if clean_line:
-                # Wrap long lines
-                if len(clean_line) > 90:
-                    words = clean_line.split()
-                    current_line = ""
-                    for word in words:
-                        if len(current_line + word) < 90:
-                            current_line += word + " "
-                        else:
-                            if current_line.strip():
-                                c.drawString(50, y, current_line.strip())
-                                y -= 15
-                            current_line = word + " "
-                    if current_line.strip():
-                        c.drawString(50, y, current_line.strip())
-                        y -= 15
-                else:
-                    c.drawString(50, y, clean_line)
-                    y -= 15
-        
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"Simple PDF generated successfully: {len(pdf_bytes)} bytes")
-        return pdf_bytes
-        
-    except Exception as e:
-        logger.error(f"Simple PDF generation error: {e}", exc_info=True)
-        raise
+def rendered_document_response(markdown_text, template_id, fmt, version, mimetype, as_attachment, download_name):
+    """
+    Serves a rendered document through the render cache.
+    Clients revalidating a primary render with If-None-Match get a 304 without a render.
+    The render process writes large documents straight to the cache directory and
+    they are sent from the open file (sendfile where the server supports it), so
+    a download does not hold the document in this worker's memory.
+    """
+    from flask import send_file
+    import io
+    
+    key = render_cache.generate_key(markdown_text, template_id, fmt, version)
+    # Primary-render ETags derive from the inputs alone, so a match needs no lookup
+    if request.if_none_match.contains(key[:32]):
+        response = app.response_class(status=304)
+        response.set_etag(key[:32])
+        return response
+    
+    artifact = render_cache.get_artifact(key)
+    cache_status = 'hit'
+    if artifact is None:
+        cache_status = 'miss'
+        tmp_path = render_cache.reserve_path(key)
+        try:
+            if tmp_path:
+                _, tier = render_service.render_to_file(fmt, markdown_text, template_id, tmp_path)
+                artifact = render_cache.adopt(key, tmp_path, tier)
+            else:
+                data, tier = render_service.render(fmt, markdown_text, template_id)
+                artifact = data, None, render_cache.set(key, data, tier)
+        except RenderQueueFull as e:
+            logger.warning(f"Render rejected: {e}")
+            response = jsonify({"error": "Document rendering is busy, please retry shortly"})
+            response.headers['Retry-After'] = '2'
+            return response, 503
+        except RenderTimeout as e:
+            logger.error(str(e))
+            return jsonify({"error": "Document rendering timed out"}), 504
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    data, f, metadata = artifact
+    response = send_file(
+        f if f is not None else io.BytesIO(data),
+        mimetype=mimetype,
+        as_attachment=as_attachment,
+        download_name=download_name,
+        etag=metadata['etag']
+    )
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.headers['X-Render-Cache'] = cache_status
+    if metadata['tier'] != 'primary':
+        response.headers['X-Render-Tier'] = metadata['tier']
+    return response
+
+@app.route('/api/render_templates_batch', methods=['POST'])
+def api_render_templates_batch():
+    """
+    Renders one resume in many templates for the template gallery.
+    The markdown is parsed once and the resume document is shared by every render;
+    uncached templates render in the render pool, RENDER_WORKERS at a time, so
+    the batch takes about ceil(misses / RENDER_WORKERS) render times. Results stream back as
+    newline-delimited JSON, one line per template as it finishes (cache hits
+    first), followed by a summary line.
+
+    Body: markdown_text, template_ids (default: all), include_data (default: true)
+    """
+    from flask import Response, stream_with_context
+    import base64
+    import time
 
-def generate_emergency_pdf(markdown_text):
-    """Emergency ultra-simple PDF generator - guaranteed to work"""
     try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        import io
-        
-        logger.info("Creating emergency minimal PDF...")
-        
-        buffer = io.BytesIO()
-        c = canvas.Canvas(buffer, pagesize=letter)
-        
-        # Ultra simple - just dump text
-        y = 750
-        c.setFont("Helvetica", 10)
-        
-        # Strip all special characters and just use plain text
-        plain_text = markdown_text.replace('#', '').replace('*', '').replace('_', '')
-        plain_text = plain_text.encode('ascii', 'ignore').decode('ascii')
-        
-        for line in plain_text.split('\n')[:100]:  # Limit to 100 lines
-            if y < 50:
-                break
-            if line.strip():
-                # Truncate long lines
-                safe_line = line[:100].strip()
-                if safe_line:
-                    try:
-                        c.drawString(50, y, safe_line)
-                    except:
-                        c.drawString(50, y, "...")
-                    y -= 12
-        
-        c.save()
-        pdf_bytes = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"Emergency PDF created: {len(pdf_bytes)} bytes")
-        return pdf_bytes
-        
+        if not request.json:
+            return jsonify({"error": "No data provided"}), 400
+
+        data = request.json
+        markdown_text = data.get('markdown_text', '')
+        include_data = bool(data.get('include_data', True))
+        if not markdown_text:
+            return jsonify({"error": "No resume content provided"}), 400
+
+        requested = data.get('template_ids')
+        if requested is None or requested == []:
+            requested = registry.render_template_ids
+        elif not isinstance(requested, list) or not all(isinstance(t, str) for t in requested):
+            return jsonify({"error": "template_ids must be a list of template id strings"}), 400
+        # Resolved up front: only known templates reach the cache and the render pool
+        template_ids = [t for t in dict.fromkeys(requested) if registry.get_render_template(t)]
+        if not template_ids:
+            return jsonify({"error": "No valid template_ids provided"}), 400
+
+        version = components.get('pdf_renderer').GENERATOR_VERSION
+        # Parse once; workers receive the document instead of re-parsing
+        document = parse_resume(markdown_text)
+
+        def result_line(template_id, data_bytes, metadata):
+            line = {"template_id": template_id, "status": "ok", **metadata}
+            if include_data:
+                line["pdf_base64"] = base64.b64encode(data_bytes).decode('ascii')
+            return json.dumps(line) + "\n"
+
+        def generate():
+            started = time.monotonic()
+            counts = {"cached": 0, "rendered": 0, "failed": 0}
+            misses = []
+            for template_id in template_ids:
+                key = render_cache.generate_key(markdown_text, template_id, 'pdf', version)
+                cached = render_cache.get(key)
+                if cached is None:
+                    misses.append(template_id)
+                    continue
+                counts["cached"] += 1
+                yield result_line(template_id, cached[0], {**cached[1], 'cache': 'hit'})
+
+            try:
+                for template_id, result, error in render_service.render_batch('pdf', markdown_text, misses, document=document):
+                    if error is not None:
+                        logger.error(f"Gallery render failed for {template_id}: {error}")
+                        counts["failed"] += 1
+                        yield json.dumps({"template_id": template_id, "status": "error", "error": str(error)}) + "\n"
+                        continue
+                    pdf_bytes, tier = result
+                    key = render_cache.generate_key(markdown_text, template_id, 'pdf', version)
+                    metadata = {**render_cache.set(key, pdf_bytes, tier), 'cache': 'miss'}
+                    counts["rendered"] += 1
+                    yield result_line(template_id, pdf_bytes, metadata)
+            except RenderQueueFull as e:
+                logger.warning(f"Gallery render rejected: {e}")
+                for template_id in misses:
+                    counts["failed"] += 1
+                    yield json.dumps({"template_id": template_id, "status": "busy",
+                                      "error": "Document rendering is busy, please retry shortly"}) + "\n"
+
+            yield json.dumps({"done": True, **counts, "seconds": round(time.monotonic() - started, 2)}) + "\n"
+
+        logger.info(f"Gallery render: {len(template_ids)} templates")
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        response.headers['Cache-Control'] = 'no-store'
+        # Stop proxies from buffering the stream
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
     except Exception as e:
-        logger.error(f"Emergency PDF failed: {e}", exc_info=True)
-        raise
+        logger.error(f"Error rendering template gallery: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
 
 @app.route('/dashboard')
 def dashboard():
@@ -484,76 +637,154 @@ def result():
 
 
 
+# Interview API helpers, shared with the async routes in backend/app/asgi.py
+
+def begin_interview(data):
+    """
+    Creates an interview session (parsing the resume, if given) and its greeting.
+    
+    Args:
+        data: Request JSON (mode, job_role, company, resume_text)
+    
+    Returns:
+        (session_id, greeting, audio_filename)
+    """
+    mode = data.get('mode', 'HR')
+    job_role = data.get('job_role', '')
+    company = data.get('company', '')
+    resume_text = data.get('resume_text', '')  # Resume text from frontend
+    
+    session_id = generate_session_id()
+    
+    memory.create_session(session_id)
+    memory.update_session(session_id, 'mode', mode)
+    
+    # Store job role and company in session
+    if job_role:
+        memory.update_session(session_id, 'job_role', job_role)
+    if company:
+        memory.update_session(session_id, 'company', company)
+    
+    # Parse resume if provided
+    candidate_name = None
+    if resume_text and len(resume_text.strip()) > 50:
+        logger.info(f"Parsing resume (length: {len(resume_text)} chars)")
+        resume_context = get_candidate_info(resume_text)
+        
+        # Store resume context in session
+        memory.update_session(session_id, 'resume_context', resume_context)
+        memory.update_session(session_id, 'candidate_name', resume_context.get('candidate_name'))
+        memory.update_session(session_id, 'resume_topics', resume_context.get('topics', []))
+        
+        # Initialize topic question count
+        topic_count = {}
+        for topic in resume_context.get('topics', []):
+            topic_count[topic] = 0
+        memory.update_session(session_id, 'topic_question_count', topic_count)
+        
+        candidate_name = resume_context.get('candidate_name')
+        logger.info(f"Resume parsed: Name={candidate_name}, Topics={len(resume_context.get('topics', []))}")
+    
+    # Generate welcoming greeting with context
+    greeting_context = ""
+    if job_role:
+        greeting_context += f" for the {job_role} position"
+    if company:
+        greeting_context += f" at {company}"
+    
+    # Personalize greeting with candidate name if available
+    if candidate_name:
+        initial_greeting = f"Hello {candidate_name}! I'm your AI interviewer. Welcome to your {mode} interview{greeting_context}. I'm excited to learn more about you. To begin, please introduce yourself."
+    else:
+        initial_greeting = f"Hello! I'm your AI interviewer. Welcome to your {mode} interview{greeting_context}. I'm excited to learn more about you. To begin, please introduce yourself."
+    
+    memory.add_history(session_id, "ai", initial_greeting)
+    
+    return session_id, initial_greeting, f"{session_id}_greeting.mp3"
+
+def greeting_payload(session_id, greeting, audio_filename, audio_generated):
+    """Response body of /start_call_interview."""
+    return {
+        "session_id": session_id,
+        "message": greeting,
+        "audio_url": f"/audio/{audio_filename}" if audio_generated else None
+    }
+
+def user_audio_path(session_id):
+    """Where an uploaded answer recording is saved before transcription."""
+    return os.path.join(AUDIO_FOLDER, f"{session_id}_{get_timestamp()}_user.wav")
+
+def resolve_turn(response_data):
+    """
+    Text to speak for a processed answer.
+    
+    Args:
+        response_data: InterviewEngine.process_answer result
+    
+    Returns:
+        (response_data, ai_text); ai_text is None if the engine failed
+    """
+    if "error" in response_data:
+        # Fallback for API key error
+        if "API Key missing" in str(response_data.get("error", "")):
+            ai_text = "I cannot process your answer because the Gemini API key is missing. Please check your settings."
+            return {"full_text": ai_text, "difficulty": "Easy"}, ai_text
+        return response_data, None
+    return response_data, response_data["full_text"]
+
+def turn_payload(user_text, ai_text, response_data, audio_bytes):
+    """Response body of /process_voice."""
+    import base64
+    
+    audio_base64 = None
+    if audio_bytes:
+        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+    
+    return {
+        "user_text": user_text,
+        "full_text": ai_text,
+        "audio_base64": audio_base64,
+        "difficulty": response_data.get("difficulty", "Normal"),
+        "phase": response_data.get("phase", "qa"),
+        "elapsed_seconds": response_data.get("elapsed_seconds", 0),
+        "interview_complete": response_data.get("interview_complete", False),
+        "degraded": response_data.get("degraded", False),
+        "real_time_feedback": response_data.get("real_time_feedback", {})
+    }
+
+def final_score_inputs(session):
+    """(mode, resume summary, transcript) for the semantic scoring call."""
+    transcript = "\n".join([f"{h['role']}: {h['content']}" for h in session["history"]])
+    return session["mode"], str(session["resume_context"]), transcript
+
+def store_final_result(session_id, semantic_data):
+    """Combines the semantic score with the local average and saves it to the session."""
+    avg_local_score = session_averages(memory.get_aggregates(session_id))["avg_local_score"]
+    final_result = calculate_final_score(semantic_data, avg_local_score)
+    memory.update_session(session_id, "final_result", final_result)
+    return final_result
+
+def overloaded_response(error):
+    """503 for a request refused by admission control (queue ticket and wait estimate in the body)."""
+    response = jsonify(error.to_dict())
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
 @app.route('/start_call_interview', methods=['POST'])
 def start_call_interview():
     """Initializes a new interview session."""
     try:
-        data = request.json
-        mode = data.get('mode', 'HR')
-        job_role = data.get('job_role', '')
-        company = data.get('company', '')
-        resume_text = data.get('resume_text', '')  # Resume text from frontend
-        
-        session_id = generate_session_id()
-        
-        memory.create_session(session_id)
-        memory.update_session(session_id, 'mode', mode)
-        
-        # Store job role and company in session
-        if job_role:
-            memory.update_session(session_id, 'job_role', job_role)
-        if company:
-            memory.update_session(session_id, 'company', company)
-        
-        # Parse resume if provided
-        candidate_name = None
-        if resume_text and len(resume_text.strip()) > 50:
-            from backend.src.resume_parser import extract_candidate_info
-            
-            logger.info(f"Parsing resume (length: {len(resume_text)} chars)")
-            resume_context = extract_candidate_info(resume_text)
-            
-            # Store resume context in session
-            memory.update_session(session_id, 'resume_context', resume_context)
-            memory.update_session(session_id, 'candidate_name', resume_context.get('candidate_name'))
-            memory.update_session(session_id, 'resume_topics', resume_context.get('topics', []))
-            
-            # Initialize topic question count
-            topic_count = {}
-            for topic in resume_context.get('topics', []):
-                topic_count[topic] = 0
-            memory.update_session(session_id, 'topic_question_count', topic_count)
-            
-            candidate_name = resume_context.get('candidate_name')
-            logger.info(f"Resume parsed: Name={candidate_name}, Topics={len(resume_context.get('topics', []))}")
-        
-        # Generate welcoming greeting with context
-        greeting_context = ""
-        if job_role:
-            greeting_context += f" for the {job_role} position"
-        if company:
-            greeting_context += f" at {company}"
-        
-        # Personalize greeting with candidate name if available
-        if candidate_name:
-            initial_greeting = f"Hello {candidate_name}! I'm your AI interviewer. Welcome to your {mode} interview{greeting_context}. I'm excited to learn more about you. To begin, please introduce yourself."
-        else:
-            initial_greeting = f"Hello! I'm your AI interviewer. Welcome to your {mode} interview{greeting_context}. I'm excited to learn more about you. To begin, please introduce yourself."
-        
-        memory.add_history(session_id, "ai", initial_greeting)
-        
-        # Generate Audio for greeting
-        audio_filename = f"{session_id}_greeting.mp3"
-        audio_path = os.path.join(AUDIO_FOLDER, audio_filename)
-        
-        # Use Edge TTS
-        audio_generated = generate_audio_sync(initial_greeting, audio_path)
-        
-        return jsonify({
-            "session_id": session_id,
-            "message": initial_greeting,
-            "audio_url": f"/audio/{audio_filename}" if audio_generated else None
-        })
+        with tracer.trace('start_call_interview', request.headers.get('X-Request-ID')):
+            # New interviews queue behind running ones under load
+            with admission.interview((request.json or {}).get('queue_ticket')):
+                session_id, greeting, audio_filename = begin_interview(request.json)
+                
+                # Generate Audio for greeting (Edge TTS)
+                audio_generated = generate_audio_sync(greeting, os.path.join(AUDIO_FOLDER, audio_filename))
+        
+        return jsonify(greeting_payload(session_id, greeting, audio_filename, audio_generated))
+    except Overloaded as e:
+        return overloaded_response(e)
     except Exception as e:
         logger.error(f"Error starting interview: {e}")
         return jsonify({"error": str(e)}), 500
@@ -561,6 +792,14 @@ def start_call_interview():
 @app.route('/process_voice', methods=['POST'])
 def process_voice():
     """Receives audio, processes it, and returns AI response."""
+    with tracer.trace('process_voice', request.headers.get('X-Request-ID')):
+        try:
+            with admission.turn() as degraded:
+                return _process_voice(degraded)
+        except Overloaded as e:
+            return overloaded_response(e)
+
+def _process_voice(degraded=False):
     try:
         # Handle both JSON and form data
         if request.is_json:
@@ -579,52 +818,29 @@ def process_voice():
                  return jsonify({"error": "No audio or text provided"}), 400
                  
             # Save user audio
-            timestamp = get_timestamp()
-            user_audio_filename = f"{session_id}_{timestamp}_user.wav"
-            user_audio_path = os.path.join(AUDIO_FOLDER, user_audio_filename)
-            audio_file.save(user_audio_path)
+            audio_path = user_audio_path(session_id)
+            audio_file.save(audio_path)
             
             # Transcribe
-            user_text = transcribe_audio(user_audio_path)
+            user_text = transcribe_audio(audio_path)
             
         if not user_text:
             return jsonify({"error": "Could not understand audio"}), 400
 
             
         # Process with Interview Engine
-        response_data = engine.process_answer(session_id, user_text)
-        
-        if "error" in response_data:
-            # Fallback for API key error
-            if "API Key missing" in str(response_data.get("error", "")):
-                ai_text = "I cannot process your answer because the Gemini API key is missing. Please check your settings."
-                response_data = {"full_text": ai_text, "difficulty": "Easy"}
-            else:
-                return jsonify(response_data), 500
-        else:
-            ai_text = response_data["full_text"]
+        with tracer.span('engine.process_answer'):
+            response_data, ai_text = resolve_turn(engine.process_answer(session_id, user_text, degraded=degraded))
+        if ai_text is None:
+            return jsonify(response_data), 500
         
         # Generate AI Audio
-        # Use In-Memory TTS for speed
-        import base64
+        # Use In-Memory TTS for speed; degraded turns are text-only (the browser speaks them)
         from backend.src.edge_tts_client import generate_audio_memory_sync
         
-        audio_bytes = generate_audio_memory_sync(ai_text)
-        
-        audio_base64 = None
-        if audio_bytes:
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        audio_bytes = None if degraded else generate_audio_memory_sync(ai_text)
         
-        return jsonify({
-            "user_text": user_text,
-            "full_text": ai_text,
-            "audio_base64": audio_base64,
-            "difficulty": response_data.get("difficulty", "Normal"),
-            "phase": response_data.get("phase", "qa"),
-            "elapsed_seconds": response_data.get("elapsed_seconds", 0),
-            "interview_complete": response_data.get("interview_complete", False),
-            "real_time_feedback": response_data.get("real_time_feedback", {})
-        })
+        return jsonify(turn_payload(user_text, ai_text, response_data, audio_bytes))
         
     except Exception as e:
         logger.error(f"Error processing voice: {e}")
@@ -652,7 +868,7 @@ def upload_profile():
             # Use resume_analyzer to parse PDF
             text_content = resume_analyzer.parse_resume(filepath)
             
-        parsed_data = parse_resume(text_content)
+        parsed_data = get_spacy_parse(text_content) or {}
         parsed_data['text_content'] = text_content  # Add text content to response
         
         return jsonify(parsed_data)
@@ -665,160 +881,138 @@ def upload_profile():
 def get_interview_results(session_id):
     """Retrieves complete interview results for a session."""
     try:
-        logger.info(f"Fetching results for session: {session_id}")
         session = memory.get_session(session_id)
         
         if not session:
             logger.error(f"Session not found: {session_id}")
-            logger.info(f"Available sessions: {list(memory.sessions.keys())}")
             return jsonify({"error": "Session not found"}), 404
         
-        logger.info(f"Session found. Keys: {session.keys()}")
-        
-        # Extract session data with defaults
-        scores = session.get("scores", [])
-        analyses = session.get("analyses", [])
-        history = session.get("history", [])
-        mode = session.get("mode", "HR")
-        job_role = session.get("job_role", "Not specified")
-        company = session.get("company", "Not specified")
-        
-        logger.info(f"Session data - Scores: {len(scores)}, Analyses: {len(analyses)}, History: {len(history)}")
-        
-        # Calculate metrics
-        if scores and len(scores) > 0:
-            avg_local_score = sum(s.get("local_score", 0) for s in scores) / len(scores)
-            avg_ai_score = sum(s.get("ai_score", 0) for s in scores) / len(scores)
-            avg_confidence = sum(s.get("confidence_score", 0) for s in scores) / len(scores)
-            
-            # Convert to 0-100 scale
-            overall_score = int(((avg_local_score + avg_ai_score) / 20) * 100)
-        else:
-            # No scores yet - provide default values
-            logger.warning("No scores found in session, using defaults")
-            avg_local_score = 5.0
-            avg_ai_score = 5.0
-            avg_confidence = 50.0
-            overall_score = 50
-        
-        # Analyze performance patterns
-        total_filler_words = sum(a.get('audio', {}).get('filler_count', 0) for a in analyses)
-        
-        # Calculate pace statistics - handle None values
-        pace_data = []
-        for a in analyses:
-            pace = a.get('audio', {}).get('speaking_pace', 0)
-            if pace is not None and pace > 0:
-                pace_data.append(pace)
-        
-        avg_pace = sum(pace_data) / len(pace_data) if pace_data else 0
-        
-        # Collect all issues and tips
-        all_issues = []
-        all_tips = []
-        for analysis in analyses:
-            audio_data = analysis.get('audio', {})
-            issues = audio_data.get('issues', [])
-            tips = audio_data.get('tips', [])
-            if issues:
-                all_issues.extend(issues)
-            if tips:
-                all_tips.extend(tips)
-        
-        # Get unique strengths and improvements
-        strengths = []
-        improvements = []
-        
-        # Add strengths based on performance - with None checks
-        if avg_confidence is not None and avg_confidence >= 70:
-            strengths.append("Demonstrated high confidence throughout")
-        if avg_pace is not None and avg_pace >= 120 and avg_pace <= 160:
-            strengths.append("Maintained optimal speaking pace")
-        if total_filler_words is not None and total_filler_words < 5:
-            strengths.append("Minimal use of filler words")
-        if avg_ai_score is not None and avg_ai_score >= 7:
-            strengths.append("Provided detailed and relevant answers")
-        
-        # Default strengths if none found
-        if not strengths:
-            strengths = [
-                "Completed the interview session",
-                "Engaged with the interviewer",
-                "Responded to questions"
-            ]
-        
-        # Add improvements based on performance - with None checks
-        if avg_confidence is not None and avg_confidence < 60:
-            improvements.append("Work on building confidence in responses")
-        if avg_pace is not None and avg_pace > 0 and avg_pace < 100:
-            improvements.append("Try to speak at a slightly faster pace")
-        elif avg_pace is not None and avg_pace > 180:
-            improvements.append("Slow down to ensure clarity")
-        if total_filler_words is not None and total_filler_words >= 5:
-            improvements.append("Reduce use of filler words (um, uh, like)")
-        if avg_ai_score is not None and avg_ai_score < 6:
-            improvements.append("Provide more specific examples and details")
-        
-        # Add unique tips as improvements
-        unique_tips = list(set(all_tips))[:3]
-        improvements.extend(unique_tips)
-        
-        # Default improvements if none found
-        if not improvements:
-            improvements = [
-                "Practice more interview scenarios",
-                "Work on articulating thoughts clearly",
-                "Prepare specific examples from experience"
-            ]
-        
-        # Question breakdown
-        total_questions = len([h for h in history if h.get('role') == 'ai'])
-        total_responses = len([h for h in history if h.get('role') == 'user'])
+        aggregates = memory.get_aggregates(session_id)
         
         # Calculate interview duration
         from datetime import datetime
         start_time = session.get('start_time')
         if start_time:
-            duration_seconds = int((datetime.now() - start_time).total_seconds())
-            duration_minutes = duration_seconds // 60
+            duration_minutes = int((datetime.now() - start_time).total_seconds()) // 60
         else:
-            duration_seconds = 0
             duration_minutes = 0
         
-        result = {
-            "session_id": session_id,
-            "overall_score": overall_score,
-            "mode": mode,
-            "job_role": job_role,
-            "company": company,
-            "duration_minutes": max(1, duration_minutes),  # At least 1 minute
-            "metrics": {
-                "local_score": round(avg_local_score, 1),
-                "ai_score": round(avg_ai_score, 1),
-                "confidence": round(avg_confidence, 1),
-                "speaking_pace": round(avg_pace, 1),
-                "filler_words": total_filler_words,
-                "total_questions": total_questions,
-                "total_responses": total_responses
-            },
-            "strengths": strengths[:5],  # Top 5 strengths
-            "improvements": improvements[:5],  # Top 5 improvements
-            "score_breakdown": [
-                {"category": "Content Quality", "score": round(avg_ai_score * 10, 1)},
-                {"category": "Confidence", "score": round(avg_confidence, 1)},
-                {"category": "Communication", "score": round(avg_local_score * 10, 1)},
-                {"category": "Overall", "score": overall_score}
-            ],
-            "performance_trend": [s.get("ai_score", 0) * 10 for s in scores] if scores else [50]  # Scores over time
-        }
+        # The result page polls this endpoint; reuse the serialized body until a
+        # new turn is recorded or the displayed duration ticks over.
+        memo_key = (aggregates["version"], duration_minutes)
+        memo = session.get("results_memo")
+        if not memo or memo["key"] != memo_key:
+            result = build_interview_results(session_id, session, aggregates, duration_minutes)
+            body = json.dumps(result)
+            memo = {
+                "key": memo_key,
+                "body": body,
+                "etag": hashlib.sha1(body.encode('utf-8')).hexdigest()
+            }
+            memory.update_session(session_id, "results_memo", memo)
+            logger.info(f"Generated results for session {session_id} (version {aggregates['version']})")
         
-        logger.info(f"Successfully generated results for session {session_id}")
-        return jsonify(result)
+        response = app.response_class(memo["body"], mimetype='application/json')
+        response.set_etag(memo["etag"])
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"Error getting interview results for session {session_id}: {e}", exc_info=True)
         return jsonify({"error": f"Failed to fetch results: {str(e)}"}), 500
 
+def build_interview_results(session_id, session, aggregates, duration_minutes):
+    """Builds the results payload from the session's running aggregates."""
+    averages = session_averages(aggregates)
+    
+    if averages["score_count"] > 0:
+        avg_local_score = averages["avg_local_score"]
+        avg_ai_score = averages["avg_ai_score"]
+        avg_confidence = averages["avg_confidence"]
+        
+        # Convert to 0-100 scale
+        overall_score = int(((avg_local_score + avg_ai_score) / 20) * 100)
+    else:
+        # No scores yet - provide default values
+        logger.warning("No scores found in session, using defaults")
+        avg_local_score = 5.0
+        avg_ai_score = 5.0
+        avg_confidence = 50.0
+        overall_score = 50
+    
+    total_filler_words = averages["total_filler_words"]
+    avg_pace = averages["avg_pace"]
+    
+    strengths = []
+    improvements = []
+    
+    # Add strengths based on performance
+    if avg_confidence >= 70:
+        strengths.append("Demonstrated high confidence throughout")
+    if 120 <= avg_pace <= 160:
+        strengths.append("Maintained optimal speaking pace")
+    if total_filler_words < 5:
+        strengths.append("Minimal use of filler words")
+    if avg_ai_score >= 7:
+        strengths.append("Provided detailed and relevant answers")
+    
+    # Default strengths if none found
+    if not strengths:
+        strengths = [
+            "Completed the interview session",
+            "Engaged with the interviewer",
+            "Responded to questions"
+        ]
+    
+    # Add improvements based on performance
+    if avg_confidence < 60:
+        improvements.append("Work on building confidence in responses")
+    if 0 < avg_pace < 100:
+        improvements.append("Try to speak at a slightly faster pace")
+    elif avg_pace > 180:
+        improvements.append("Slow down to ensure clarity")
+    if total_filler_words >= 5:
+        improvements.append("Reduce use of filler words (um, uh, like)")
+    if avg_ai_score < 6:
+        improvements.append("Provide more specific examples and details")
+    
+    # Add unique tips as improvements
+    improvements.extend(list(aggregates["unique_tips"])[:3])
+    
+    # Default improvements if none found
+    if not improvements:
+        improvements = [
+            "Practice more interview scenarios",
+            "Work on articulating thoughts clearly",
+            "Prepare specific examples from experience"
+        ]
+    
+    return {
+        "session_id": session_id,
+        "overall_score": overall_score,
+        "mode": session.get("mode", "HR"),
+        "job_role": session.get("job_role", "Not specified"),
+        "company": session.get("company", "Not specified"),
+        "duration_minutes": max(1, duration_minutes),  # At least 1 minute
+        "metrics": {
+            "local_score": round(avg_local_score, 1),
+            "ai_score": round(avg_ai_score, 1),
+            "confidence": round(avg_confidence, 1),
+            "speaking_pace": round(avg_pace, 1),
+            "filler_words": total_filler_words,
+            "total_questions": averages["total_questions"],
+            "total_responses": averages["total_responses"]
+        },
+        "strengths": strengths[:5],  # Top 5 strengths
+        "improvements": improvements[:5],  # Top 5 improvements
+        "score_breakdown": [
+            {"category": "Content Quality", "score": round(avg_ai_score * 10, 1)},
+            {"category": "Confidence", "score": round(avg_confidence, 1)},
+            {"category": "Communication", "score": round(avg_local_score * 10, 1)},
+            {"category": "Overall", "score": overall_score}
+        ],
+        "performance_trend": list(aggregates["performance_trend"]) or [50]  # Scores over time
+    }
+
 @app.route('/final_results', methods=['POST'])
 def final_results():
     """Calculates and returns final scores."""
@@ -830,21 +1024,15 @@ def final_results():
         if not session:
             return jsonify({"error": "Session not found"}), 404
             
-        # Calculate final scores
-        scores = session.get("scores", [])
-        avg_local_score = sum(s["local_score"] for s in scores) / max(1, len(scores))
-        
-        # Get semantic analysis of full transcript
-        transcript = "\n".join([f"{h['role']}: {h['content']}" for h in session["history"]])
-        semantic_data = get_semantic_score(session["mode"], str(session["resume_context"]), transcript)
+        # Get semantic analysis of full transcript (a running interview: admitted as a turn)
+        with tracer.trace('final_results', request.headers.get('X-Request-ID')), admission.turn():
+            semantic_data = get_semantic_score(*final_score_inputs(session))
         
-        final_result = calculate_final_score(semantic_data, avg_local_score)
-        
-        # Save result to session
-        memory.update_session(session_id, "final_result", final_result)
-        
-        return jsonify(final_result)
+        # Calculate and save final scores
+        return jsonify(store_final_result(session_id, semantic_data))
         
+    except Overloaded as e:
+        return overloaded_response(e)
     except Exception as e:
         logger.error(f"Error getting results: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
@@ -891,6 +1079,38 @@ def health_check():
             'message': 'Free AI not initialized'
         }
     
+    # Document rendering pool and cache
+    health_status['components']['rendering'] = {
+        'status': 'healthy',
+        'service': render_service.get_stats(),
+        'cache': render_cache.get_stats()
+    }
+    
+    # Speculative recreation quota versus latency saved
+    health_status['components']['speculative_recreation'] = {
+        'status': 'healthy',
+        **resume_recreator.speculation_budget.get_stats()
+    }
+    
+    # Request and stage latency (see /metrics for the full histograms)
+    health_status['components']['latency'] = {
+        'status': 'healthy',
+        **tracer.get_stats()
+    }
+    
+    # Admission control: pressure level, queue and shed decisions
+    admission_stats = admission.get_stats()
+    health_status['components']['admission'] = {
+        'status': 'healthy' if admission_stats['level'] == 'normal' else admission_stats['level'],
+        **admission_stats
+    }
+    
+    # Lazily loaded models and renderers
+    health_status['components']['models'] = {
+        'status': 'healthy' if components.is_ready() else 'warming',
+        **components.get_status()
+    }
+    
     # Check environment
     health_status['components']['environment'] = {
         'status': 'healthy',
@@ -899,10 +1119,91 @@ def health_check():
     
     return jsonify(health_status), 200
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus scrape endpoint: request and stage latency histograms, admission decisions"""
+    return app.response_class(tracer.render_prometheus() + admission.render_prometheus(),
+                              mimetype='text/plain; version=0.0.4')
+
+# ============================================
+# PROFILING ENDPOINTS (admin only)
+# ============================================
+
+# Profiling is off unless ADMIN_TOKEN is set; requests send it as X-Admin-Token
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+
+def admin_required(view):
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        token = request.headers.get('X-Admin-Token', '')
+        if not ADMIN_TOKEN or not hmac.compare_digest(token.encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            abort(404)
+        return view(*args, **kwargs)
+    return wrapper
+
+@app.route('/admin/profile/cpu', methods=['POST'])
+@admin_required
+def profile_cpu():
+    """
+    Sample this worker's stacks for ?seconds= (default 10) every ?interval_ms= (default 5).
+    ?format=collapsed (default, flamegraph.pl input) or speedscope (JSON for speedscope.app)
+    """
+    try:
+        seconds = float(request.args.get('seconds', 10))
+        interval = float(request.args.get('interval_ms', 5)) / 1000
+        fmt = request.args.get('format', 'collapsed')
+        profile = sampling_profiler.run(seconds, interval)
+    except ProfilerBusy as e:
+        return jsonify({"error": str(e)}), 409
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    name = f"worker-{os.getpid()}-{get_timestamp()}"
+    if fmt == 'speedscope':
+        body, mimetype, filename = dumps_speedscope(profile, name), 'application/json', f"{name}.speedscope.json"
+    else:
+        body, mimetype, filename = profile.to_collapsed(), 'text/plain', f"{name}.collapsed.txt"
+    response = app.response_class(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['X-Profile-Samples'] = str(profile.samples)
+    return response
+
+@app.route('/admin/profile/allocations', methods=['POST'])
+@admin_required
+def profile_allocations():
+    """Diff tracemalloc snapshots ?seconds= apart (default 10); ?top=, ?key_type=lineno|filename|traceback"""
+    try:
+        key_type = request.args.get('key_type', 'lineno')
+        if key_type not in ('lineno', 'filename', 'traceback'):
+            raise ValueError(f"Unsupported key_type '{key_type}'")
+        return jsonify(allocation_diff(float(request.args.get('seconds', 10)),
+                                       int(request.args.get('top', 30)), key_type))
+    except ProfilerBusy as e:
+        return jsonify({"error": str(e)}), 409
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+@app.route('/admin/profile/routes', methods=['GET', 'POST'])
+@admin_required
+def profile_routes():
+    """Per-route CPU accounting: GET reports; POST {"enabled": bool, "reset": bool} controls it"""
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if data.get('reset'):
+            route_cpu.reset()
+        if 'enabled' in data:
+            route_cpu.enabled = bool(data['enabled'])
+    return jsonify({'pid': os.getpid(), **route_cpu.get_stats()})
+
 @app.route('/ready', methods=['GET'])
 def readiness_check():
     """Readiness check - is the app ready to serve traffic?"""
-    return jsonify({'ready': True, 'message': 'Application is ready'}), 200
+    status = components.get_status()
+    if not components.is_ready():
+        # A probe before any warm-up (e.g. the dev server) starts one
+        components.warm_up()
+        return jsonify({'ready': False, 'message': 'Warming up', 'components': status}), 503
+    return jsonify({'ready': True, 'message': 'Application is ready', 'components': status}), 200
 
 @app.route('/live', methods=['GET'])
 def liveness_check():
@@ -0,0 +1,353 @@
+"""
+ASGI entry point (SERVER_MODE=asgi)
+Serves the interview API - /start_call_interview, /process_voice and
+/final_results - natively on asyncio: the LLM call (aiohttp / async provider
+manager) and Edge TTS are awaited on the worker's event loop, so a worker holds
+thousands of sessions waiting on I/O instead of one per request. CPU-bound
+steps (resume parsing, Whisper) run in threads. Every other route is the
+existing Flask app, mounted as WSGI.
+
+/ws/interview is a persistent per-session WebSocket channel (see
+InterviewChannel) replacing the per-turn /process_voice round-trips.
+
+Run:
+    uvicorn asgi:app --workers 4 --port 8000           (from backend/app)
+    SERVER_MODE=asgi gunicorn --config ../../gunicorn_config.py asgi:app
+"""
+
+import os
+import sys
+import json
+import asyncio
+
+# Add the project root to sys.path to allow imports from backend.src
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(PROJECT_ROOT)
+
+from asgiref.wsgi import WsgiToAsgi
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route, Mount, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+
+from backend.app.app import (app as flask_app, AUDIO_FOLDER, begin_interview, greeting_payload,
+                             user_audio_path, resolve_turn, turn_payload, final_score_inputs,
+                             store_final_result)
+from backend.src.utils import logger
+from backend.src.memory_store import memory
+from backend.src.interview_engine import engine
+from backend.src.whisper_stt import transcribe_audio
+from backend.src.edge_tts_client import generate_audio_async, generate_audio_memory_async, stream_audio_async
+from backend.src.scoring import get_semantic_score_async
+from backend.src.tracing import tracer, run_in_thread
+from backend.src.admission import admission, Overloaded
+
+
+def overloaded_response(error):
+    """503 for a request refused by admission control (queue ticket and wait estimate in the body)."""
+    return JSONResponse(error.to_dict(), status_code=503, headers={'Retry-After': str(error.retry_after)})
+
+
+async def start_call_interview(request):
+    """Initializes a new interview session."""
+    try:
+        data = await request.json()
+        with tracer.trace('start_call_interview', request.headers.get('X-Request-ID')):
+            # New interviews queue behind running ones under load
+            with admission.interview(data.get('queue_ticket')):
+                # Resume parsing is CPU-bound
+                session_id, greeting, audio_filename = await run_in_thread(begin_interview, data)
+
+                audio_generated = await generate_audio_async(greeting, os.path.join(AUDIO_FOLDER, audio_filename))
+
+        return JSONResponse(greeting_payload(session_id, greeting, audio_filename, audio_generated))
+    except Overloaded as e:
+        return overloaded_response(e)
+    except Exception as e:
+        logger.error(f"Error starting interview: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def process_voice(request):
+    """Receives audio, processes it, and returns AI response."""
+    with tracer.trace('process_voice', request.headers.get('X-Request-ID')):
+        try:
+            with admission.turn() as degraded:
+                return await _process_voice(request, degraded)
+        except Overloaded as e:
+            return overloaded_response(e)
+
+
+async def _process_voice(request, degraded=False):
+    try:
+        # Handle both JSON and form data
+        if request.headers.get('content-type', '').startswith('application/json'):
+            data = await request.json()
+            session_id = data.get('session_id')
+            user_text = data.get('user_text')
+            audio_file = None
+        else:
+            form = await request.form()
+            session_id = form.get('session_id')
+            audio_file = form.get('audio')
+            user_text = form.get('user_text')
+
+        if not user_text:
+            # If no text, try audio transcription
+            if not audio_file:
+                return JSONResponse({"error": "No audio or text provided"}, status_code=400)
+
+            user_text = await transcribe_upload(session_id, await audio_file.read())
+
+        if not user_text:
+            return JSONResponse({"error": "Could not understand audio"}, status_code=400)
+
+        with tracer.span('engine.process_answer'):
+            response_data, ai_text = resolve_turn(
+                await engine.process_answer_async(session_id, user_text, degraded=degraded))
+        if ai_text is None:
+            return JSONResponse(response_data, status_code=500)
+
+        # Degraded turns are text-only (the browser speaks them)
+        audio_bytes = None if degraded else await generate_audio_memory_async(ai_text)
+
+        return JSONResponse(turn_payload(user_text, ai_text, response_data, audio_bytes))
+
+    except Exception as e:
+        logger.error(f"Error processing voice: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def final_results(request):
+    """Calculates and returns final scores."""
+    try:
+        data = await request.json()
+        session_id = data.get('session_id')
+        session = memory.get_session(session_id)
+
+        if not session:
+            return JSONResponse({"error": "Session not found"}, status_code=404)
+
+        # A running interview: admitted as a turn
+        with tracer.trace('final_results', request.headers.get('X-Request-ID')), admission.turn():
+            semantic_data = await get_semantic_score_async(*final_score_inputs(session))
+
+        return JSONResponse(store_final_result(session_id, semantic_data))
+
+    except Overloaded as e:
+        return overloaded_response(e)
+    except Exception as e:
+        logger.error(f"Error getting results: {e}", exc_info=True)
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
+async def transcribe_upload(session_id, audio_bytes):
+    """Saves an uploaded answer recording and transcribes it (Whisper, in a thread)."""
+    audio_path = user_audio_path(session_id)
+    await run_in_thread(_write_file, audio_path, audio_bytes)
+    return await run_in_thread(transcribe_audio, audio_path)
+
+
+def _write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+# ============================================
+# WEBSOCKET INTERVIEW CHANNEL
+# ============================================
+
+# Seconds between server-pushed timer events
+CHANNEL_TIMER_INTERVAL = float(os.getenv('CHANNEL_TIMER_INTERVAL', 1))
+# Largest recorded answer accepted over the channel
+CHANNEL_MAX_AUDIO_BYTES = int(os.getenv('CHANNEL_MAX_AUDIO_BYTES', 10 * 1024 * 1024))
+
+
+class InterviewChannel:
+    """
+    One interview session over a WebSocket, bound to the session for its lifetime.
+
+    Client -> server:
+        {"type": "answer", "text": ..., "duration": seconds?}   Browser-transcribed answer
+        {"type": "audio_start"}, binary frames, {"type": "audio_end", "duration": seconds?}
+                                                                Recorded answer (transcribed here)
+        {"type": "end"}                                         Final scoring, then close
+        {"type": "ping"}
+
+    Server -> client:
+        {"type": "ready" | "timer", "phase", "elapsed_seconds"}
+        {"type": "transcript", "text"}
+        {"type": "response", ...}   Same fields as /process_voice minus audio_base64,
+                                    followed by binary MP3 frames and {"type": "audio_end"}
+        {"type": "phase", "phase": "summary"}   Pushed when Q&A time is up, followed by
+                                                the summary as a "response"
+        {"type": "final_result", ...}, {"type": "error", "error"}, {"type": "pong"}
+    """
+
+    def __init__(self, websocket, session_id, session):
+        self.websocket = websocket
+        self.session_id = session_id
+        self.session = session
+        self.audio = None  # bytearray while a recorded answer is arriving
+        self.turn = None  # Task of the answer being processed
+        self.send_lock = asyncio.Lock()
+
+    async def run(self):
+        await self.websocket.accept()
+        timer = asyncio.create_task(self._push_timer())
+        try:
+            await self.send_event('ready', **self._clock())
+            while True:
+                message = await self.websocket.receive()
+                if message['type'] == 'websocket.disconnect':
+                    break
+                if message.get('bytes') is not None:
+                    await self._on_audio_frame(message['bytes'])
+                elif message.get('text') is not None:
+                    if not await self._on_event(json.loads(message['text'])):
+                        break
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        except Exception as e:
+            logger.error(f"Interview channel error ({self.session_id}): {e}", exc_info=True)
+        finally:
+            timer.cancel()
+            if self.turn is not None:
+                self.turn.cancel()
+
+    def _clock(self):
+        phase, elapsed_seconds = engine.check_interview_phase(self.session)
+        return {'phase': phase, 'elapsed_seconds': elapsed_seconds}
+
+    async def send_event(self, event_type, **fields):
+        async with self.send_lock:
+            await self.websocket.send_text(json.dumps({'type': event_type, **fields}))
+
+    async def _on_event(self, event):
+        """Handles a client control event; returns False to close the channel."""
+        event_type = event.get('type')
+        if event_type == 'ping':
+            await self.send_event('pong')
+        elif event_type == 'answer':
+            self._start_turn(event.get('text'), event.get('duration'))
+        elif event_type == 'audio_start':
+            self.audio = bytearray()
+        elif event_type == 'audio_end':
+            audio, self.audio = self.audio, None
+            if not audio:
+                await self.send_event('error', error='No audio or text provided')
+            else:
+                self._start_turn(None, event.get('duration'), bytes(audio))
+        elif event_type == 'end':
+            await self._final_results()
+            return False
+        else:
+            await self.send_event('error', error=f"Unknown event type: {event_type}")
+        return True
+
+    async def _on_audio_frame(self, data):
+        if self.audio is None:
+            await self.send_event('error', error='Audio frame outside audio_start/audio_end')
+        elif len(self.audio) + len(data) > CHANNEL_MAX_AUDIO_BYTES:
+            self.audio = None
+            await self.send_event('error', error='Recorded answer too large')
+        else:
+            self.audio.extend(data)
+
+    def _start_turn(self, user_text, duration, audio_bytes=None):
+        if self.turn is not None and not self.turn.done():
+            asyncio.create_task(self.send_event('error', error='Previous answer still processing'))
+            return
+        self.turn = asyncio.create_task(self._answer(user_text, duration, audio_bytes))
+
+    async def _answer(self, user_text, duration, audio_bytes):
+        with tracer.trace('channel_answer'):
+            try:
+                with admission.turn() as degraded:
+                    await self._process_answer(user_text, duration, audio_bytes, degraded)
+            except Overloaded as e:
+                await self.send_event('error', **e.to_dict())
+
+    async def _process_answer(self, user_text, duration, audio_bytes, degraded=False):
+        try:
+            if audio_bytes is not None:
+                user_text = await transcribe_upload(self.session_id, audio_bytes)
+                if user_text:
+                    await self.send_event('transcript', text=user_text)
+            if not user_text:
+                await self.send_event('error', error='Could not understand audio')
+                return
+
+            with tracer.span('engine.process_answer'):
+                response_data, ai_text = resolve_turn(
+                    await engine.process_answer_async(self.session_id, user_text, duration, session=self.session,
+                                                      degraded=degraded))
+            if ai_text is None:
+                await self.send_event('error', **response_data)
+                return
+
+            await self._speak(turn_payload(user_text, ai_text, response_data, None), ai_text, audio=not degraded)
+        except Exception as e:
+            logger.error(f"Error processing channel answer: {e}")
+            await self.send_event('error', error=str(e))
+
+    async def _speak(self, payload, ai_text, audio=True):
+        """Sends a response event followed by its TTS audio as binary frames (none when text-only)."""
+        payload.pop('audio_base64', None)
+        async with self.send_lock:
+            await self.websocket.send_text(json.dumps({'type': 'response', **payload}))
+            if audio:
+                async for chunk in stream_audio_async(ai_text):
+                    await self.websocket.send_bytes(chunk)
+            await self.websocket.send_text(json.dumps({'type': 'audio_end'}))
+
+    async def _push_timer(self):
+        """Pushes the interview clock, and the summary once the Q&A phase is over."""
+        try:
+            while True:
+                await asyncio.sleep(CHANNEL_TIMER_INTERVAL)
+                await self.send_event('timer', **self._clock())
+
+                if self.session.get('interview_phase') == 'qa' and (self.turn is None or self.turn.done()):
+                    # The summary is an LLM call: keep it off the event loop
+                    try:
+                        summary = await run_in_thread(engine.advance_phase, self.session_id, self.session)
+                    except Exception:
+                        # Keep the clock running; the next tick checks the phase again
+                        logger.exception(f"Phase check failed for session {self.session_id}")
+                        continue
+                    if summary is not None:
+                        await self.send_event('phase', phase='summary')
+                        self.turn = asyncio.create_task(self._speak(
+                            turn_payload(None, summary['full_text'], summary, None), summary['full_text']))
+        except (WebSocketDisconnect, RuntimeError):
+            # Client went away; run() tears the channel down
+            pass
+        except Exception:
+            logger.exception(f"Interview timer stopped for session {self.session_id}")
+
+    async def _final_results(self):
+        semantic_data = await get_semantic_score_async(*final_score_inputs(self.session))
+        await self.send_event('final_result', **store_final_result(self.session_id, semantic_data))
+        await self.websocket.close()
+
+
+async def interview_channel(websocket):
+    """WebSocket /ws/interview?session_id=..."""
+    session_id = websocket.query_params.get('session_id')
+    session = memory.get_session(session_id)
+    if not session:
+        # Reject the handshake: unknown session
+        await websocket.close(code=4404)
+        return
+    await InterviewChannel(websocket, session_id, session).run()
+
+
+app = Starlette(routes=[
+    Route('/start_call_interview', start_call_interview, methods=['POST']),
+    Route('/process_voice', process_voice, methods=['POST']),
+    Route('/final_results', final_results, methods=['POST']),
+    WebSocketRoute('/ws/interview', interview_channel),
+    # Pages, resume and rendering routes stay on the sync Flask app
+    Mount('/', app=WsgiToAsgi(flask_app)),
+])
@@ -0,0 +1,248 @@
+"""
+Admission - Admission control and load shedding for interviews (per worker)
+Pressure is read from live load (interview requests in flight in this worker)
+and recent provider latency (p90 of the 'provider.groq' spans over a sliding
+window, fed by the tracer):
+
+- normal:    everything admitted, full turns
+- degraded:  turns of running interviews are served degraded (question bank
+             follow-up, no relevance or follow-up LLM call, no server TTS - the
+             browser speaks the text); new interviews wait in a virtual queue
+- shedding:  as degraded, and new interviews that are not already queued are rejected
+
+Running interviews keep priority: their turns are only refused past a hard
+in-flight cap. A new interview that is not admitted gets a queue ticket, its
+position and a wait estimate (503 + Retry-After); retrying with the ticket keeps
+its place. Nobody is held in a worker while waiting, so requests don't pile up
+in the listen backlog.
+
+Every ADMISSION_PROBE_EVERY-th degraded turn still runs in full, so the latency
+window keeps getting fresh samples and the level recovers once providers do.
+"""
+
+import os
+import math
+import time
+import uuid
+import logging
+import threading
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+from .tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_ENABLED = os.getenv('ADMISSION_ENABLED', '1') == '1'
+
+# In-flight interview requests (starts + turns) per worker
+DEGRADE_INFLIGHT = int(os.getenv('ADMISSION_DEGRADE_INFLIGHT', 32))
+SHED_INFLIGHT = int(os.getenv('ADMISSION_SHED_INFLIGHT', 64))
+# Hard cap on turns in flight; beyond it even running interviews are asked to retry
+MAX_TURNS_INFLIGHT = int(os.getenv('ADMISSION_MAX_TURNS', 128))
+
+# p90 provider latency (seconds) over the window
+DEGRADE_LATENCY = float(os.getenv('ADMISSION_DEGRADE_LATENCY', 4))
+SHED_LATENCY = float(os.getenv('ADMISSION_SHED_LATENCY', 10))
+LATENCY_WINDOW_SECONDS = float(os.getenv('ADMISSION_LATENCY_WINDOW', 30))
+PROVIDER_SPAN = 'provider.groq'
+
+QUEUE_LENGTH = int(os.getenv('ADMISSION_QUEUE_LENGTH', 200))
+PROBE_EVERY = int(os.getenv('ADMISSION_PROBE_EVERY', 10))
+# Queued tickets not retried within this long give up their place
+TICKET_TTL_SECONDS = 30
+MAX_RETRY_AFTER = 10
+TURN_RETRY_AFTER = 2
+
+# Pressure levels
+NORMAL = 'normal'
+DEGRADED = 'degraded'
+SHEDDING = 'shedding'
+LEVELS = (NORMAL, DEGRADED, SHEDDING)
+
+
+class Overloaded(Exception):
+    """Request not admitted; details go into the 503 response body"""
+
+    def __init__(self, message: str, retry_after: int, **details):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.details = details
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'error': str(self), 'retry_after': self.retry_after, **self.details}
+
+
+class AdmissionController:
+    """Decides whether interview requests run in full, degraded, queued or not at all"""
+
+    def __init__(self, enabled: bool = ADMISSION_ENABLED):
+        self.enabled = enabled
+        self.inflight = {'interview': 0, 'turn': 0}
+        self.latencies = deque(maxlen=256)  # (monotonic time, provider seconds)
+        self.queue = OrderedDict()  # ticket -> last seen (monotonic time)
+        self.turn_seconds = None  # Moving average of turn duration, for wait estimates
+        self.decisions = Counter()  # (kind, outcome) -> count
+        self._degraded_turns = 0
+        self._lock = threading.Lock()
+
+    def observe_provider(self, seconds: float):
+        """Record one provider call duration (registered as a tracer listener)"""
+        self.latencies.append((time.monotonic(), seconds))
+
+    def provider_latency(self) -> Optional[float]:
+        """p90 provider latency over the window, None without recent samples"""
+        horizon = time.monotonic() - LATENCY_WINDOW_SECONDS
+        recent = sorted(seconds for observed, seconds in list(self.latencies) if observed >= horizon)
+        if not recent:
+            return None
+        return recent[min(len(recent) - 1, math.ceil(0.9 * len(recent)) - 1)]
+
+    def level(self) -> str:
+        """Current pressure level"""
+        if not self.enabled:
+            return NORMAL
+        inflight = sum(self.inflight.values())
+        latency = self.provider_latency() or 0.0
+        if inflight >= SHED_INFLIGHT or latency >= SHED_LATENCY:
+            return SHEDDING
+        if inflight >= DEGRADE_INFLIGHT or latency >= DEGRADE_LATENCY:
+            return DEGRADED
+        return NORMAL
+
+    @contextmanager
+    def interview(self, ticket: Optional[str] = None):
+        """
+        Admit a new interview for the duration of the block
+
+        Args:
+            ticket: Queue ticket from an earlier Overloaded response, if any
+
+        Raises:
+            Overloaded: Queued (with ticket, position and wait estimate) or rejected
+        """
+        self._admit_interview(ticket)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.inflight['interview'] -= 1
+
+    def _admit_interview(self, ticket):
+        level = self.level()
+        now = time.monotonic()
+        with self._lock:
+            for expired in [t for t, seen in self.queue.items() if now - seen > TICKET_TTL_SECONDS]:
+                del self.queue[expired]
+
+            if ticket not in self.queue:
+                ticket = None
+            position = list(self.queue).index(ticket) if ticket else len(self.queue)
+            headroom = DEGRADE_INFLIGHT - sum(self.inflight.values()) if level == NORMAL else 0
+
+            if position < headroom:
+                self.queue.pop(ticket, None)
+                self.inflight['interview'] += 1
+                self.decisions[('interview', 'admitted')] += 1
+                return
+
+            wait = self._wait_estimate(position)
+            if ticket is None and (level == SHEDDING or len(self.queue) >= QUEUE_LENGTH):
+                self.decisions[('interview', 'rejected')] += 1
+                raise Overloaded("We're at capacity right now. Please try again in a little while.",
+                                 retry_after=MAX_RETRY_AFTER, estimated_wait_seconds=wait)
+
+            ticket = ticket or uuid.uuid4().hex
+            self.queue[ticket] = now  # Existing tickets keep their place
+            self.decisions[('interview', 'queued')] += 1
+            raise Overloaded("High demand right now - you're in the queue.",
+                             retry_after=max(1, min(wait, MAX_RETRY_AFTER)), queue_ticket=ticket,
+                             queue_position=position + 1, estimated_wait_seconds=wait)
+
+    def _wait_estimate(self, position: int) -> int:
+        # Slots free up about once per turn duration (or per slow provider call);
+        # everyone ahead needs one of DEGRADE_INFLIGHT slots
+        per_round = max(self.turn_seconds or 1.0, self.provider_latency() or 0.0)
+        return math.ceil(per_round * (1 + position / max(1, DEGRADE_INFLIGHT)))
+
+    @contextmanager
+    def turn(self):
+        """
+        Admit a turn of a running interview for the duration of the block
+
+        Yields:
+            True when the turn should be served degraded
+
+        Raises:
+            Overloaded: Past the hard in-flight cap (the client retries shortly)
+        """
+        level = self.level()
+        with self._lock:
+            if self.enabled and self.inflight['turn'] >= MAX_TURNS_INFLIGHT:
+                self.decisions[('turn', 'shed')] += 1
+                raise Overloaded("Server busy, retrying your answer.", retry_after=TURN_RETRY_AFTER)
+
+            degraded, outcome = False, 'admitted'
+            if level != NORMAL:
+                self._degraded_turns += 1
+                if PROBE_EVERY and self._degraded_turns % PROBE_EVERY == 0:
+                    outcome = 'probe'
+                else:
+                    degraded, outcome = True, 'degraded'
+            self.decisions[('turn', outcome)] += 1
+            self.inflight['turn'] += 1
+
+        started = time.monotonic()
+        try:
+            yield degraded
+        finally:
+            seconds = time.monotonic() - started
+            with self._lock:
+                self.inflight['turn'] -= 1
+                if not degraded:
+                    self.turn_seconds = seconds if self.turn_seconds is None else 0.8 * self.turn_seconds + 0.2 * seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        latency = self.provider_latency()
+        return {
+            'enabled': self.enabled,
+            'level': self.level(),
+            'inflight': dict(self.inflight),
+            'queue_length': len(self.queue),
+            'provider_latency_p90_ms': round(latency * 1000, 1) if latency is not None else None,
+            'turn_seconds_avg': round(self.turn_seconds, 2) if self.turn_seconds is not None else None,
+            'decisions': {f"{kind}.{outcome}": count for (kind, outcome), count in sorted(self.decisions.items())},
+        }
+
+    def render_prometheus(self) -> str:
+        """Admission state and decision counters in Prometheus text format"""
+        lines = [
+            '# HELP interview_admission_decisions_total Admission decisions by request kind and outcome',
+            '# TYPE interview_admission_decisions_total counter',
+        ]
+        for (kind, outcome), count in sorted(self.decisions.items()):
+            lines.append(f'interview_admission_decisions_total{{kind="{kind}",outcome="{outcome}"}} {count}')
+
+        lines.append('# HELP interview_admission_level Pressure level (0 normal, 1 degraded, 2 shedding)')
+        lines.append('# TYPE interview_admission_level gauge')
+        lines.append(f'interview_admission_level {LEVELS.index(self.level())}')
+        lines.append('# HELP interview_admission_inflight Interview requests in flight in this worker')
+        lines.append('# TYPE interview_admission_inflight gauge')
+        for kind, count in sorted(self.inflight.items()):
+            lines.append(f'interview_admission_inflight{{kind="{kind}"}} {count}')
+        lines.append('# HELP interview_admission_queue_length New interviews holding a queue ticket')
+        lines.append('# TYPE interview_admission_queue_length gauge')
+        lines.append(f'interview_admission_queue_length {len(self.queue)}')
+
+        latency = self.provider_latency()
+        if latency is not None:
+            lines.append('# HELP interview_admission_provider_latency_seconds p90 provider latency over the window')
+            lines.append('# TYPE interview_admission_provider_latency_seconds gauge')
+            lines.append(f'interview_admission_provider_latency_seconds {latency:.6f}')
+        return '\n'.join(lines) + '\n'
+
+
+# Singleton instance, fed by the provider spans
+admission = AdmissionController()
+tracer.add_listener(PROVIDER_SPAN, admission.observe_provider)
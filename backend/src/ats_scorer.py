@@ -0,0 +1,175 @@
+"""
+ATS Scorer - Deterministic local resume scoring
+Approximates the LLM analyzer's overall_score from structural signals (section
+presence, bullet density, action verbs, quantified impact, keyword coverage) so
+recreation drafts can be compared in milliseconds without an API call.
+"""
+
+import re
+import logging
+from typing import Dict, Any, Iterable, Optional
+
+from .resume_parser import SKILL_MATCHER, KeywordMatcher, segment_sections, extract_email, extract_phone
+
+logger = logging.getLogger(__name__)
+
+# Bump when weights or signals change so cached comparisons are not mixed
+SCORER_VERSION = "1"
+
+# Section weights for the formatting factor (sum to 100)
+SECTION_WEIGHTS = {
+    'experience': 30,
+    'skills': 25,
+    'education': 20,
+    'projects': 15,
+    'summary': 10,
+}
+
+# Overall score weights per factor, mirroring the analyzer's factor_scores
+FACTOR_WEIGHTS = {
+    'impact': 0.35,
+    'skills': 0.25,
+    'formatting': 0.25,
+    'brevity': 0.15,
+}
+
+# Targets at which a signal earns full marks
+TARGET_BULLETS = 12
+TARGET_SKILLS = 15
+IDEAL_WORDS = (350, 900)
+IDEAL_BULLET_WORDS = (8, 30)
+
+ACTION_VERBS = frozenset("""
+accelerated achieved added administered analyzed architected automated boosted built championed collaborated
+completed configured consolidated contributed coordinated created cut decreased delivered deployed designed
+developed devised directed drove eliminated enabled engineered enhanced established executed expanded facilitated
+founded generated grew guided handled identified implemented improved increased initiated integrated introduced
+launched led maintained managed mentored migrated modernized monitored negotiated optimized orchestrated organized
+overhauled owned partnered piloted planned produced programmed published redesigned reduced refactored resolved
+restructured revamped saved scaled secured shipped simplified spearheaded standardized streamlined strengthened
+supervised supported tested trained transformed tuned unified upgraded wrote
+""".split())
+
+_BULLET_RE = re.compile(r'^\s*(?:[-•*▪●◦]|\d+[.)])\s+(.*\S)')
+# Percentages, multipliers, currency and counts; bare years do not count as impact
+_QUANTIFIED_RE = re.compile(
+    r'\d+(?:\.\d+)?\s*(?:%|x\b|k\b|\+)|[$€£₹]\s?\d|\b(?!(?:19|20)\d{2}\b)\d[\d,]*(?:\.\d+)?\b'
+)
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z+#.'-]*")
+_LINKEDIN_RE = re.compile(r'linkedin\.com/', re.IGNORECASE)
+
+
+def _ramp(value: float, target: float) -> float:
+    """0..1 linear credit up to target"""
+    return min(1.0, value / target) if target > 0 else 1.0
+
+
+def _band(value: float, low: float, high: float) -> float:
+    """1.0 inside [low, high], falling off linearly to 0 at half/double the band"""
+    if value < low:
+        return max(0.0, (value - low / 2) / (low / 2))
+    if value > high:
+        return max(0.0, 1 - (value - high) / high)
+    return 1.0
+
+
+def score_resume(text: str, keywords: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Score a resume locally.
+
+    Args:
+        text: Resume text (plain or markdown)
+        keywords: Optional target keywords (e.g. from a job description); when
+                  given, coverage of these replaces part of the skill-count signal
+
+    Returns:
+        Dict with overall_score (0-100), factor_scores (impact, skills,
+        formatting, brevity; 0-100 each) and the raw signal counts
+    """
+    text = text or ''
+    sections = segment_sections(text)
+
+    # Bullets from experience/projects; the whole text when those are missing
+    body = '\n'.join(sections.get(name, '') for name in ('experience', 'projects', 'achievements')).strip() or text
+    bullets = [match.group(1) for match in map(_BULLET_RE.match, body.split('\n')) if match]
+    action_bullets = sum(1 for bullet in bullets if bullet.split(None, 1)[0].strip('*_,:').lower() in ACTION_VERBS)
+    quantified_bullets = sum(1 for bullet in bullets if _QUANTIFIED_RE.search(bullet))
+
+    skills = {skill for _, _, (_, skill) in SKILL_MATCHER.find_all(text)}
+    keyword_coverage = None
+    keywords = [keyword for keyword in (keywords or []) if keyword and keyword.strip()]
+    if keywords:
+        matcher = KeywordMatcher((keyword, keyword.lower()) for keyword in keywords)
+        found = {payload for _, _, payload in matcher.find_all(text)}
+        keyword_coverage = len(found) / len({keyword.lower() for keyword in keywords})
+
+    word_count = len(_WORD_RE.findall(text))
+    avg_bullet_words = (sum(len(bullet.split()) for bullet in bullets) / len(bullets)) if bullets else 0
+
+    has_contact = bool(extract_email(text)) + bool(extract_phone(text)) + bool(_LINKEDIN_RE.search(text))
+
+    # Factor scores (0-100)
+    bullet_count = len(bullets)
+    impact = 100 * (
+        0.45 * (quantified_bullets / bullet_count if bullet_count else 0)
+        + 0.30 * (action_bullets / bullet_count if bullet_count else 0)
+        + 0.25 * _ramp(bullet_count, TARGET_BULLETS)
+    )
+    skill_count_credit = _ramp(len(skills), TARGET_SKILLS)
+    if keyword_coverage is None:
+        skills_score = 100 * skill_count_credit
+    else:
+        skills_score = 100 * (0.6 * keyword_coverage + 0.4 * skill_count_credit)
+    section_credit = sum(weight for name, weight in SECTION_WEIGHTS.items() if sections.get(name))
+    formatting = 0.85 * section_credit + 5 * has_contact
+    brevity = 100 * (
+        0.6 * _band(word_count, *IDEAL_WORDS)
+        + 0.4 * (_band(avg_bullet_words, *IDEAL_BULLET_WORDS) if bullets else 0)
+    )
+
+    factor_scores = {
+        'impact': round(impact),
+        'skills': round(skills_score),
+        'formatting': round(formatting),
+        'brevity': round(brevity),
+    }
+    overall = sum(FACTOR_WEIGHTS[name] * value for name, value in factor_scores.items())
+
+    return {
+        'overall_score': int(round(max(0, min(100, overall)))),
+        'factor_scores': factor_scores,
+        'signals': {
+            'sections': sorted(name for name in sections if name != 'header'),
+            'bullets': bullet_count,
+            'action_verb_bullets': action_bullets,
+            'quantified_bullets': quantified_bullets,
+            'skills': len(skills),
+            'keyword_coverage': round(keyword_coverage, 3) if keyword_coverage is not None else None,
+            'word_count': word_count,
+            'avg_bullet_words': round(avg_bullet_words, 1),
+            'contact_fields': has_contact,
+        },
+        'scorer_version': SCORER_VERSION,
+    }
+
+
+def estimate_llm_score(candidate_text: str, baseline_text: str, baseline_llm_score: float,
+                       keywords: Optional[Iterable[str]] = None) -> float:
+    """
+    Project an LLM-scale score for a rewrite from the local score delta.
+
+    The local and LLM scales differ in offset, so the rewrite's estimate is the
+    baseline's known LLM score shifted by how much the local score moved.
+
+    Args:
+        candidate_text: Rewritten resume
+        baseline_text: Original resume
+        baseline_llm_score: The analyzer's score for the original
+        keywords: Optional target keywords (see score_resume)
+
+    Returns:
+        Estimated score, clamped to 0-100
+    """
+    keywords = list(keywords or [])
+    delta = score_resume(candidate_text, keywords)['overall_score'] - score_resume(baseline_text, keywords)['overall_score']
+    return max(0, min(100, baseline_llm_score + delta))
@@ -0,0 +1,160 @@
+"""
+Components - Lazily loaded heavy dependencies (models, renderers)
+Modules register a loader instead of loading at import time. A component loads
+on first use, or earlier in a warm-up; /ready reports each component's state.
+A load that raised is retried on a later get() once its backoff has passed, so
+a transient failure does not disable the feature until the worker restarts.
+
+With PRELOAD_MODELS=1 the app warms everything at import, so under gunicorn's
+preload_app the master loads the models once and forked workers share the
+read-only pages copy-on-write.
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, Any, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_MODELS = os.getenv('PRELOAD_MODELS', '0') == '1'
+
+# Backoff before retrying a failed load: doubles per consecutive failure, up to the max
+RETRY_SECONDS = float(os.getenv('COMPONENT_RETRY_SECONDS', 30))
+RETRY_MAX_SECONDS = float(os.getenv('COMPONENT_RETRY_MAX_SECONDS', 600))
+
+# Component states
+COLD = 'cold'
+LOADING = 'loading'
+READY = 'ready'
+UNAVAILABLE = 'unavailable'  # Loader returned None (optional dependency not installed)
+FAILED = 'failed'
+
+
+class Component:
+    """A named lazily loaded value"""
+
+    def __init__(self, name: str, loader: Callable[[], Any], warm: bool = True):
+        self.name = name
+        self.loader = loader
+        self.warm = warm
+        self.state = COLD
+        self.value = None
+        self.error = None
+        self.load_seconds = None
+        self.failures = 0  # Consecutive failed loads
+        self.retry_at = 0.0  # Monotonic time a failed load may be retried
+        self.lock = threading.Lock()
+
+    def settled(self, now: float) -> bool:
+        """True when get() should return the current value without (re)loading"""
+        return self.state in (READY, UNAVAILABLE) or (self.state == FAILED and now < self.retry_at)
+
+
+class ComponentRegistry:
+    """
+    Registry of lazily loaded components.
+    Each component loads once per process (failed loads are retried after a
+    backoff); concurrent first users wait for it.
+    """
+
+    def __init__(self):
+        self._components: Dict[str, Component] = {}
+        self._warm_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any], warm: bool = True):
+        """
+        Register a component
+
+        Args:
+            name: Component name
+            loader: Zero-argument callable returning the loaded value (None if unavailable)
+            warm: Include in warm-up (otherwise loaded only on first use)
+        """
+        if name not in self._components:
+            self._components[name] = Component(name, loader, warm)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a component, loading it on first use
+
+        Args:
+            name: Component name
+
+        Returns:
+            Loaded value, or None if unavailable or failed (until the retry backoff passes)
+        """
+        component = self._components[name]
+        if component.settled(time.monotonic()):
+            return component.value
+
+        with component.lock:
+            if not component.settled(time.monotonic()):
+                component.state = LOADING
+                started = time.perf_counter()
+                try:
+                    component.value = component.loader()
+                    component.state = READY if component.value is not None else UNAVAILABLE
+                    component.error = None
+                    component.failures = 0
+                except Exception as e:
+                    component.failures += 1
+                    backoff = min(RETRY_SECONDS * 2 ** (component.failures - 1), RETRY_MAX_SECONDS)
+                    logger.error(f"Failed to load component '{name}' (retry in {backoff:.0f}s): {e}")
+                    component.value = None
+                    component.error = str(e)
+                    component.state = FAILED
+                    component.retry_at = time.monotonic() + backoff
+                component.load_seconds = round(time.perf_counter() - started, 3)
+                logger.info(f"Component '{name}' {component.state} in {component.load_seconds}s")
+        return component.value
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, background: bool = True) -> Optional[threading.Thread]:
+        """
+        Load components ahead of first use
+
+        Args:
+            names: Components to load (default: all registered with warm=True)
+            background: Load in a daemon thread instead of blocking
+
+        Returns:
+            The warm-up thread when background, else None
+        """
+        if names is None:
+            names = [name for name, component in self._components.items() if component.warm]
+        names = list(names)
+
+        def load_all():
+            for name in names:
+                self.get(name)
+
+        if not background:
+            load_all()
+            return None
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return self._warm_thread
+        self._warm_thread = threading.Thread(target=load_all, name='component-warmup', daemon=True)
+        self._warm_thread.start()
+        return self._warm_thread
+
+    def is_ready(self) -> bool:
+        """True once every warm-up component has finished loading (successfully or not)"""
+        # A retry of a failed load does not take the worker out of rotation
+        return all(component.state not in (COLD, LOADING) or component.failures
+                   for component in self._components.values() if component.warm)
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-component state, load time and error"""
+        return {
+            name: {
+                'state': component.state,
+                'load_seconds': component.load_seconds,
+                **({'error': component.error} if component.error else {})
+            }
+            for name, component in self._components.items()
+        }
+
+
+# Singleton instance
+components = ComponentRegistry()
@@ -3,7 +3,6 @@ DOCX Resume Generator
 Converts Markdown resume content to formatted Word documents.
 """
 import io
-import re
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -11,71 +10,16 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 import logging
 
-logger = logging.getLogger(__name__)
-
-class ResumeParser:
-    def __init__(self, markdown_text):
-        self.markdown = markdown_text
-        self.sections = {}
-        self.parse()
-
-    def parse(self):
-        lines = self.markdown.split('\n')
-        current_section = None
-        content_lines = []
-        
-        def save_section():
-            if current_section and content_lines:
-                self.sections[current_section] = '\n'.join(content_lines).strip()
+from .resume_ast import parse_resume
 
-        # Extract name (first line with #)
-        name_match = re.search(r'^#\s+(.+)', self.markdown, re.MULTILINE)
-        self.sections['name'] = name_match.group(1).strip() if name_match else 'Your Name'
-
-        # Extract title (first bold text **)
-        title_match = re.search(r'\*\*(.+?)\*\*', self.markdown)
-        self.sections['title'] = title_match.group(1).strip() if title_match else ''
-
-        # Extract contact info
-        self.sections['contact'] = self.extract_contact()
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith('## '):
-                save_section()
-                raw_name = line[3:].strip().lower()
-                current_section = re.sub(r'\s+', '_', raw_name)
-                content_lines = []
-            elif current_section:
-                content_lines.append(line)
-        
-        save_section()
+logger = logging.getLogger(__name__)
 
-    def extract_contact(self):
-        contact = {}
-        email_match = re.search(r'([a-zA-Z0-9._-]+@[a-zA-Z0-9._-]+\.[a-zA-Z0-9_-]+)', self.markdown)
-        if email_match: contact['email'] = email_match.group(1)
-            
-        phone_match = re.search(r'(\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})', self.markdown)
-        if phone_match: contact['phone'] = phone_match.group(1)
-            
-        linkedin_match = re.search(r'(linkedin\.com\/in\/[^\s)]+)', self.markdown)
-        if linkedin_match: contact['linkedin'] = linkedin_match.group(1)
-            
-        location_match = re.search(r'([A-Z][a-z]+,\s*[A-Z]{2}|[A-Z][a-z]+,\s*[A-Z][a-z]+)', self.markdown)
-        if location_match: contact['location'] = location_match.group(1)
-            
-        return contact
-        
-    def get_section(self, keys):
-        if isinstance(keys, str): keys = [keys]
-        for key in keys:
-            if key in self.sections: return self.sections[key]
-        return ""
+# Bump when rendering output changes so cached documents are invalidated
+GENERATOR_VERSION = "1"
 
-def markdown_to_docx(markdown_text, template_id='modern'):
+def markdown_to_docx(markdown_text, template_id='modern', resume=None):
     document = Document()
-    parser = ResumeParser(markdown_text)
+    resume = resume if resume is not None else parse_resume(markdown_text)
     
     # Configure Styles
     styles = {
@@ -87,42 +31,24 @@ def markdown_to_docx(markdown_text, template_id='modern'):
     }
     current_style = styles.get(template_id, styles['template-1'])
     
-    # Helper to add markdown content
-    def add_markdown_content(container, text, bold_color=None):
-        if not text: return
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line: continue
-            
+    # Helper to add parsed section blocks
+    def add_markdown_content(container, blocks, bold_color=None):
+        for block in blocks:
             p = container.add_paragraph()
             p.paragraph_format.space_after = Pt(2)
             
-            if line.startswith('### '):
-                run = p.add_run(line[4:])
+            if block.kind == 'heading':
+                run = p.add_run(block.text)
                 run.bold = True
                 run.font.size = Pt(11)
-            elif line.startswith('- ') or line.startswith('* '):
+                continue
+            if block.kind == 'bullet':
                 p.style = 'List Bullet'
-                content = line[2:]
-                # Basic bold parsing
-                parts = re.split(r'(\*\*.*?\*\*)', content)
-                for part in parts:
-                    if part.startswith('**') and part.endswith('**'):
-                        r = p.add_run(part[2:-2])
-                        r.bold = True
-                        if bold_color: r.font.color.rgb = bold_color
-                    else:
-                        p.add_run(part)
-            else:
-                 # Basic bold parsing
-                parts = re.split(r'(\*\*.*?\*\*)', line)
-                for part in parts:
-                    if part.startswith('**') and part.endswith('**'):
-                        r = p.add_run(part[2:-2])
-                        r.bold = True
-                        if bold_color: r.font.color.rgb = bold_color
-                    else:
-                        p.add_run(part)
+            for span in block.spans:
+                r = p.add_run(span.text)
+                if span.bold:
+                    r.bold = True
+                    if bold_color: r.font.color.rgb = bold_color
 
     def add_section_header(container, text, color=None):
         p = container.add_paragraph()
@@ -143,23 +69,23 @@ def markdown_to_docx(markdown_text, template_id='modern'):
     
     header = document.add_paragraph()
     header.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    name_run = header.add_run(parser.sections['name'] + "\n")
+    name_run = header.add_run(resume.name + "\n")
     name_run.bold = True
     name_run.font.size = Pt(24)
     name_run.font.color.rgb = current_style['header_color']
     
-    title_run = header.add_run(parser.sections['title'])
+    title_run = header.add_run(resume.title)
     title_run.font.size = Pt(14)
     title_run.font.color.rgb = RGBColor(100, 100, 100)
 
     # 2. Layouts
     
-    sections = parser.sections
-    summary = parser.get_section(['summary', 'professional_summary'])
-    skills = parser.get_section(['skills', 'technical_skills'])
-    experience = parser.get_section(['experience', 'work_experience'])
-    education = parser.get_section(['education'])
-    contact = parser.sections['contact']
+    # Exact section names only (no fuzzy matching), as DOCX exports have always done
+    summary = resume.get_blocks(['summary', 'professional_summary'], fuzzy=False)
+    skills = resume.get_blocks(['skills', 'technical_skills'], fuzzy=False)
+    experience = resume.get_blocks(['experience', 'work_experience'], fuzzy=False)
+    education = resume.get_blocks(['education'], fuzzy=False)
+    contact = resume.contact
 
     contact_text = '\n'.join([v for v in contact.values() if v])
 
@@ -1,8 +1,11 @@
 import asyncio
 import logging
 import os
+import time
 import edge_tts
 
+from .tracing import tracer, run_in_thread
+
 logger = logging.getLogger(__name__)
 
 # Voice Options (Indian Female voices for smooth interaction)
@@ -14,6 +17,7 @@ logger = logging.getLogger(__name__)
 # en-US-SaraNeural (Female, Conversational)
 DEFAULT_VOICE = "en-US-JennyNeural"  # US female voice (very smooth, friendly & natural) for interviews
 
+@tracer.traced('tts.edge')
 async def generate_audio_edge(text, output_path, voice=DEFAULT_VOICE):
     """
     Generates audio using edge-tts library and saves to file.
@@ -61,6 +65,17 @@ def generate_audio_sync(text, output_path, voice=DEFAULT_VOICE):
             logger.error(f"gTTS fallback also failed: {gtts_error}")
             return False
 
+async def generate_audio_async(text, output_path, voice=DEFAULT_VOICE):
+    """
+    Async counterpart of generate_audio_sync for the ASGI server: awaits Edge TTS
+    on the running loop; the gTTS fallback runs in a thread.
+    """
+    if await generate_audio_edge(text, output_path, voice):
+        return True
+    logger.warning("Edge TTS failed, falling back to gTTS")
+    return await run_in_thread(generate_audio_gtts, text, output_path)
+
+@tracer.traced('tts.gtts')
 def generate_audio_gtts(text, output_path):
     """
     Fallback TTS using Google Text-to-Speech (gTTS).
@@ -87,6 +102,7 @@ def generate_audio_gtts(text, output_path):
         logger.error(f"gTTS Generation Error: {e}")
         return False
 
+@tracer.traced('tts.edge')
 async def generate_audio_memory_edge(text, voice=DEFAULT_VOICE):
     """
     Generates audio bytes in-memory using edge-tts.
@@ -135,6 +151,42 @@ def generate_audio_memory_sync(text, voice=DEFAULT_VOICE):
             logger.error(f"gTTS memory fallback also failed: {gtts_error}")
             return None
 
+async def generate_audio_memory_async(text, voice=DEFAULT_VOICE):
+    """
+    Async counterpart of generate_audio_memory_sync for the ASGI server.
+    """
+    result = await generate_audio_memory_edge(text, voice)
+    if result:
+        return result
+    logger.warning("Edge TTS memory generation failed, falling back to gTTS")
+    return await run_in_thread(generate_audio_gtts_memory, text)
+
+async def stream_audio_async(text, voice=DEFAULT_VOICE):
+    """
+    Yields MP3 chunks as Edge TTS produces them (WebSocket channel), so playback
+    data reaches the client before synthesis finishes. Falls back to a single
+    gTTS chunk if Edge TTS yields nothing.
+    """
+    sent = False
+    started = time.perf_counter()
+    try:
+        communicate = edge_tts.Communicate(text, voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio" and chunk["data"]:
+                if not sent:
+                    tracer.observe('tts.edge_first_chunk', time.perf_counter() - started)
+                sent = True
+                yield chunk["data"]
+    except Exception as e:
+        logger.error(f"Edge TTS Stream Error: {e}")
+    
+    if not sent:
+        logger.warning("Edge TTS stream failed, falling back to gTTS")
+        audio_data = await run_in_thread(generate_audio_gtts_memory, text)
+        if audio_data:
+            yield audio_data
+
+@tracer.traced('tts.gtts')
 def generate_audio_gtts_memory(text):
     """
     Fallback TTS using gTTS for in-memory generation.
@@ -1,14 +1,17 @@
 import os
 import logging
+import re
 import json
 import requests
 from .prompts import SYSTEM_INSTRUCTION
+from .tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 # Configure Groq API
 API_KEY = os.getenv("GROQ_API_KEY") or os.getenv("GROK_API_KEY") or os.getenv("XAI_API_KEY")
-BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
+BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1/chat/completions")
+REQUEST_TIMEOUT = float(os.getenv("GROQ_TIMEOUT", 30))
 
 if not API_KEY:
     logger.warning("GROQ_API_KEY not found in environment variables.")
@@ -16,11 +19,8 @@ else:
     logger.info("GROQ API Key loaded successfully")
 
 
-def generate_response(prompt):
-    """Generates a response from Grok using REST API."""
-    if not API_KEY:
-        return {"reaction": "Error", "follow_up_question": "API Key missing.", "score": 0, "feedback": "Config Error"}
-
+def _follow_up_request(prompt):
+    """Headers and JSON payload for the interview follow-up call."""
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {API_KEY}"
@@ -35,25 +35,79 @@ def generate_response(prompt):
         "temperature": 0.7,
         "response_format": {"type": "json_object"}
     }
+    return headers, payload
+
+def _parse_follow_up(result):
+    """Parses the follow-up JSON out of a chat completion response."""
+    try:
+        text_content = result['choices'][0]['message']['content']
+        return json.loads(text_content)
+    except (KeyError, IndexError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to parse Grok response: {e}. Raw: {result}")
+        return {"reaction": "I see.", "follow_up_question": "Could you elaborate?", "score": 5, "feedback": "Parse Error"}
+
+@tracer.traced('provider.groq')
+def generate_response(prompt):
+    """Generates a response from Grok using REST API."""
+    if not API_KEY:
+        return {"reaction": "Error", "follow_up_question": "API Key missing.", "score": 0, "feedback": "Config Error"}
+
+    headers, payload = _follow_up_request(prompt)
     
     try:
-        response = requests.post(BASE_URL, headers=headers, json=payload)
+        response = requests.post(BASE_URL, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
-        result = response.json()
-        
-        # Parse Grok response
+        return _parse_follow_up(response.json())
+            
+    except Exception as e:
+        logger.error(f"Grok API Error: {e}")
+        return {"reaction": "Hmm...", "follow_up_question": "Let's continue.", "score": 0, "feedback": "API Error"}
+
+_async_session = None
+
+async def _get_async_session():
+    """Shared aiohttp session (one per worker's event loop), reusing connections across turns."""
+    global _async_session
+    import aiohttp
+    if _async_session is None or _async_session.closed:
+        _async_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT))
+    return _async_session
+
+@tracer.traced('provider.groq')
+async def generate_response_async(prompt):
+    """
+    Async generate_response for the ASGI server. Without a Groq key it uses the
+    free AI provider manager when providers are registered.
+    """
+    if not API_KEY:
+        from .ai_provider_manager import ai_manager
+        if not ai_manager.providers:
+            return {"reaction": "Error", "follow_up_question": "API Key missing.", "score": 0, "feedback": "Config Error"}
         try:
-            text_content = result['choices'][0]['message']['content']
-            return json.loads(text_content)
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
-            logger.error(f"Failed to parse Grok response: {e}. Raw: {result}")
-            return {"reaction": "I see.", "follow_up_question": "Could you elaborate?", "score": 5, "feedback": "Parse Error"}
+            json_prompt = f"{prompt}\n\nIMPORTANT: Respond with ONLY a valid JSON object containing: reaction, follow_up_question, score, and feedback fields."
+            text_content = await ai_manager.get_response(json_prompt, SYSTEM_INSTRUCTION)
+            json_match = re.search(r'\{.*\}', text_content, re.DOTALL)
+            return json.loads(json_match.group() if json_match else text_content)
+        except Exception as e:
+            logger.error(f"Free AI Error: {e}")
+            return {"reaction": "Hmm...", "follow_up_question": "Let's continue.", "score": 0, "feedback": "API Error"}
+
+    headers, payload = _follow_up_request(prompt)
+    
+    try:
+        session = await _get_async_session()
+        async with session.post(BASE_URL, headers=headers, json=payload) as response:
+            response.raise_for_status()
+            result = await response.json()
+        
+        return _parse_follow_up(result)
             
     except Exception as e:
         logger.error(f"Grok API Error: {e}")
         return {"reaction": "Hmm...", "follow_up_question": "Let's continue.", "score": 0, "feedback": "API Error"}
 
+@tracer.traced('provider.groq')
 def generate_text_response(prompt):
     """Generates a plain text response (non-JSON)."""
     if not API_KEY:
@@ -3,16 +3,18 @@ import logging
 import json
 import requests
 from .prompts import SYSTEM_INSTRUCTION
+from .tracing import tracer
 
 logger = logging.getLogger(__name__)
 
 # Configure Groq
 API_KEY = os.getenv("GEMINI_API_KEY")  # Using same env var for simplicity
-BASE_URL = "https://api.groq.com/openai/v1/chat/completions"
+BASE_URL = os.getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1/chat/completions")
 
 if not API_KEY:
     logger.warning("GROQ API KEY not found in environment variables.")
 
+@tracer.traced('provider.groq')
 def generate_response(prompt):
     """Generates a response from Groq using OpenAI-compatible API."""
     if not API_KEY:
@@ -52,6 +54,7 @@ def generate_response(prompt):
         logger.error(f"Groq API Error: {e}")
         return {"reaction": "Hmm...", "follow_up_question": "Let's continue.", "score": 0, "feedback": "API Error"}
 
+@tracer.traced('provider.groq')
 def generate_text_response(prompt):
     """Generates a plain text response (non-JSON)."""
     if not API_KEY:
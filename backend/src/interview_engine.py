@@ -1,9 +1,11 @@
 import logging
 from datetime import datetime
-from .grok_client import generate_response
+from .grok_client import generate_response, generate_response_async
 from .prompts import FOLLOW_UP_PROMPT_TEMPLATE, INTERVIEW_MODES, PERFORMANCE_SUMMARY_PROMPT
 from .memory_store import memory
-from .scoring import calculate_local_metrics
+from .scoring import calculate_local_metrics, session_averages
+from .tracing import tracer, run_in_thread
+from .question_selector import question_selector
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +14,9 @@ logger = logging.getLogger(__name__)
 INTERVIEW_DURATION_MINUTES = 5  # Total interview time
 QA_PHASE_MINUTES = 2  # Q&A phase duration (summary triggers after this)
 
+# Feedback the provider clients return on a failed call (generic follow-up, score 0 or 5)
+PROVIDER_ERROR_FEEDBACK = ("API Error", "Parse Error")
+
 class InterviewEngine:
     def __init__(self):
         pass
@@ -47,23 +52,22 @@ class InterviewEngine:
         job_role = session.get("job_role", "Not specified")
         company = session.get("company", "Not specified")
         history = session.get("history", [])
-        scores = session.get("scores", [])
-        analyses = session.get("analyses", [])
         
         # Build transcript
         transcript = "\n".join([f"{h['role'].upper()}: {h['content']}" for h in history])
         
-        # Calculate performance metrics
-        avg_local_score = sum(s.get("local_score", 0) for s in scores) / max(1, len(scores))
-        avg_ai_score = sum(s.get("ai_score", 0) for s in scores) / max(1, len(scores))
-        avg_confidence = sum(s.get("confidence_score", 0) for s in scores) / max(1, len(scores))
+        # Calculate performance metrics from the running aggregates
+        averages = session_averages(memory.get_aggregates(session_id))
+        avg_local_score = averages["avg_local_score"]
+        avg_ai_score = averages["avg_ai_score"]
+        avg_confidence = averages["avg_confidence"]
         
         performance_metrics = f"""Average Scores:
 - Local Score: {avg_local_score:.1f}/10
 - AI Score: {avg_ai_score:.1f}/10
 - Confidence: {avg_confidence:.1f}/100
-- Total Questions: {len([h for h in history if h['role'] == 'ai'])}
-- Total Responses: {len([h for h in history if h['role'] == 'user'])}
+- Total Questions: {averages["total_questions"]}
+- Total Responses: {averages["total_responses"]}
 """
         
         # Generate summary using AI
@@ -105,7 +109,7 @@ Keep practicing and you'll continue to improve. Best of luck in your job search!
             "elapsed_seconds": elapsed_seconds
         }
 
-    def process_answer(self, session_id, user_audio_text, audio_duration=None):
+    def process_answer(self, session_id, user_audio_text, audio_duration=None, degraded=False):
         """
         Main logic pipeline with real-time analysis:
         1. Retrieve session context.
@@ -114,40 +118,83 @@ Keep practicing and you'll continue to improve. Best of luck in your job search!
         4. Send context + answer to AI for analysis & next question.
         5. Update session state (difficulty, history).
         6. Return AI response (text) for TTS with real-time feedback.
+        degraded: under load shedding, skip the LLM calls (relevance check,
+        follow-up) and ask a question bank follow-up instead.
+        """
+        result, turn = self._prepare_turn(session_id, user_audio_text, audio_duration, degraded=degraded)
+        if turn is None:
+            return result
+        if degraded:
+            ai_data = self._bank_follow_up(turn, "Degraded mode")
+        else:
+            with tracer.span('llm.follow_up'):
+                ai_data = generate_response(turn["prompt"])
+        return self._complete_turn(turn, ai_data)
+    
+    async def process_answer_async(self, session_id, user_audio_text, audio_duration=None, session=None,
+                                   degraded=False):
+        """
+        Same pipeline as process_answer, awaiting the AI call on the running
+        event loop (ASGI mode) instead of blocking a worker on it. The answer
+        analysis and the (blocking) relevance LLM call run in a worker thread,
+        so other connections keep being served meanwhile.
+        session: the session dict, when the caller already holds it (WebSocket channel)
+        """
+        result, turn = await run_in_thread(self._prepare_turn, session_id, user_audio_text, audio_duration,
+                                           session, degraded)
+        if turn is None:
+            return result
+        if degraded:
+            ai_data = self._bank_follow_up(turn, "Degraded mode")
+        else:
+            with tracer.span('llm.follow_up'):
+                ai_data = await generate_response_async(turn["prompt"])
+        return self._complete_turn(turn, ai_data)
+    
+    def advance_phase(self, session_id, session):
+        """
+        Moves the session to the summary phase once the Q&A time is up.
+        Returns the performance summary on that transition, else None.
         """
-        from .audio_analyzer import analyze_answer
-        from .mistake_detector import analyze_mistakes
-        from .question_packs import get_company_style_prompt, get_questions_for_role
-        
-        session = memory.get_session(session_id)
-        if not session:
-            return {"error": "Session not found"}
-        
-        # Check interview phase
         phase, elapsed_seconds = self.check_interview_phase(session)
         
         # If we've reached summary phase, generate performance summary
         if phase == 'summary' and session.get('interview_phase') != 'summary':
             memory.update_session(session_id, 'interview_phase', 'summary')
             return self.generate_performance_summary(session_id, elapsed_seconds)
+        return None
+    
+    def _prepare_turn(self, session_id, user_audio_text, audio_duration=None, session=None, degraded=False):
+        """
+        Steps 1-3: analyze the answer and build the AI prompt (no prompt when degraded).
+        Returns (result, None) when the turn ends without an AI call
+        (unknown session, summary phase), else (None, turn state).
+        """
+        from .audio_analyzer import analyze_answer
+        from .mistake_detector import analyze_mistakes
+        
+        session = session or memory.get_session(session_id)
+        if not session:
+            return {"error": "Session not found"}, None
+        
+        summary = self.advance_phase(session_id, session)
+        if summary is not None:
+            return summary, None
 
-        mode = session.get("mode", "HR")
-        job_role = session.get("job_role", "")
-        company = session.get("company", "")
         history = session.get("history", [])
-        resume_context = session.get("resume_context", {})
         last_question = history[-1]['content'] if history and history[-1]['role'] == 'ai' else "Tell me about yourself"
         
         # Real-time audio analysis
-        audio_analysis = analyze_answer(user_audio_text, audio_duration, language='en')
+        with tracer.span('engine.audio_analysis'):
+            audio_analysis = analyze_answer(user_audio_text, audio_duration, language='en')
         
-        # Mistake detection
-        mistake_analysis = analyze_mistakes(last_question, user_audio_text, audio_duration)
+        # Mistake detection (includes the relevance LLM call unless degraded)
+        with tracer.span('engine.mistake_detection'):
+            mistake_analysis = analyze_mistakes(last_question, user_audio_text, audio_duration,
+                                                check_relevance=not degraded)
         
         # Store analysis in session
-        if 'analyses' not in session:
-            session['analyses'] = []
-        session['analyses'].append({
+        memory.add_analysis(session_id, {
             'audio': audio_analysis,
             'mistakes': mistake_analysis,
             'timestamp': str(datetime.now())
@@ -162,7 +209,48 @@ Keep practicing and you'll continue to improve. Best of luck in your job search!
         adjusted_score -= len(mistake_analysis['all_feedback']) * 0.5  # -0.5 per mistake
         adjusted_score = max(0, min(10, adjusted_score))
         
+        # Local follow-up: the question for degraded turns, prefetched as the LLM fallback
+        with tracer.span('engine.local_question'):
+            local_question = question_selector.select(session, adjusted_score)
+        
         # 2. Construct Prompt with real-time feedback + role/company context + resume context
+        prompt = None
+        if not degraded:
+            prompt = self.build_follow_up_prompt(session, user_audio_text, audio_analysis, mistake_analysis)
+        
+        return None, {
+            "session_id": session_id,
+            "session": session,
+            "prompt": prompt,
+            "user_text": user_audio_text,
+            "adjusted_score": adjusted_score,
+            "audio_analysis": audio_analysis,
+            "local_question": local_question,
+            "degraded": degraded
+        }
+    
+    def build_follow_up_prompt(self, session, user_audio_text, audio_analysis, mistake_analysis):
+        """
+        Builds the follow-up prompt: role/company context, resume details, topic
+        coverage and real-time feedback on the answer.
+        
+        Args:
+            session: Session dict
+            user_audio_text: The candidate's answer
+            audio_analysis: analyze_answer() result for the answer
+            mistake_analysis: analyze_mistakes() result for the answer
+            
+        Returns:
+            Prompt text
+        """
+        from .question_packs import get_company_style_prompt, get_questions_for_role
+        
+        mode = session.get("mode", "HR")
+        job_role = session.get("job_role", "")
+        company = session.get("company", "")
+        history = session.get("history", [])
+        resume_context = session.get("resume_context", {})
+        
         history_summary = "\n".join([f"{h['role']}: {h['content']}" for h in history[-6:]])
         
         # Add role context
@@ -299,7 +387,7 @@ Real-time Analysis:
 - Issues Detected: {', '.join(mistake_analysis['all_feedback']) if mistake_analysis['all_feedback'] else 'None'}
 """
         
-        prompt = FOLLOW_UP_PROMPT_TEMPLATE.format(
+        return FOLLOW_UP_PROMPT_TEMPLATE.format(
             mode=INTERVIEW_MODES.get(mode, "Standard Interview"),
             role_context=role_context,
             company_context=company_context,
@@ -314,36 +402,47 @@ Real-time Analysis:
             last_answer=user_audio_text,
             multilingual_note="**IMPORTANT**: If the candidate responds in Hindi or Marathi, respond in the SAME language."
         )
+    
+    def _bank_follow_up(self, turn, feedback):
+        """
+        Follow-up picked locally from the question bank, without an AI call
+        (mock mode, load shedding). Reports the resume topic it covers, so
+        topic tracking works as for AI follow-ups.
+        """
+        import random
+        
+        mock_reactions = ["I see.", "That's interesting.", "Okay, understood.", "Thanks for sharing that."]
+        ai_data = {
+            "reaction": random.choice(mock_reactions),
+            "follow_up_question": "Could you tell me more about your experience?",
+            "score": turn["adjusted_score"],
+            "feedback": feedback
+        }
         
-        # 3. AI Call
-        ai_data = generate_response(prompt)
+        local_question = turn.get("local_question")
+        if local_question:
+            question_selector.mark_asked(turn["session"], local_question)
+            ai_data["follow_up_question"] = local_question["question"]
+            if local_question["topic"]:
+                ai_data["topic"] = local_question["topic"]
+        return ai_data
+    
+    def _complete_turn(self, turn, ai_data):
+        """
+        Steps 4-6: apply the AI response (ai_data) to the session and build the reply.
+        """
+        session_id = turn["session_id"]
+        session = turn["session"]
+        user_audio_text = turn["user_text"]
+        adjusted_score = turn["adjusted_score"]
+        audio_analysis = turn["audio_analysis"]
         
         # Mock Mode Fallback
         if ai_data.get("reaction") == "Error" or "API Key missing" in ai_data.get("follow_up_question", ""):
-            import random
-            
-            # Use role-specific questions if available
-            if job_role:
-                role_questions = get_questions_for_role(job_role, 5)
-                mock_questions = role_questions if role_questions else [
-                    "Could you tell me more about your experience?",
-                    "What was the most challenging project you've worked on?",
-                ]
-            else:
-                mock_questions = [
-                    "Could you tell me more about your experience?",
-                    "What was the most challenging project you've worked on?",
-                    "How do you handle tight deadlines?",
-                ]
-            
-            mock_reactions = ["I see.", "That's interesting.", "Okay, understood.", "Thanks for sharing that."]
-            
-            ai_data = {
-                "reaction": random.choice(mock_reactions),
-                "follow_up_question": random.choice(mock_questions),
-                "score": adjusted_score,
-                "feedback": "Mock mode active"
-            }
+            ai_data = self._bank_follow_up(turn, "Mock mode active")
+        elif ai_data.get("feedback") in PROVIDER_ERROR_FEEDBACK:
+            # Provider failed: ask the prefetched local question, scored locally
+            ai_data = self._bank_follow_up(turn, "Provider unavailable")
         
         # Add gentle real-time tips to AI response
         real_time_tips = []
@@ -437,6 +536,7 @@ Real-time Analysis:
             "difficulty": session.get("difficulty", "Normal"),
             "phase": "qa",
             "elapsed_seconds": elapsed_seconds,
+            "degraded": turn.get("degraded", False),
             "real_time_feedback": {
                 "confidence": audio_analysis['confidence_level'],
                 "pace": audio_analysis['pace_category'],
@@ -0,0 +1,350 @@
+"""
+Job Queue - SQLite-backed background jobs for long-running AI work
+Web requests enqueue a job and return its id in milliseconds; a worker pool runs
+the handler, records progress events, and keeps the result for polling.
+The database is shared, so any gunicorn worker can serve status requests.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv(
+    'JOB_DB_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'jobs.sqlite3')
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    status TEXT NOT NULL,
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    payload TEXT,
+    result TEXT,
+    error TEXT,
+    owner TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    progress INTEGER NOT NULL,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id, ts);
+"""
+
+
+class JobError(Exception):
+    """Raised by handlers to fail a job with a user-facing message"""
+
+
+class JobQueue:
+    """
+    Persistent job queue with a local worker pool.
+    Statuses: queued -> running -> done | error
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, workers=4, retention=86400, stale_after=900, poll_interval=0.5):
+        """
+        Initialize job queue
+
+        Args:
+            db_path: SQLite database file (shared by all processes)
+            workers: Worker threads started in this process
+            retention: Seconds finished jobs (and their idempotency keys) are kept
+            stale_after: Seconds without a progress update before a running job is requeued
+            poll_interval: Seconds idle workers wait before checking for jobs from other processes
+        """
+        self.db_path = db_path
+        self.workers = workers
+        self.retention = retention
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.handlers: Dict[str, Callable] = {}
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._threads = []
+        self._start_lock = threading.Lock()
+        self._stopping = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+        logger.info(f"Job queue initialized (db={db_path}, workers={workers})")
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any], Callable[[int, str], None]], Any]):
+        """
+        Register a handler for a job kind
+
+        Args:
+            kind: Job type name
+            handler: Callable(payload, report) returning a JSON-serializable result.
+                     report(progress_percent, message) records a progress event.
+        """
+        self.handlers[kind] = handler
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], idempotency_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a job, or return the existing one for the same idempotency key
+
+        Args:
+            kind: Registered job type
+            payload: JSON-serializable handler input
+            idempotency_key: Requests with the same key share one job until it expires or fails
+
+        Returns:
+            Job status dict (see get)
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        self._purge_expired()
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        scoped_key = f"{kind}:{idempotency_key}" if idempotency_key else None
+
+        existing_id = None
+        with self._transaction() as conn:
+            if scoped_key:
+                row = conn.execute("SELECT id, status FROM jobs WHERE idempotency_key = ?", (scoped_key,)).fetchone()
+                if row and row['status'] != 'error':
+                    existing_id = row['id']
+                elif row:
+                    # A failed job must not block retries with the same key
+                    conn.execute("UPDATE jobs SET idempotency_key = NULL WHERE id = ?", (row['id'],))
+            if existing_id is None:
+                conn.execute(
+                    "INSERT INTO jobs (id, kind, idempotency_key, status, progress, message, payload, created_at, updated_at) "
+                    "VALUES (?, ?, ?, 'queued', 0, 'Queued', ?, ?, ?)",
+                    (job_id, kind, scoped_key, json.dumps(payload), now, now)
+                )
+                conn.execute("INSERT INTO job_events (job_id, ts, progress, message) VALUES (?, ?, 0, 'Queued')",
+                             (job_id, now))
+
+        if existing_id is not None:
+            logger.info(f"Reusing {kind} job {existing_id} for idempotency key")
+            return self.get(existing_id)
+
+        self._ensure_workers()
+        self._wakeup.set()
+        logger.info(f"Enqueued {kind} job {job_id}")
+        return self.get(job_id)
+
+    def get(self, job_id: str, include_events: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get job status
+
+        Returns:
+            Dict with id, kind, status, progress, message, result/error and events, or None
+        """
+        conn = self._connection()
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = {
+            "job_id": row['id'],
+            "kind": row['kind'],
+            "status": row['status'],
+            "progress": row['progress'],
+            "message": row['message'],
+            "created_at": row['created_at'],
+            "updated_at": row['updated_at'],
+            "finished_at": row['finished_at'],
+        }
+        if row['status'] == 'done':
+            job['result'] = json.loads(row['result']) if row['result'] else None
+        elif row['status'] == 'error':
+            job['error'] = row['error']
+
+        if include_events:
+            job['events'] = [
+                {"ts": event['ts'], "progress": event['progress'], "message": event['message']}
+                for event in conn.execute(
+                    "SELECT ts, progress, message FROM job_events WHERE job_id = ? ORDER BY ts", (job_id,)
+                )
+            ]
+        return job
+
+    def run_pending(self, limit: Optional[int] = None) -> int:
+        """
+        Run queued jobs on the calling thread (used by tests and scripts)
+
+        Returns:
+            Number of jobs processed
+        """
+        processed = 0
+        while limit is None or processed < limit:
+            job = self._claim_next()
+            if job is None:
+                break
+            self._execute(job)
+            processed += 1
+        return processed
+
+    def stop(self):
+        """Signal worker threads to exit after their current job"""
+        self._stopping = True
+        self._wakeup.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts by status"""
+        conn = self._connection()
+        counts = {row['status']: row['n'] for row in conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")}
+        return {
+            'queued': counts.get('queued', 0),
+            'running': counts.get('running', 0),
+            'done': counts.get('done', 0),
+            'error': counts.get('error', 0),
+            'workers': len(self._threads)
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE so check-then-write sequences are atomic across processes"""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _ensure_workers(self):
+        with self._start_lock:
+            if self._threads or self.workers <= 0:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            logger.info(f"Started {self.workers} job workers ({self.owner})")
+
+    def _worker_loop(self):
+        while not self._stopping:
+            try:
+                job = self._claim_next()
+            except sqlite3.Error as e:
+                logger.error(f"Job claim failed: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._execute(job)
+
+    def _claim_next(self) -> Optional[sqlite3.Row]:
+        """Atomically move the oldest queued (or stale running) job to running"""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' OR (status = 'running' AND updated_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now - self.stale_after,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row['status'] == 'running':
+                logger.warning(f"Requeuing stale job {row['id']} (owner {row['owner']})")
+            conn.execute(
+                "UPDATE jobs SET status = 'running', owner = ?, updated_at = ?, message = 'Started' WHERE id = ?",
+                (self.owner, now, row['id'])
+            )
+            return row
+
+    def _execute(self, row: sqlite3.Row):
+        job_id, kind = row['id'], row['kind']
+        handler = self.handlers.get(kind)
+
+        def report(progress: int, message: str):
+            self._record_progress(job_id, progress, message)
+
+        started = time.time()
+        try:
+            if handler is None:
+                raise JobError(f"No handler registered for '{kind}'")
+            report(5, "Started")
+            result = handler(json.loads(row['payload'] or '{}'), report)
+            self._finish(job_id, 'done', result=result)
+            logger.info(f"Job {job_id} ({kind}) done in {time.time() - started:.1f}s")
+        except Exception as e:
+            if not isinstance(e, JobError):
+                logger.error(f"Job {job_id} ({kind}) failed: {e}", exc_info=True)
+            self._finish(job_id, 'error', error=str(e))
+
+    def _record_progress(self, job_id: str, progress: int, message: str):
+        now = time.time()
+        progress = max(0, min(100, int(progress)))
+        with self._transaction() as conn:
+            conn.execute("UPDATE jobs SET progress = ?, message = ?, updated_at = ? WHERE id = ?",
+                         (progress, message, now, job_id))
+            conn.execute("INSERT INTO job_events (job_id, ts, progress, message) VALUES (?, ?, ?, ?)",
+                         (job_id, now, progress, message))
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None):
+        now = time.time()
+        message = 'Completed' if status == 'done' else 'Failed'
+        with self._transaction() as conn:
+            if status == 'done':
+                progress = 100
+            else:
+                row = conn.execute("SELECT progress FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                progress = row['progress'] if row else 0
+            conn.execute(
+                "UPDATE jobs SET status = ?, progress = ?, message = ?, result = ?, error = ?, "
+                "updated_at = ?, finished_at = ? WHERE id = ?",
+                (status, progress, message, json.dumps(result) if status == 'done' else None,
+                 error, now, now, job_id)
+            )
+            conn.execute("INSERT INTO job_events (job_id, ts, progress, message) VALUES (?, ?, ?, ?)",
+                         (job_id, now, progress, error or message))
+
+    def _purge_expired(self):
+        cutoff = time.time() - self.retention
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM job_events WHERE job_id IN "
+                         "(SELECT id FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?)", (cutoff,))
+            conn.execute("DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,))
+
+
+# Singleton instance
+job_queue = JobQueue(workers=int(os.getenv('JOB_WORKERS', 4)))
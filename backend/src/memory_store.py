@@ -2,6 +2,38 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _new_aggregates():
+    """Running totals kept alongside the raw session lists."""
+    return {
+        "version": 0,  # Bumped on every recorded turn; keys the memoized results
+        "score_count": 0,
+        "local_score_sum": 0.0,
+        "ai_score_sum": 0.0,
+        "confidence_sum": 0.0,
+        "local_score_min": None,
+        "local_score_max": None,
+        "ai_score_min": None,
+        "ai_score_max": None,
+        "performance_trend": [],
+        "analysis_count": 0,
+        "filler_total": 0,
+        "pace_count": 0,
+        "pace_sum": 0.0,
+        "pace_min": None,
+        "pace_max": None,
+        "unique_issues": {},  # dict used as an insertion-ordered set
+        "unique_tips": {},
+        "role_counts": {},
+    }
+
+
+def _track_min_max(aggregates, name, value):
+    low, high = aggregates[f"{name}_min"], aggregates[f"{name}_max"]
+    aggregates[f"{name}_min"] = value if low is None else min(low, value)
+    aggregates[f"{name}_max"] = value if high is None else max(high, value)
+
+
 class MemoryStore:
     def __init__(self):
         self.sessions = {}
@@ -18,6 +50,7 @@ class MemoryStore:
             "mode": "HR",
             "difficulty": 1,
             "scores": [],
+            "analyses": [],
             "emotional_state": "neutral",
             "metadata": {},
             # New fields for resume-based personalized interviews
@@ -25,6 +58,9 @@ class MemoryStore:
             "resume_topics": [],
             "topic_question_count": {},  # Track questions asked per topic
             "total_questions_asked": 0,  # Total questions counter
+            # Incrementally maintained totals so results never rescan the lists
+            "aggregates": _new_aggregates(),
+            "results_memo": None,
         }
         logger.info(f"Session {session_id} created.")
 
@@ -39,20 +75,41 @@ class MemoryStore:
             return True
         return False
 
+    def get_aggregates(self, session_id):
+        """Return the running aggregates for a session (None if unknown)."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        if "aggregates" not in session:
+            self._rebuild_aggregates(session)
+        return session["aggregates"]
+
     def add_history(self, session_id, role, content):
         """Add a message to the conversation history."""
         if session_id in self.sessions:
+            aggregates = self.get_aggregates(session_id)
             self.sessions[session_id]["history"].append({
                 "role": role,
                 "content": content
             })
-    
+            aggregates["role_counts"][role] = aggregates["role_counts"].get(role, 0) + 1
+            aggregates["version"] += 1
+
     def add_score(self, session_id, score_data):
         """Add a score entry to the session."""
         if session_id in self.sessions:
+            aggregates = self.get_aggregates(session_id)
             if "scores" not in self.sessions[session_id]:
                 self.sessions[session_id]["scores"] = []
             self.sessions[session_id]["scores"].append(score_data)
+            self._apply_score(aggregates, score_data)
+
+    def add_analysis(self, session_id, analysis_data):
+        """Add a per-turn audio/mistake analysis entry to the session."""
+        if session_id in self.sessions:
+            aggregates = self.get_aggregates(session_id)
+            self.sessions[session_id].setdefault("analyses", []).append(analysis_data)
+            self._apply_analysis(aggregates, analysis_data)
 
     def delete_session(self, session_id):
         """Remove a session."""
@@ -60,5 +117,47 @@ class MemoryStore:
             del self.sessions[session_id]
             logger.info(f"Session {session_id} deleted.")
 
+    def _apply_score(self, aggregates, score_data):
+        local_score = score_data.get("local_score", 0) or 0
+        ai_score = score_data.get("ai_score", 0) or 0
+        aggregates["score_count"] += 1
+        aggregates["local_score_sum"] += local_score
+        aggregates["ai_score_sum"] += ai_score
+        aggregates["confidence_sum"] += score_data.get("confidence_score", 0) or 0
+        _track_min_max(aggregates, "local_score", local_score)
+        _track_min_max(aggregates, "ai_score", ai_score)
+        aggregates["performance_trend"].append(ai_score * 10)
+        aggregates["version"] += 1
+
+    def _apply_analysis(self, aggregates, analysis_data):
+        audio = analysis_data.get("audio", {}) or {}
+        aggregates["analysis_count"] += 1
+        aggregates["filler_total"] += audio.get("filler_count", 0) or 0
+
+        pace = audio.get("speaking_pace")
+        if pace is not None and pace > 0:
+            aggregates["pace_count"] += 1
+            aggregates["pace_sum"] += pace
+            _track_min_max(aggregates, "pace", pace)
+
+        for issue in audio.get("issues", []) or []:
+            aggregates["unique_issues"][issue] = None
+        for tip in audio.get("tips", []) or []:
+            aggregates["unique_tips"][tip] = None
+        aggregates["version"] += 1
+
+    def _rebuild_aggregates(self, session):
+        """Recompute aggregates from the raw lists (sessions created before aggregates existed)."""
+        aggregates = _new_aggregates()
+        for entry in session.get("history", []):
+            role = entry.get("role")
+            aggregates["role_counts"][role] = aggregates["role_counts"].get(role, 0) + 1
+        for score_data in session.get("scores", []):
+            self._apply_score(aggregates, score_data)
+        for analysis_data in session.get("analyses", []):
+            self._apply_analysis(aggregates, analysis_data)
+        session["aggregates"] = aggregates
+        return aggregates
+
 # Global instance
 memory = MemoryStore()
@@ -5,6 +5,7 @@ Detects rambling, off-topic answers, and provides content analysis
 
 import re
 from .groq_client import generate_text_response
+from .tracing import tracer
 
 class MistakeDetector:
     """Detects common interview mistakes in answers"""
@@ -99,7 +100,8 @@ class MistakeDetector:
         """
         
         try:
-            response = generate_text_response(prompt)
+            with tracer.span('llm.relevance'):
+                response = generate_text_response(prompt)
             score = float(response.strip())
             result['relevance_score'] = max(0.0, min(1.0, score))
             
@@ -157,7 +159,7 @@ class MistakeDetector:
         
         return result
     
-    def detect_all_mistakes(self, question, answer, duration_seconds=None):
+    def detect_all_mistakes(self, question, answer, duration_seconds=None, check_relevance=True):
         """
         Comprehensive mistake detection
         
@@ -165,13 +167,15 @@ class MistakeDetector:
             question: Interview question
             answer: User's answer
             duration_seconds: Duration of answer (optional)
+            check_relevance: Run the AI relevance check (skipped under load shedding)
             
         Returns:
             dict with all detected mistakes and feedback
         """
         mistakes = {
             'rambling': self.detect_rambling(answer),
-            'relevance': self.check_relevance(question, answer),
+            'relevance': (self.check_relevance(question, answer) if check_relevance
+                          else {'is_relevant': True, 'relevance_score': 1.0, 'feedback': None}),
             'structure': self.analyze_structure(answer),
             'all_feedback': [],
             'severity': 'none'  # none, low, medium, high
@@ -202,7 +206,7 @@ class MistakeDetector:
 
 
 # Helper function
-def analyze_mistakes(question, answer, duration_seconds=None):
+def analyze_mistakes(question, answer, duration_seconds=None, check_relevance=True):
     """
     Quick mistake analysis
     
@@ -210,9 +214,10 @@ def analyze_mistakes(question, answer, duration_seconds=None):
         question: Interview question
         answer: User's answer
         duration_seconds: Duration of answer
+        check_relevance: Run the AI relevance check
         
     Returns:
         Mistake analysis dict
     """
     detector = MistakeDetector()
-    return detector.detect_all_mistakes(question, answer, duration_seconds)
+    return detector.detect_all_mistakes(question, answer, duration_seconds, check_relevance)
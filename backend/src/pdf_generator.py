@@ -1,7 +1,8 @@
 import os
-import re
 import logging
 import io
+from functools import lru_cache
+from types import MappingProxyType
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import (
@@ -14,239 +15,217 @@ from reportlab.lib.units import mm
 from reportlab.pdfgen import canvas
 from reportlab.platypus import FrameBreak
 
+from .resume_ast import parse_resume
+from .template_registry import (registry, DEFAULT_RENDER_TEMPLATE, LAYOUT_SIDEBAR_LEFT, LAYOUT_SPLIT,
+                                LAYOUT_SIDEBAR_RIGHT)
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
-class ResumeParser:
-    def __init__(self, markdown_text):
-        self.markdown = markdown_text
-        self.sections = {}
-        self.parse()
+# Bump when rendering output changes so cached documents are invalidated
+GENERATOR_VERSION = "1"
 
-    def parse(self):
-        lines = self.markdown.split('\n')
-        current_section = None
-        content_lines = []
-        
-        def save_section():
-            if current_section and content_lines:
-                self.sections[current_section] = '\n'.join(content_lines).strip()
-
-        # Extract name (first line with #)
-        name_match = re.search(r'^#\s+(.+)', self.markdown, re.MULTILINE)
-        self.sections['name'] = name_match.group(1).strip() if name_match else 'Your Name'
-
-        # Extract title (first bold text **)
-        title_match = re.search(r'\*\*(.+?)\*\*', self.markdown)
-        self.sections['title'] = title_match.group(1).strip() if title_match else ''
-
-        # Extract contact info
-        self.sections['contact'] = self.extract_contact()
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith('## '):
-                save_section()
-                raw_name = line[3:].strip().lower()
-                current_section = re.sub(r'\s+', '_', raw_name)
-                content_lines = []
-            elif current_section:
-                content_lines.append(line)
-        
-        save_section()
+# ---------------------------------------------------------------------------
+# Per-template layout cache
+# Stylesheets, color maps and frame geometry depend only on template_id, so they
+# are built once per process and shared (read-only) by every render.
+# ---------------------------------------------------------------------------
 
-    def extract_contact(self):
-        contact = {}
-        email_match = re.search(r'([a-zA-Z0-9._-]+@[a-zA-Z0-9._-]+\.[a-zA-Z0-9_-]+)', self.markdown)
-        if email_match: contact['email'] = email_match.group(1)
-            
-        phone_match = re.search(r'(\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})', self.markdown)
-        if phone_match: contact['phone'] = phone_match.group(1)
-            
-        linkedin_match = re.search(r'(linkedin\.com\/in\/[^\s)]+)', self.markdown)
-        if linkedin_match: contact['linkedin'] = linkedin_match.group(1)
-            
-        location_match = re.search(r'([A-Z][a-z]+,\s*[A-Z]{2}|[A-Z][a-z]+,\s*[A-Z][a-z]+)', self.markdown)
-        if location_match: contact['location'] = location_match.group(1)
-            
-        return contact
+class FrameSpec:
+    """Immutable frame geometry; Frames themselves hold layout state and are created per build"""
+    __slots__ = ('args', 'kwargs')
+
+    def __init__(self, x, y, width, height, **kwargs):
+        self.args = (x, y, width, height)
+        self.kwargs = tuple(sorted(kwargs.items()))
+
+    def build(self):
+        return Frame(*self.args, **dict(self.kwargs))
+
+
+class TemplateLayout:
+    """Cached styles, colors and page frame geometry for one template_id"""
+    __slots__ = ('template_id', 'family', 'styles', 'colors', 'first_page_frames', 'later_page_frames')
+
+    def __init__(self, template_id, family, styles, colors, first_page_frames, later_page_frames):
+        self.template_id = template_id
+        self.family = family
+        self.styles = styles
+        self.colors = MappingProxyType(colors)
+        self.first_page_frames = tuple(first_page_frames)
+        self.later_page_frames = tuple(later_page_frames)
+
+
+def _to_color(value):
+    return colors.HexColor(value) if value.startswith('#') else getattr(colors, value)
+
+
+def _template_colors(descriptor):
+    """Color map for a template: base colors plus the descriptor's overrides"""
+    template_colors = {
+        'primary': colors.black,
+        'secondary': colors.grey,
+        'accent': colors.lightgrey,
+        'text': colors.black,
+        'bg_sidebar': colors.white
+    }
+    template_colors.update((key, _to_color(value)) for key, value in descriptor.colors.items())
+    return template_colors
+
+
+def _template_styles(template_colors):
+    """Stylesheet with the custom paragraph styles for a color map"""
+    styles = getSampleStyleSheet()
+
+    # Create Custom Paragraph Styles
+    styles.add(ParagraphStyle(
+        name='NameTitle', 
+        fontName='Helvetica-Bold', 
+        fontSize=24, 
+        leading=28,
+        textColor=template_colors.get('header_text', template_colors['primary'])
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='RoleTitle',
+        fontName='Helvetica',
+        fontSize=14,
+        leading=18,
+        textColor=template_colors.get('header_text', template_colors['secondary'])
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        fontName='Helvetica-Bold',
+        fontSize=16,
+        leading=20,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor=template_colors['primary'],
+        textTransform='uppercase'
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SidebarHeader',
+        parent=styles['SectionHeader'],
+        fontSize=14,
+        textColor=template_colors.get('text_sidebar', template_colors['primary'])
+    ))
+
+    styles.add(ParagraphStyle(
+        name='SidebarText',
+        fontName='Helvetica',
+        fontSize=10,
+        leading=14,
+        textColor=template_colors.get('text_sidebar', colors.black)
+    ))
+
+    styles.add(ParagraphStyle(
+        name='MainText',
+        fontName='Helvetica',
+        fontSize=10,
+        leading=14,
+        textColor=colors.black
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='JobTitle',
+        fontName='Helvetica-Bold',
+        fontSize=12,
+        leading=14,
+        spaceBefore=8,
+        textColor=colors.black
+    ))
+
+    styles.add(ParagraphStyle('ContactLine', parent=styles['Normal'], alignment=TA_CENTER))
+    return styles
+
+
+def _template_frames(family):
+    """(first page, later pages) frame geometry for a layout family"""
+    # 1. Sidebar Left (Templates 1 & 4)
+    frames_sidebar_left = [
+        FrameSpec(0, 0, 70*mm, 297*mm, leftPadding=10*mm, rightPadding=5*mm, topPadding=10*mm, bottomPadding=10*mm, id='sidebar'),
+        FrameSpec(70*mm, 0, 140*mm, 297*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, bottomPadding=10*mm, id='main')
+    ]
+    
+    # 2. Split (Template 2) - Header then Split
+    frames_split = [
+        FrameSpec(0, 250*mm, 210*mm, 47*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, bottomPadding=0, id='header'),
+        FrameSpec(0, 0, 130*mm, 250*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='main'),
+        FrameSpec(130*mm, 0, 80*mm, 250*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='sidebar')
+    ]
+    
+    # 3. Sidebar Right (Template 5) - Header then Main/Sidebar
+    frames_sidebar_right = [
+        FrameSpec(0, 260*mm, 210*mm, 37*mm, leftPadding=10*mm, topPadding=5*mm, id='header'),
+        FrameSpec(0, 0, 140*mm, 260*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='main'),
+        FrameSpec(140*mm, 0, 70*mm, 260*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=20*mm, id='sidebar')
+    ]
+    
+    # 4. Single Column (Template 3)
+    frames_single = [FrameSpec(10*mm, 10*mm, 190*mm, 277*mm, id='main')]
+
+    # 5. Generic FULL PAGE Main Frame (For Page 2+ overflow)
+    # Positioned to align with the 'main' column of the first page to maintain visual continuity
+    return {
+        LAYOUT_SIDEBAR_LEFT: (frames_sidebar_left, [FrameSpec(70*mm, 10*mm, 140*mm, 277*mm, leftPadding=10*mm, rightPadding=10*mm, id='main')]),
+        LAYOUT_SPLIT: (frames_split, [FrameSpec(10*mm, 10*mm, 130*mm, 277*mm, leftPadding=0, rightPadding=10*mm, id='main')]),
+        LAYOUT_SIDEBAR_RIGHT: (frames_sidebar_right, [FrameSpec(10*mm, 10*mm, 140*mm, 277*mm, leftPadding=0, rightPadding=10*mm, id='main')]),
+    }.get(family, (frames_single, frames_single))
+
+
+def get_template_layout(template_id):
+    """
+    Get the shared layout for a template, building it on first use.
+
+    Args:
+        template_id: Template identifier (unknown ids get the default template's layout)
+
+    Returns:
+        TemplateLayout (treat styles as read-only)
+    """
+    # Resolved first so client-supplied ids cannot grow the cache
+    if registry.get_render_template(template_id) is None:
+        template_id = DEFAULT_RENDER_TEMPLATE
+    return _build_template_layout(template_id)
+
+
+@lru_cache(maxsize=64)
+def _build_template_layout(template_id):
+    descriptor = registry.get_render_template(template_id)
+    template_colors = _template_colors(descriptor)
+    first_page_frames, later_page_frames = _template_frames(descriptor.layout)
+    return TemplateLayout(template_id, descriptor.layout, _template_styles(template_colors), template_colors,
+                          first_page_frames, later_page_frames)
+
+
+get_template_layout.cache_clear = _build_template_layout.cache_clear
 
-    def get_section(self, keys):
-        """Get section content with flexible matching"""
-        if isinstance(keys, str): keys = [keys]
-        
-        # Try exact match first
-        for key in keys:
-            if key in self.sections:
-                return self.sections[key]
-        
-        # Try lowercase match
-        for key in keys:
-            key_lower = key.lower().replace(' ', '_')
-            if key_lower in self.sections:
-                return self.sections[key_lower]
-        
-        # Try partial match (contains)
-        for key in keys:
-            key_lower = key.lower()
-            for section_name in self.sections.keys():
-                if key_lower in section_name or section_name in key_lower:
-                    return self.sections[section_name]
-        
-        # Try common variations
-        variation_map = {
-            'experience': ['professional_experience', 'work_experience', 'employment', 'work_history'],
-            'skills': ['technical_skills', 'core_competencies', 'key_skills', 'expertise'],
-            'education': ['academic_background', 'qualifications', 'academic_qualifications'],
-            'projects': ['key_projects', 'notable_projects', 'project_experience'],
-            'summary': ['professional_summary', 'profile', 'about', 'professional_profile'],
-            'certifications': ['certificates', 'professional_certifications']
-        }
-        
-        for key in keys:
-            key_lower = key.lower().replace(' ', '_')
-            if key_lower in variation_map:
-                for variation in variation_map[key_lower]:
-                    if variation in self.sections:
-                        return self.sections[variation]
-        
-        return ""
 
 class PDFGenerator:
-    def __init__(self, markdown_text, template_id='modern'):
-        self.parser = ResumeParser(markdown_text)
+    def __init__(self, markdown_text, template_id='modern', document=None):
+        # A document parsed by the caller (e.g. shared across a template gallery) skips the parse
+        self.document = document if document is not None else parse_resume(markdown_text)
         self.template_id = template_id
-        self.styles = getSampleStyleSheet()
-        self.setup_styles()
-
-    def setup_styles(self):
-        """Define custom styles based on template"""
-        # Base colors
-        self.colors = {
-            'primary': colors.black,
-            'secondary': colors.grey,
-            'accent': colors.lightgrey,
-            'text': colors.black,
-            'bg_sidebar': colors.white
-        }
-
-        # Template Specific Colors
-        if self.template_id in ['template-1', 'template-8', 'template-9']: # Dark Sidebar
-            self.colors['bg_sidebar'] = colors.HexColor('#1f2a33')
-            self.colors['text_sidebar'] = colors.white
-            self.colors['primary'] = colors.HexColor('#1f2a33')
-            self.colors['header_text'] = colors.white
-            
-        elif self.template_id == 'template-2': # Split Column
-            self.colors['primary'] = colors.black
-            self.colors['header_bg'] = colors.black
-            self.colors['header_text'] = colors.white
-            
-        elif self.template_id in ['template-3', 'template-6', 'template-7', 'template-10', 'template-13', 'template-14']: # Single / Simple
-            self.colors['primary'] = colors.HexColor('#333333')
-            
-        elif self.template_id == 'template-4': # Teal
-            self.colors['bg_sidebar'] = colors.HexColor('#004d40')
-            self.colors['text_sidebar'] = colors.HexColor('#e0f2f1')
-            self.colors['primary'] = colors.HexColor('#004d40')
-            self.colors['accent'] = colors.HexColor('#80cbc4')
-            self.colors['header_text'] = colors.white
-            
-        elif self.template_id in ['template-5', 'template-15']: # Blue Header
-            self.colors['header_bg'] = colors.HexColor('#0b4ea2') if self.template_id == 'template-5' else colors.HexColor('#2c3e50')
-            self.colors['header_text'] = colors.white
-            self.colors['primary'] = self.colors['header_bg']
-            self.colors['bg_sidebar'] = colors.HexColor('#f8f9fa')
-            
-        elif self.template_id in ['template-11', 'template-12']: # Mint Sidebar
-            self.colors['bg_sidebar'] = colors.HexColor('#E6EDE9')
-            self.colors['text_sidebar'] = colors.black
-            self.colors['primary'] = colors.HexColor('#6B8E23') if self.template_id == 'template-11' else colors.black
-            self.colors['header_text'] = colors.black
-
-        # Create Custom Paragraph Styles
-        self.styles.add(ParagraphStyle(
-            name='NameTitle', 
-            fontName='Helvetica-Bold', 
-            fontSize=24, 
-            leading=28,
-            textColor=self.colors.get('header_text', self.colors['primary'])
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='RoleTitle',
-            fontName='Helvetica',
-            fontSize=14,
-            leading=18,
-            textColor=self.colors.get('header_text', self.colors['secondary'])
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            fontName='Helvetica-Bold',
-            fontSize=16,
-            leading=20,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=self.colors['primary'],
-            textTransform='uppercase'
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='SidebarHeader',
-            parent=self.styles['SectionHeader'],
-            fontSize=14,
-            textColor=self.colors.get('text_sidebar', self.colors['primary'])
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='SidebarText',
-            fontName='Helvetica',
-            fontSize=10,
-            leading=14,
-            textColor=self.colors.get('text_sidebar', colors.black)
-        ))
-
-        self.styles.add(ParagraphStyle(
-            name='MainText',
-            fontName='Helvetica',
-            fontSize=10,
-            leading=14,
-            textColor=colors.black
-        ))
-        
-        self.styles.add(ParagraphStyle(
-            name='JobTitle',
-            fontName='Helvetica-Bold',
-            fontSize=12,
-            leading=14,
-            spaceBefore=8,
-            textColor=colors.black
-        ))
-
-    def md_to_flowables(self, text, style_name='MainText'):
-        """Convert markdown text to ReportLab flowables"""
-        if not text: return []
-        
+        self.layout = get_template_layout(template_id)
+        self.styles = self.layout.styles
+        self.colors = self.layout.colors
+
+    def md_to_flowables(self, blocks, style_name='MainText'):
+        """Convert parsed section blocks to ReportLab flowables"""
         flowables = []
         style = self.styles[style_name]
         
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line: continue
-            
-            if line.startswith('### '):
-                flowables.append(Paragraph(line[4:], self.styles['JobTitle']))
-            elif line.startswith('- ') or line.startswith('* '):
-                # Handle bullets
-                bullet_text = line[2:]
-                # Bold processing within text
-                bullet_text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', bullet_text)
-                
-                flowables.append(Paragraph(f"• {bullet_text}", style))
+        for block in blocks:
+            if block.kind == 'heading':
+                flowables.append(Paragraph(block.text, self.styles['JobTitle']))
+                continue
+            # Bold spans become <b> markup
+            text_content = ''.join(f"<b>{span.text}</b>" if span.bold else span.text for span in block.spans)
+            if block.kind == 'bullet':
+                flowables.append(Paragraph(f"• {text_content}", style))
             else:
-                text_content = line
-                text_content = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text_content)
                 flowables.append(Paragraph(text_content, style))
         
         return flowables
@@ -255,12 +234,12 @@ class PDFGenerator:
         """Draw background colors for sidebars/headers"""
         canvas.saveState()
         
-        if self.template_id in ['template-1', 'template-8', 'template-9']:
-            # Dark Left Sidebar
+        if self.layout.family == LAYOUT_SIDEBAR_LEFT:
+            # Full-height Left Sidebar (dark, teal or mint)
             canvas.setFillColor(self.colors['bg_sidebar'])
             canvas.rect(0, 0, 70*mm, 297*mm, fill=1, stroke=0)
             
-        elif self.template_id == 'template-2':
+        elif self.layout.family == LAYOUT_SPLIT:
             # Header Band
             canvas.setFillColor(self.colors['header_bg'])
             canvas.rect(0, 250*mm, 210*mm, 47*mm, fill=1, stroke=0)
@@ -268,12 +247,7 @@ class PDFGenerator:
             canvas.setFillColor(colors.HexColor('#fafafa'))
             canvas.rect(130*mm, 0, 80*mm, 250*mm, fill=1, stroke=0)
             
-        elif self.template_id == 'template-4':
-            # Teal Left Sidebar
-            canvas.setFillColor(self.colors['bg_sidebar'])
-            canvas.rect(0, 0, 70*mm, 297*mm, fill=1, stroke=0)
-            
-        elif self.template_id in ['template-5', 'template-15']:
+        elif self.layout.family == LAYOUT_SIDEBAR_RIGHT:
             # Blue Header Band
             canvas.setFillColor(self.colors['header_bg'])
             canvas.rect(0, 260*mm, 210*mm, 37*mm, fill=1, stroke=0)
@@ -281,11 +255,6 @@ class PDFGenerator:
             canvas.setFillColor(self.colors['bg_sidebar'])
             # Draw a rect for the sidebar area, but with margins
             canvas.rect(140*mm, 20*mm, 60*mm, 230*mm, fill=1, stroke=0)
-
-        elif self.template_id in ['template-11', 'template-12']:
-            # Mint Left Sidebar
-            canvas.setFillColor(self.colors['bg_sidebar'])
-            canvas.rect(0, 0, 70*mm, 297*mm, fill=1, stroke=0)
             
         canvas.restoreState()
 
@@ -295,86 +264,39 @@ class PDFGenerator:
         
         from reportlab.platypus import NextPageTemplate
 
-        # --- Frames & Templates Definition ---
-        
-        # 1. Sidebar Left (Templates 1 & 4)
-        frames_sidebar_left = [
-            Frame(0, 0, 70*mm, 297*mm, leftPadding=10*mm, rightPadding=5*mm, topPadding=10*mm, bottomPadding=10*mm, id='sidebar'),
-            Frame(70*mm, 0, 140*mm, 297*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, bottomPadding=10*mm, id='main')
+        # --- Page Templates (frame geometry is cached per template) ---
+        templates = [
+            PageTemplate(id='FirstPage', frames=[spec.build() for spec in self.layout.first_page_frames],
+                         onPage=self.draw_background),
+            # Second Page Template (Simple Main Column), background kept for consistency
+            PageTemplate(id='SecondPage', frames=[spec.build() for spec in self.layout.later_page_frames],
+                         onPage=self.draw_background)
         ]
         
-        # 2. Split (Template 2) - Header then Split
-        frames_split = [
-            Frame(0, 250*mm, 210*mm, 47*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, bottomPadding=0, id='header'),
-            Frame(0, 0, 130*mm, 250*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='main'),
-            Frame(130*mm, 0, 80*mm, 250*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='sidebar')
-        ]
-        
-        # 3. Sidebar Right (Template 5) - Header then Main/Sidebar
-        frames_sidebar_right = [
-            Frame(0, 260*mm, 210*mm, 37*mm, leftPadding=10*mm, topPadding=5*mm, id='header'),
-            Frame(0, 0, 140*mm, 260*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=10*mm, id='main'),
-            Frame(140*mm, 0, 70*mm, 260*mm, leftPadding=10*mm, rightPadding=10*mm, topPadding=20*mm, id='sidebar')
-        ]
-        
-        # 4. Single Column (Template 3)
-        frames_single = [Frame(10*mm, 10*mm, 190*mm, 277*mm, id='main')]
-
-        # 5. Generic FULL PAGE Main Frame (For Page 2+ overflow)
-        # Positioned to align with the 'main' column of the first page to maintain visual continuity,
-        # or full width if preferred. Let's align with main column.
-        
-        frames_page2 = frames_single # Default
-        if self.template_id in ['template-1', 'template-4', 'template-8', 'template-9', 'template-11', 'template-12']:
-            frames_page2 = [Frame(70*mm, 10*mm, 140*mm, 277*mm, leftPadding=10*mm, rightPadding=10*mm, id='main')]
-        elif self.template_id == 'template-2':
-             frames_page2 = [Frame(10*mm, 10*mm, 130*mm, 277*mm, leftPadding=0, rightPadding=10*mm, id='main')]
-        elif self.template_id in ['template-5', 'template-15']:
-             frames_page2 = [Frame(10*mm, 10*mm, 140*mm, 277*mm, leftPadding=0, rightPadding=10*mm, id='main')]
-
-
-        # Register Templates
-        templates = []
-        
-        # First Page Template
-        if self.template_id in ['template-1', 'template-4', 'template-8', 'template-9', 'template-11', 'template-12']:
-            templates.append(PageTemplate(id='FirstPage', frames=frames_sidebar_left, onPage=self.draw_background))
-        elif self.template_id == 'template-2':
-            templates.append(PageTemplate(id='FirstPage', frames=frames_split, onPage=self.draw_background))
-        elif self.template_id in ['template-5', 'template-15']:
-            templates.append(PageTemplate(id='FirstPage', frames=frames_sidebar_right, onPage=self.draw_background))
-        else:
-            templates.append(PageTemplate(id='FirstPage', frames=frames_single, onPage=self.draw_background))
-            
-        # Second Page Template (Simple Main Column)
-        # Note: onPage=self.draw_background is included to keep the sidebar background if desired,
-        # but usually page 2 is cleaner. Let's keep background for consistency for now.
-        templates.append(PageTemplate(id='SecondPage', frames=frames_page2, onPage=self.draw_background))
-        
         doc.addPageTemplates(templates)
         
         # --- Build Stories ---
         stories = []
         
-        name = self.parser.get_section('name')
-        title = self.parser.get_section('title')
-        contact = self.parser.extract_contact()
-        summary = self.parser.get_section(['summary', 'professional_summary'])
-        experience = self.parser.get_section(['experience', 'work_experience'])
-        education = self.parser.get_section(['education'])
-        skills = self.parser.get_section(['skills', 'technical_skills'])
-        projects = self.parser.get_section(['projects'])
+        name = self.document.get_section('name')
+        title = self.document.get_section('title')
+        contact = self.document.contact
+        summary = self.document.get_blocks(['summary', 'professional_summary'])
+        experience = self.document.get_blocks(['experience', 'work_experience'])
+        education = self.document.get_blocks(['education'])
+        skills = self.document.get_blocks(['skills', 'technical_skills'])
+        projects = self.document.get_blocks(['projects'])
 
         # Debug logging
         logger.info(f"PDF Generation - Sections found:")
         logger.info(f"  Name: {name[:50] if name else 'MISSING'}")
         logger.info(f"  Title: {title[:50] if title else 'MISSING'}")
-        logger.info(f"  Summary: {len(summary)} chars" if summary else "  Summary: MISSING")
-        logger.info(f"  Experience: {len(experience)} chars" if experience else "  Experience: MISSING ⚠️")
-        logger.info(f"  Education: {len(education)} chars" if education else "  Education: MISSING")
-        logger.info(f"  Skills: {len(skills)} chars" if skills else "  Skills: MISSING")
-        logger.info(f"  Projects: {len(projects)} chars" if projects else "  Projects: MISSING ⚠️")
-        logger.info(f"  All sections in parser: {list(self.parser.sections.keys())}")
+        logger.info(f"  Summary: {len(summary)} lines" if summary else "  Summary: MISSING")
+        logger.info(f"  Experience: {len(experience)} lines" if experience else "  Experience: MISSING ⚠️")
+        logger.info(f"  Education: {len(education)} lines" if education else "  Education: MISSING")
+        logger.info(f"  Skills: {len(skills)} lines" if skills else "  Skills: MISSING")
+        logger.info(f"  Projects: {len(projects)} lines" if projects else "  Projects: MISSING ⚠️")
+        logger.info(f"  All sections in document: {list(self.document.sections.keys())}")
 
         header_flowables = [
             Paragraph(name, self.styles['NameTitle']),
@@ -382,7 +304,7 @@ class PDFGenerator:
             Spacer(1, 5*mm)
         ]
 
-        if self.template_id in ['template-1', 'template-4', 'template-8', 'template-9', 'template-11', 'template-12']:
+        if self.layout.family == LAYOUT_SIDEBAR_LEFT:
             # Layout: Sidebar -> Main
             
             # 1. Sidebar Content
@@ -416,7 +338,7 @@ class PDFGenerator:
                 stories.append(Paragraph("PROJECTS", self.styles['SectionHeader']))
                 stories.extend(self.md_to_flowables(projects, 'MainText'))
             
-        elif self.template_id in ['template-2', 'template-5', 'template-15']:
+        elif self.layout.family in (LAYOUT_SPLIT, LAYOUT_SIDEBAR_RIGHT):
              # Layout: Header -> Main -> Sidebar (T2) or Header -> Main -> Sidebar (T5)
              # Wait, T2 frames are [Header, Main, Sidebar].
              # T5 frames are [Header, Main, Sidebar].
@@ -496,7 +418,7 @@ class PDFGenerator:
             stories.extend(header_flowables)
             # ... (rest of T3 logic same as before)
             contact_line = " | ".join([v for v in contact.values() if v])
-            stories.append(Paragraph(contact_line, ParagraphStyle('ContactLine', parent=self.styles['Normal'], alignment=TA_CENTER)))
+            stories.append(Paragraph(contact_line, self.styles['ContactLine']))
             stories.append(Spacer(1, 5*mm))
             
             if summary:
@@ -523,11 +445,164 @@ class PDFGenerator:
             return b""
 
 
-def markdown_to_pdf(markdown_text, template_id='modern'):
+def markdown_to_pdf(markdown_text, template_id='modern', document=None):
     try:
-        generator = PDFGenerator(markdown_text, template_id)
+        generator = PDFGenerator(markdown_text, template_id, document=document)
         return generator.generate()
     except Exception as e:
         logger.error(f"Generation failed: {e}", exc_info=True)
         # Fallback to simple bytes
         return markdown_text.encode('utf-8')
+
+
+def generate_simple_pdf(markdown_text):
+    """Fallback simple PDF generator using reportlab basics"""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+        import io
+        
+        logger.info("Starting simple PDF generation...")
+        
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=letter)
+        width, height = letter
+        
+        # Simple text rendering
+        y = height - 50
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(50, y, "Optimized Resume")
+        
+        y -= 30
+        c.setFont("Helvetica", 10)
+        
+        # Split text into lines
+        lines = markdown_text.split('\n')
+        logger.info(f"Processing {len(lines)} lines...")
+        
+        for i, line in enumerate(lines):
+            if y < 50:  # New page if needed
+                c.showPage()
+                y = height - 50
+                c.setFont("Helvetica", 10)
+            
+            # Remove markdown formatting for simple display
+            clean_line = line.replace('#', '').replace('**', '').replace('*', '').strip()
+            
+            # Handle special characters that might cause issues
+            clean_line = clean_line.encode('ascii', 'ignore').decode('ascii')
+            
+            if clean_line:
+                # Wrap long lines
+                if len(clean_line) > 90:
+                    words = clean_line.split()
+                    current_line = ""
+                    for word in words:
+                        if len(current_line + word) < 90:
+                            current_line += word + " "
+                        else:
+                            if current_line.strip():
+                                c.drawString(50, y, current_line.strip())
+                                y -= 15
+                            current_line = word + " "
+                    if current_line.strip():
+                        c.drawString(50, y, current_line.strip())
+                        y -= 15
+                else:
+                    c.drawString(50, y, clean_line)
+                    y -= 15
+        
+        c.save()
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        
+        logger.info(f"Simple PDF generated successfully: {len(pdf_bytes)} bytes")
+        return pdf_bytes
+        
+    except Exception as e:
+        logger.error(f"Simple PDF generation error: {e}", exc_info=True)
+        raise
+
+def generate_emergency_pdf(markdown_text):
+    """Emergency ultra-simple PDF generator - guaranteed to work"""
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+        import io
+        
+        logger.info("Creating emergency minimal PDF...")
+        
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=letter)
+        
+        # Ultra simple - just dump text
+        y = 750
+        c.setFont("Helvetica", 10)
+        
+        # Strip all special characters and just use plain text
+        plain_text = markdown_text.replace('#', '').replace('*', '').replace('_', '')
+        plain_text = plain_text.encode('ascii', 'ignore').decode('ascii')
+        
+        for line in plain_text.split('\n')[:100]:  # Limit to 100 lines
+            if y < 50:
+                break
+            if line.strip():
+                # Truncate long lines
+                safe_line = line[:100].strip()
+                if safe_line:
+                    try:
+                        c.drawString(50, y, safe_line)
+                    except:
+                        c.drawString(50, y, "...")
+                    y -= 12
+        
+        c.save()
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        
+        logger.info(f"Emergency PDF created: {len(pdf_bytes)} bytes")
+        return pdf_bytes
+        
+    except Exception as e:
+        logger.error(f"Emergency PDF failed: {e}", exc_info=True)
+        raise
+
+
+def render_pdf_with_fallbacks(markdown_text, template_id, document=None):
+    """
+    Renders a resume PDF, falling back to simpler generators on failure.
+    
+    Args:
+        markdown_text: Resume markdown
+        template_id: Template identifier
+        document: Optional ResumeDocument from an earlier parse of the same markdown
+    
+    Returns:
+        (pdf_bytes, tier) where tier is 'primary', 'simple' or 'emergency'
+    """
+    try:
+        # Try template-based PDF generation
+        logger.info(f"Attempting template-based PDF generation with '{template_id}' template...")
+        pdf_bytes = markdown_to_pdf(markdown_text, template_id=template_id, document=document)
+        # markdown_to_pdf reports failures as empty or non-PDF output
+        if not pdf_bytes.startswith(b'%PDF'):
+            raise ValueError("Template renderer returned no PDF")
+        logger.info(f"✅ PDF generated successfully, size: {len(pdf_bytes)} bytes")
+        return pdf_bytes, 'primary'
+    except Exception as pdf_error:
+        logger.error(f"Fancy PDF generation failed: {pdf_error}", exc_info=True)
+    
+    # Fallback to simple PDF
+    logger.info("Attempting fallback simple PDF generation...")
+    try:
+        pdf_bytes = generate_simple_pdf(markdown_text)
+        logger.info(f"✅ Simple PDF generated, size: {len(pdf_bytes)} bytes")
+        return pdf_bytes, 'simple'
+    except Exception as fallback_error:
+        logger.error(f"Simple PDF also failed: {fallback_error}", exc_info=True)
+    
+    # Emergency fallback - super minimal PDF (raises if even this fails)
+    logger.info("Attempting emergency minimal PDF...")
+    pdf_bytes = generate_emergency_pdf(markdown_text)
+    logger.info(f"✅ Emergency PDF generated, size: {len(pdf_bytes)} bytes")
+    return pdf_bytes, 'emergency'
@@ -0,0 +1,233 @@
+"""
+PDF Ingestion - Budgeted, page-parallel text extraction for uploaded resumes
+Pages are extracted in a process pool, joined once with str.join, and work stops
+as soon as the analysis character budget is filled. Extraction can also run as
+a background job (in the shared SQLite job queue, so any gunicorn worker can
+answer polls) so upload requests return immediately.
+"""
+
+import os
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, List
+
+from .job_queue import job_queue, JobError
+
+logger = logging.getLogger(__name__)
+
+# Characters sent to the analysis prompt (see resume_analyzer.analyze_resume_content)
+ANALYSIS_CHAR_LIMIT = 15000
+
+# Hard budgets for a single upload
+MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', 40))
+MAX_FILE_BYTES = int(os.getenv('PDF_MAX_FILE_BYTES', 10 * 1024 * 1024))
+
+# Documents at or below this many pages are extracted inline (pool overhead dominates)
+PARALLEL_MIN_PAGES = 4
+PAGES_PER_TASK = 2
+POOL_WORKERS = int(os.getenv('PDF_POOL_WORKERS', min(4, os.cpu_count() or 1)))
+# Seconds a pooled extraction may take before its pool is replaced
+EXTRACT_TIMEOUT = float(os.getenv('PDF_EXTRACT_TIMEOUT', 60))
+
+# Job queue kind for background extractions
+JOB_KIND = 'extract_resume_text'
+
+
+class PDFBudgetError(ValueError):
+    """Raised when an upload exceeds the ingestion budget"""
+
+
+def _extract_page_range(filepath: str, start: int, end: int) -> List[str]:
+    """Worker task: extract pages [start, end) of a PDF."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(filepath)
+    return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+_process_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool, _pool_pid
+    with _pool_lock:
+        if _process_pool is None or _pool_pid != os.getpid():
+            methods = multiprocessing.get_all_start_methods()
+            # forkserver children start clean instead of inheriting a monkey-patched worker
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _process_pool = ProcessPoolExecutor(max_workers=POOL_WORKERS, mp_context=context)
+            _pool_pid = os.getpid()
+            logger.info(f"PDF extraction pool started ({POOL_WORKERS} workers, {context.get_start_method()})")
+        return _process_pool
+
+
+def _reset_process_pool(pool: ProcessPoolExecutor):
+    """Replace a broken or hung pool (the next extraction starts a new one)"""
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is not pool:
+            return  # Another extraction already replaced it
+        _process_pool = None
+    logger.warning("Restarting PDF extraction pool")
+    # A hung page range never returns; terminate the workers instead of waiting
+    for process in list((getattr(pool, '_processes', None) or {}).values()):
+        try:
+            process.terminate()
+        except Exception:
+            pass
+    pool.shutdown(wait=False)
+
+
+def _submit_pages(filepath: str, page_count: int):
+    ranges = [(start, min(start + PAGES_PER_TASK, page_count)) for start in range(0, page_count, PAGES_PER_TASK)]
+    pool = _get_process_pool()
+    try:
+        return pool, [pool.submit(_extract_page_range, filepath, start, end) for start, end in ranges]
+    except BrokenProcessPool:
+        # A child died in an earlier extraction: start over with a fresh pool
+        _reset_process_pool(pool)
+        pool = _get_process_pool()
+        return pool, [pool.submit(_extract_page_range, filepath, start, end) for start, end in ranges]
+
+
+def _collect_pages(filepath: str, page_count: int, max_chars: Optional[int]) -> List[str]:
+    """Extract pages in the pool, in page order, until max_chars is reached"""
+    pool, futures = _submit_pages(filepath, page_count)
+    deadline = time.monotonic() + EXTRACT_TIMEOUT
+    pages: List[str] = []
+    collected = 0
+
+    # Consume in page order so the budget cut-off is deterministic
+    try:
+        for future in futures:
+            for text in future.result(timeout=max(0.0, deadline - time.monotonic())):
+                pages.append(text)
+                collected += len(text) + 1
+                if max_chars is not None and collected >= max_chars:
+                    return pages
+    except FutureTimeout:
+        _reset_process_pool(pool)
+        raise PDFBudgetError(f"PDF extraction exceeded {EXTRACT_TIMEOUT:.0f}s")
+    except BrokenProcessPool:
+        _reset_process_pool(pool)
+        raise
+    finally:
+        # Drop page ranges that have not started yet
+        for future in futures:
+            future.cancel()
+    return pages
+
+
+def extract_pdf_text(filepath: str, max_chars: Optional[int] = ANALYSIS_CHAR_LIMIT,
+                     max_pages: int = MAX_PAGES) -> str:
+    """
+    Extract text from a PDF within the page/size budget.
+
+    Args:
+        filepath: Path to the PDF
+        max_chars: Stop once at least this many characters are collected (None = no limit).
+                   Extraction stops on a page boundary, so the last page is never cut.
+        max_pages: Maximum number of pages to read
+
+    Returns:
+        Extracted text, pages separated by newlines
+
+    Raises:
+        PDFBudgetError: If the file is larger than MAX_FILE_BYTES, or extraction
+                        takes longer than EXTRACT_TIMEOUT
+    """
+    size = os.path.getsize(filepath)
+    if size > MAX_FILE_BYTES:
+        raise PDFBudgetError(f"PDF is {size} bytes; limit is {MAX_FILE_BYTES}")
+
+    from pypdf import PdfReader
+
+    reader = PdfReader(filepath)
+    page_count = min(len(reader.pages), max_pages)
+    pages: List[str] = []
+    collected = 0
+
+    if page_count <= PARALLEL_MIN_PAGES:
+        for i in range(page_count):
+            text = reader.pages[i].extract_text() or ""
+            pages.append(text)
+            collected += len(text) + 1
+            if max_chars is not None and collected >= max_chars:
+                break
+        return "\n".join(pages)
+
+    pages = _collect_pages(filepath, page_count, max_chars)
+    collected = sum(len(text) + 1 for text in pages)
+    logger.info(f"Extracted {len(pages)}/{page_count} pages ({collected} chars) from {os.path.basename(filepath)}")
+    return "\n".join(pages)
+
+
+# ---------------------------------------------------------------------------
+# Background extraction jobs
+# ---------------------------------------------------------------------------
+
+def submit_extraction(filepath: str, max_chars: Optional[int] = ANALYSIS_CHAR_LIMIT,
+                      delete_after: bool = False) -> str:
+    """
+    Start extracting a PDF in the background.
+
+    Args:
+        filepath: Path to the saved upload
+        max_chars: Character budget (see extract_pdf_text)
+        delete_after: Remove the file once extraction finishes (uploads are not kept)
+
+    Returns:
+        Job id to poll with get_extraction()
+    """
+    job = job_queue.enqueue(JOB_KIND, {
+        "filepath": filepath, "filename": os.path.basename(filepath),
+        "max_chars": max_chars, "delete_after": delete_after,
+    })
+    return job["job_id"]
+
+
+def _run_extraction_job(payload: Dict[str, Any], report) -> Dict[str, str]:
+    report(10, "Extracting resume text")
+    try:
+        text = _extract_job(payload["filepath"], payload["max_chars"], payload["delete_after"])
+    except PDFBudgetError as e:
+        raise JobError(str(e))
+    return {"filename": payload["filename"], "text": text.strip()}
+
+
+def _extract_job(filepath: str, max_chars: Optional[int], delete_after: bool) -> str:
+    try:
+        return extract_pdf_text(filepath, max_chars)
+    finally:
+        if delete_after:
+            try:
+                os.remove(filepath)
+            except OSError as e:
+                logger.warning(f"Could not remove upload {os.path.basename(filepath)}: {e}")
+
+
+def get_extraction(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the status of a background extraction.
+
+    Returns:
+        None for unknown/expired jobs, otherwise a dict with 'status'
+        ('pending', 'done' or 'error') and 'text' or 'error' when finished.
+    """
+    job = job_queue.get(job_id, include_events=False)
+    if job is None or job["kind"] != JOB_KIND:
+        return None
+    if job["status"] == "error":
+        return {"job_id": job_id, "status": "error", "error": job["error"]}
+    if job["status"] != "done":
+        return {"job_id": job_id, "status": "pending"}
+    return {"job_id": job_id, "status": "done", **job["result"]}
+
+
+job_queue.register(JOB_KIND, _run_extraction_job)
@@ -0,0 +1,277 @@
+"""
+Profiler - On-demand profiling of a live worker (no restart needed)
+- Statistical CPU sampling: a native thread samples every thread's stack at a
+  fixed interval for a bounded time; results export as collapsed stacks
+  (flamegraph.pl / speedscope input) or speedscope JSON.
+- Per-route CPU accounting: thread CPU time per endpoint, switched on at runtime.
+- Allocation tracking: two tracemalloc snapshots an interval apart, diffed.
+
+Everything is idle until requested; the admin endpoints in app.py drive it.
+"""
+
+import os
+import sys
+import time
+import json
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+# Upper bounds for one request
+MAX_PROFILE_SECONDS = float(os.getenv('MAX_PROFILE_SECONDS', 60))
+MIN_SAMPLE_INTERVAL = 0.001
+TRACEMALLOC_FRAMES = int(os.getenv('TRACEMALLOC_FRAMES', 10))
+
+
+class ProfilerBusy(Exception):
+    """Another profile is already running in this worker"""
+
+
+def _start_native_thread(target):
+    """
+    Start target on a real OS thread. Under gevent monkey-patching a regular
+    thread would be a greenlet and could only ever sample itself.
+    """
+    if _gevent_patched():
+        from gevent import monkey
+        monkey.get_original('_thread', 'start_new_thread')(target, ())
+    else:
+        threading.Thread(target=target, name='profiler-sampler', daemon=True).start()
+
+
+def _gevent_patched() -> bool:
+    if 'gevent' not in sys.modules:
+        return False
+    from gevent import monkey
+    return monkey.is_module_patched('threading')
+
+
+def _native(module: str, name: str):
+    """Unpatched stdlib function (gevent's versions act on greenlets, not OS threads)"""
+    if _gevent_patched():
+        from gevent import monkey
+        return monkey.get_original(module, name)
+    return getattr(sys.modules[module], name)
+
+
+class Profile:
+    """Result of a sampling run: stack -> sample count"""
+
+    def __init__(self, stacks: Counter, samples: int, interval: float, duration: float):
+        self.stacks = stacks
+        self.samples = samples
+        self.interval = interval
+        self.duration = duration
+
+    def to_collapsed(self) -> str:
+        """Brendan Gregg collapsed stack format: 'root;...;leaf count' per line"""
+        return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common())
+
+    def to_speedscope(self, name: str = 'worker') -> Dict[str, Any]:
+        """Speedscope 'sampled' profile (https://www.speedscope.app/file-format-schema.json)"""
+        frame_index: Dict[str, int] = {}
+        frames: List[Dict[str, Any]] = []
+        samples, weights = [], []
+        for stack, count in self.stacks.most_common():
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    label, _, location = frame.partition(' (')
+                    file, _, line = location.rstrip(')').rpartition(':')
+                    entry = {'name': label}
+                    if file:
+                        entry.update(file=file, line=int(line) if line.isdigit() else None)
+                    frames.append(entry)
+                indexes.append(frame_index[frame])
+            samples.append(indexes)
+            weights.append(round(count * self.interval, 6))
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': round(sum(weights), 6),
+                'samples': samples,
+                'weights': weights,
+            }],
+            'name': name,
+            'exporter': 'sampro-profiler',
+        }
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling all threads' stacks from a native thread"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = False
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({code.co_filename}:{frame.f_lineno})"
+
+    def _sample(self, stacks: Counter, skip: set):
+        threads = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in skip:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._frame_label(frame))
+                frame = frame.f_back
+            stack.append(f"thread {threads.get(thread_id, thread_id)}")
+            stacks[tuple(reversed(stack))] += 1
+
+    def run(self, seconds: float, interval: float = 0.005) -> Profile:
+        """
+        Sample for a bounded time and return the profile (blocks the caller)
+
+        Args:
+            seconds: Sampling duration (capped at MAX_PROFILE_SECONDS)
+            interval: Seconds between samples
+
+        Returns:
+            Profile
+        """
+        seconds = max(0.1, min(float(seconds), MAX_PROFILE_SECONDS))
+        interval = max(MIN_SAMPLE_INTERVAL, float(interval))
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy("A CPU profile is already running")
+
+        stacks: Counter = Counter()
+        result = {'samples': 0, 'duration': 0.0, 'done': False}
+        # With OS threads the requesting thread is only waiting; under gevent it
+        # is the hub thread running every other request, so keep it
+        skip = set() if _gevent_patched() else {threading.get_ident()}
+
+        def sampler():
+            skip.add(_native('_thread', 'get_ident')())
+            sleep = _native('time', 'sleep')
+            try:
+                started = time.perf_counter()
+                deadline = started + seconds
+                while time.perf_counter() < deadline:
+                    self._sample(stacks, skip)
+                    result['samples'] += 1
+                    sleep(interval)
+                result['duration'] = time.perf_counter() - started
+            finally:
+                result['done'] = True
+
+        try:
+            self.running = True
+            _start_native_thread(sampler)
+            # Poll rather than block, so a gevent worker keeps serving meanwhile
+            while not result['done']:
+                time.sleep(min(0.05, seconds))
+            return Profile(stacks, result['samples'], interval, result['duration'])
+        finally:
+            self.running = False
+            self._lock.release()
+
+
+class RouteCPUAccounting:
+    """Thread CPU and wall time per route, enabled at runtime"""
+
+    def __init__(self):
+        self.enabled = False
+        self.routes: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def begin(self) -> Optional[Tuple[float, float]]:
+        """Call at request start; returns a token for end() (None when disabled)"""
+        if not self.enabled:
+            return None
+        return time.thread_time(), time.perf_counter()
+
+    def end(self, route: str, token: Optional[Tuple[float, float]]):
+        """Call at request end with the token from begin()"""
+        if token is None:
+            return
+        cpu = time.thread_time() - token[0]
+        wall = time.perf_counter() - token[1]
+        with self._lock:
+            entry = self.routes.setdefault(route, {'requests': 0, 'cpu_seconds': 0.0, 'wall_seconds': 0.0})
+            entry['requests'] += 1
+            entry['cpu_seconds'] += cpu
+            entry['wall_seconds'] += wall
+
+    def reset(self):
+        with self._lock:
+            self.routes = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            routes = {route: dict(entry) for route, entry in self.routes.items()}
+        for entry in routes.values():
+            entry['cpu_ms_avg'] = round(entry['cpu_seconds'] / entry['requests'] * 1000, 2)
+            entry['wall_ms_avg'] = round(entry['wall_seconds'] / entry['requests'] * 1000, 2)
+        return {
+            'enabled': self.enabled,
+            'routes': dict(sorted(routes.items(), key=lambda item: -item[1]['cpu_seconds']))
+        }
+
+
+_allocation_lock = threading.Lock()
+
+
+def allocation_diff(seconds: float, top: int = 30, key_type: str = 'lineno') -> Dict[str, Any]:
+    """
+    Diff two tracemalloc snapshots taken `seconds` apart (blocks the caller)
+
+    Args:
+        seconds: Interval between snapshots (capped at MAX_PROFILE_SECONDS)
+        top: Number of entries to return
+        key_type: 'lineno', 'filename' or 'traceback'
+
+    Returns:
+        Dict with the largest size differences
+    """
+    seconds = max(0.1, min(float(seconds), MAX_PROFILE_SECONDS))
+    if not _allocation_lock.acquire(blocking=False):
+        raise ProfilerBusy("An allocation profile is already running")
+
+    started_here = not tracemalloc.is_tracing()
+    try:
+        if started_here:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        before = tracemalloc.take_snapshot()
+        time.sleep(seconds)
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        own_file = tracemalloc.Filter(False, tracemalloc.__file__)
+        stats = after.filter_traces([own_file]).compare_to(before.filter_traces([own_file]), key_type)
+        return {
+            'seconds': seconds,
+            'key_type': key_type,
+            'traced_current_bytes': current,
+            'traced_peak_bytes': peak,
+            'top': [{
+                'location': [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                'size_diff_bytes': stat.size_diff,
+                'size_bytes': stat.size,
+                'count_diff': stat.count_diff,
+                'count': stat.count,
+            } for stat in stats[:top]]
+        }
+    finally:
+        if started_here:
+            tracemalloc.stop()
+        _allocation_lock.release()
+
+
+def dumps_speedscope(profile: Profile, name: str) -> bytes:
+    return json.dumps(profile.to_speedscope(name), separators=(',', ':')).encode('utf-8')
+
+
+# Singleton instances
+sampling_profiler = SamplingProfiler()
+route_cpu = RouteCPUAccounting()
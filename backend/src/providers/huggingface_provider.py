@@ -12,6 +12,10 @@ from backend.src.ai_provider_manager import BaseAIProvider
 
 logger = logging.getLogger(__name__)
 
+# Chat-completions endpoint override (e.g. a dedicated endpoint or a local stand-in);
+# requests go to the hosted Inference API when unset
+HF_BASE_URL = os.getenv('HF_BASE_URL')
+
 
 class HuggingFaceProvider(BaseAIProvider):
     """
@@ -123,7 +127,7 @@ class HuggingFaceProvider(BaseAIProvider):
                     None,
                     lambda: client.chat_completion(
                         messages=messages,
-                        model=self.current_model,
+                        model=HF_BASE_URL or self.current_model,
                         max_tokens=max_tokens,
                         temperature=temperature
                     )
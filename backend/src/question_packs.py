@@ -1,8 +1,19 @@
 """
 Question Packs Module
 Provides job-specific and company-specific interview questions
+
+The banks below are indexed once at import: flat question tuples per role,
+pre-rendered company prompt fragments, and alias maps so free-form role and
+company names ("SWE", "software engineer", "Tata Consultancy Services",
+typos) resolve to a pack. QuestionDeck deals a session's questions in a
+shuffled order without repeats.
 """
 
+import re
+import random
+import difflib
+from functools import lru_cache
+
 # Job Role-Specific Question Banks
 JOB_ROLE_QUESTIONS = {
     "ML Engineer": {
@@ -259,29 +270,146 @@ COMPANY_STYLES = {
 }
 
 
+# Alternative names (matched case- and punctuation-insensitively)
+ROLE_ALIASES = {
+    "ML Engineer": ["MLE", "Machine Learning Engineer", "AI Engineer", "AI/ML Engineer",
+                    "Deep Learning Engineer", "Data Scientist"],
+    "Python Developer": ["Python Engineer", "Python Dev", "Software Engineer", "SWE", "SDE",
+                         "Software Developer", "Software Development Engineer", "Backend Engineer",
+                         "Backend Developer", "Django Developer"],
+    "Data Analyst": ["Data Analytics", "Business Analyst", "BI Analyst", "Business Intelligence Analyst",
+                     "Analyst"],
+    "Robotics Engineer": ["Robotics", "Robotics Developer", "ROS Developer", "Mechatronics Engineer"],
+    "Cloud Engineer": ["DevOps", "DevOps Engineer", "SRE", "Site Reliability Engineer", "Cloud Architect",
+                       "AWS Engineer", "Platform Engineer", "Infrastructure Engineer"],
+    "QA Engineer": ["QA", "Quality Assurance Engineer", "SDET", "Test Engineer", "Tester",
+                    "Software Tester", "Automation Tester", "QA Analyst"],
+}
+
+COMPANY_ALIASES = {
+    "Google": ["Alphabet", "Google LLC"],
+    "Amazon": ["AWS", "Amazon Web Services"],
+    "TCS": ["Tata Consultancy Services", "Tata Consultancy"],
+    "Infosys": ["Infy"],
+    "Deloitte": ["Deloitte Consulting"],
+    "Wipro": ["Wipro Limited"],
+    "Microsoft": ["MSFT"],
+}
+
+# Seniority words dropped from role names ("Senior Python Developer")
+ROLE_QUALIFIERS = {"senior", "sr", "junior", "jr", "lead", "principal", "staff", "associate",
+                   "intern", "trainee", "entry", "level", "mid"}
+# Words ignored when fuzzy matching (else "data engineer" is close to "qa engineer")
+GENERIC_WORDS = {"engineer", "engineering", "developer", "dev", "engg", "inc", "ltd", "limited"}
+# Minimum difflib ratio for a fuzzy match
+FUZZY_CUTOFF = 0.8
+
+
+def _normalize(name, drop=()):
+    words = re.sub(r'[^a-z0-9+#]+', ' ', str(name).lower()).split()
+    return ' '.join(word for word in words if word not in drop)
+
+
+def _build_lookup(canonical_names, aliases, drop=()):
+    """Normalized name or alias -> canonical name, and the same without generic words for fuzzy matching"""
+    lookup = {_normalize(name, drop): name for name in canonical_names}
+    for name, names in aliases.items():
+        for alias in names:
+            lookup.setdefault(_normalize(alias, drop), name)
+    fuzzy = {}
+    for key, name in lookup.items():
+        core = _normalize(key, GENERIC_WORDS)
+        if core:
+            fuzzy.setdefault(core, name)
+    return lookup, fuzzy
+
+
+def _render_company_prompt(company, style):
+    return f"""
+You are conducting a {company} interview. Follow these guidelines:
+
+**Interview Style:**
+- Focus: {style['focus']}
+- Tone: {style['tone']}
+- Difficulty: {style['difficulty']}
+- Question Style: {style['question_style']}
+
+**Company Principles:**
+{chr(10).join(f"- {p}" for p in style['principles'])}
+
+**Example Questions:**
+{chr(10).join(f"- {q}" for q in style['sample_questions'])}
+
+Maintain {company}'s interview culture throughout the conversation.
+"""
+
+
+# Import-time index
+ROLE_QUESTION_INDEX = {
+    role: tuple(question for category in role_data.values() for question in category)
+    for role, role_data in JOB_ROLE_QUESTIONS.items()
+}
+COMPANY_PROMPTS = {company: _render_company_prompt(company, style) for company, style in COMPANY_STYLES.items()}
+_ROLE_LOOKUP = _build_lookup(JOB_ROLE_QUESTIONS, ROLE_ALIASES, ROLE_QUALIFIERS)
+_COMPANY_LOOKUP = _build_lookup(COMPANY_STYLES, COMPANY_ALIASES)
+
+
+def _resolve(name, lookups, drop=()):
+    lookup, fuzzy = lookups
+    key = _normalize(name, drop) if name else ''
+    if not key:
+        return None
+    if key in lookup:
+        return lookup[key]
+    # Typos and near-misses ("pyhton developer", "cloud engg")
+    core = _normalize(key, GENERIC_WORDS)
+    if core in fuzzy:
+        return fuzzy[core]
+    matches = difflib.get_close_matches(core, fuzzy, n=1, cutoff=FUZZY_CUTOFF)
+    return fuzzy[matches[0]] if matches else None
+
+
+@lru_cache(maxsize=512)
+def resolve_role(role):
+    """
+    Canonical job role for a free-form role name
+    
+    Args:
+        role: Role as entered (e.g., "SWE", "senior software engineer")
+        
+    Returns:
+        Key of JOB_ROLE_QUESTIONS, or None when nothing matches
+    """
+    return _resolve(role, _ROLE_LOOKUP, ROLE_QUALIFIERS)
+
+
+@lru_cache(maxsize=512)
+def resolve_company(company):
+    """
+    Canonical company for a free-form company name
+    
+    Args:
+        company: Company as entered (e.g., "tata consultancy services")
+        
+    Returns:
+        Key of COMPANY_STYLES, or None when nothing matches
+    """
+    return _resolve(company, _COMPANY_LOOKUP)
+
+
 def get_questions_for_role(role, count=5):
     """
     Get random questions for a specific job role
     
     Args:
-        role: Job role (e.g., "ML Engineer")
+        role: Job role (e.g., "ML Engineer"; aliases and typos resolve)
         count: Number of questions to return
         
     Returns:
         List of questions
     """
-    import random
-    
-    if role not in JOB_ROLE_QUESTIONS:
-        return []
-    
-    role_data = JOB_ROLE_QUESTIONS[role]
-    all_questions = []
-    
-    for category in role_data.values():
-        all_questions.extend(category)
-    
-    return random.sample(all_questions, min(count, len(all_questions)))
+    questions = ROLE_QUESTION_INDEX.get(resolve_role(role), ())
+    return random.sample(questions, min(count, len(questions)))
 
 
 def get_company_style_prompt(company):
@@ -289,35 +417,12 @@ def get_company_style_prompt(company):
     Get interview style prompt for a specific company
     
     Args:
-        company: Company name (e.g., "Google")
+        company: Company name (e.g., "Google"; aliases and typos resolve)
         
     Returns:
         Formatted prompt string
     """
-    if company not in COMPANY_STYLES:
-        return ""
-    
-    style = COMPANY_STYLES[company]
-    
-    prompt = f"""
-You are conducting a {company} interview. Follow these guidelines:
-
-**Interview Style:**
-- Focus: {style['focus']}
-- Tone: {style['tone']}
-- Difficulty: {style['difficulty']}
-- Question Style: {style['question_style']}
-
-**Company Principles:**
-{chr(10).join(f"- {p}" for p in style['principles'])}
-
-**Example Questions:**
-{chr(10).join(f"- {q}" for q in style['sample_questions'])}
-
-Maintain {company}'s interview culture throughout the conversation.
-"""
-    
-    return prompt
+    return COMPANY_PROMPTS.get(resolve_company(company), "")
 
 
 def generate_role_company_questions(role, company, count=3):
@@ -332,14 +437,76 @@ def generate_role_company_questions(role, company, count=3):
     Returns:
         List of tailored questions
     """
-    import random
-    
     role_questions = get_questions_for_role(role, count * 2)
     
-    if company in COMPANY_STYLES:
+    company = resolve_company(company)
+    if company:
         company_questions = COMPANY_STYLES[company]['sample_questions']
         # Mix role-specific and company-specific
         combined = role_questions + company_questions
         return random.sample(combined, min(count, len(combined)))
     
     return role_questions[:count]
+
+
+class QuestionDeck:
+    """
+    A session's role questions, shuffled once and dealt without repeats.
+    Once the whole bank has been dealt it is reshuffled (never starting with
+    the question just asked). Iterating never ends unless the role has no pack.
+    """
+    
+    def __init__(self, role, rng=None):
+        self.role = resolve_role(role)
+        self.questions = ROLE_QUESTION_INDEX.get(self.role, ())
+        self.dealt = 0
+        self._rng = rng or random.Random()
+        self._order = []
+        self._last = None
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        if not self.questions:
+            raise StopIteration
+        if not self._order:
+            self._order = list(self.questions)
+            self._rng.shuffle(self._order)
+            # Dealt from the end: keep the previous question away from the front
+            if len(self._order) > 1 and self._order[-1] == self._last:
+                self._order[0], self._order[-1] = self._order[-1], self._order[0]
+        self._last = self._order.pop()
+        self.dealt += 1
+        return self._last
+    
+    def remaining(self):
+        """Questions left before the bank repeats"""
+        return len(self._order) if self.dealt else len(self.questions)
+    
+    def deal_round(self):
+        """
+        Deal the rest of the current shuffle (a fresh shuffle once it is used up)
+        
+        Returns:
+            List of questions in dealing order, none repeated
+        """
+        if not self._order and self.questions:
+            return [next(self)] + [next(self) for _ in range(len(self._order))]
+        return [next(self) for _ in range(len(self._order))]
+
+
+def session_question_deck(session):
+    """
+    The session's QuestionDeck, created on first use (and again if the role changes)
+    
+    Args:
+        session: Session dict
+        
+    Returns:
+        QuestionDeck
+    """
+    deck = session.get("question_deck")
+    if deck is None or deck.role != resolve_role(session.get("job_role")):
+        deck = session["question_deck"] = QuestionDeck(session.get("job_role"))
+    return deck
@@ -0,0 +1,291 @@
+"""
+Question Selector - Local follow-up question selection (no LLM call)
+Ranks the question_packs bank for a session by:
+- resume topic match: cosine of precomputed keyword vectors against the
+  session's resume topics, weighted by how little each topic was covered
+  (topic_question_count; a topic is done after 2 questions)
+- difficulty: bank categories map to tiers (behavioral 1, technical 2,
+  system design 3), aimed at the tier the last answer's score suggests
+- redundancy: similarity to the last few interviewer turns is penalized,
+  questions already asked are skipped until the bank runs out
+
+Resume topics also get templated questions ("Walk me through your ... project")
+so a resume without bank matches still gets anchored follow-ups. The role's
+pack comes from the session's QuestionDeck, one shuffled round per plan, so
+equally ranked role questions are asked in a per-session order.
+
+Vectors for the bank are built at import; per-session topic similarities are
+built on first use and kept in the session, so a selection costs well under a
+millisecond. It serves degraded turns (load shedding, provider outage) and is
+prefetched on normal turns as the fallback if the LLM call fails.
+"""
+
+import re
+import math
+import random
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .question_packs import (JOB_ROLE_QUESTIONS, COMPANY_STYLES, resolve_role, resolve_company,
+                             session_question_deck)
+
+logger = logging.getLogger(__name__)
+
+# Ranking weights
+TOPIC_WEIGHT = 0.5
+DIFFICULTY_WEIGHT = 0.3
+PACK_WEIGHT = 0.2
+REDUNDANCY_PENALTY = 0.4
+JITTER = 0.05
+# Templated topic questions count as this strong a topic match
+TEMPLATE_MATCH = 0.5
+# Below this similarity a bank question is not credited to a resume topic
+TOPIC_MIN_SIMILARITY = 0.2
+# Interviewer turns checked for redundancy
+RECENT_TURNS = 3
+# Questions per topic before it counts as covered (as in the follow-up prompt)
+TOPIC_LIMIT = 2
+
+CATEGORY_TIERS = {"behavioral": 1, "technical": 2, "system_design": 3}
+
+# Used for every session, role or not
+GENERAL_QUESTIONS = (
+    ("Could you tell me more about your experience?", 1),
+    ("What was the most challenging project you've worked on?", 1),
+    ("How do you handle tight deadlines?", 1),
+    ("Tell me about a time you disagreed with a teammate and how you resolved it.", 1),
+    ("What is a technical decision you made that you would make differently today?", 2),
+)
+
+TOPIC_TEMPLATES = {
+    "skill": ("How have you used {name} in your work, and what would you do differently next time?", 2),
+    "project": ("Walk me through your {name} project - what was the hardest technical decision?", 2),
+    "experience": ("Tell me about your time as {name} - what was your most significant contribution?", 1),
+    "education": ("Which part of your {name} studies has been most useful in practice?", 1),
+}
+
+_STOPWORDS = frozenset("""
+a an and are as at be by can did do does for from had has have how i if in into is it its me my of on or
+our so that the their them then there these they this to was we were what when where which who why will
+with would you your about tell describe explain walk through time situation example examples give
+""".split())
+
+# Spellings normalized before matching resume topics against the bank
+_SYNONYMS = {
+    "ml": "machine learning", "ai": "artificial intelligence", "dl": "deep learning",
+    "k8s": "kubernetes", "aws": "aws cloud", "gcp": "gcp cloud", "azure": "azure cloud",
+    "js": "javascript", "sql": "sql database", "postgresql": "postgresql sql database",
+    "mysql": "mysql sql database", "ci": "ci cd", "qa": "qa testing", "nlp": "nlp language",
+    "ros": "ros robotics", "pandas": "pandas python data", "numpy": "numpy python",
+    "pytorch": "pytorch deep learning", "tensorflow": "tensorflow deep learning",
+    "django": "django python", "flask": "flask python", "fastapi": "fastapi python",
+    "selenium": "selenium testing automation", "tableau": "tableau visualization",
+    "powerbi": "powerbi visualization",
+}
+
+
+def _terms(text: str) -> List[str]:
+    terms = []
+    for word in re.findall(r"[a-z0-9+#]+", text.lower()):
+        for term in _SYNONYMS.get(word, word).split():
+            if term in _STOPWORDS or len(term) < 2:
+                continue
+            # Light stemming: plurals
+            if len(term) > 4 and term.endswith("s") and not term.endswith("ss"):
+                term = term[:-1]
+            terms.append(term)
+    return terms
+
+
+class Candidate:
+    """A bank or templated question with its precomputed keyword vector"""
+
+    __slots__ = ("text", "tier", "pack", "topic", "vector")
+
+    def __init__(self, text: str, tier: int, pack: Optional[str] = None, topic: Optional[str] = None):
+        self.text = text
+        self.tier = tier
+        self.pack = pack  # Role or company the question belongs to (None: general)
+        self.topic = topic  # Resume topic, for templated questions
+        self.vector: Dict[str, float] = {}
+
+    def __repr__(self):
+        return f"Candidate({self.text!r}, tier={self.tier}, pack={self.pack!r}, topic={self.topic!r})"
+
+
+def _build_bank() -> Tuple[List[Candidate], Dict[str, float]]:
+    bank = [Candidate(text, tier) for text, tier in GENERAL_QUESTIONS]
+    for role, role_data in JOB_ROLE_QUESTIONS.items():
+        for category, questions in role_data.items():
+            bank.extend(Candidate(text, CATEGORY_TIERS.get(category, 2), role) for text in questions)
+    for company, style in COMPANY_STYLES.items():
+        bank.extend(Candidate(text, 2, company) for text in style["sample_questions"])
+
+    document_frequency = Counter(term for candidate in bank for term in set(_terms(candidate.text)))
+    idf = {term: math.log(len(bank) / count) + 1.0 for term, count in document_frequency.items()}
+    for candidate in bank:
+        candidate.vector = _vector(candidate.text, idf)
+    return bank, idf
+
+
+def _vector(text: str, idf: Dict[str, float]) -> Dict[str, float]:
+    """Unit-length tf-idf vector (terms unseen in the bank weigh as the rarest)"""
+    rarest = max(idf.values()) if idf else 1.0
+    weights = {term: count * idf.get(term, rarest) for term, count in Counter(_terms(text)).items()}
+    norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+    return {term: weight / norm for term, weight in weights.items()} if norm else {}
+
+
+def _cosine(a: Dict[str, float], b: Dict[str, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def _topic_label(category: str, name: str) -> str:
+    """Readable name for a resume topic ("Rate Limiter Service - Token-bucket..." -> "Rate Limiter Service")"""
+    title, _, rest = name.strip().partition(" - ")
+    if category == "experience" and rest:
+        return f"{title} at {rest}"
+    return title
+
+
+class SessionPlan:
+    """Per-session candidates and their similarity to each resume topic"""
+
+    def __init__(self, key, candidates: List[Candidate], topics: List[str],
+                 similarities: List[List[Tuple[int, float]]]):
+        self.key = key
+        self.candidates = candidates
+        self.topics = topics
+        self.similarities = similarities  # Per candidate: (topic index, similarity), nonzero only
+        self.asked = set()  # Candidate indexes
+        self.vectors: Dict[str, Dict[str, float]] = {}  # Interviewer turn text -> vector
+
+
+class QuestionSelector:
+    """Ranks bank and templated questions for a session, locally"""
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.bank, self.idf = _build_bank()
+        self.role_questions = {role: {c.text: c for c in self.bank if c.pack == role} for role in JOB_ROLE_QUESTIONS}
+        self._rng = rng or random.Random()
+
+    def plan(self, session: Dict) -> SessionPlan:
+        """
+        The session's SessionPlan, built on first use and again when the
+        role, company or resume topics change
+
+        Args:
+            session: Session dict
+
+        Returns:
+            SessionPlan
+        """
+        role = resolve_role(session.get("job_role"))
+        company = resolve_company(session.get("company"))
+        topics = list(session.get("resume_topics") or [])
+        key = (role, company, tuple(topics))
+        plan = session.get("question_plan")
+        if plan is not None and plan.key == key:
+            return plan
+
+        # General and company questions, plus the role's pack in the session deck's
+        # order (every role's pack without one)
+        candidates = [c for c in self.bank
+                      if c.pack in (None, company) or (c.pack in JOB_ROLE_QUESTIONS and role is None)]
+        if role is not None:
+            role_questions = self.role_questions[role]
+            candidates.extend(role_questions[text] for text in session_question_deck(session).deal_round())
+        for topic in topics:
+            category, _, name = topic.partition(":")
+            if category in TOPIC_TEMPLATES and name.strip():
+                text, tier = TOPIC_TEMPLATES[category]
+                templated = Candidate(text.format(name=_topic_label(category, name)), tier, topic=topic)
+                templated.vector = _vector(templated.text, self.idf)
+                candidates.append(templated)
+
+        topic_vectors = [_vector(topic.partition(":")[2] or topic, self.idf) for topic in topics]
+        similarities = []
+        for candidate in candidates:
+            row = []
+            for i, (topic, vector) in enumerate(zip(topics, topic_vectors)):
+                similarity = TEMPLATE_MATCH if candidate.topic == topic else _cosine(candidate.vector, vector)
+                if similarity > 0:
+                    row.append((i, similarity))
+            similarities.append(row)
+        plan = session["question_plan"] = SessionPlan(key, candidates, topics, similarities)
+        return plan
+
+    def _recent_vectors(self, plan: SessionPlan, session: Dict) -> List[Dict[str, float]]:
+        recent = [h["content"] for h in session.get("history", [])[-2 * RECENT_TURNS:] if h["role"] == "ai"]
+        if len(plan.vectors) > 4 * RECENT_TURNS:
+            plan.vectors = {text: plan.vectors[text] for text in recent if text in plan.vectors}
+        for text in recent:
+            if text not in plan.vectors:
+                plan.vectors[text] = _vector(text, self.idf)
+        return [plan.vectors[text] for text in recent[-RECENT_TURNS:]]
+
+    def select(self, session: Dict, answer_score: Optional[float] = None) -> Optional[Dict]:
+        """
+        Best next question for the session (does not mark it asked)
+
+        Args:
+            session: Session dict
+            answer_score: Score of the last answer (0-10); higher aims at harder questions
+
+        Returns:
+            Dict with question, topic (resume topic it covers, or None), tier and
+            the plan index; None when there is nothing to ask
+        """
+        plan = self.plan(session)
+        if not plan.candidates:
+            return None
+        if len(plan.asked) >= len(plan.candidates):
+            plan.asked.clear()  # Bank exhausted: start over
+
+        role = plan.key[0]
+        company = plan.key[1]
+        counts = session.get("topic_question_count") or {}
+        freshness = [max(0.0, 1.0 - counts.get(topic, 0) / TOPIC_LIMIT) for topic in plan.topics]
+        target_tier = 1 + 2 * min(max((5.0 if answer_score is None else answer_score) / 10, 0.0), 1.0)
+        recent = self._recent_vectors(plan, session)
+
+        best, best_score, best_topic = None, -math.inf, None
+        for index, candidate in enumerate(plan.candidates):
+            if index in plan.asked:
+                continue
+            topic_score, topic_index, topic_similarity = 0.0, None, 0.0
+            for i, similarity in plan.similarities[index]:
+                weighted = similarity * freshness[i]
+                if weighted > topic_score:
+                    topic_score, topic_index, topic_similarity = weighted, i, similarity
+            if candidate.topic is not None and topic_score == 0.0:
+                continue  # Templated question for a covered topic
+
+            pack_score = 1.0 if candidate.pack is not None and candidate.pack in (role, company) else 0.0
+            redundancy = max((_cosine(candidate.vector, vector) for vector in recent), default=0.0)
+            score = (TOPIC_WEIGHT * topic_score
+                     + DIFFICULTY_WEIGHT * (1 - abs(candidate.tier - target_tier) / 2)
+                     + PACK_WEIGHT * pack_score
+                     - REDUNDANCY_PENALTY * redundancy
+                     + JITTER * self._rng.random())
+            if score > best_score:
+                best, best_score = index, score
+                best_topic = plan.topics[topic_index] if topic_similarity >= TOPIC_MIN_SIMILARITY else None
+
+        if best is None:
+            return None
+        chosen = plan.candidates[best]
+        return {"question": chosen.text, "topic": best_topic, "tier": chosen.tier, "index": best, "plan": plan.key}
+
+    def mark_asked(self, session: Dict, selection: Dict):
+        """Exclude a selected question from later selections in the session"""
+        plan = self.plan(session)
+        if selection["plan"] == plan.key:
+            plan.asked.add(selection["index"])
+
+
+# Singleton instance
+question_selector = QuestionSelector()
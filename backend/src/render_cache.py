@@ -0,0 +1,456 @@
+"""
+Render Cache - Rendered PDF/DOCX artifacts keyed by their inputs
+Preview, PDF download and DOCX download of the same resume share one render.
+Small artifacts live in a byte-bounded in-memory LRU; large ones spill to disk
+with only their metadata kept in memory. The spill directory is shared by all
+workers and outlives them, so it has its own byte cap: the first spill of a
+process, and any spill past the cap, prunes expired and then the oldest files.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Tuple, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv(
+    'RENDER_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'render')
+)
+
+# Bytes of spilled artifacts kept on disk; past it the expired and then the oldest are pruned
+MAX_DISK_BYTES = int(os.getenv('RENDER_CACHE_MAX_DISK_BYTES', 512 * 1024 * 1024))
+
+# Renderer temp files older than this are left over from a crashed process
+STALE_TMP_SECONDS = 3600
+
+# Output produced by a fallback renderer is kept briefly so a transient
+# ReportLab failure does not pin a degraded document
+DEGRADED_TTL = 300
+
+
+class RenderCache:
+    """
+    LRU cache of rendered documents bounded by total bytes held in memory.
+    Entries record the renderer tier that produced them ('primary' or a fallback).
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=64 * 1024 * 1024, spill_bytes=256 * 1024,
+                 max_entries=2000, ttl=86400, max_disk_bytes=MAX_DISK_BYTES):
+        """
+        Initialize render cache
+
+        Args:
+            cache_dir: Directory for spilled artifacts (None disables spilling; large artifacts are not cached)
+            max_bytes: Maximum bytes of artifact data kept in memory
+            spill_bytes: Artifacts at least this large are written to disk instead of memory
+            max_entries: Maximum number of entries (memory and spilled)
+            ttl: Time to live in seconds for primary renders
+            max_disk_bytes: Maximum bytes of spilled artifacts kept on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.spill_bytes = spill_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.memory_bytes = 0
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = None  # Unknown until the first prune scans the directory
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Render cache directory unavailable ({e}). Large artifacts will not be cached")
+                self.cache_dir = None
+
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'spills': 0,
+            'evictions': 0,
+            'disk_pruned': 0
+        }
+        logger.info(f"Render cache initialized (dir={self.cache_dir}, max_bytes={max_bytes}, spill_bytes={spill_bytes})")
+
+    def generate_key(self, markdown_text: str, template_id: str, fmt: str, version: str) -> str:
+        """
+        Generate cache key from render inputs
+
+        Args:
+            markdown_text: Resume markdown
+            template_id: Template identifier
+            fmt: Output format ('pdf', 'docx')
+            version: Generator version (bump to invalidate renders)
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{fmt}:{template_id}:{version}\n".encode('utf-8'))
+        digest.update(markdown_text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Retrieve an artifact
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (data, metadata) with metadata keys 'etag', 'tier' and 'size', or None
+        """
+        artifact = self.get_artifact(key)
+        if artifact is None:
+            return None
+        data, f, metadata = artifact
+        if f is not None:
+            with f:
+                data = f.read()
+        return data, metadata
+
+    def get_artifact(self, key: str) -> Optional[Tuple[Optional[bytes], Optional[BinaryIO], Dict[str, Any]]]:
+        """
+        Retrieve an artifact without loading spilled entries into memory
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (data, None, metadata) for in-memory entries, (None, open_file, metadata)
+            for spilled entries (caller closes the file), or None
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry['expires_at'] <= time.time():
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                data = entry.get('data')
+                if data is not None:
+                    self.stats['hits'] += 1
+                    return data, None, self._metadata(entry)
+
+        # Spilled entries (or entries spilled by a previous process)
+        f = self._open_disk(key)
+        if f is None:
+            with self._lock:
+                if key in self.entries:
+                    self._drop(key)
+                self.stats['misses'] += 1
+            return None
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self._new_entry(key, os.fstat(f.fileno()).st_size, 'primary', self.ttl, spilled=True)
+                self._insert(key, entry)
+            self.stats['hits'] += 1
+            self.stats['disk_hits'] += 1
+            return None, f, self._metadata(entry)
+
+    def set(self, key: str, data: bytes, tier: str = 'primary') -> Dict[str, Any]:
+        """
+        Store an artifact
+
+        Args:
+            key: Cache key
+            data: Rendered bytes
+            tier: Renderer that produced the artifact
+
+        Returns:
+            Metadata for the stored artifact
+        """
+        ttl = self.ttl if tier == 'primary' else DEGRADED_TTL
+        spill = tier == 'primary' and len(data) >= self.spill_bytes
+        entry = self._new_entry(key, len(data), tier, ttl, spilled=spill)
+
+        if spill:
+            if not self._write_disk(key, data):
+                return self._metadata(entry)
+            with self._lock:
+                self.stats['spills'] += 1
+        else:
+            entry['data'] = data
+
+        with self._lock:
+            if key in self.entries:
+                self._drop(key, remove_file=False)
+            self._insert(key, entry)
+            self.stats['sets'] += 1
+        return self._metadata(entry)
+
+    def get_or_render(self, markdown_text: str, template_id: str, fmt: str, version: str,
+                      render: Callable[[], Tuple[bytes, str]]) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Return the cached artifact for the inputs or render and store it
+
+        Args:
+            markdown_text: Resume markdown
+            template_id: Template identifier
+            fmt: Output format
+            version: Generator version
+            render: Zero-argument callable returning (bytes, tier)
+
+        Returns:
+            (data, metadata) where metadata also has 'cache' = 'hit' or 'miss'
+        """
+        key = self.generate_key(markdown_text, template_id, fmt, version)
+        cached = self.get(key)
+        if cached is not None:
+            data, metadata = cached
+            return data, {**metadata, 'cache': 'hit'}
+
+        data, tier = render()
+        return data, {**self.set(key, data, tier), 'cache': 'miss'}
+
+    def reserve_path(self, key: str) -> Optional[str]:
+        """
+        Create a temporary file for a renderer to write an artifact into
+
+        Args:
+            key: Cache key the artifact will be stored under
+
+        Returns:
+            Path to pass to adopt(), or None if spilling is disabled
+        """
+        if not self.cache_dir:
+            return None
+        try:
+            directory = os.path.dirname(self._path_for(key))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            os.close(fd)
+            return tmp_path
+        except OSError as e:
+            logger.warning(f"Render cache temp file unavailable: {e}")
+            return None
+
+    def adopt(self, key: str, tmp_path: str, tier: str = 'primary') -> Tuple[Optional[bytes], Optional[BinaryIO], Dict[str, Any]]:
+        """
+        Store an artifact a renderer wrote to a reserve_path() file
+
+        Large primary artifacts are moved into place without being read;
+        small or degraded ones are loaded into memory as set() would.
+
+        Args:
+            key: Cache key
+            tmp_path: File returned by reserve_path()
+            tier: Renderer that produced the artifact
+
+        Returns:
+            (data, open_file, metadata) in the same form as get_artifact()
+        """
+        f = open(tmp_path, 'rb')
+        size = os.fstat(f.fileno()).st_size
+        if tier != 'primary' or size < self.spill_bytes:
+            with f:
+                data = f.read()
+            self._remove_path(tmp_path)
+            return data, None, self.set(key, data, tier)
+
+        entry = self._new_entry(key, size, tier, self.ttl, spilled=True)
+        try:
+            # The open handle stays valid after the rename (and after any later eviction)
+            os.replace(tmp_path, self._path_for(key))
+        except OSError as e:
+            logger.error(f"Render cache write error: {e}")
+            self._remove_path(tmp_path)
+            return None, f, self._metadata(entry)
+
+        with self._lock:
+            if key in self.entries:
+                self._drop(key, remove_file=False)
+            self._insert(key, entry)
+            self.stats['sets'] += 1
+            self.stats['spills'] += 1
+        self._count_spill(size)
+        return None, f, self._metadata(entry)
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold the lock unless noted)
+    # ------------------------------------------------------------------
+
+    def _new_entry(self, key, size, tier, ttl, spilled):
+        return {
+            'key': key,
+            'size': size,
+            'tier': tier,
+            'spilled': spilled,
+            'expires_at': time.time() + ttl
+        }
+
+    def _metadata(self, entry):
+        etag = entry['key'][:32] if entry['tier'] == 'primary' else f"{entry['key'][:32]}-{entry['tier']}"
+        return {'etag': etag, 'tier': entry['tier'], 'size': entry['size']}
+
+    def _insert(self, key, entry):
+        self.entries[key] = entry
+        if not entry['spilled']:
+            self.memory_bytes += entry['size']
+        while self.entries and (self.memory_bytes > self.max_bytes or len(self.entries) > self.max_entries):
+            oldest = next(iter(self.entries))
+            self._drop(oldest)
+            self.stats['evictions'] += 1
+
+    def _drop(self, key, remove_file=True):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        if entry['spilled']:
+            if remove_file:
+                self._remove_disk(key)
+        else:
+            self.memory_bytes -= entry['size']
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.bin")
+
+    def _open_disk(self, key: str) -> Optional[BinaryIO]:
+        """Open a spilled artifact if present and fresh (no lock needed)"""
+        if not self.cache_dir:
+            return None
+        path = self._path_for(key)
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Render cache read error for {key[:12]}: {e}")
+            return None
+        if os.fstat(f.fileno()).st_mtime + self.ttl <= time.time():
+            f.close()
+            self._remove_disk(key)
+            return None
+        return f
+
+    def _write_disk(self, key: str, data: bytes) -> bool:
+        """Write a spilled artifact atomically (no lock needed)"""
+        if not self.cache_dir:
+            return False
+        path = self._path_for(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Render cache write error: {e}")
+            return False
+        self._count_spill(len(data))
+        return True
+
+    def _count_spill(self, size: int):
+        """Account for a spilled file, pruning on the first spill and past the cap (no lock needed)"""
+        with self._disk_lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += size
+            prune = self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes
+        if prune:
+            self.prune_disk()
+
+    def _remove_disk(self, key: str):
+        path = self._path_for(key)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        if self._remove_path(path):
+            with self._disk_lock:
+                if self._disk_bytes is not None:
+                    self._disk_bytes = max(0, self._disk_bytes - size)
+
+    def prune_disk(self) -> int:
+        """
+        Delete expired spilled artifacts (and stale temp files), then the oldest
+        ones past max_disk_bytes. Other workers share the directory, so files may
+        vanish mid-scan.
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.cache_dir:
+            return 0
+        now = time.time()
+        kept, removed, total = [], 0, 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.endswith('.tmp'):
+                    if stat.st_mtime + STALE_TMP_SECONDS <= now:
+                        removed += self._remove_path(path)
+                elif stat.st_mtime + self.ttl <= now:
+                    removed += self._remove_path(path)
+                else:
+                    kept.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+
+        # Oldest first, down to 90% of the cap so pruning doesn't run on every spill
+        if total > self.max_disk_bytes:
+            for _, size, path in sorted(kept):
+                if total <= self.max_disk_bytes * 0.9:
+                    break
+                if self._remove_path(path):
+                    removed += 1
+                    total -= size
+
+        with self._disk_lock:
+            self._disk_bytes = total
+        with self._lock:
+            self.stats['disk_pruned'] += removed
+        if removed:
+            logger.info(f"Pruned {removed} spilled renders from disk")
+        return removed
+
+    @staticmethod
+    def _remove_path(path: str) -> bool:
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        return True
+
+    def get_hit_rate(self) -> float:
+        """Calculate cache hit rate percentage"""
+        total = self.stats['hits'] + self.stats['misses']
+        return (self.stats['hits'] / total * 100) if total > 0 else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                'hit_rate': round(self.get_hit_rate(), 2),
+                'entries': len(self.entries),
+                'memory_bytes': self.memory_bytes,
+                'disk_bytes': self._disk_bytes,
+                'cache_dir': self.cache_dir
+            }
+
+    def clear(self):
+        """Clear memory and spilled entries"""
+        with self._lock:
+            for key in list(self.entries):
+                self._drop(key)
+        logger.info("Render cache cleared")
+
+
+# Singleton instance
+render_cache = RenderCache()
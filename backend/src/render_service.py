@@ -0,0 +1,383 @@
+"""
+Render Service - Document rendering in a dedicated process pool
+ReportLab and python-docx rendering is CPU-bound; run on the request thread it
+blocks every other greenlet in a gevent worker (including live interview turns).
+Renders run in worker processes instead, behind a bounded queue with per-job
+timeouts and a per-process memory cap.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import (ProcessPoolExecutor, TimeoutError as FutureTimeout, CancelledError,
+                                wait, FIRST_COMPLETED)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple, Dict, Any, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# 0 renders inline on the calling thread (development, tests)
+RENDER_WORKERS = int(os.getenv('RENDER_WORKERS', min(2, os.cpu_count() or 1)))
+# Renders waiting or running at once; further requests are rejected
+RENDER_MAX_PENDING = int(os.getenv('RENDER_MAX_PENDING', RENDER_WORKERS * 4))
+RENDER_TIMEOUT = float(os.getenv('RENDER_TIMEOUT', 20))
+# Address-space cap per render process (bytes); 0 disables
+RENDER_MEMORY_LIMIT = int(os.getenv('RENDER_MEMORY_LIMIT', 1024 * 1024 * 1024))
+# Worker processes are replaced after this many renders (Python 3.11+)
+RENDER_TASKS_PER_CHILD = int(os.getenv('RENDER_TASKS_PER_CHILD', 200))
+# Times a render lost to a pool restart (another render's timeout or crash) is resubmitted
+RENDER_RESUBMITS = int(os.getenv('RENDER_RESUBMITS', 1))
+
+
+class RenderError(Exception):
+    """Base class for render service failures"""
+
+
+class RenderQueueFull(RenderError):
+    """Raised when the render queue is at capacity"""
+
+
+class RenderTimeout(RenderError):
+    """Raised when a render exceeds its time budget"""
+
+
+def _init_worker(memory_limit):
+    """Process pool initializer: cap memory and warm the renderer imports."""
+    if memory_limit:
+        try:
+            import resource
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        except (ImportError, ValueError, OSError) as e:
+            logger.warning(f"Render worker memory limit not applied: {e}")
+    try:
+        from . import pdf_generator  # noqa: F401
+    except ImportError:
+        pass
+
+
+def _render_task(fmt: str, markdown_text: str, template_id: str, document=None) -> Tuple[bytes, str]:
+    """Worker task: render one document. Returns (bytes, tier)."""
+    if fmt == 'pdf':
+        from .pdf_generator import render_pdf_with_fallbacks
+        return render_pdf_with_fallbacks(markdown_text, template_id, document=document)
+    if fmt == 'docx':
+        from .docx_generator import markdown_to_docx
+        return markdown_to_docx(markdown_text, template_id, resume=document), 'primary'
+    raise ValueError(f"Unsupported render format: {fmt}")
+
+
+def _render_file_task(fmt: str, markdown_text: str, template_id: str, path: str) -> Tuple[int, str]:
+    """Worker task: render one document into `path`. Returns (size, tier); the bytes never leave the worker."""
+    data, tier = _render_task(fmt, markdown_text, template_id)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data), tier
+
+
+class RenderService:
+    """
+    Bounded process-pool renderer.
+    The pool is created lazily so it is started inside each gunicorn worker
+    (preload_app forks after import) rather than in the master.
+    """
+
+    def __init__(self, workers=RENDER_WORKERS, max_pending=RENDER_MAX_PENDING, timeout=RENDER_TIMEOUT,
+                 memory_limit=RENDER_MEMORY_LIMIT, tasks_per_child=RENDER_TASKS_PER_CHILD):
+        """
+        Initialize render service
+
+        Args:
+            workers: Render processes (0 = render inline)
+            max_pending: Renders admitted at once (queued + running)
+            timeout: Default seconds a render may take before it is abandoned
+            memory_limit: RLIMIT_AS per render process in bytes (0 = unlimited)
+            tasks_per_child: Renders before a worker process is replaced
+        """
+        self.workers = workers
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.tasks_per_child = tasks_per_child
+
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'renders': 0,
+            'failures': 0,
+            'timeouts': 0,
+            'rejected': 0,
+            'pool_restarts': 0,
+            'resubmitted': 0,
+            'pending': 0,
+            'total_seconds': 0.0
+        }
+
+    def render(self, fmt: str, markdown_text: str, template_id: str, timeout: float = None) -> Tuple[bytes, str]:
+        """
+        Render a document
+
+        Args:
+            fmt: 'pdf' or 'docx'
+            markdown_text: Resume markdown
+            template_id: Template identifier
+            timeout: Seconds before giving up (default: service timeout)
+
+        Returns:
+            (bytes, tier) as produced by the renderer
+
+        Raises:
+            RenderQueueFull: Too many renders in flight
+            RenderTimeout: The render did not finish in time
+        """
+        return self._run(_render_task, (fmt, markdown_text, template_id), f"{template_id} ({fmt})", timeout)
+
+    def render_to_file(self, fmt: str, markdown_text: str, template_id: str, path: str,
+                       timeout: float = None) -> Tuple[int, str]:
+        """
+        Render a document into a file written by the render process
+
+        The document is not copied back through the pool's result pipe, so the
+        caller's memory use does not grow with document size.
+
+        Args:
+            fmt: 'pdf' or 'docx'
+            markdown_text: Resume markdown
+            template_id: Template identifier
+            path: Destination file (overwritten)
+            timeout: Seconds before giving up (default: service timeout)
+
+        Returns:
+            (size, tier)
+
+        Raises:
+            RenderQueueFull: Too many renders in flight
+            RenderTimeout: The render did not finish in time
+        """
+        return self._run(_render_file_task, (fmt, markdown_text, template_id, path), f"{template_id} ({fmt})", timeout)
+
+    def _run(self, task, args, label, timeout):
+        if not self._slots.acquire(blocking=False):
+            self._count('rejected')
+            raise RenderQueueFull(f"{self.max_pending} renders already in progress")
+
+        started = time.monotonic()
+        self._count('pending')
+        outcome = 'failures'
+        try:
+            if self.workers <= 0:
+                result = task(*args)
+            else:
+                result = self._run_in_pool(task, args, label, timeout or self.timeout)
+            outcome = 'renders'
+            return result
+        except RenderTimeout:
+            outcome = 'timeouts'
+            raise
+        finally:
+            self._finish(outcome, started)
+            self._slots.release()
+
+    def render_batch(self, fmt: str, markdown_text: str, template_ids: Iterable[str], document=None,
+                     timeout: float = None) -> Iterator[Tuple[str, Optional[Tuple[bytes, str]], Optional[Exception]]]:
+        """
+        Render one resume in several templates, yielding each as it finishes
+
+        The whole batch takes a single admission slot, and at most `workers`
+        of its renders are in the pool at once so a gallery cannot starve
+        single downloads queued behind it. N templates therefore take about
+        ceil(N / workers) render times (20 on the default 2 workers: ~10);
+        raise RENDER_WORKERS to trade CPU for gallery latency.
+
+        Args:
+            fmt: 'pdf' or 'docx'
+            markdown_text: Resume markdown
+            template_ids: Templates to render
+            document: ResumeDocument parsed once by the caller and shared by every render
+            timeout: Seconds to wait for the next render to finish (default: service timeout)
+
+        Yields:
+            (template_id, (bytes, tier), None) on success or (template_id, None, error) on failure
+
+        Raises:
+            RenderQueueFull: Too many renders in flight (raised on first iteration)
+        """
+        if not self._slots.acquire(blocking=False):
+            self._count('rejected')
+            raise RenderQueueFull(f"{self.max_pending} renders already in progress")
+
+        timeout = timeout or self.timeout
+        in_flight = {}
+        try:
+            if self.workers <= 0:
+                for template_id in template_ids:
+                    started = time.monotonic()
+                    self._count('pending')
+                    try:
+                        result = _render_task(fmt, markdown_text, template_id, document)
+                    except Exception as e:
+                        self._finish('failures', started)
+                        yield template_id, None, e
+                    else:
+                        self._finish('renders', started)
+                        yield template_id, result, None
+                return
+
+            queued = list(template_ids)
+            resubmits = {}
+            executor = self._get_executor()
+            while queued or in_flight:
+                while queued and len(in_flight) < self.workers:
+                    template_id = queued.pop(0)
+                    self._count('pending')
+                    executor, future = self._submit(_render_task, (fmt, markdown_text, template_id, document))
+                    in_flight[future] = (template_id, time.monotonic())
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Nothing finished in time: everything in flight is stuck
+                    self._restart_pool(executor)
+                    executor = self._get_executor()
+                    for template_id, started in in_flight.values():
+                        self._finish('timeouts', started)
+                        yield template_id, None, RenderTimeout(f"Render of {template_id} ({fmt}) exceeded {timeout:.0f}s")
+                    in_flight.clear()
+                    continue
+
+                for future in done:
+                    template_id, started = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if isinstance(e, (BrokenProcessPool, CancelledError)):
+                            self._restart_pool(executor)
+                            executor = self._get_executor()
+                            if resubmits.get(template_id, 0) < RENDER_RESUBMITS:
+                                # Lost to a pool restart, not its own fault (most likely): try again
+                                resubmits[template_id] = resubmits.get(template_id, 0) + 1
+                                self._finish_resubmitted(started)
+                                queued.insert(0, template_id)
+                                continue
+                        self._finish('failures', started)
+                        yield template_id, None, e
+                    else:
+                        self._finish('renders', started)
+                        yield template_id, result, None
+        finally:
+            # Also runs when the consumer stops early (e.g. client disconnect)
+            for future, (_, started) in in_flight.items():
+                future.cancel()
+                self._finish('failures', started)
+            self._slots.release()
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _finish_resubmitted(self, started):
+        with self._stats_lock:
+            self.stats['resubmitted'] += 1
+            self.stats['pending'] -= 1
+            self.stats['total_seconds'] += time.monotonic() - started
+
+    def _finish(self, outcome, started):
+        with self._stats_lock:
+            self.stats[outcome] += 1
+            self.stats['pending'] -= 1
+            self.stats['total_seconds'] += time.monotonic() - started
+
+    def _run_in_pool(self, task, args, label, timeout):
+        deadline = time.monotonic() + timeout
+        for attempt in range(RENDER_RESUBMITS + 1):
+            executor, future = self._submit(task, args)
+            try:
+                # Under gevent's monkey patching this wait yields to other greenlets
+                return future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                if not future.cancel():
+                    # Already running: the only way to stop it is to replace the pool
+                    self._restart_pool(executor)
+                raise RenderTimeout(f"Render of {label} exceeded {timeout:.0f}s")
+            except (BrokenProcessPool, CancelledError) as e:
+                # The pool was replaced under this render (another render timed out or a
+                # worker died, e.g. memory limit): run it again in the new pool
+                self._restart_pool(executor)
+                if attempt == RENDER_RESUBMITS or time.monotonic() >= deadline:
+                    raise BrokenProcessPool(f"Render of {label} lost to a render pool restart") from e
+                self._count('resubmitted')
+                logger.info(f"Resubmitting render of {label} after a pool restart")
+
+    def _submit(self, task, args):
+        executor = self._get_executor()
+        try:
+            return executor, executor.submit(task, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # Shut down by another request between lookup and submit
+            self._restart_pool(executor)
+            executor = self._get_executor()
+            return executor, executor.submit(task, *args)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                methods = multiprocessing.get_all_start_methods()
+                # forkserver children start clean instead of inheriting a monkey-patched worker
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                kwargs = {}
+                if sys.version_info >= (3, 11) and self.tasks_per_child:
+                    kwargs['max_tasks_per_child'] = self.tasks_per_child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=context,
+                    initializer=_init_worker, initargs=(self.memory_limit,), **kwargs
+                )
+                self._executor_pid = os.getpid()
+                logger.info(f"Render pool started ({self.workers} workers, {context.get_start_method()})")
+            return self._executor
+
+    def _restart_pool(self, executor: ProcessPoolExecutor):
+        """
+        Replace the pool. Renders still queued or running in it fail with
+        CancelledError / BrokenProcessPool, and their callers resubmit them
+        (up to RENDER_RESUBMITS times) to the new pool.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return  # Another request already replaced it
+            self._executor = None
+        self._count('pool_restarts')
+        logger.warning("Restarting render pool")
+        # ProcessPoolExecutor has no per-task cancel; terminate its workers directly
+        for process in list(getattr(executor, '_processes', {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        # Python 3.8: no cancel_futures, cancel the queued renders directly
+        for work_item in list(getattr(executor, '_pending_work_items', {}).values()):
+            work_item.future.cancel()
+        executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get render statistics"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        completed = stats['renders'] + stats['failures'] + stats['timeouts']
+        return {
+            **stats,
+            'total_seconds': round(stats['total_seconds'], 2),
+            'avg_seconds': round(stats['total_seconds'] / completed, 3) if completed else 0,
+            'workers': self.workers,
+            'max_pending': self.max_pending
+        }
+
+
+# Singleton instance
+render_service = RenderService()
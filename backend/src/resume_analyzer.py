@@ -1,24 +1,25 @@
 import os
 import json
 import logging
-from pypdf import PdfReader
+from .pdf_ingest import extract_pdf_text, ANALYSIS_CHAR_LIMIT
 from .grok_client import generate_resume_analysis
 from .prompts import DETAILED_RESUME_ANALYSIS_PROMPT
-from .resume_parser import extract_candidate_info
+from .resume_cache import resume_cache, get_candidate_info, PROMPT_VERSION
 
 logger = logging.getLogger(__name__)
 
-def parse_resume(filepath):
-    """Extracts text from a PDF or TXT file."""
+def parse_resume(filepath, max_chars=ANALYSIS_CHAR_LIMIT):
+    """
+    Extracts text from a PDF or TXT file.
+    PDF extraction stops on the first page boundary past max_chars (None reads every page in the budget).
+    """
     try:
         ext = os.path.splitext(filepath)[1].lower()
         text = ""
         
         if ext == '.pdf':
             try:
-                reader = PdfReader(filepath)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
+                text = extract_pdf_text(filepath, max_chars=max_chars)
             except Exception as e:
                 logger.error(f"Error reading PDF: {e}")
                 return None
@@ -41,9 +42,18 @@ def analyze_resume_content(text):
     """Analyzes resume text using Gemini and returns a structured JSON response."""
     if not text or len(text) < 50:
         return {"error": "Resume content is too short or empty."}
-        
+    
+    # Identical resumes (re-uploads, recreation verification) reuse the stored analysis
+    return resume_cache.get_or_compute(
+        text, 'analysis', lambda: _analyze_resume_content_uncached(text),
+        version=PROMPT_VERSION,
+        should_cache=lambda result: isinstance(result, dict) and "error" not in result
+    )
+
+def _analyze_resume_content_uncached(text):
+    """Runs the LLM analysis for a resume that is not in the cache."""
     try:
-        prompt = DETAILED_RESUME_ANALYSIS_PROMPT.format(resume_text=text[:15000]) # Limit context
+        prompt = DETAILED_RESUME_ANALYSIS_PROMPT.format(resume_text=text[:ANALYSIS_CHAR_LIMIT]) # Limit context
         response = generate_resume_analysis(prompt)
         
         logger.info(f"Gemini response type: {type(response)}")
@@ -61,7 +71,7 @@ def analyze_resume_content(text):
                 return {"error": "AI returned unexpected format. Please try again."}
             
             # Extract structured data from resume (Regex fallback)
-            regex_data = extract_candidate_info(text)
+            regex_data = get_candidate_info(text)
             
             # Extract structured data from AI response
             ai_data = response.get("structured_data", {})
@@ -0,0 +1,224 @@
+"""
+Resume AST - Single-pass markdown parse shared by the PDF and DOCX generators
+Builds a compact document model (sections, blocks, bold spans, contact fields)
+in one walk over the lines. Documents are memoized by content hash, so the
+preview, downloads and every template in a gallery reuse one parse.
+"""
+
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Tuple, Dict, Optional, List, Union
+
+logger = logging.getLogger(__name__)
+
+# Patterns are the ones the generators have always used, so renders are unchanged
+_NAME_RE = re.compile(r'#\s+(.+)')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_EMAIL_RE = re.compile(r'([a-zA-Z0-9._-]+@[a-zA-Z0-9._-]+\.[a-zA-Z0-9_-]+)')
+_LINKEDIN_RE = re.compile(r'(linkedin\.com\/in\/[^\s)]+)')
+# These two may match across a line break, so they run over the full text
+_PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9})')
+_LOCATION_RE = re.compile(r'([A-Z][a-z]+,\s*[A-Z]{2}|[A-Z][a-z]+,\s*[A-Z][a-z]+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Section aliases used when no section matches a requested key directly
+SECTION_VARIATIONS = {
+    'experience': ['professional_experience', 'work_experience', 'employment', 'work_history'],
+    'skills': ['technical_skills', 'core_competencies', 'key_skills', 'expertise'],
+    'education': ['academic_background', 'qualifications', 'academic_qualifications'],
+    'projects': ['key_projects', 'notable_projects', 'project_experience'],
+    'summary': ['professional_summary', 'profile', 'about', 'professional_profile'],
+    'certifications': ['certificates', 'professional_certifications']
+}
+
+DOCUMENT_CACHE_SIZE = 128
+
+
+class Span(NamedTuple):
+    """Inline run of text"""
+    text: str
+    bold: bool = False
+
+
+class Block(NamedTuple):
+    """One non-empty line of a section"""
+    kind: str  # 'heading' (###), 'bullet' (- or *) or 'text'
+    text: str  # Line content without its marker
+    spans: Tuple[Span, ...]
+
+
+def _spans(text: str) -> Tuple[Span, ...]:
+    # split() with a capture group alternates plain and bold parts
+    parts = _BOLD_RE.split(text)
+    return tuple(Span(part, bool(i % 2)) for i, part in enumerate(parts))
+
+
+def _block(line: str) -> Block:
+    if line.startswith('### '):
+        return Block('heading', line[4:], (Span(line[4:]),))
+    if line.startswith('- ') or line.startswith('* '):
+        return Block('bullet', line[2:], _spans(line[2:]))
+    return Block('text', line, _spans(line))
+
+
+class ResumeDocument:
+    """
+    Parsed resume. Shared between renders (and pickled to render workers),
+    so treat it as read-only.
+
+    `sections` maps 'name', 'title', 'contact' and each '## ' section (lowercased,
+    spaces as underscores) to its content; `blocks` holds each section's lines.
+    """
+
+    def __init__(self, markdown: str, sections: Dict[str, Union[str, dict]], blocks: Dict[str, Tuple[Block, ...]]):
+        self.markdown = markdown
+        self.sections = sections
+        self.blocks = blocks
+
+    @property
+    def name(self) -> str:
+        return self.sections['name']
+
+    @property
+    def title(self) -> str:
+        return self.sections['title']
+
+    @property
+    def contact(self) -> Dict[str, str]:
+        return self.sections['contact']
+
+    def resolve(self, keys, fuzzy: bool = True) -> Optional[str]:
+        """
+        Find the section name for a list of candidate keys
+
+        Args:
+            keys: Key or list of keys in order of preference
+            fuzzy: Also try normalized, partial and alias matches
+
+        Returns:
+            Section name, or None if nothing matches
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+
+        for key in keys:
+            if key in self.sections:
+                return key
+        if not fuzzy:
+            return None
+
+        for key in keys:
+            key_lower = key.lower().replace(' ', '_')
+            if key_lower in self.sections:
+                return key_lower
+
+        for key in keys:
+            key_lower = key.lower()
+            for section_name in self.sections:
+                if key_lower in section_name or section_name in key_lower:
+                    return section_name
+
+        for key in keys:
+            for variation in SECTION_VARIATIONS.get(key.lower().replace(' ', '_'), []):
+                if variation in self.sections:
+                    return variation
+        return None
+
+    def get_section(self, keys, fuzzy: bool = True):
+        """Get section content ('' if missing)"""
+        name = self.resolve(keys, fuzzy)
+        return self.sections[name] if name is not None else ""
+
+    def get_blocks(self, keys, fuzzy: bool = True) -> Tuple[Block, ...]:
+        """Get section blocks (empty if missing)"""
+        name = self.resolve(keys, fuzzy)
+        return self.blocks.get(name, ()) if name is not None else ()
+
+
+def _extract_contact(markdown: str, lines: List[str]) -> Dict[str, str]:
+    contact = {}
+    for key, pattern in (('email', _EMAIL_RE), ('phone', _PHONE_RE), ('linkedin', _LINKEDIN_RE),
+                         ('location', _LOCATION_RE)):
+        if pattern is _PHONE_RE or pattern is _LOCATION_RE:
+            match = pattern.search(markdown)
+        else:
+            # Cannot span lines, so the first matching line holds the first match
+            match = next(filter(None, (pattern.search(line) for line in lines)), None)
+        if match:
+            contact[key] = match.group(1)
+    return contact
+
+
+def _parse(markdown: str) -> ResumeDocument:
+    lines = markdown.split('\n')
+    name = None
+    title = None
+    section_order = []
+
+    current_section = None
+    content_lines = []
+    offset = 0
+    for raw in lines:
+        if name is None and raw.startswith('#'):
+            match = _NAME_RE.match(markdown, offset)
+            if match:
+                name = match.group(1).strip()
+        if title is None and '**' in raw:
+            match = _BOLD_RE.search(raw)
+            if match:
+                title = match.group(1).strip()
+        offset += len(raw) + 1
+
+        line = raw.strip()
+        if line.startswith('## '):
+            if current_section and content_lines:
+                section_order.append((current_section, content_lines))
+            current_section = _WHITESPACE_RE.sub('_', line[3:].strip().lower())
+            content_lines = []
+        elif current_section:
+            content_lines.append(line)
+    if current_section and content_lines:
+        section_order.append((current_section, content_lines))
+
+    sections = {
+        'name': name if name is not None else 'Your Name',
+        'title': title if title is not None else '',
+        'contact': _extract_contact(markdown, lines)
+    }
+    blocks = {}
+    for section_name, content in section_order:
+        sections[section_name] = '\n'.join(content).strip()
+        blocks[section_name] = tuple(_block(line) for line in content if line)
+    return ResumeDocument(markdown, sections, blocks)
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_resume(markdown_text: str) -> ResumeDocument:
+    """
+    Parse resume markdown, reusing the result for identical content
+
+    Args:
+        markdown_text: Resume markdown
+
+    Returns:
+        Shared ResumeDocument
+    """
+    key = hashlib.sha256(markdown_text.encode('utf-8')).hexdigest()
+    with _cache_lock:
+        document = _cache.get(key)
+        if document is not None:
+            _cache.move_to_end(key)
+            return document
+
+    document = _parse(markdown_text)
+    with _cache_lock:
+        _cache[key] = document
+        while len(_cache) > DOCUMENT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return document
@@ -0,0 +1,340 @@
+"""
+Resume Cache - Content-hash keyed cache for resume parsing and AI analysis
+Shares extracted candidate info, spaCy parses and full AI analyses across the
+upload, interview and recreation entry points, persisted to disk across restarts.
+"""
+
+import os
+import copy
+import json
+import hashlib
+import logging
+import tempfile
+import threading
+import unicodedata
+import re
+from typing import Optional, Dict, Any, Callable
+from datetime import datetime, timedelta
+from collections import OrderedDict
+
+from .prompts import DETAILED_RESUME_ANALYSIS_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# Any edit to the analysis prompt invalidates previously cached analyses
+PROMPT_VERSION = hashlib.sha256(DETAILED_RESUME_ANALYSIS_PROMPT.encode('utf-8')).hexdigest()[:12]
+
+# Bump when the regex/spaCy extraction output format changes
+PARSER_VERSION = "2"
+
+DEFAULT_CACHE_DIR = os.getenv(
+    'RESUME_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache', 'resume')
+)
+
+# Entries kept on disk; past it the expired and then the oldest are pruned
+MAX_DISK_ENTRIES = int(os.getenv('RESUME_CACHE_MAX_DISK_ENTRIES', 5000))
+
+_WHITESPACE_RE = re.compile(r'[ \t\r\f\v]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize resume text so trivially different extractions share a key.
+    Unicode NFC, unified line endings, collapsed horizontal whitespace.
+    """
+    text = unicodedata.normalize('NFC', text or '')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = _WHITESPACE_RE.sub(' ', text)
+    text = '\n'.join(line.strip() for line in text.split('\n'))
+    return _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+
+class ResumeCache:
+    """
+    Two-tier cache (in-memory LRU in front of a JSON file store) keyed by
+    SHA-256 of the normalized resume text, the entry kind and its version.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=7 * 86400, max_size=1000,
+                 max_disk_entries=MAX_DISK_ENTRIES):
+        """
+        Initialize resume cache
+
+        Args:
+            cache_dir: Directory for persisted entries (None disables disk persistence)
+            ttl: Time to live in seconds (default: 7 days)
+            max_size: Maximum number of entries kept in memory
+            max_disk_entries: Maximum number of entries kept on disk
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_disk_entries = max_disk_entries
+        self.memory_cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_entries = None  # Unknown until the first write prunes the directory
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Resume cache directory unavailable ({e}). Using memory only")
+                self.cache_dir = None
+
+        self.stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'evictions': 0,
+            'disk_pruned': 0
+        }
+        logger.info(f"Resume cache initialized (dir={self.cache_dir}, max_size={max_size}, ttl={ttl}s)")
+
+    def generate_key(self, text: str, kind: str, version: str = PARSER_VERSION) -> str:
+        """
+        Generate cache key from resume text
+
+        Args:
+            text: Raw resume text
+            kind: Entry type ('candidate_info', 'spacy_parse', 'analysis')
+            version: Prompt or parser version the entry was produced with
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{kind}:{version}\n".encode('utf-8'))
+        digest.update(normalize_text(text).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve a cached value, checking memory first and then disk
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        with self._lock:
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                if self._is_fresh(entry):
+                    self.memory_cache.move_to_end(key)
+                    self.stats['hits'] += 1
+                    # Callers decorate results (e.g. add filenames); never hand out the cached object
+                    return copy.deepcopy(entry['value'])
+                del self.memory_cache[key]
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            if self._is_fresh(entry):
+                with self._lock:
+                    self._remember(key, entry)
+                    self.stats['hits'] += 1
+                    self.stats['disk_hits'] += 1
+                return copy.deepcopy(entry['value'])
+            # Expired resume data does not stay on disk
+            self._remove_disk(self._path_for(key))
+
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Any):
+        """
+        Store a JSON-serializable value in memory and on disk
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        entry = {
+            'value': copy.deepcopy(value),
+            'created_at': datetime.now().isoformat(),
+            'expires_at': (datetime.now() + timedelta(seconds=self.ttl)).isoformat()
+        }
+        with self._lock:
+            self._remember(key, entry)
+            self.stats['sets'] += 1
+        self._write_disk(key, entry)
+
+    def get_or_compute(self, text: str, kind: str, compute: Callable[[], Any],
+                       version: str = PARSER_VERSION, should_cache: Callable[[Any], bool] = None) -> Any:
+        """
+        Return the cached value for (text, kind, version) or compute and store it
+
+        Args:
+            text: Raw resume text
+            kind: Entry type
+            compute: Zero-argument callable producing the value on a miss
+            version: Prompt or parser version
+            should_cache: Optional predicate; results failing it are returned but not stored
+        """
+        key = self.generate_key(text, kind, version)
+        cached = self.get(key)
+        if cached is not None:
+            logger.info(f"Resume cache hit ({kind}, {key[:12]})")
+            return cached
+
+        value = compute()
+        if value is not None and (should_cache is None or should_cache(value)):
+            self.set(key, value)
+        return value
+
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return datetime.fromisoformat(entry['expires_at']) > datetime.now()
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """Insert into the in-memory LRU (caller holds the lock)"""
+        if key not in self.memory_cache and len(self.memory_cache) >= self.max_size:
+            self.memory_cache.popitem(last=False)
+            self.stats['evictions'] += 1
+        self.memory_cache[key] = entry
+        self.memory_cache.move_to_end(key)
+
+    def _path_for(self, key: str) -> str:
+        # Two-level fan-out keeps directories small
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.cache_dir:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable resume cache entry {key[:12]}: {e}")
+            self._remove_disk(path)
+            return None
+
+    def _remove_disk(self, path: str) -> bool:
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+        with self._disk_lock:
+            if self._disk_entries is not None:
+                self._disk_entries = max(0, self._disk_entries - 1)
+        return True
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.json'):
+                    yield os.path.join(root, name)
+
+    def prune_disk(self) -> int:
+        """
+        Delete expired disk entries, then the oldest ones past max_disk_entries
+
+        Returns:
+            Number of entries deleted
+        """
+        if not self.cache_dir:
+            return 0
+        now = datetime.now()
+        kept, removed = [], 0
+        for path in list(self._disk_files()):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    expired = datetime.fromisoformat(json.load(f)['expires_at']) <= now
+                mtime = os.path.getmtime(path)
+            except FileNotFoundError:
+                continue  # Pruned by another worker meanwhile
+            except (OSError, ValueError, KeyError, TypeError):
+                expired, mtime = True, 0
+            if expired:
+                removed += self._remove_disk(path)
+            else:
+                kept.append((mtime, path))
+
+        # Oldest first, down to 90% of the cap so pruning doesn't run on every write
+        excess = len(kept) - self.max_disk_entries
+        if excess > 0:
+            excess += self.max_disk_entries // 10
+            for _, path in sorted(kept)[:excess]:
+                removed += self._remove_disk(path)
+
+        with self._disk_lock:
+            self._disk_entries = sum(1 for _ in self._disk_files())
+        with self._lock:
+            self.stats['disk_pruned'] += removed
+        if removed:
+            logger.info(f"Pruned {removed} resume cache entries from disk")
+        return removed
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]):
+        if not self.cache_dir:
+            return
+        if self._disk_entries is None:
+            # First write of this process (not at import, so booting workers don't
+            # all scan the shared directory): drop what expired while it was unused
+            self.prune_disk()
+        path = self._path_for(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            existed = os.path.exists(path)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Resume cache write error: {e}")
+            return
+        if not existed:
+            with self._disk_lock:
+                self._disk_entries += 1
+                over_cap = self._disk_entries > self.max_disk_entries
+            if over_cap:
+                self.prune_disk()
+
+    def get_hit_rate(self) -> float:
+        """Calculate cache hit rate percentage"""
+        total = self.stats['hits'] + self.stats['misses']
+        return (self.stats['hits'] / total * 100) if total > 0 else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            **self.stats,
+            'hit_rate': round(self.get_hit_rate(), 2),
+            'size': len(self.memory_cache),
+            'disk_entries': self._disk_entries,
+            'cache_dir': self.cache_dir
+        }
+
+    def clear(self):
+        """Clear memory and disk entries"""
+        with self._lock:
+            self.memory_cache.clear()
+        if self.cache_dir:
+            for path in list(self._disk_files()):
+                self._remove_disk(path)
+        logger.info("Resume cache cleared")
+
+
+# Singleton instance
+resume_cache = ResumeCache()
+
+
+def get_candidate_info(resume_text: str) -> Dict[str, Any]:
+    """Cached resume_parser.extract_candidate_info"""
+    from .resume_parser import extract_candidate_info
+    return resume_cache.get_or_compute(resume_text, 'candidate_info', lambda: extract_candidate_info(resume_text))
+
+
+def get_spacy_parse(resume_text: str) -> Dict[str, Any]:
+    """Cached spacy_parser.parse_resume (empty results are not stored, so a later model load is picked up)"""
+    from .spacy_parser import parse_resume
+    return resume_cache.get_or_compute(resume_text, 'spacy_parse', lambda: parse_resume(resume_text),
+                                       should_cache=bool)
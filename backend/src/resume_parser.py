@@ -1,9 +1,202 @@
 import re
 import logging
+from collections import deque
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Pattern registry - everything is compiled once at import time
+# ---------------------------------------------------------------------------
+
+# Section headings recognised by the segmenter, mapped to a canonical name.
+# Headings that are not extracted still matter: they terminate the previous section.
+SECTION_HEADINGS = {
+    'skills': ['skills', 'technical skills', 'technologies', 'expertise', 'core competencies',
+               'key skills', 'skills & tools', 'tools & technologies'],
+    'projects': ['projects', 'personal projects', 'academic projects', 'key projects', 'notable projects'],
+    'experience': ['experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'internships', 'internship'],
+    'education': ['education', 'academic background', 'qualifications', 'academic qualifications'],
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'career objective', 'about me'],
+    'certifications': ['certifications', 'certificates', 'licenses & certifications'],
+    'achievements': ['achievements', 'awards', 'honors', 'honors & awards', 'accomplishments'],
+    'other': ['languages', 'interests', 'hobbies', 'publications', 'references', 'volunteering',
+              'extracurricular activities', 'contact', 'contact information', 'declaration'],
+}
+_HEADING_LOOKUP = {alias: canonical for canonical, aliases in SECTION_HEADINGS.items() for alias in aliases}
+_HEADING_MAX_LENGTH = max(len(alias) for alias in _HEADING_LOOKUP)
+
+# Common skill keywords and technologies, in reporting priority order
+SKILL_DICTIONARY = [
+    # Programming languages
+    ['Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin',
+     'PHP', 'R', 'MATLAB', 'Scala'],
+    # Frameworks
+    ['React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI', 'Spring', 'Node.js', 'Express', 'TensorFlow',
+     'PyTorch', 'Keras', 'Scikit-learn'],
+    # Databases
+    ['MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Cassandra', 'Oracle', 'SQL Server', 'DynamoDB',
+     'Elasticsearch'],
+    # Cloud & DevOps
+    ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git', 'CI/CD', 'Terraform', 'Ansible'],
+    # Data Science & ML
+    ['Machine Learning', 'Deep Learning', 'NLP', 'Computer Vision', 'Data Analysis', 'Pandas', 'NumPy',
+     'Matplotlib'],
+    # Other technologies
+    ['REST API', 'GraphQL', 'Microservices', 'Agile', 'Scrum', 'Linux', 'Unix', 'Bash'],
+]
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_HEADING_STRIP_CHARS = '#*_-=•| \t'
+_PROJECT_SPLIT_RE = re.compile(r'\n\s*[-•*]\s*|\n\s*\d+\.\s*')
+# Job patterns are applied per line, so the character classes never span line breaks
+_JOB_PATTERNS = [
+    re.compile(r'([A-Z][A-Za-z &]+(?:Inc|LLC|Ltd|Corporation|Corp)?)[ \t]*[-–|][ \t]*([A-Z][A-Za-z ]+)'),  # Company - Title
+    re.compile(r'([A-Z][A-Za-z ]+?)[ \t]+at[ \t]+([A-Z][A-Za-z &]+)'),  # Title at Company
+]
+_DEGREE_PATTERNS = [
+    re.compile(r'(Bachelor|Master|PhD|B\.Tech|M\.Tech|B\.S|M\.S|MBA).*?(?:in|of)\s+([A-Za-z ]+)', re.IGNORECASE),
+    re.compile(r'(B\.E|M\.E|B\.Sc|M\.Sc).*?(?:in|of)?\s+([A-Za-z ]+)', re.IGNORECASE),
+]
+_NAME_SKIP_KEYWORDS = ('resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact')
+_NAME_LABEL_RE = re.compile(r'(?:Name|Full Name|Candidate)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Look for patterns with at least 10 digits, possibly separated by -, space, or . (may start with +)
+_PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton for case-insensitive multi-keyword search.
+    Finds every dictionary entry in a single pass over the text, independent
+    of how many keywords are registered.
+    """
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords: Iterable of (phrase, payload) pairs
+        """
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for phrase, payload in keywords:
+            self._add(phrase.lower(), payload)
+        self._build_failure_links()
+
+    def _add(self, phrase, payload):
+        state = 0
+        for char in phrase:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(phrase), payload))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_all(self, text):
+        """
+        Yield (start, end, payload) for every whole-word keyword occurrence.
+        """
+        lowered = text.lower()
+        length = len(lowered)
+        state = 0
+        for index, char in enumerate(lowered):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for phrase_length, payload in self._output[state]:
+                start = index - phrase_length + 1
+                end = index + 1
+                if start > 0 and _is_word_char(lowered[start - 1]):
+                    continue
+                if end < length and _is_word_char(lowered[end]):
+                    continue
+                yield start, end, payload
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+
+SKILL_MATCHER = KeywordMatcher(
+    (skill, (priority, skill))
+    for priority, group in enumerate(SKILL_DICTIONARY)
+    for skill in group
+)
+
+
+def _match_heading(line: str):
+    """
+    Return (canonical_section, inline_content) if the line is a section heading.
+    Handles bare headings ("Skills"), markdown headings ("## Skills") and inline
+    headings ("Skills: Python, SQL").
+    """
+    stripped = line.strip().strip(_HEADING_STRIP_CHARS)
+    if not stripped:
+        return None
+
+    head, sep, rest = stripped.partition(':')
+    if len(head) > _HEADING_MAX_LENGTH + 4:
+        return None
+
+    canonical = _HEADING_LOOKUP.get(_WHITESPACE_RE.sub(' ', head.strip(_HEADING_STRIP_CHARS)).lower())
+    if canonical is None:
+        return None
+    return canonical, rest.strip() if sep else ''
+
+
+def segment_sections(text: str) -> Dict[str, str]:
+    """
+    Split resume text into headed sections in a single linear pass.
+    
+    Args:
+        text: Raw resume text
+        
+    Returns:
+        Dictionary mapping canonical section name to its body text. Text before
+        the first heading is stored under 'header'. Repeated headings are merged.
+    """
+    sections = {}
+    current = 'header'
+    buffer = []
+
+    def flush():
+        body = '\n'.join(buffer).strip()
+        if body:
+            sections[current] = f"{sections[current]}\n{body}" if current in sections else body
+
+    for line in text.split('\n'):
+        heading = _match_heading(line)
+        if heading:
+            flush()
+            current, inline_content = heading
+            buffer = [inline_content] if inline_content else []
+        else:
+            buffer.append(line.rstrip())
+
+    flush()
+    return sections
+
+
 def extract_candidate_info(resume_text: str) -> Dict:
     """
     Extract structured information from resume text.
@@ -31,14 +224,17 @@ def extract_candidate_info(resume_text: str) -> Dict:
             "topics": []
         }
     
+    # Segment once and share the result with every section extractor
+    sections = segment_sections(resume_text)
+    
     result = {
         "candidate_name": extract_name(resume_text),
         "email": extract_email(resume_text),
         "phone": extract_phone(resume_text),
-        "skills": extract_skills(resume_text),
-        "projects": extract_projects(resume_text),
-        "experience": extract_experience(resume_text),
-        "education": extract_education(resume_text),
+        "skills": extract_skills(resume_text, sections),
+        "projects": extract_projects(resume_text, sections),
+        "experience": extract_experience(resume_text, sections),
+        "education": extract_education(resume_text, sections),
         "topics": []
     }
     
@@ -57,7 +253,7 @@ def extract_name(text: str) -> Optional[str]:
     Extract candidate name from resume text.
     Assumes name is typically at the beginning of the resume.
     """
-    lines = text.strip().split('\n')
+    lines = text.strip().split('\n', 5)
     
     # Try first few lines for name
     for line in lines[:5]:
@@ -66,7 +262,7 @@ def extract_name(text: str) -> Optional[str]:
             continue
             
         # Skip common headers
-        if any(keyword in line.lower() for keyword in ['resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact']):
+        if any(keyword in line.lower() for keyword in _NAME_SKIP_KEYWORDS):
             continue
             
         # Check if line looks like a name (2-4 words, mostly alphabetic)
@@ -77,76 +273,50 @@ def extract_name(text: str) -> Optional[str]:
                 return line
     
     # Fallback: look for "Name:" pattern
-    name_match = re.search(r'(?:Name|Full Name|Candidate)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', text, re.IGNORECASE)
+    name_match = _NAME_LABEL_RE.search(text)
     if name_match:
         return name_match.group(1).strip()
     
     return None
 
 
-def extract_skills(text: str) -> List[str]:
+def extract_skills(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Extract technical skills from resume text.
     """
-    skills = []
+    if sections is None:
+        sections = segment_sections(text)
     
-    # Common skill keywords and technologies
-    skill_patterns = [
-        # Programming languages
-        r'\b(Python|Java|JavaScript|TypeScript|C\+\+|C#|Ruby|Go|Rust|Swift|Kotlin|PHP|R|MATLAB|Scala)\b',
-        # Frameworks
-        r'\b(React|Angular|Vue|Django|Flask|FastAPI|Spring|Node\.js|Express|TensorFlow|PyTorch|Keras|Scikit-learn)\b',
-        # Databases
-        r'\b(MySQL|PostgreSQL|MongoDB|Redis|Cassandra|Oracle|SQL Server|DynamoDB|Elasticsearch)\b',
-        # Cloud & DevOps
-        r'\b(AWS|Azure|GCP|Docker|Kubernetes|Jenkins|Git|CI/CD|Terraform|Ansible)\b',
-        # Data Science & ML
-        r'\b(Machine Learning|Deep Learning|NLP|Computer Vision|Data Analysis|Pandas|NumPy|Matplotlib)\b',
-        # Other technologies
-        r'\b(REST API|GraphQL|Microservices|Agile|Scrum|Linux|Unix|Bash)\b'
-    ]
+    # Prefer the skills section; fall back to the whole resume
+    search_text = sections.get('skills') or text
     
-    # Look for skills section
-    skills_section = re.search(r'(?:Skills|Technical Skills|Technologies|Expertise)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|$)', 
-                               text, re.IGNORECASE | re.MULTILINE)
+    # Order by dictionary category first, then by position in the text
+    matches = sorted((priority, start, skill) for start, _, (priority, skill) in SKILL_MATCHER.find_all(search_text))
     
-    search_text = skills_section.group(1) if skills_section else text
-    
-    # Extract skills using patterns
-    for pattern in skill_patterns:
-        matches = re.finditer(pattern, search_text, re.IGNORECASE)
-        for match in matches:
-            skill = match.group(1)
-            if skill not in skills:
-                skills.append(skill)
-    
-    # Remove duplicates while preserving order
+    # Remove duplicates while preserving priority order
     seen = set()
     unique_skills = []
-    for skill in skills:
-        skill_lower = skill.lower()
-        if skill_lower not in seen:
-            seen.add(skill_lower)
+    for _, _, skill in matches:
+        if skill not in seen:
+            seen.add(skill)
             unique_skills.append(skill)
     
     return unique_skills[:15]  # Limit to top 15 skills
 
 
-def extract_projects(text: str) -> List[str]:
+def extract_projects(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Extract project names and descriptions from resume.
     """
-    projects = []
+    if sections is None:
+        sections = segment_sections(text)
     
-    # Look for projects section
-    projects_section = re.search(r'(?:Projects|Personal Projects|Academic Projects)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Experience|Education|$)', 
-                                 text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    projects = []
+    project_text = sections.get('projects')
     
-    if projects_section:
-        project_text = projects_section.group(1)
-        
+    if project_text:
         # Split by bullet points or numbered lists
-        project_items = re.split(r'\n\s*[-•*]\s*|\n\s*\d+\.\s*', project_text)
+        project_items = _PROJECT_SPLIT_RE.split('\n' + project_text)
         
         for item in project_items:
             item = item.strip()
@@ -155,64 +325,52 @@ def extract_projects(text: str) -> List[str]:
                 first_line = item.split('\n')[0].strip()
                 if first_line:
                     projects.append(first_line[:200])  # Limit length
+                    if len(projects) == 5:
+                        break
     
     return projects[:5]  # Limit to top 5 projects
 
 
-def extract_experience(text: str) -> List[str]:
+def extract_experience(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Extract work experience items from resume.
     """
-    experience = []
+    if sections is None:
+        sections = segment_sections(text)
     
-    # Look for experience section
-    exp_section = re.search(r'(?:Experience|Work Experience|Professional Experience|Employment)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Projects|Education|Skills|$)', 
-                           text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    experience = []
+    exp_text = sections.get('experience')
     
-    if exp_section:
-        exp_text = exp_section.group(1)
-        
+    if exp_text:
         # Look for company names and job titles (typically in bold or at start of line)
-        job_patterns = [
-            r'([A-Z][A-Za-z\s&]+(?:Inc|LLC|Ltd|Corporation|Corp)?)\s*[-–|]\s*([A-Z][A-Za-z\s]+)',  # Company - Title
-            r'([A-Z][A-Za-z\s]+)\s+at\s+([A-Z][A-Za-z\s&]+)',  # Title at Company
-        ]
-        
-        for pattern in job_patterns:
-            matches = re.finditer(pattern, exp_text)
-            for match in matches:
-                exp_item = f"{match.group(1)} - {match.group(2)}"
-                if exp_item not in experience:
-                    experience.append(exp_item)
+        for pattern in _JOB_PATTERNS:
+            for line in exp_text.split('\n'):
+                for match in pattern.finditer(line):
+                    exp_item = f"{match.group(1).strip()} - {match.group(2).strip()}"
+                    if exp_item not in experience:
+                        experience.append(exp_item)
     
     return experience[:5]  # Limit to top 5 experiences
 
 
-def extract_education(text: str) -> List[str]:
+def extract_education(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Extract education information from resume.
     """
-    education = []
+    if sections is None:
+        sections = segment_sections(text)
     
-    # Look for education section
-    edu_section = re.search(r'(?:Education|Academic Background|Qualifications)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Experience|Projects|Skills|$)', 
-                           text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+    education = []
+    edu_text = sections.get('education')
     
-    if edu_section:
-        edu_text = edu_section.group(1)
-        
+    if edu_text:
         # Look for degree patterns
-        degree_patterns = [
-            r'(Bachelor|Master|PhD|B\.Tech|M\.Tech|B\.S|M\.S|MBA).*?(?:in|of)\s+([A-Za-z\s]+)',
-            r'(B\.E|M\.E|B\.Sc|M\.Sc).*?(?:in|of)?\s+([A-Za-z\s]+)',
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, edu_text, re.IGNORECASE)
-            for match in matches:
-                edu_item = f"{match.group(1)} in {match.group(2)}"
-                if edu_item not in education:
-                    education.append(edu_item.strip())
+        for pattern in _DEGREE_PATTERNS:
+            for line in edu_text.split('\n'):
+                for match in pattern.finditer(line):
+                    edu_item = f"{match.group(1)} in {match.group(2)}".strip()
+                    if edu_item not in education:
+                        education.append(edu_item)
     
     return education[:3]  # Limit to top 3 education items
 
@@ -259,9 +417,7 @@ def extract_email(text: str) -> Optional[str]:
     """
     Extract email address from resume text.
     """
-    # Standard email regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    match = _EMAIL_RE.search(text)
     if match:
         return match.group(0)
     return None
@@ -272,18 +428,11 @@ def extract_phone(text: str) -> Optional[str]:
     Extract phone number from resume text.
     Handles various formats: +1-234-567-8900, (123) 456-7890, 123 456 7890, etc.
     """
-    # Regex for phone numbers - simplistic but covers common cases
-    # Look for patterns with at least 10 digits, possibly separated by -, space, or .
-    # It might start with a +
-    
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    
     # Iterate through matches and pick the first reasonable one
-    matches = re.finditer(phone_pattern, text)
-    for match in matches:
+    for match in _PHONE_RE.finditer(text):
         phone = match.group(0)
         # minimal validation: ensure it has at least 10 digits
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         if len(digits) >= 10:
             return phone.strip()
             
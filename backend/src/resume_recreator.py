@@ -1,11 +1,289 @@
+import os
+import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .grok_client import generate_resume_analysis
 from .prompts import RESUME_RECREATION_PROMPT
 from .resume_analyzer import analyze_resume_content
+from .ats_scorer import estimate_llm_score
 
 logger = logging.getLogger(__name__)
 
-def recreate_resume_with_ai(resume_text, current_score, analysis_data):
+# Speculative mode sends the standard and aggressive prompts at once instead of
+# retrying sequentially. It spends extra AI quota, so each deployment caps it.
+SPECULATIVE_RECREATION = os.getenv('RECREATION_SPECULATIVE', 'false').lower() == 'true'
+SPECULATIVE_CALL_BUDGET = int(os.getenv('RECREATION_SPECULATIVE_BUDGET', 200))
+SPECULATIVE_BUDGET_WINDOW = int(os.getenv('RECREATION_SPECULATIVE_WINDOW', 86400))
+
+# Drafts are compared with the local ATS scorer; only the accepted draft is sent
+# to the LLM analyzer. Set to false to verify every attempt with the analyzer.
+LOCAL_VERIFICATION = os.getenv('RECREATION_LOCAL_VERIFY', 'true').lower() == 'true'
+
+# AI calls per variant: one generation, plus one analysis when verifying remotely
+CALLS_PER_ATTEMPT = 1 if LOCAL_VERIFICATION else 2
+
+
+class SpeculationBudget:
+    """
+    Caps the extra AI calls speculative recreation may spend per time window
+    and tracks quota spent versus latency saved.
+    """
+
+    def __init__(self, max_extra_calls=SPECULATIVE_CALL_BUDGET, window=SPECULATIVE_BUDGET_WINDOW):
+        """
+        Initialize speculation budget
+
+        Args:
+            max_extra_calls: AI calls a sequential run would not have made, allowed per window
+            window: Budget window in seconds (default: 1 day)
+        """
+        self.max_extra_calls = max_extra_calls
+        self.window = window
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._spent = 0
+        self._reserved = 0
+        self.stats = {
+            'speculative_runs': 0,
+            'sequential_fallbacks': 0,
+            'extra_calls': 0,
+            'latency_saved_seconds': 0.0,
+            'wins_by_attempt': {}
+        }
+
+    def reserve(self, calls: int) -> bool:
+        """
+        Reserve worst-case extra calls for one speculative run
+
+        Returns:
+            True if the run fits in the remaining budget
+        """
+        with self._lock:
+            self._roll_window()
+            if self._spent + self._reserved + calls > self.max_extra_calls:
+                self.stats['sequential_fallbacks'] += 1
+                return False
+            self._reserved += calls
+            self.stats['speculative_runs'] += 1
+            return True
+
+    def settle(self, reserved: int, extra_calls: int, latency_saved: float, winner=None):
+        """
+        Replace a reservation with the calls actually spent
+
+        Args:
+            reserved: Amount passed to reserve()
+            extra_calls: Calls the sequential strategy would not have made
+            latency_saved: Estimated sequential latency minus speculative latency (seconds)
+            winner: Attempt number whose result was returned
+        """
+        with self._lock:
+            self._reserved = max(0, self._reserved - reserved)
+            self._spent += extra_calls
+            self.stats['extra_calls'] += extra_calls
+            self.stats['latency_saved_seconds'] += latency_saved
+            if winner is not None:
+                wins = self.stats['wins_by_attempt']
+                wins[winner] = wins.get(winner, 0) + 1
+
+    def _roll_window(self):
+        if time.time() - self._window_start >= self.window:
+            self._window_start = time.time()
+            self._spent = 0
+
+    def get_stats(self):
+        """Get speculation statistics"""
+        with self._lock:
+            self._roll_window()
+            return {
+                **self.stats,
+                'latency_saved_seconds': round(self.stats['latency_saved_seconds'], 2),
+                'budget': self.max_extra_calls,
+                'budget_remaining': max(0, self.max_extra_calls - self._spent - self._reserved),
+                'enabled': SPECULATIVE_RECREATION
+            }
+
+
+# Singleton instance
+speculation_budget = SpeculationBudget()
+
+_speculative_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='recreate')
+
+
+def _improvement_instructions(attempt, weaknesses_text, current_score, best_score, target_score, has_best):
+    """Builds the per-attempt section of the recreation prompt."""
+    if attempt == 1:
+        # First attempt: Use standard recreation prompt
+        return f"""
+📋 SPECIFIC WEAKNESSES TO ADDRESS:
+{weaknesses_text}
+
+Focus particularly on improving these aspects to boost the score.
+"""
+    # Retry attempt: Add aggressive improvement instructions
+    score_gap = current_score - best_score if has_best else 0
+    return f"""
+⚠️ RETRY ATTEMPT {attempt} - Previous recreation did not meet quality standards.
+
+CRITICAL ISSUES FROM PREVIOUS ATTEMPT:
+- Score achieved: {best_score}/100 (below target of {target_score})
+- Score improvement gap: {score_gap} points (need +{target_score - current_score} minimum)
+
+📋 ORIGINAL WEAKNESSES TO ADDRESS:
+{weaknesses_text}
+
+🔥 AGGRESSIVE OPTIMIZATION REQUIRED:
+1. SIGNIFICANTLY expand technical details (add frameworks, methodologies, tools)
+2. ADD MORE bullet points (minimum 15-20 across all experience)
+3. Each bullet must show IMPACT with action verbs
+4. Maximize ATS keyword density (add all relevant technical terms)
+5. Expand project descriptions to 4-6 bullets each
+6. Create comprehensive skills section (20+ items)
+7. Add professional summary highlighting key achievements
+
+This is your last chance - make it count!
+"""
+
+
+def _generate_candidate(resume_text, current_score, target_score, specific_improvements, attempt):
+    """Sends one recreation prompt to the AI."""
+    # IMPORTANT: Send FULL resume text - do not truncate!
+    # The AI needs ALL information to create a complete optimized resume
+    prompt = RESUME_RECREATION_PROMPT.format(
+        resume_text=resume_text,  # Full text, no truncation
+        current_score=current_score,
+        target_score=target_score,
+        specific_improvements=specific_improvements
+    )
+    logger.info(f"📤 Sending recreation request to AI (attempt {attempt})...")
+    return generate_resume_analysis(prompt)
+
+
+def _analyzer_score(resume_markdown):
+    """Scores a resume with the LLM analyzer. Returns None if scoring failed."""
+    analysis_result = analyze_resume_content(resume_markdown)
+    if analysis_result and "overall_score" in analysis_result and "error" not in analysis_result:
+        return analysis_result["overall_score"]
+    return None
+
+
+def _target_keywords(analysis_data):
+    """Skills the analyzer found in the original resume; a rewrite should keep covering them."""
+    skills = ((analysis_data or {}).get("structured_data") or {}).get("skills") or {}
+    if not isinstance(skills, dict):
+        return []
+    return [skill for group in ("languages", "frameworks", "tools") for skill in skills.get(group) or []
+            if isinstance(skill, str)]
+
+
+def _verify_candidate(resume_markdown, resume_text, current_score, keywords=None):
+    """Scores a recreated resume. Returns None if scoring failed."""
+    if LOCAL_VERIFICATION:
+        try:
+            return estimate_llm_score(resume_markdown, resume_text, current_score, keywords)
+        except Exception as e:
+            logger.error(f"Local ATS scoring failed: {e}")
+            return None
+    logger.info(f"🔍 Verifying recreated resume with real analyzer...")
+    return _analyzer_score(resume_markdown)
+
+
+def _confirm_result(result, resume_text, current_score):
+    """
+    Replaces the local estimate on an accepted draft with the analyzer's score.
+    This is the only analyzer call of a recreation in local verification mode.
+    A draft the analyzer does not score above the original is not returned.
+    """
+    if not LOCAL_VERIFICATION:
+        return result
+    logger.info(f"🔍 Confirming accepted draft with real analyzer...")
+    confirmed = _analyzer_score(result["resume_markdown"])
+    result["estimated_score"] = result["new_score"]
+    if confirmed is None:
+        result["score_source"] = "local_estimate"
+        return result
+    logger.info(f"📊 Local estimate {result['new_score']} vs analyzer {confirmed}")
+    if confirmed <= current_score:
+        logger.warning(f"❌ Analyzer scored the accepted draft {confirmed} (original {current_score})")
+        return _already_optimized_result(resume_text, current_score)
+    result["new_score"] = confirmed
+    result["improvement"] = confirmed - current_score
+    result["score_source"] = "analyzer"
+    return result
+
+
+def _candidate_result(response, resume_markdown, real_new_score, current_score, attempt):
+    return {
+        "resume_markdown": resume_markdown,
+        "new_score": real_new_score,
+        "old_score": current_score,
+        "improvement": real_new_score - current_score,
+        "improvements_made": response.get("improvements_made", []),
+        "keywords_added": response.get("keywords_added", []),
+        "attempt_number": attempt,
+        "content_expansion": response.get("content_expansion_ratio", "0%")
+    }
+
+
+def _unverified_result(response, resume_markdown, current_score):
+    # Use AI's prediction as fallback when the analyzer is unavailable
+    return {
+        "resume_markdown": resume_markdown,
+        "new_score": response.get("new_score", 0),
+        "old_score": current_score,
+        "improvements_made": response.get("improvements_made", []),
+        "keywords_added": response.get("keywords_added", []),
+        "warning": "Score verification unavailable - using AI estimate"
+    }
+
+
+def _already_optimized_result(resume_text, current_score):
+    """Returns the original resume, formatted as markdown, when no attempt improved it."""
+    # IMPORTANT: Convert original text to markdown format for preview
+    # The resume_text is plain text extracted from PDF, we need markdown
+    logger.info("Converting original resume to markdown format for display...")
+    
+    # Use AI to convert plain text to markdown (simple formatting task)
+    conversion_prompt = f"""Convert this resume text into clean, professional markdown format.
+
+ORIGINAL RESUME TEXT:
+{resume_text}
+
+INSTRUCTIONS:
+1. Format as markdown with proper headers (# for name, ## for sections)
+2. Use bullet points (- ) for lists
+3. Use **bold** for job titles and company names
+4. Keep ALL original content - don't add or remove anything
+5. Just reformat the existing text into markdown structure
+
+Return ONLY the markdown-formatted resume, nothing else."""
+
+    try:
+        markdown_response = generate_resume_analysis(conversion_prompt)
+        if isinstance(markdown_response, dict):
+            formatted_markdown = markdown_response.get("resume_markdown", resume_text)
+        else:
+            formatted_markdown = str(markdown_response) if markdown_response else resume_text
+    except Exception as e:
+        logger.error(f"Markdown conversion failed: {e}")
+        # Fallback: basic markdown formatting
+        formatted_markdown = f"# Resume\n\n{resume_text}"
+    
+    # Return original resume with friendly message (not an error)
+    return {
+        "resume_markdown": formatted_markdown,  # Properly formatted markdown
+        "new_score": current_score,  # Keep original score
+        "old_score": current_score,
+        "improvement": 0,
+        "improvements_made": [],
+        "keywords_added": [],
+        "already_optimized": True,
+        "message": "No new keywords or skills found to level up this resume score. Your resume is already well-optimized!"
+    }
+
+
+def recreate_resume_with_ai(resume_text, current_score, analysis_data, progress=None, speculative=None):
     """
     Uses AI to recreate and optimize a resume for better ATS compatibility.
     Implements intelligent retry logic if initial recreation doesn't improve score.
@@ -14,14 +292,21 @@ def recreate_resume_with_ai(resume_text, current_score, analysis_data):
         resume_text: Original resume text
         current_score: Current ATS score (0-100)
         analysis_data: Dict containing weakness analysis
+        progress: Optional callback(percent, message) for background job reporting
+        speculative: Run all attempts concurrently (None = RECREATION_SPECULATIVE setting).
+                     Falls back to sequential retries when the speculation budget is spent.
     
     Returns:
         Dict with recreated resume and metadata
     """
+    report = progress or (lambda percent, message: None)
+    
     try:
         if not resume_text or len(resume_text) < 100:
             return {"error": "Resume text is too short to optimize"}
         
+        keywords = _target_keywords(analysis_data)
+        
         # Extract weaknesses for targeted improvement
         weaknesses = analysis_data.get("weaknesses", [])
         weaknesses_text = "\n".join([f"- {w}" for w in weaknesses]) if weaknesses else "General ATS optimization needed"
@@ -31,6 +316,14 @@ def recreate_resume_with_ai(resume_text, current_score, analysis_data):
         
         # Maximum retry attempts for intelligent recreation
         max_attempts = 2
+        
+        if speculative is None:
+            speculative = SPECULATIVE_RECREATION
+        reserve = (max_attempts - 1) * CALLS_PER_ATTEMPT
+        if speculative and speculation_budget.reserve(reserve):
+            return _recreate_speculative(resume_text, current_score, target_score, weaknesses_text,
+                                         max_attempts, reserve, report, keywords)
+        
         best_result = None
         best_score = current_score
         
@@ -38,53 +331,14 @@ def recreate_resume_with_ai(resume_text, current_score, analysis_data):
             logger.info(f"🎯 Recreation attempt {attempt}/{max_attempts} (Target: {target_score}+)")
             
             # Build intelligent, context-aware prompt
-            if attempt == 1:
-                # First attempt: Use standard recreation prompt
-                specific_improvements = f"""
-📋 SPECIFIC WEAKNESSES TO ADDRESS:
-{weaknesses_text}
-
-Focus particularly on improving these aspects to boost the score.
-"""
-            else:
-                # Retry attempt: Add aggressive improvement instructions
-                score_gap = current_score - best_score if best_result else 0
-                specific_improvements = f"""
-⚠️ RETRY ATTEMPT {attempt} - Previous recreation did not meet quality standards.
-
-CRITICAL ISSUES FROM PREVIOUS ATTEMPT:
-- Score achieved: {best_score}/100 (below target of {target_score})
-- Score improvement gap: {score_gap} points (need +{target_score - current_score} minimum)
-
-📋 ORIGINAL WEAKNESSES TO ADDRESS:
-{weaknesses_text}
-
-🔥 AGGRESSIVE OPTIMIZATION REQUIRED:
-1. SIGNIFICANTLY expand technical details (add frameworks, methodologies, tools)
-2. ADD MORE bullet points (minimum 15-20 across all experience)
-3. Each bullet must show IMPACT with action verbs
-4. Maximize ATS keyword density (add all relevant technical terms)
-5. Expand project descriptions to 4-6 bullets each
-6. Create comprehensive skills section (20+ items)
-7. Add professional summary highlighting key achievements
-
-This is your last chance - make it count!
-"""
-            
-            # Create dynamic prompt with intelligent targeting
-            # IMPORTANT: Send FULL resume text - do not truncate!
-            # The AI needs ALL information to create a complete optimized resume
-            prompt = RESUME_RECREATION_PROMPT.format(
-                resume_text=resume_text,  # Full text, no truncation
-                current_score=current_score,
-                target_score=target_score,
-                specific_improvements=specific_improvements
+            specific_improvements = _improvement_instructions(
+                attempt, weaknesses_text, current_score, best_score, target_score, best_result is not None
             )
             
-            logger.info(f"📤 Sending recreation request to AI (attempt {attempt})...")
+            report(10 + (attempt - 1) * 45, f"Rewriting resume (attempt {attempt}/{max_attempts})")
             
             # Call AI to recreate resume
-            response = generate_resume_analysis(prompt)
+            response = _generate_candidate(resume_text, current_score, target_score, specific_improvements, attempt)
             
             if isinstance(response, dict) and "error" in response:
                 logger.error(f"❌ AI error on attempt {attempt}: {response['error']}")
@@ -105,16 +359,15 @@ This is your last chance - make it count!
                     return {"error": "AI did not generate resume content"}
                 
                 # ✨ INTELLIGENT VERIFICATION: Analyze with real analyzer
-                logger.info(f"🔍 Verifying recreated resume with real analyzer...")
-                analysis_result = analyze_resume_content(resume_markdown)
+                report(35 + (attempt - 1) * 45, f"Scoring rewritten resume (attempt {attempt}/{max_attempts})")
+                real_new_score = _verify_candidate(resume_markdown, resume_text, current_score, keywords)
                 
-                if analysis_result and "overall_score" in analysis_result and "error" not in analysis_result:
-                    real_new_score = analysis_result["overall_score"]
+                if real_new_score is not None:
                     improvement = real_new_score - current_score
                     
                     logger.info(f"📊 Attempt {attempt} Results:")
                     logger.info(f"   - AI predicted: {ai_predicted_score}")
-                    logger.info(f"   - Real analyzed: {real_new_score}")
+                    logger.info(f"   - Verified score: {real_new_score}")
                     logger.info(f"   - Improvement: {improvement:+.1f} points")
                     logger.info(f"   - AI confidence: {quality_confidence}%")
                     
@@ -125,26 +378,17 @@ This is your last chance - make it count!
                     # Store if this is the best result so far
                     if real_new_score > best_score:
                         best_score = real_new_score
-                        best_result = {
-                            "resume_markdown": resume_markdown,
-                            "new_score": real_new_score,
-                            "old_score": current_score,
-                            "improvement": improvement,
-                            "improvements_made": response.get("improvements_made", []),
-                            "keywords_added": response.get("keywords_added", []),
-                            "attempt_number": attempt,
-                            "content_expansion": response.get("content_expansion_ratio", "0%")
-                        }
+                        best_result = _candidate_result(response, resume_markdown, real_new_score, current_score, attempt)
                     
                     # ✨ INTELLIGENT DECISION LOGIC
                     if meets_target:
                         # SUCCESS! Target score achieved
                         logger.info(f"✅ SUCCESS! Recreation achieved target score of {target_score}+ on attempt {attempt}")
-                        return best_result
+                        return _confirm_result(best_result, resume_text, current_score)
                     elif is_improvement and attempt == max_attempts:
                         # Last attempt - return best result even if below target
                         logger.info(f"✅ Returning best result from attempt {best_result['attempt_number']} ({best_score} vs original {current_score})")
-                        return best_result
+                        return _confirm_result(best_result, resume_text, current_score)
                     elif not is_improvement and attempt < max_attempts:
                         # Score didn't improve - retry with more aggressive prompt
                         logger.warning(f"⚠️ Attempt {attempt} scored {real_new_score} (no improvement). Retrying with aggressive optimization...")
@@ -152,48 +396,7 @@ This is your last chance - make it count!
                     elif not is_improvement and attempt == max_attempts:
                         # Final attempt still didn't improve - return original gracefully
                         logger.warning(f"❌ All {max_attempts} attempts failed to improve score")
-                        
-                        # IMPORTANT: Convert original text to markdown format for preview
-                        # The resume_text is plain text extracted from PDF, we need markdown
-                        logger.info("Converting original resume to markdown format for display...")
-                        
-                        # Use AI to convert plain text to markdown (simple formatting task)
-                        conversion_prompt = f"""Convert this resume text into clean, professional markdown format.
-
-ORIGINAL RESUME TEXT:
-{resume_text}
-
-INSTRUCTIONS:
-1. Format as markdown with proper headers (# for name, ## for sections)
-2. Use bullet points (- ) for lists
-3. Use **bold** for job titles and company names
-4. Keep ALL original content - don't add or remove anything
-5. Just reformat the existing text into markdown structure
-
-Return ONLY the markdown-formatted resume, nothing else."""
-
-                        try:
-                            markdown_response = generate_resume_analysis(conversion_prompt)
-                            if isinstance(markdown_response, dict):
-                                formatted_markdown = markdown_response.get("resume_markdown", resume_text)
-                            else:
-                                formatted_markdown = str(markdown_response) if markdown_response else resume_text
-                        except Exception as e:
-                            logger.error(f"Markdown conversion failed: {e}")
-                            # Fallback: basic markdown formatting
-                            formatted_markdown = f"# Resume\n\n{resume_text}"
-                        
-                        # Return original resume with friendly message (not an error)
-                        return {
-                            "resume_markdown": formatted_markdown,  # Properly formatted markdown
-                            "new_score": current_score,  # Keep original score
-                            "old_score": current_score,
-                            "improvement": 0,
-                            "improvements_made": [],
-                            "keywords_added": [],
-                            "already_optimized": True,
-                            "message": "No new keywords or skills found to level up this resume score. Your resume is already well-optimized!"
-                        }
+                        return _already_optimized_result(resume_text, current_score)
                     else:
                         # Didn't meet target - try again
                         logger.info(f"⚠️ Score {real_new_score} below target {target_score}. Retrying...")
@@ -205,19 +408,12 @@ Return ONLY the markdown-formatted resume, nothing else."""
                     if attempt < max_attempts:
                         continue
                     # Use AI's prediction as fallback on final attempt
-                    return {
-                        "resume_markdown": resume_markdown,
-                        "new_score": ai_predicted_score,
-                        "old_score": current_score,
-                        "improvements_made": response.get("improvements_made", []),
-                        "keywords_added": response.get("keywords_added", []),
-                        "warning": "Score verification unavailable - using AI estimate"
-                    }
+                    return _unverified_result(response, resume_markdown, current_score)
         
         # Should not reach here, but just in case
         if best_result:
             logger.info(f"✅ Returning best result achieved: {best_score}")
-            return best_result
+            return _confirm_result(best_result, resume_text, current_score)
         
         return {"error": "Resume recreation failed after all attempts"}
     
@@ -226,6 +422,106 @@ Return ONLY the markdown-formatted resume, nothing else."""
         return {"error": str(e)}
 
 
+def _recreate_speculative(resume_text, current_score, target_score, weaknesses_text, max_attempts, reserved, report,
+                          keywords=None):
+    """
+    Runs every attempt variant concurrently and returns the best verified result.
+    Once a variant clears target_score, variants still generating skip their
+    verification call and queued variants are cancelled.
+    """
+    started = time.monotonic()
+    target_met = threading.Event()
+    lock = threading.Lock()
+    outcomes = {}
+    settled = []
+
+    def run_variant(attempt):
+        variant_start = time.monotonic()
+        outcome = {"attempt": attempt, "calls": 1, "score": None, "response": None, "markdown": ""}
+        try:
+            specific_improvements = _improvement_instructions(
+                attempt, weaknesses_text, current_score, current_score, target_score, False
+            )
+            response = _generate_candidate(resume_text, current_score, target_score, specific_improvements, attempt)
+            outcome["response"] = response
+            if isinstance(response, dict) and "error" not in response:
+                outcome["markdown"] = response.get("resume_markdown", "")
+            if outcome["markdown"] and not target_met.is_set():
+                outcome["calls"] += CALLS_PER_ATTEMPT - 1
+                outcome["score"] = _verify_candidate(outcome["markdown"], resume_text, current_score, keywords)
+                if outcome["score"] is not None and outcome["score"] >= target_score:
+                    # Record the winner before waking the main thread, which reads outcomes right away
+                    with lock:
+                        outcomes[attempt] = outcome
+                    target_met.set()
+        except Exception as e:
+            logger.error(f"Speculative attempt {attempt} failed: {e}")
+            outcome["response"] = {"error": str(e)}
+        finally:
+            outcome["duration"] = time.monotonic() - variant_start
+            with lock:
+                outcomes[attempt] = outcome
+        return outcome
+
+    report(10, f"Rewriting resume ({max_attempts} variants in parallel)")
+    futures = {attempt: _speculative_executor.submit(run_variant, attempt)
+               for attempt in range(1, max_attempts + 1)}
+
+    # Wait until a variant clears the target or every variant has finished
+    while not target_met.is_set() and not all(future.done() for future in futures.values()):
+        target_met.wait(0.05)
+    for future in futures.values():
+        future.cancel()
+
+    with lock:
+        finished = dict(outcomes)
+    verified = [o for o in finished.values() if o["score"] is not None]
+    best = max(verified, key=lambda o: (o["score"], -o["attempt"]), default=None)
+    elapsed = time.monotonic() - started
+
+    def settle(_future=None):
+        # Account once every variant has stopped spending quota
+        if not all(future.done() for future in futures.values()):
+            return
+        with lock:
+            if settled:
+                return
+            settled.append(True)
+            completed = dict(outcomes)
+        # The sequential loop stops at the first attempt that meets the target
+        sequential_attempts = []
+        for attempt in sorted(completed):
+            sequential_attempts.append(attempt)
+            score = completed[attempt]["score"]
+            if score is not None and score >= target_score:
+                break
+        extra_calls = sum(o["calls"] for a, o in completed.items() if a not in sequential_attempts)
+        sequential_latency = sum(completed[a]["duration"] for a in sequential_attempts)
+        speculation_budget.settle(reserved, extra_calls, sequential_latency - elapsed,
+                                  best["attempt"] if best else None)
+        logger.info(f"Speculative recreation: {extra_calls} extra AI calls, "
+                    f"~{sequential_latency - elapsed:.1f}s saved")
+
+    for future in futures.values():
+        future.add_done_callback(settle)
+
+    if best and best["score"] > current_score:
+        logger.info(f"✅ Speculative recreation picked attempt {best['attempt']} ({best['score']} vs original {current_score})")
+        report(90, "Scoring rewritten resume")
+        result = _candidate_result(best["response"], best["markdown"], best["score"], current_score, best["attempt"])
+        return _confirm_result(result, resume_text, current_score)
+    if verified:
+        logger.warning(f"❌ All {max_attempts} speculative attempts failed to improve score")
+        return _already_optimized_result(resume_text, current_score)
+
+    unverified = [finished[a] for a in sorted(finished) if finished[a]["markdown"]]
+    if unverified:
+        return _unverified_result(unverified[-1]["response"], unverified[-1]["markdown"], current_score)
+    errors = [finished[a]["response"] for a in sorted(finished)
+              if isinstance(finished[a]["response"], dict) and "error" in finished[a]["response"]]
+    return errors[-1] if errors else {"error": "AI did not generate resume content"}
+
+
 def generate_sample_optimized_resume(resume_text):
     """
     Fallback function to create a basic optimized version if AI fails.
@@ -1,6 +1,7 @@
 import logging
-from .grok_client import generate_response
+from .grok_client import generate_response, generate_response_async
 from .prompts import SCORING_PROMPT_TEMPLATE
+from .tracing import tracer
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,27 @@ def calculate_local_metrics(text, audio_duration=None):
     local_score = (clarity_index * 0.4 + fluency_ratio * 0.4 + pace_score * 0.2) * 10
     return round(local_score, 1)
 
+def session_averages(aggregates):
+    """
+    Derives per-session averages from the running aggregates kept by MemoryStore.
+    Constant time regardless of how many turns were recorded.
+    """
+    count = aggregates.get("score_count", 0)
+    divisor = max(1, count)
+    pace_count = aggregates.get("pace_count", 0)
+    role_counts = aggregates.get("role_counts", {})
+
+    return {
+        "score_count": count,
+        "avg_local_score": aggregates.get("local_score_sum", 0.0) / divisor,
+        "avg_ai_score": aggregates.get("ai_score_sum", 0.0) / divisor,
+        "avg_confidence": aggregates.get("confidence_sum", 0.0) / divisor,
+        "avg_pace": aggregates.get("pace_sum", 0.0) / pace_count if pace_count else 0,
+        "total_filler_words": aggregates.get("filler_total", 0),
+        "total_questions": role_counts.get("ai", 0),
+        "total_responses": role_counts.get("user", 0),
+    }
+
 def get_semantic_score(mode, resume_summary, transcript):
     """Uses Gemini to generate a semantic score and feedback."""
     prompt = SCORING_PROMPT_TEMPLATE.format(
@@ -44,9 +66,21 @@ def get_semantic_score(mode, resume_summary, transcript):
         transcript=transcript
     )
     
-    response = generate_response(prompt)
+    with tracer.span('llm.scoring'):
+        response = generate_response(prompt)
     return response
 
+async def get_semantic_score_async(mode, resume_summary, transcript):
+    """Async get_semantic_score for the ASGI server."""
+    prompt = SCORING_PROMPT_TEMPLATE.format(
+        mode=mode,
+        resume_summary=resume_summary,
+        transcript=transcript
+    )
+    
+    with tracer.span('llm.scoring'):
+        return await generate_response_async(prompt)
+
 def calculate_final_score(semantic_score_data, local_score):
     """Combines semantic and local scores."""
     gemini_score = semantic_score_data.get("overall_score", 0)
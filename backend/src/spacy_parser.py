@@ -1,28 +1,32 @@
 import logging
 import re
 
+from .components import components
+
 logger = logging.getLogger(__name__)
 
-try:
-    import spacy
-except ImportError:
-    spacy = None
-    logger.warning("SpaCy not installed. Resume parsing will be limited.")
+def _load_model():
+    """Load English tokenizer, tagger, parser and NER (None when unavailable)."""
+    try:
+        import spacy
+    except ImportError:
+        logger.warning("SpaCy module not available, parsing disabled.")
+        return None
 
-# Load English tokenizer, tagger, parser and NER
-nlp = None
-if spacy:
     try:
         nlp = spacy.load("en_core_web_sm")
         logger.info("SpaCy model loaded.")
+        return nlp
     except OSError:
         logger.warning("SpaCy model 'en_core_web_sm' not found. Please run 'python -m spacy download en_core_web_sm'.")
-        nlp = None
-else:
-    logger.warning("SpaCy module not available, parsing disabled.")
+        return None
+
+# Loaded once per process, on first use or during warm-up
+components.register('spacy', _load_model)
 
 def parse_resume(text):
     """Extracts skills, education, and experience from resume text."""
+    nlp = components.get('spacy')
     if not nlp:
         return {}
 
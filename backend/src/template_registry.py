@@ -1,30 +1,182 @@
 import os
+import re
 import json
+import time
+import hashlib
 import logging
+import threading
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Mapping
 
 logger = logging.getLogger(__name__)
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_JSON_PATH = os.path.join(BASE_DIR, 'templates', 'templates.json')
+DEFAULT_THEMES_DIR = os.path.join(os.path.dirname(BASE_DIR), 'frontend', 'public', 'css', 'themes')
+
+THEME_CATEGORIES = ['Modern', 'Creative', 'Minimal', 'Professional', 'Academic']
+THEME_FILE_RE = re.compile(r'^theme-(\d+)\.css$')
+DEFAULT_THEME_COUNT = 50
+
+# Seconds between checks of templates.json / the themes directory for changes
+RELOAD_INTERVAL = float(os.getenv('TEMPLATE_RELOAD_INTERVAL', 2))
+
+# Layout families of the server-rendered (ReportLab) templates. The family decides
+# frame geometry, page background and section order.
+LAYOUT_SIDEBAR_LEFT = 'sidebar_left'    # Full-height left sidebar, main column right
+LAYOUT_SPLIT = 'split'                  # Header band, main column left, light sidebar right
+LAYOUT_SIDEBAR_RIGHT = 'sidebar_right'  # Header band, main column left, boxed sidebar right
+LAYOUT_SINGLE = 'single'                # One column
+
+# Color overrides: '#rrggbb' or a ReportLab color name
+_DARK_SIDEBAR = {'bg_sidebar': '#1f2a33', 'text_sidebar': 'white', 'primary': '#1f2a33', 'header_text': 'white'}
+_SIMPLE = {'primary': '#333333'}
+_MINT_SIDEBAR = {'bg_sidebar': '#E6EDE9', 'text_sidebar': 'black', 'header_text': 'black'}
+
+# template_id -> (layout family, color overrides), in gallery order
+RENDER_TEMPLATE_TABLE = {
+    'classic': (LAYOUT_SINGLE, {}),
+    'modern': (LAYOUT_SINGLE, {}),
+    'creative': (LAYOUT_SINGLE, {}),
+    'professional': (LAYOUT_SINGLE, {}),
+    'minimal': (LAYOUT_SINGLE, {}),
+    'template-1': (LAYOUT_SIDEBAR_LEFT, _DARK_SIDEBAR),
+    'template-2': (LAYOUT_SPLIT, {'primary': 'black', 'header_bg': 'black', 'header_text': 'white'}),
+    'template-3': (LAYOUT_SINGLE, _SIMPLE),
+    'template-4': (LAYOUT_SIDEBAR_LEFT, {'bg_sidebar': '#004d40', 'text_sidebar': '#e0f2f1', 'primary': '#004d40',
+                                        'accent': '#80cbc4', 'header_text': 'white'}),
+    'template-5': (LAYOUT_SIDEBAR_RIGHT, {'header_bg': '#0b4ea2', 'header_text': 'white', 'primary': '#0b4ea2',
+                                         'bg_sidebar': '#f8f9fa'}),
+    'template-6': (LAYOUT_SINGLE, _SIMPLE),
+    'template-7': (LAYOUT_SINGLE, _SIMPLE),
+    'template-8': (LAYOUT_SIDEBAR_LEFT, _DARK_SIDEBAR),
+    'template-9': (LAYOUT_SIDEBAR_LEFT, _DARK_SIDEBAR),
+    'template-10': (LAYOUT_SINGLE, _SIMPLE),
+    'template-11': (LAYOUT_SIDEBAR_LEFT, {**_MINT_SIDEBAR, 'primary': '#6B8E23'}),
+    'template-12': (LAYOUT_SIDEBAR_LEFT, {**_MINT_SIDEBAR, 'primary': 'black'}),
+    'template-13': (LAYOUT_SINGLE, _SIMPLE),
+    'template-14': (LAYOUT_SINGLE, _SIMPLE),
+    'template-15': (LAYOUT_SIDEBAR_RIGHT, {'header_bg': '#2c3e50', 'header_text': 'white', 'primary': '#2c3e50',
+                                          'bg_sidebar': '#f8f9fa'}),
+}
+
+DEFAULT_RENDER_TEMPLATE = 'modern'
+
+
+class RenderTemplate(NamedTuple):
+    """Descriptor of a server-rendered template"""
+    id: str
+    name: str
+    layout: str
+    colors: Mapping[str, str]
+
+
+class _Snapshot:
+    """Immutable view of the registry: templates, category index and serialized payloads"""
+
+    def __init__(self, templates, fingerprint):
+        self.templates = templates
+        self.fingerprint = fingerprint
+
+        by_category = {}
+        for template in templates.values():
+            by_category.setdefault(template['category'].lower(), []).append(template)
+        self.by_category = {key: tuple(values) for key, values in by_category.items()}
+
+        # /api/templates responses, serialized once per snapshot
+        self.payloads = {'all': self._serialize(list(templates.values()))}
+        for key, values in self.by_category.items():
+            self.payloads[key] = self._serialize(list(values))
+        self.empty_payload = self._serialize([])
+
+    @staticmethod
+    def _serialize(templates):
+        body = json.dumps({"templates": templates}, separators=(',', ':')).encode('utf-8')
+        return body, hashlib.sha256(body).hexdigest()[:32]
+
+
 class TemplateRegistry:
-    def __init__(self):
-        self._templates = {}
-        # Load legacy/existing templates first
-        self._load_legacy_registry()
-        # Generate/Load dynamic theme templates
-        self._generate_theme_templates()
-
-    def _load_legacy_registry(self):
-        # Assuming templates.json exists in ../templates/templates.json
-        # Adjust path as necessary closer to app root or config
+    """
+    Template catalogue with per-category indexes and pre-serialized API payloads.
+    Built on first use and rebuilt when templates.json or the themes directory changes.
+    """
+
+    def __init__(self, json_path=DEFAULT_JSON_PATH, themes_dir=DEFAULT_THEMES_DIR, reload_interval=RELOAD_INTERVAL):
+        """
+        Initialize template registry
+
+        Args:
+            json_path: Legacy templates.json
+            themes_dir: Directory of theme-N.css files
+            reload_interval: Seconds between change checks (0 checks on every access)
+        """
+        self.json_path = json_path
+        self.themes_dir = themes_dir
+        self.reload_interval = reload_interval
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.stats = {'builds': 0}
+        # Code-defined, so built once rather than on reload
+        self.render_templates = self._build_render_templates()
+        self.render_template_ids = tuple(self.render_templates)
+
+    def _build_render_templates(self):
+        names = {}
         try:
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            json_path = os.path.join(base_dir, 'templates', 'templates.json')
-            
-            if os.path.exists(json_path):
-                with open(json_path, 'r') as f:
+            with open(self.json_path, 'r') as f:
+                names = {key: val.get('name') for key, val in json.load(f).get('templates', {}).items()}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Template names unavailable: {e}")
+
+        return {
+            template_id: RenderTemplate(template_id, names.get(template_id) or template_id.replace('-', ' ').title(),
+                                        layout, MappingProxyType(dict(overrides)))
+            for template_id, (layout, overrides) in RENDER_TEMPLATE_TABLE.items()
+        }
+
+    def _fingerprint(self):
+        fingerprint = []
+        for path in (self.json_path, self.themes_dir):
+            try:
+                fingerprint.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def _current(self) -> _Snapshot:
+        """Return the current snapshot, rebuilding it if the sources changed"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.reload_interval:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.reload_interval:
+                return snapshot
+            fingerprint = self._fingerprint()
+            self._checked_at = now
+            if snapshot is None or snapshot.fingerprint != fingerprint:
+                templates = {}
+                # Load legacy/existing templates first
+                self._load_legacy_registry(templates)
+                # Then the CSS theme templates
+                self._generate_theme_templates(templates)
+                if snapshot is not None:
+                    logger.info("Template sources changed, reloading registry")
+                snapshot = self._snapshot = _Snapshot(templates, fingerprint)
+                self.stats['builds'] += 1
+            return snapshot
+
+    def _load_legacy_registry(self, templates):
+        try:
+            if os.path.exists(self.json_path):
+                with open(self.json_path, 'r') as f:
                     data = json.load(f)
                     for key, val in data.get('templates', {}).items():
                         # Standardize structure
-                        self._templates[key] = {
+                        templates[key] = {
                             "id": key,
                             "name": val.get('name', key.title()),
                             "category": "Classic", # Default category for legacy
@@ -36,18 +188,24 @@ class TemplateRegistry:
         except Exception as e:
             logger.error(f"Failed to load legacy templates: {e}")
 
-    def _generate_theme_templates(self):
+    def _theme_numbers(self):
+        try:
+            numbers = [int(m.group(1)) for m in map(THEME_FILE_RE.match, os.listdir(self.themes_dir)) if m]
+        except OSError:
+            numbers = []
+        # Without a themes directory (e.g. backend-only deploys) keep the standard set
+        return sorted(numbers) or list(range(1, DEFAULT_THEME_COUNT + 1))
+
+    def _generate_theme_templates(self, templates):
         """
-        Generates 50 CSS-based themes.
+        Generates one CSS-based template per theme-N.css stylesheet.
         Categories: Modern, Creative, Minimal, Professional, Academic
         """
-        categories = ['Modern', 'Creative', 'Minimal', 'Professional', 'Academic']
-        
-        for i in range(1, 51):
+        for i in self._theme_numbers():
             theme_id = f"theme-{i}"
-            category = categories[i % 5]
-            
-            self._templates[theme_id] = {
+            category = THEME_CATEGORIES[i % 5]
+
+            templates[theme_id] = {
                 "id": theme_id,
                 "name": f"{category} Style {i}",
                 "category": category,
@@ -58,13 +216,38 @@ class TemplateRegistry:
             }
 
     def get_all_templates(self):
-        return list(self._templates.values())
+        return list(self._current().templates.values())
 
     def get_template(self, template_id):
-        return self._templates.get(template_id)
+        return self._current().templates.get(template_id)
 
     def get_templates_by_category(self, category):
-        return [t for t in self._templates.values() if t['category'].lower() == category.lower()]
+        return list(self._current().by_category.get(category.lower(), ()))
+
+    def get_render_template(self, template_id) -> Optional[RenderTemplate]:
+        """Descriptor for a server-rendered template, or None if the id is not one"""
+        return self.render_templates.get(template_id) if isinstance(template_id, str) else None
+
+    def resolve_render_template(self, template_id) -> str:
+        """Validate a requested render template id, falling back to the default"""
+        if isinstance(template_id, str) and template_id in self.render_templates:
+            return template_id
+        logger.warning(f"Invalid template_id '{template_id}', defaulting to '{DEFAULT_RENDER_TEMPLATE}'")
+        return DEFAULT_RENDER_TEMPLATE
+
+    def get_payload(self, category=None):
+        """
+        Serialized /api/templates response
+
+        Args:
+            category: Category name, or None/'all' for every template
+
+        Returns:
+            (json_bytes, etag)
+        """
+        snapshot = self._current()
+        key = (category or 'all').lower()
+        return snapshot.payloads.get(key, snapshot.empty_payload)
 
 # Singleton instance
 registry = TemplateRegistry()
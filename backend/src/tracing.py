@@ -0,0 +1,275 @@
+"""
+Tracing - Per-request spans and stage latency histograms
+A trace covers one request (e.g. /process_voice); spans time its stages (Whisper,
+relevance and follow-up LLM calls, provider HTTP, Edge TTS) with monotonic
+timestamps. Each span feeds an in-process log-linear (HDR-style) histogram,
+exported in Prometheus text format on /metrics. The current trace id is carried
+in a context variable (follows asyncio tasks, threads started via run_in_thread
+and gevent greenlets) and added to every log line.
+
+TRACING_ENABLED=0 turns span() and trace() into a shared no-op context manager;
+spans with listeners (admission control) are still timed for the listeners only.
+Histograms are per process; with several gunicorn workers each /metrics scrape
+reports the worker that answered.
+"""
+
+import os
+import time
+import asyncio
+import uuid
+import bisect
+import logging
+import threading
+import contextvars
+import functools
+import inspect
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv('TRACING_ENABLED', '1') == '1'
+
+# Bucket upper bounds: 4 linear sub-buckets per power of two, ~1ms to ~4 minutes
+BUCKET_BOUNDS = tuple(2.0 ** exponent * (1 + step / 4) for exponent in range(-10, 8) for step in range(4))
+
+# Traces slower than this log their span breakdown at INFO (others at DEBUG)
+SLOW_TRACE_SECONDS = float(os.getenv('SLOW_TRACE_SECONDS', 5))
+
+_NOOP = nullcontext()
+_current_trace = contextvars.ContextVar('trace', default=None)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram (relative error <= 25% per bucket)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)  # Last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+            self.count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th percentile (0-100)"""
+        with self._lock:
+            counts, count = list(self.counts), self.count
+        if not count:
+            return None
+        rank = q / 100 * count
+        seen = 0
+        for index, bucket in enumerate(counts):
+            seen += bucket
+            if seen >= rank and bucket:
+                return BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else float('inf')
+        return float('inf')
+
+
+class Trace:
+    """Spans of one request"""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None):
+        self.name = name
+        self.trace_id = trace_id or uuid.uuid4().hex[:16]
+        self.started = time.perf_counter()
+        self.spans: List[tuple] = []  # (name, start offset, seconds)
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'root', 'token', 'started')
+
+    def __init__(self, tracer, name, root=None):
+        self.tracer = tracer
+        self.name = name
+        self.root = root
+        self.token = None
+
+    def __enter__(self):
+        if self.root is not None:
+            self.token = _current_trace.set(self.root)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.started
+        self.tracer.observe(self.name, seconds)
+        trace = self.root or _current_trace.get()
+        if trace is not None:
+            trace.spans.append((self.name, self.started - trace.started, seconds))
+        if self.root is not None:
+            _current_trace.reset(self.token)
+            self.tracer._finish(self.root, seconds, exc_type)
+        return False
+
+
+class _ListenerTimer:
+    """Times a span for its listeners only (tracing disabled)"""
+    __slots__ = ('tracer', 'name', 'started')
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._notify(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class Tracer:
+    """Creates traces and spans and keeps one histogram per span name"""
+
+    def __init__(self, enabled: bool = TRACING_ENABLED):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.listeners: Dict[str, List[Callable[[float], None]]] = {}
+        self._lock = threading.Lock()
+
+    def trace(self, name: str, trace_id: Optional[str] = None):
+        """
+        Start a trace (one request) and time it as a span
+
+        Args:
+            name: Trace name, e.g. the route
+            trace_id: Incoming id to continue (e.g. an X-Request-ID header)
+        """
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, name, Trace(name, trace_id))
+
+    def span(self, name: str):
+        """Time a stage of the current trace (also recorded outside a trace)"""
+        if not self.enabled:
+            return _ListenerTimer(self, name) if name in self.listeners else _NOOP
+        return _Span(self, name)
+
+    def traced(self, name: str):
+        """Decorator form of span() for sync and async functions"""
+        def decorate(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def add_listener(self, name: str, callback: Callable[[float], None]):
+        """
+        Call callback(seconds) on every observation of span `name` (e.g. admission
+        control), also while tracing is disabled
+        """
+        self.listeners.setdefault(name, []).append(callback)
+
+    def observe(self, name: str, seconds: float):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        histogram.observe(seconds)
+        self._notify(name, seconds)
+
+    def _notify(self, name: str, seconds: float):
+        for callback in self.listeners.get(name, ()):
+            callback(seconds)
+
+    def _finish(self, trace: Trace, seconds: float, exc_type):
+        if exc_type is not None:
+            with self._lock:
+                self.errors[trace.name] = self.errors.get(trace.name, 0) + 1
+        level = logging.INFO if seconds >= SLOW_TRACE_SECONDS else logging.DEBUG
+        if logger.isEnabledFor(level):
+            stages = ', '.join(f"{name}={span_seconds * 1000:.0f}ms"
+                               for name, _, span_seconds in trace.spans if name != trace.name)
+            logger.log(level, f"{trace.name} {seconds * 1000:.0f}ms: {stages or 'no spans'}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Count, mean and p50/p95/p99 (bucket upper bounds) per span name"""
+        stats = {}
+        for name, histogram in sorted(self.histograms.items()):
+            if not histogram.count:
+                continue
+            stats[name] = {
+                'count': histogram.count,
+                'mean_ms': round(histogram.total / histogram.count * 1000, 1),
+                **{f'p{q}_ms': round(histogram.percentile(q) * 1000, 1) for q in (50, 95, 99)}
+            }
+        return stats
+
+    def render_prometheus(self) -> str:
+        """Histograms in Prometheus text exposition format"""
+        lines = [
+            '# HELP interview_span_seconds Latency of traced requests and their stages',
+            '# TYPE interview_span_seconds histogram',
+        ]
+        for name, histogram in sorted(self.histograms.items()):
+            with histogram._lock:
+                counts, total, count = list(histogram.counts), histogram.total, histogram.count
+            cumulative = 0
+            for bound, bucket in zip(BUCKET_BOUNDS, counts):
+                cumulative += bucket
+                lines.append(f'interview_span_seconds_bucket{{span="{name}",le="{bound:.6g}"}} {cumulative}')
+            lines.append(f'interview_span_seconds_bucket{{span="{name}",le="+Inf"}} {count}')
+            lines.append(f'interview_span_seconds_sum{{span="{name}"}} {total:.6f}')
+            lines.append(f'interview_span_seconds_count{{span="{name}"}} {count}')
+
+        lines.append('# HELP interview_trace_errors_total Traced requests that raised')
+        lines.append('# TYPE interview_trace_errors_total counter')
+        for name, count in sorted(self.errors.items()):
+            lines.append(f'interview_trace_errors_total{{trace="{name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def current_trace_id() -> Optional[str]:
+    """Id of the trace running in this context, if any"""
+    trace = _current_trace.get()
+    return trace.trace_id if trace is not None else None
+
+
+async def run_in_thread(func, *args):
+    """
+    Run a blocking call in the event loop's default executor, with the caller's
+    context (trace id) copied in, like asyncio.to_thread (Python 3.9+)
+
+    Args:
+        func: Callable to run
+        *args: Its positional arguments
+
+    Returns:
+        func's return value
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(contextvars.copy_context().run, func, *args))
+
+
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _record_factory(*args, **kwargs):
+    # Exposes %(trace)s to log formats: "[trace <id>] " inside a trace, else ""
+    record = _base_record_factory(*args, **kwargs)
+    trace = _current_trace.get()
+    record.trace = f"[trace {trace.trace_id}] " if trace is not None else ""
+    return record
+
+
+logging.setLogRecordFactory(_record_factory)
+
+# Singleton instance
+tracer = Tracer()
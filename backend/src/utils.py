@@ -4,8 +4,10 @@ import json
 import logging
 from datetime import datetime
 
+from . import tracing  # noqa: F401  (adds %(trace)s to log records)
+
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(trace)s%(message)s')
 logger = logging.getLogger(__name__)
 
 def generate_session_id():
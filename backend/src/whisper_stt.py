@@ -1,29 +1,31 @@
 import logging
 import os
 
-logger = logging.getLogger(__name__)
+from .components import components
+from .tracing import tracer
 
-try:
-    import whisper
-except ImportError:
-    whisper = None
-    logger.info("Whisper not installed. Using browser's built-in speech recognition (works great!).")
+logger = logging.getLogger(__name__)
 
-# Load model globally to avoid reloading per request
-# Using 'base' model for balance of speed and accuracy. Can be 'tiny', 'small', 'medium', 'large'.
-model = None
-if whisper:
+def _load_model():
+    """Load the Whisper model (None when Whisper is not installed)."""
     try:
-        model = whisper.load_model("base")
-        logger.info("Whisper model loaded successfully - advanced audio transcription available.")
-    except Exception as e:
-        logger.error(f"Failed to load Whisper model: {e}")
-        model = None
-else:
-    logger.info("Using browser-based speech recognition (primary method).")
+        import whisper
+    except ImportError:
+        logger.info("Whisper not installed. Using browser's built-in speech recognition (works great!).")
+        return None
+
+    # Using 'base' model for balance of speed and accuracy. Can be 'tiny', 'small', 'medium', 'large'.
+    model = whisper.load_model("base")
+    logger.info("Whisper model loaded successfully - advanced audio transcription available.")
+    return model
+
+# Loaded once per process, on first use or during warm-up
+components.register('whisper', _load_model)
 
+@tracer.traced('stt.whisper')
 def transcribe_audio(file_path):
     """Transcribes audio file to text using Whisper."""
+    model = components.get('whisper')
     if not model:
         logger.error("Whisper model is not loaded.")
         return None
@@ -0,0 +1,152 @@
+"""
+Unit Tests for admission control and load shedding
+"""
+
+import pytest
+
+from backend.src import admission as admission_module
+from backend.src.admission import AdmissionController, Overloaded, NORMAL, DEGRADED, SHEDDING
+from backend.src.tracing import Tracer
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setattr(admission_module, 'DEGRADE_INFLIGHT', 2)
+    monkeypatch.setattr(admission_module, 'SHED_INFLIGHT', 4)
+    monkeypatch.setattr(admission_module, 'MAX_TURNS_INFLIGHT', 6)
+    monkeypatch.setattr(admission_module, 'PROBE_EVERY', 3)
+    return AdmissionController(enabled=True)
+
+
+class TestLevels:
+    """Test pressure levels from live load and provider latency"""
+
+    def test_levels_from_inflight(self, controller):
+        assert controller.level() == NORMAL
+        controller.inflight['turn'] = 2
+        assert controller.level() == DEGRADED
+        controller.inflight['turn'] = 4
+        assert controller.level() == SHEDDING
+
+    def test_levels_from_provider_latency(self, controller):
+        assert controller.provider_latency() is None
+        for _ in range(9):
+            controller.observe_provider(0.5)
+        controller.observe_provider(20.0)
+        assert controller.provider_latency() == 0.5
+        assert controller.level() == NORMAL
+        for _ in range(5):
+            controller.observe_provider(5.0)
+        assert controller.level() == DEGRADED
+
+    def test_fed_by_tracer_listener(self, controller):
+        tracer = Tracer(enabled=True)
+        tracer.add_listener('provider.groq', controller.observe_provider)
+        tracer.observe('provider.groq', 12.0)
+        tracer.observe('llm.follow_up', 0.1)
+        assert controller.provider_latency() == 12.0
+        assert controller.level() == SHEDDING
+
+    def test_fed_with_tracing_disabled(self, controller):
+        tracer = Tracer(enabled=False)
+        tracer.add_listener('provider.groq', controller.observe_provider)
+        with tracer.span('provider.groq'):
+            pass
+        with tracer.span('llm.follow_up'):
+            pass
+        assert len(controller.latencies) == 1
+        assert controller.provider_latency() is not None
+        assert tracer.get_stats() == {}
+
+    def test_disabled_admits_everything(self):
+        controller = AdmissionController(enabled=False)
+        controller.inflight['turn'] = 10_000
+        assert controller.level() == NORMAL
+        with controller.turn() as degraded:
+            assert degraded is False
+
+
+class TestInterviewQueue:
+    """Test queue tickets for new interviews"""
+
+    def test_queued_with_ticket_and_position(self, controller):
+        controller.inflight['turn'] = 2
+        with pytest.raises(Overloaded) as first:
+            with controller.interview():
+                pass
+        with pytest.raises(Overloaded) as second:
+            with controller.interview():
+                pass
+        body = second.value.to_dict()
+        assert first.value.details['queue_position'] == 1
+        assert body['queue_position'] == 2
+        assert body['queue_ticket'] != first.value.details['queue_ticket']
+        assert body['retry_after'] >= 1 and body['estimated_wait_seconds'] >= 1
+
+        # Retrying keeps the place, and the head of the queue gets in once load drops
+        ticket = first.value.details['queue_ticket']
+        with pytest.raises(Overloaded) as retry:
+            with controller.interview(ticket):
+                pass
+        assert retry.value.details['queue_position'] == 1
+
+        controller.inflight['turn'] = 0
+        with controller.interview(ticket):
+            assert controller.inflight['interview'] == 1
+        assert controller.inflight['interview'] == 0
+        assert len(controller.queue) == 1
+
+    def test_newcomer_waits_behind_queue(self, controller):
+        controller.inflight['turn'] = 2
+        with pytest.raises(Overloaded):
+            with controller.interview():
+                pass
+        controller.inflight['turn'] = 1
+        # One free slot belongs to the ticket holder
+        with pytest.raises(Overloaded) as newcomer:
+            with controller.interview():
+                pass
+        assert newcomer.value.details['queue_position'] == 2
+
+    def test_rejected_when_shedding(self, controller):
+        controller.inflight['turn'] = 4
+        with pytest.raises(Overloaded) as rejected:
+            with controller.interview():
+                pass
+        assert 'queue_ticket' not in rejected.value.details
+        assert controller.decisions[('interview', 'rejected')] == 1
+
+
+class TestTurns:
+    """Test degraded turns, probes and the hard cap"""
+
+    def test_degraded_with_periodic_probe(self, controller):
+        with controller.turn() as degraded:
+            assert degraded is False
+
+        controller.inflight['interview'] = 2
+        flags = []
+        for _ in range(6):
+            with controller.turn() as degraded:
+                flags.append(degraded)
+        assert flags == [True, True, False, True, True, False]
+        assert controller.decisions[('turn', 'probe')] == 2
+        assert controller.inflight['turn'] == 0
+
+    def test_turn_cap(self, controller):
+        controller.inflight['turn'] = 6
+        with pytest.raises(Overloaded) as busy:
+            with controller.turn():
+                pass
+        assert busy.value.retry_after == admission_module.TURN_RETRY_AFTER
+        assert controller.decisions[('turn', 'shed')] == 1
+
+    def test_prometheus_export(self, controller):
+        with controller.turn():
+            pass
+        controller.observe_provider(1.5)
+        text = controller.render_prometheus()
+        assert 'interview_admission_decisions_total{kind="turn",outcome="admitted"} 1' in text
+        assert 'interview_admission_level 0' in text
+        assert 'interview_admission_inflight{kind="turn"} 0' in text
+        assert 'interview_admission_provider_latency_seconds 1.500000' in text
@@ -0,0 +1,61 @@
+"""
+Unit Tests for the local ATS scorer
+"""
+
+from backend.src.ats_scorer import score_resume, estimate_llm_score
+from backend.tests.test_resume_parser import SAMPLE_RESUME
+
+STRONG_RESUME = """# Jane Doe
+jane@example.com | +1 555 123 4567 | linkedin.com/in/jane
+
+## Summary
+Backend engineer with 6 years building distributed systems.
+
+## Skills
+Python, Java, Go, Docker, Kubernetes, AWS, PostgreSQL, Redis, Terraform, React, Git, CI/CD, Linux
+
+## Experience
+**Acme Corp - Senior Engineer** (2019 - 2024)
+- Reduced p99 latency by 45% by redesigning the caching layer with Redis
+- Led a team of 5 engineers to migrate 30 services to Kubernetes
+- Automated deployments with Terraform, cutting release time from 2 hours to 15 minutes
+- Worked on various internal tools in 2021
+
+## Education
+B.Tech in Computer Science, XYZ University, 2018
+"""
+
+
+class TestScoreResume:
+    """Test signal extraction and scoring"""
+
+    def test_signals(self):
+        signals = score_resume(STRONG_RESUME)['signals']
+        assert signals['sections'] == ['education', 'experience', 'skills', 'summary']
+        assert signals['bullets'] == 4
+        assert signals['action_verb_bullets'] == 3
+        # "in 2021" is a year, not a quantified result
+        assert signals['quantified_bullets'] == 3
+        assert signals['contact_fields'] == 3
+
+    def test_stronger_resume_scores_higher(self):
+        assert score_resume(STRONG_RESUME)['overall_score'] > score_resume(SAMPLE_RESUME)['overall_score']
+
+    def test_keyword_coverage(self):
+        result = score_resume(STRONG_RESUME, keywords=['Kubernetes', 'Kafka'])
+        assert result['signals']['keyword_coverage'] == 0.5
+
+    def test_deterministic_and_bounded(self):
+        assert score_resume(STRONG_RESUME) == score_resume(STRONG_RESUME)
+        assert score_resume("")['overall_score'] == 0
+
+
+class TestEstimateLLMScore:
+    """Test projection onto the analyzer's scale"""
+
+    def test_shifts_baseline_by_local_delta(self):
+        local_delta = score_resume(STRONG_RESUME)['overall_score'] - score_resume(SAMPLE_RESUME)['overall_score']
+        assert estimate_llm_score(STRONG_RESUME, SAMPLE_RESUME, 50) == 50 + local_delta
+
+    def test_clamped(self):
+        assert estimate_llm_score(STRONG_RESUME, SAMPLE_RESUME, 99) == 100
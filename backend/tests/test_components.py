@@ -0,0 +1,96 @@
+"""
+Unit Tests for the lazy component registry
+"""
+
+import threading
+import time
+
+from backend.src import components as components_module
+from backend.src.components import ComponentRegistry
+
+
+class TestComponentRegistry:
+    """Test lazy loading, states and warm-up"""
+
+    def test_loads_once_on_first_use(self):
+        registry = ComponentRegistry()
+        calls = []
+        registry.register('model', lambda: calls.append(1) or 'loaded')
+
+        assert registry.get_status()['model']['state'] == 'cold'
+        assert not registry.is_ready()
+        assert registry.get('model') == 'loaded'
+        assert registry.get('model') == 'loaded'
+        assert len(calls) == 1
+        assert registry.get_status()['model']['state'] == 'ready'
+        assert registry.is_ready()
+
+    def test_concurrent_first_users_share_one_load(self):
+        registry = ComponentRegistry()
+        calls = []
+
+        def slow_loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        registry.register('model', slow_loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get('model'))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_unavailable_and_failed_components(self):
+        registry = ComponentRegistry()
+        registry.register('optional', lambda: None)
+        registry.register('broken', lambda: 1 / 0)
+
+        registry.warm_up(background=False)
+        status = registry.get_status()
+        assert status['optional']['state'] == 'unavailable'
+        assert status['broken']['state'] == 'failed'
+        assert 'division' in status['broken']['error']
+        assert registry.get('broken') is None
+        # Settled components do not hold readiness back
+        assert registry.is_ready()
+
+    def test_failed_component_retried_after_backoff(self, monkeypatch):
+        monkeypatch.setattr(components_module, 'RETRY_SECONDS', 0.05)
+        registry = ComponentRegistry()
+        attempts = []
+
+        def flaky_loader():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("model hub unreachable")
+            return 'loaded'
+
+        registry.register('model', flaky_loader)
+        assert registry.get('model') is None
+        assert registry.get('model') is None  # Within the backoff: no new attempt
+        assert len(attempts) == 1
+
+        time.sleep(0.06)
+        assert registry.get('model') is None
+        assert len(attempts) == 2
+        time.sleep(0.06)
+        assert registry.get('model') is None and len(attempts) == 2  # Backoff doubled
+        time.sleep(0.06)
+        assert registry.get('model') == 'loaded'
+        status = registry.get_status()['model']
+        assert status['state'] == 'ready' and 'error' not in status
+
+    def test_background_warm_up_skips_lazy_only(self):
+        registry = ComponentRegistry()
+        registry.register('eager', lambda: 'eager')
+        registry.register('lazy', lambda: 'lazy', warm=False)
+
+        registry.warm_up().join(timeout=5)
+        status = registry.get_status()
+        assert status['eager']['state'] == 'ready'
+        assert status['lazy']['state'] == 'cold'
+        assert registry.is_ready()
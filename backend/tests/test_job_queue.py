@@ -0,0 +1,94 @@
+"""
+Unit Tests for the SQLite-backed job queue
+"""
+
+import time
+import pytest
+
+from backend.src.job_queue import JobQueue, JobError
+
+
+@pytest.fixture
+def queue(tmp_path):
+    # workers=0: jobs only run when the test calls run_pending()
+    queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=0)
+    queue.register('echo', lambda payload, report: (report(50, "Halfway"), payload)[1])
+    return queue
+
+
+class TestJobLifecycle:
+    """Test enqueue, execution and polling"""
+
+    def test_enqueue_and_run(self, queue):
+        job = queue.enqueue('echo', {"value": 1})
+        assert job['status'] == 'queued'
+
+        assert queue.run_pending() == 1
+        finished = queue.get(job['job_id'])
+        assert finished['status'] == 'done'
+        assert finished['progress'] == 100
+        assert finished['result'] == {"value": 1}
+        assert [event['message'] for event in finished['events']] == ['Queued', 'Started', 'Halfway', 'Completed']
+
+    def test_handler_failure_is_recorded(self, queue):
+        def fail(payload, report):
+            raise JobError("AI provider unavailable")
+        queue.register('fail', fail)
+
+        job = queue.enqueue('fail', {})
+        queue.run_pending()
+        failed = queue.get(job['job_id'])
+        assert failed['status'] == 'error'
+        assert failed['error'] == "AI provider unavailable"
+        assert 'result' not in failed
+
+    def test_unknown_kind_rejected(self, queue):
+        with pytest.raises(ValueError):
+            queue.enqueue('missing', {})
+
+    def test_unknown_job_is_none(self, queue):
+        assert queue.get('does-not-exist') is None
+
+
+class TestIdempotency:
+    """Test idempotency keys"""
+
+    def test_same_key_returns_same_job(self, queue):
+        first = queue.enqueue('echo', {"value": 1}, idempotency_key='abc')
+        second = queue.enqueue('echo', {"value": 2}, idempotency_key='abc')
+        assert first['job_id'] == second['job_id']
+        assert queue.get_stats()['queued'] == 1
+
+    def test_failed_job_does_not_block_retry(self, queue):
+        queue.register('flaky', lambda payload, report: 1 / 0)
+        first = queue.enqueue('flaky', {}, idempotency_key='abc')
+        queue.run_pending()
+        retry = queue.enqueue('flaky', {}, idempotency_key='abc')
+        assert retry['job_id'] != first['job_id']
+        assert retry['status'] == 'queued'
+
+
+class TestRecovery:
+    """Test retention and stale job handling"""
+
+    def test_stale_running_job_is_requeued(self, tmp_path):
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=0, stale_after=0)
+        queue.register('echo', lambda payload, report: payload)
+        job = queue.enqueue('echo', {"value": 3})
+        # Simulate a worker that claimed the job and died
+        assert queue._claim_next()['id'] == job['job_id']
+        time.sleep(0.01)
+
+        assert queue.run_pending() == 1
+        assert queue.get(job['job_id'])['result'] == {"value": 3}
+
+    def test_finished_jobs_expire(self, tmp_path):
+        queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=0, retention=0)
+        queue.register('echo', lambda payload, report: payload)
+        job = queue.enqueue('echo', {}, idempotency_key='abc')
+        queue.run_pending()
+        time.sleep(0.01)
+
+        replacement = queue.enqueue('echo', {}, idempotency_key='abc')
+        assert queue.get(job['job_id']) is None
+        assert replacement['job_id'] != job['job_id']
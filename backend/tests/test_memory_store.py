@@ -0,0 +1,72 @@
+"""
+Unit Tests for MemoryStore session aggregates
+"""
+
+import pytest
+from backend.src.memory_store import MemoryStore
+
+
+@pytest.fixture
+def store():
+    store = MemoryStore()
+    store.create_session("s1")
+    return store
+
+
+class TestSessionAggregates:
+    """Running aggregates must match a full rescan of the raw lists"""
+
+    def test_new_session_has_empty_aggregates(self, store):
+        aggregates = store.get_aggregates("s1")
+        assert aggregates["score_count"] == 0
+        assert aggregates["version"] == 0
+        assert aggregates["role_counts"] == {}
+
+    def test_add_score_updates_sums_and_bounds(self, store):
+        store.add_score("s1", {"local_score": 6, "ai_score": 8, "confidence_score": 70})
+        store.add_score("s1", {"local_score": 4, "ai_score": 5, "confidence_score": 50})
+
+        aggregates = store.get_aggregates("s1")
+        assert aggregates["score_count"] == 2
+        assert aggregates["local_score_sum"] == 10
+        assert aggregates["ai_score_min"] == 5
+        assert aggregates["ai_score_max"] == 8
+        assert aggregates["performance_trend"] == [80, 50]
+
+    def test_add_history_counts_roles(self, store):
+        store.add_history("s1", "ai", "Hello")
+        store.add_history("s1", "user", "Hi")
+        store.add_history("s1", "ai", "Tell me about yourself")
+
+        assert store.get_aggregates("s1")["role_counts"] == {"ai": 2, "user": 1}
+
+    def test_add_analysis_tracks_pace_fillers_and_unique_tips(self, store):
+        store.add_analysis("s1", {"audio": {"filler_count": 2, "speaking_pace": 130, "tips": ["Slow down"]}})
+        store.add_analysis("s1", {"audio": {"filler_count": 3, "speaking_pace": None, "tips": ["Slow down", "Pause"]}})
+
+        aggregates = store.get_aggregates("s1")
+        assert aggregates["filler_total"] == 5
+        assert aggregates["pace_count"] == 1
+        assert list(aggregates["unique_tips"]) == ["Slow down", "Pause"]
+        assert len(store.get_session("s1")["analyses"]) == 2
+
+    def test_version_changes_on_every_turn(self, store):
+        before = store.get_aggregates("s1")["version"]
+        store.add_history("s1", "user", "answer")
+        store.add_score("s1", {"local_score": 5})
+        assert store.get_aggregates("s1")["version"] == before + 2
+
+    def test_rebuild_for_legacy_session(self, store):
+        session = store.get_session("s1")
+        session["history"] = [{"role": "ai", "content": "Q"}, {"role": "user", "content": "A"}]
+        session["scores"] = [{"local_score": 7, "ai_score": 6, "confidence_score": 80}]
+        del session["aggregates"]
+
+        store.add_history("s1", "ai", "Next question")
+
+        aggregates = store.get_aggregates("s1")
+        assert aggregates["role_counts"] == {"ai": 2, "user": 1}
+        assert aggregates["score_count"] == 1
+
+    def test_unknown_session(self, store):
+        assert store.get_aggregates("missing") is None
@@ -0,0 +1,124 @@
+"""
+Unit Tests for PDF ingestion budgets and background extraction jobs
+"""
+
+import os
+import pytest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import backend.src.pdf_ingest as pdf_ingest
+from backend.src.job_queue import JobQueue
+
+
+@pytest.fixture(autouse=True)
+def queue(tmp_path, monkeypatch):
+    # workers=0: jobs only run when the test calls run_pending()
+    queue = JobQueue(db_path=str(tmp_path / "jobs.sqlite3"), workers=0)
+    queue.register(pdf_ingest.JOB_KIND, pdf_ingest._run_extraction_job)
+    monkeypatch.setattr(pdf_ingest, "job_queue", queue)
+    return queue
+
+
+def wait_for(job_id):
+    assert pdf_ingest.get_extraction(job_id)["status"] == "pending"
+    pdf_ingest.job_queue.run_pending()
+    return pdf_ingest.get_extraction(job_id)
+
+
+class TestExtractionJobs:
+    """Test the async job API around extract_pdf_text"""
+
+    def test_job_returns_text(self, monkeypatch):
+        monkeypatch.setattr(pdf_ingest, "extract_pdf_text", lambda path, max_chars: "  page one\npage two  ")
+        job_id = pdf_ingest.submit_extraction("/uploads/resume.pdf")
+
+        job = wait_for(job_id)
+        assert job["status"] == "done"
+        assert job["text"] == "page one\npage two"
+        assert job["filename"] == "resume.pdf"
+
+    def test_job_reports_errors(self, monkeypatch):
+        def fail(path, max_chars):
+            raise pdf_ingest.PDFBudgetError("too big")
+
+        monkeypatch.setattr(pdf_ingest, "extract_pdf_text", fail)
+        job = wait_for(pdf_ingest.submit_extraction("/uploads/huge.pdf"))
+        assert job["status"] == "error"
+        assert "too big" in job["error"]
+
+    def test_unknown_job(self, queue):
+        assert pdf_ingest.get_extraction("missing") is None
+        queue.register('echo', lambda payload, report: payload)
+        assert pdf_ingest.get_extraction(queue.enqueue('echo', {})['job_id']) is None
+
+    def test_any_worker_can_poll(self, queue, monkeypatch):
+        # Another gunicorn worker: same database, its own queue instance
+        monkeypatch.setattr(pdf_ingest, "extract_pdf_text", lambda path, max_chars: "text")
+        job_id = pdf_ingest.submit_extraction("/uploads/resume.pdf")
+        queue.run_pending()
+        monkeypatch.setattr(pdf_ingest, "job_queue", JobQueue(db_path=queue.db_path, workers=0))
+        assert pdf_ingest.get_extraction(job_id)["text"] == "text"
+
+
+class TestBudget:
+    """Test the size budget is enforced before parsing"""
+
+    def test_oversized_file_rejected(self, tmp_path, monkeypatch):
+        path = tmp_path / "resume.pdf"
+        path.write_bytes(b"%PDF" + b"0" * 100)
+        monkeypatch.setattr(pdf_ingest, "MAX_FILE_BYTES", 10)
+
+        with pytest.raises(pdf_ingest.PDFBudgetError):
+            pdf_ingest.extract_pdf_text(str(path))
+
+    def test_upload_deleted_after_extraction(self, monkeypatch, tmp_path):
+        upload = tmp_path / "3f2a9c1b_resume.pdf"
+        upload.write_bytes(b"%PDF")
+        monkeypatch.setattr(pdf_ingest, "extract_pdf_text", lambda path, max_chars: "text")
+
+        job = wait_for(pdf_ingest.submit_extraction(str(upload), delete_after=True))
+        assert job["status"] == "done"
+        assert not upload.exists()
+
+
+class StubPool:
+    """Process pool stand-in whose futures fail or never finish"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.shut_down = False
+
+    def submit(self, func, *args):
+        future = Future()
+        if self.error is not None:
+            future.set_exception(self.error)
+        return future
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+class TestPoolRecovery:
+    """Test a broken or hung extraction pool is replaced"""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        def install(stub):
+            monkeypatch.setattr(pdf_ingest, "_process_pool", stub)
+            monkeypatch.setattr(pdf_ingest, "_pool_pid", os.getpid())
+            return stub
+        return install
+
+    def test_broken_pool_is_reset(self, pool):
+        stub = pool(StubPool(BrokenProcessPool("child died")))
+        with pytest.raises(BrokenProcessPool):
+            pdf_ingest._collect_pages("/uploads/resume.pdf", 8, None)
+        assert stub.shut_down and pdf_ingest._process_pool is None
+
+    def test_hung_extraction_times_out(self, pool, monkeypatch):
+        monkeypatch.setattr(pdf_ingest, "EXTRACT_TIMEOUT", 0.05)
+        stub = pool(StubPool())
+        with pytest.raises(pdf_ingest.PDFBudgetError):
+            pdf_ingest._collect_pages("/uploads/resume.pdf", 8, None)
+        assert stub.shut_down and pdf_ingest._process_pool is None
@@ -0,0 +1,99 @@
+"""
+Unit Tests for the on-demand profiler
+"""
+
+import threading
+import time
+
+import pytest
+
+from backend.src.profiler import SamplingProfiler, RouteCPUAccounting, ProfilerBusy, allocation_diff
+
+
+def spin_in_hot_function(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(i * i for i in range(500))
+
+
+class TestSamplingProfiler:
+    """Test sampling and export formats"""
+
+    def test_samples_busy_thread(self):
+        worker = threading.Thread(target=spin_in_hot_function, args=(0.6,), name='hot')
+        worker.start()
+        profile = SamplingProfiler().run(0.3, 0.005)
+        worker.join()
+
+        assert profile.samples > 10
+        collapsed = profile.to_collapsed()
+        hot_lines = [line for line in collapsed.splitlines() if 'spin_in_hot_function' in line]
+        assert hot_lines and all(line.startswith('thread hot;') for line in hot_lines)
+        # The requesting thread (only waiting) is not sampled
+        assert 'test_samples_busy_thread' not in collapsed
+
+    def test_speedscope_export(self):
+        worker = threading.Thread(target=spin_in_hot_function, args=(0.3,))
+        worker.start()
+        profile = SamplingProfiler().run(0.2, 0.005)
+        worker.join()
+
+        document = profile.to_speedscope('test')
+        sampled = document['profiles'][0]
+        assert sampled['type'] == 'sampled'
+        assert len(sampled['samples']) == len(sampled['weights'])
+        frames = document['shared']['frames']
+        assert any(frame['name'] == 'spin_in_hot_function' and frame['file'].endswith('test_profiler.py')
+                   for frame in frames)
+        assert all(index < len(frames) for sample in sampled['samples'] for index in sample)
+
+    def test_one_profile_at_a_time(self):
+        profiler = SamplingProfiler()
+        thread = threading.Thread(target=profiler.run, args=(0.3,))
+        thread.start()
+        time.sleep(0.05)
+        with pytest.raises(ProfilerBusy):
+            profiler.run(0.1)
+        thread.join()
+
+
+class TestRouteCPUAccounting:
+    """Test per-route CPU accounting"""
+
+    def test_disabled_by_default(self):
+        accounting = RouteCPUAccounting()
+        accounting.end('/process_voice', accounting.begin())
+        assert accounting.get_stats()['routes'] == {}
+
+    def test_accumulates_per_route(self):
+        accounting = RouteCPUAccounting()
+        accounting.enabled = True
+        for _ in range(2):
+            token = accounting.begin()
+            spin_in_hot_function(0.02)
+            accounting.end('/api/render', token)
+        stats = accounting.get_stats()['routes']['/api/render']
+        assert stats['requests'] == 2
+        assert stats['cpu_seconds'] > 0.01
+        accounting.reset()
+        assert accounting.get_stats()['routes'] == {}
+
+
+class TestAllocationDiff:
+    """Test tracemalloc snapshot diffs"""
+
+    def test_reports_growth_during_interval(self):
+        retained = []
+
+        def allocate():
+            time.sleep(0.05)
+            retained.extend(bytearray(1024) for _ in range(2000))
+
+        thread = threading.Thread(target=allocate)
+        thread.start()
+        result = allocation_diff(0.3, top=5)
+        thread.join()
+
+        assert result['top']
+        assert 'test_profiler.py' in result['top'][0]['location'][0]
+        assert result['top'][0]['size_diff_bytes'] > 1024 * 1000
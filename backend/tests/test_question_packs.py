@@ -0,0 +1,86 @@
+"""
+Unit Tests for the question pack index, aliases and per-session decks
+"""
+
+import random
+
+from backend.src.question_packs import (
+    JOB_ROLE_QUESTIONS, ROLE_QUESTION_INDEX, COMPANY_PROMPTS, QuestionDeck,
+    resolve_role, resolve_company, get_questions_for_role, get_company_style_prompt, session_question_deck
+)
+
+
+class TestResolution:
+    """Test alias and fuzzy resolution of role and company names"""
+
+    def test_role_aliases(self):
+        assert resolve_role("ML Engineer") == "ML Engineer"
+        assert resolve_role("software engineer") == "Python Developer"
+        assert resolve_role("SWE") == "Python Developer"
+        assert resolve_role("Senior ML engineer") == "ML Engineer"
+        assert resolve_role("site-reliability engineer") == "Cloud Engineer"
+
+    def test_fuzzy_matches_without_false_positives(self):
+        assert resolve_role("pyhton developer") == "Python Developer"
+        assert resolve_role("cloud engg") == "Cloud Engineer"
+        assert resolve_role("data engineer") is None
+        assert resolve_role("") is None
+        assert resolve_role(None) is None
+
+    def test_company_aliases(self):
+        assert resolve_company("tata consultancy services") == "TCS"
+        assert resolve_company("Microsft") == "Microsoft"
+        assert resolve_company("Acme") is None
+
+
+class TestIndex:
+    """Test the precomputed questions and prompt fragments"""
+
+    def test_flat_tuples_per_role(self):
+        for role, role_data in JOB_ROLE_QUESTIONS.items():
+            assert ROLE_QUESTION_INDEX[role] == tuple(q for category in role_data.values() for q in category)
+
+    def test_questions_for_alias(self):
+        questions = get_questions_for_role("swe", 3)
+        assert len(questions) == 3
+        assert set(questions) <= set(ROLE_QUESTION_INDEX["Python Developer"])
+        assert get_questions_for_role("Astronaut") == []
+
+    def test_company_prompt_prerendered(self):
+        prompt = get_company_style_prompt("google")
+        assert prompt is COMPANY_PROMPTS["Google"]
+        assert "You are conducting a Google interview" in prompt
+        assert get_company_style_prompt("Acme") == ""
+
+
+class TestQuestionDeck:
+    """Test per-session dealing without repeats"""
+
+    def test_no_repeats_until_exhausted(self):
+        deck = QuestionDeck("QA Engineer", rng=random.Random(7))
+        bank = ROLE_QUESTION_INDEX["QA Engineer"]
+        first_cycle = [next(deck) for _ in bank]
+        assert sorted(first_cycle) == sorted(bank)
+        assert deck.remaining() == 0
+        # Reshuffled, without repeating the last question back to back
+        assert next(deck) != first_cycle[-1]
+
+    def test_deal_round(self):
+        deck = QuestionDeck("ML Engineer", rng=random.Random(3))
+        bank = ROLE_QUESTION_INDEX["ML Engineer"]
+        first = deck.deal_round()
+        assert sorted(first) == sorted(bank)
+        second = deck.deal_round()
+        assert sorted(second) == sorted(bank) and second[0] != first[-1]
+        next(deck)
+        assert len(deck.deal_round()) == len(bank) - 1
+
+    def test_unknown_role_is_empty(self):
+        assert next(QuestionDeck("Astronaut"), None) is None
+
+    def test_session_deck_follows_role(self):
+        session = {"job_role": "SWE"}
+        deck = session_question_deck(session)
+        assert session_question_deck(session) is deck
+        session["job_role"] = "Data Analyst"
+        assert session_question_deck(session).role == "Data Analyst"
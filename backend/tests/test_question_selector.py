@@ -0,0 +1,98 @@
+"""
+Unit Tests for local follow-up question selection
+"""
+
+import random
+import time
+
+from backend.src.question_selector import QuestionSelector, TOPIC_LIMIT
+
+
+def make_session(**overrides):
+    topics = ['skill:Python', 'skill:Docker', 'project:Rate Limiter Service - Token-bucket limiter in Go',
+              'experience:Senior Software Engineer - Finlytics']
+    session = {
+        'job_role': 'Python Developer',
+        'company': '',
+        'resume_topics': topics,
+        'topic_question_count': {topic: 0 for topic in topics},
+        'history': [],
+    }
+    session.update(overrides)
+    return session
+
+
+def ask(selector, session, score=5):
+    selection = selector.select(session, score)
+    selector.mark_asked(session, selection)
+    session['history'].append({'role': 'ai', 'content': selection['question']})
+    if selection['topic']:
+        counts = session['topic_question_count']
+        counts[selection['topic']] = counts.get(selection['topic'], 0) + 1
+    return selection
+
+
+class TestQuestionSelector:
+    """Test ranking by resume topic, difficulty and coverage"""
+
+    def test_prefers_uncovered_resume_topics(self):
+        selector = QuestionSelector(rng=random.Random(1))
+        session = make_session()
+        topics = [ask(selector, session)['topic'] for _ in range(6)]
+        covered = [topic for topic in topics if topic]
+        assert len(covered) >= 4
+        assert all(covered.count(topic) <= TOPIC_LIMIT for topic in covered)
+
+    def test_templates_use_readable_topic_names(self):
+        selector = QuestionSelector(rng=random.Random(1))
+        plan = selector.plan(make_session())
+        texts = [candidate.text for candidate in plan.candidates if candidate.topic]
+        assert "Walk me through your Rate Limiter Service project - what was the hardest technical decision?" in texts
+        assert any("Senior Software Engineer at Finlytics" in text for text in texts)
+
+    def test_no_repeats_until_bank_exhausted(self):
+        selector = QuestionSelector(rng=random.Random(2))
+        session = make_session(resume_topics=[], topic_question_count={})
+        size = len(selector.plan(session).candidates)
+        questions = [ask(selector, session)['question'] for _ in range(size)]
+        assert len(set(questions)) == size
+        assert ask(selector, session)['question'] in questions
+
+    def test_difficulty_follows_answer_score(self):
+        selector = QuestionSelector(rng=random.Random(3))
+        tiers = {}
+        for score in (0, 10):
+            session = make_session(job_role='ML Engineer', resume_topics=[], topic_question_count={})
+            tiers[score] = [ask(selector, session, score)['tier'] for _ in range(3)]
+        assert sum(tiers[10]) > sum(tiers[0])
+
+    def test_alias_role_and_plan_rebuild(self):
+        selector = QuestionSelector()
+        session = make_session(job_role='SWE')
+        plan = selector.plan(session)
+        assert plan.key[0] == 'Python Developer'
+        assert selector.plan(session) is plan
+        session['job_role'] = 'QA Engineer'
+        assert selector.plan(session) is not plan
+
+    def test_role_pack_from_session_deck(self):
+        selector = QuestionSelector()
+        session = make_session(resume_topics=[], topic_question_count={})
+        plan = selector.plan(session)
+        role_texts = [c.text for c in plan.candidates if c.pack == 'Python Developer']
+        deck = session['question_deck']
+        assert sorted(role_texts) == sorted(deck.questions)
+        assert deck.dealt == len(deck.questions) and deck.remaining() == 0
+        session['resume_topics'] = ['skill:Go']
+        rebuilt = [c.text for c in selector.plan(session).candidates if c.pack == 'Python Developer']
+        assert sorted(rebuilt) == sorted(role_texts)
+        assert deck.dealt == 2 * len(deck.questions)
+
+    def test_selection_is_fast(self):
+        selector = QuestionSelector()
+        session = make_session(job_role='', company='Google')
+        selector.select(session)
+        started = time.perf_counter()
+        for _ in range(20):
+            ask(selector, session)
+        assert (time.perf_counter() - started) / 20 < 0.005
@@ -0,0 +1,121 @@
+"""
+Unit Tests for the rendered-document cache
+"""
+
+import os
+import time
+import pytest
+
+from backend.src.render_cache import RenderCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(cache_dir=str(tmp_path), max_bytes=100, spill_bytes=50, max_entries=10)
+
+
+class TestRenderCache:
+    """Test keys, hits and ETags"""
+
+    def test_key_depends_on_all_inputs(self, cache):
+        base = cache.generate_key("# Jane", "modern", "pdf", "1")
+        assert base != cache.generate_key("# Jane", "template-1", "pdf", "1")
+        assert base != cache.generate_key("# Jane", "modern", "docx", "1")
+        assert base != cache.generate_key("# Jane", "modern", "pdf", "2")
+        assert base == cache.generate_key("# Jane", "modern", "pdf", "1")
+
+    def test_get_or_render_renders_once(self, cache):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return b"%PDF-small", 'primary'
+
+        first, meta_first = cache.get_or_render("# Jane", "modern", "pdf", "1", render)
+        second, meta_second = cache.get_or_render("# Jane", "modern", "pdf", "1", render)
+        assert first == second == b"%PDF-small"
+        assert len(calls) == 1
+        assert (meta_first['cache'], meta_second['cache']) == ('miss', 'hit')
+        assert meta_first['etag'] == meta_second['etag']
+
+    def test_degraded_tier_has_distinct_etag(self, cache):
+        key = cache.generate_key("# Jane", "modern", "pdf", "1")
+        assert cache.set(key, b"fallback", 'simple')['etag'] == f"{key[:32]}-simple"
+
+
+class TestBounds:
+    """Test memory bound and disk spill"""
+
+    def test_large_artifacts_spill_to_disk(self, cache, tmp_path):
+        key = cache.generate_key("# Big", "modern", "pdf", "1")
+        cache.set(key, b"x" * 80)
+        assert cache.memory_bytes == 0
+        assert cache.get(key)[0] == b"x" * 80
+
+        # A new process finds the spilled artifact
+        fresh = RenderCache(cache_dir=str(tmp_path), max_bytes=100, spill_bytes=50)
+        assert fresh.get(key)[0] == b"x" * 80
+        assert fresh.get_stats()['disk_hits'] == 1
+
+    def test_memory_bound_evicts_oldest(self, cache):
+        keys = [cache.generate_key(f"# {i}", "modern", "pdf", "1") for i in range(3)]
+        for key in keys:
+            cache.set(key, b"y" * 40)
+        assert cache.memory_bytes <= 100
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2])[0] == b"y" * 40
+
+    def test_disk_cap_prunes_oldest_spills(self, tmp_path):
+        cache = RenderCache(cache_dir=str(tmp_path), max_bytes=100, spill_bytes=50, max_disk_bytes=200)
+        keys = [cache.generate_key(f"# {i}", "modern", "pdf", "1") for i in range(4)]
+        for age, key in zip((40, 30, 20, 10), keys):
+            cache.set(key, b"x" * 80)
+            path = cache._path_for(key)
+            os.utime(path, (time.time() - age, time.time() - age))
+        # Third spill went past 200 bytes: pruned down to 90% of the cap
+        assert cache.get(keys[0]) is None and cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None and cache.get(keys[3]) is not None
+        assert cache.get_stats()['disk_bytes'] == 160
+
+    def test_first_spill_prunes_leftovers(self, tmp_path):
+        stale = tmp_path / "ab"
+        stale.mkdir()
+        old = time.time() - 2 * 86400
+        for name in ("ab00.bin", "ab01.tmp"):
+            (stale / name).write_bytes(b"old")
+            os.utime(stale / name, (old, old))
+        cache = RenderCache(cache_dir=str(tmp_path), max_bytes=100, spill_bytes=50)
+        assert (stale / "ab00.bin").exists()  # Nothing scanned at startup
+
+        cache.set(cache.generate_key("# Big", "modern", "pdf", "1"), b"x" * 80)
+        assert not (stale / "ab00.bin").exists() and not (stale / "ab01.tmp").exists()
+        assert cache.get_stats()['disk_pruned'] == 2
+
+
+class TestRendererFiles:
+    """Test artifacts written to disk by the render process"""
+
+    def test_large_artifact_is_adopted_without_reading(self, cache):
+        key = cache.generate_key("# Big", "modern", "pdf", "1")
+        tmp_path = cache.reserve_path(key)
+        with open(tmp_path, 'wb') as f:
+            f.write(b"z" * 80)
+
+        data, f, metadata = cache.adopt(key, tmp_path)
+        with f:
+            assert (data, f.read(), metadata['size']) == (None, b"z" * 80, 80)
+        assert cache.memory_bytes == 0
+
+        data, f, _ = cache.get_artifact(key)
+        with f:
+            assert f.read() == b"z" * 80
+
+    def test_small_artifact_is_kept_in_memory(self, cache):
+        key = cache.generate_key("# Small", "modern", "pdf", "1")
+        tmp_path = cache.reserve_path(key)
+        with open(tmp_path, 'wb') as f:
+            f.write(b"%PDF")
+
+        data, f, _ = cache.adopt(key, tmp_path)
+        assert (data, f) == (b"%PDF", None)
+        assert cache.get_artifact(key)[0] == b"%PDF"
@@ -0,0 +1,114 @@
+"""
+Unit Tests for the process-pool render service
+"""
+
+import threading
+import pytest
+
+import backend.src.render_service as render_service_module
+from backend.src.render_service import RenderService, RenderQueueFull
+from backend.src.resume_ast import parse_resume
+
+
+class TestRenderService:
+    """Test admission and error propagation"""
+
+    def test_queue_full_rejects(self, monkeypatch):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_task(fmt, markdown_text, template_id):
+            started.set()
+            release.wait(5)
+            return b"%PDF", 'primary'
+
+        monkeypatch.setattr(render_service_module, '_render_task', slow_task)
+        service = RenderService(workers=0, max_pending=1)
+
+        worker = threading.Thread(target=service.render, args=('pdf', '# Jane', 'modern'))
+        worker.start()
+        started.wait(5)
+        with pytest.raises(RenderQueueFull):
+            service.render('pdf', '# Jane', 'modern')
+        release.set()
+        worker.join(5)
+
+        stats = service.get_stats()
+        assert (stats['renders'], stats['rejected'], stats['pending']) == (1, 1, 0)
+
+    def test_worker_errors_propagate(self):
+        service = RenderService(workers=1, max_pending=2, timeout=30, memory_limit=0)
+        with pytest.raises(ValueError):
+            service.render('odt', '# Jane', 'modern')
+        assert service.get_stats()['failures'] == 1
+
+    def test_render_to_file_returns_size(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(render_service_module, '_render_task',
+                            lambda fmt, markdown_text, template_id: (b"%PDF-1.4", 'primary'))
+        service = RenderService(workers=0, max_pending=1)
+        path = tmp_path / 'out.pdf'
+
+        assert service.render_to_file('pdf', '# Jane', 'modern', str(path)) == (8, 'primary')
+        assert path.read_bytes() == b"%PDF-1.4"
+
+
+class TestRenderBatch:
+    """Test batch rendering from a shared section model"""
+
+    def test_inline_batch_yields_every_template(self, monkeypatch):
+        seen = []
+
+        def task(fmt, markdown_text, template_id, document=None):
+            seen.append(document)
+            if template_id == 'broken':
+                raise RuntimeError("layout failed")
+            return f"%PDF-{template_id}".encode(), 'primary'
+
+        monkeypatch.setattr(render_service_module, '_render_task', task)
+        service = RenderService(workers=0, max_pending=1)
+        document = parse_resume("# Jane")
+
+        results = {tid: (result, error) for tid, result, error in
+                   service.render_batch('pdf', '# Jane', ['modern', 'broken', 'classic'], document=document)}
+
+        assert results['modern'] == ((b"%PDF-modern", 'primary'), None)
+        assert isinstance(results['broken'][1], RuntimeError)
+        assert seen == [document] * 3
+        stats = service.get_stats()
+        assert (stats['renders'], stats['failures'], stats['pending']) == (2, 1, 0)
+
+    def test_pooled_batch_reports_per_template_errors(self):
+        service = RenderService(workers=2, max_pending=1, timeout=30, memory_limit=0)
+        results = list(service.render_batch('odt', '# Jane', ['modern', 'classic', 'minimal']))
+        assert sorted(tid for tid, _, _ in results) == ['classic', 'minimal', 'modern']
+        assert all(isinstance(error, ValueError) for _, _, error in results)
+        # The slot is released once the batch is consumed
+        assert list(service.render_batch('odt', '# Jane', [])) == []
+
+
+class TestPoolRestart:
+    """Test that a timeout does not take other requests' renders down with it"""
+
+    def test_collateral_render_resubmitted(self):
+        import time
+        service = RenderService(workers=2, max_pending=4, timeout=30, memory_limit=0)
+        results = {}
+
+        def run(name, seconds, timeout):
+            try:
+                results[name] = service._run(time.sleep, (seconds,), name, timeout)
+            except Exception as e:
+                results[name] = e
+
+        hung = threading.Thread(target=run, args=('hung', 5, 1.5))
+        collateral = threading.Thread(target=run, args=('collateral', 2, 30))
+        service._get_executor().submit(int).result(30)  # Pool warm before the clock starts
+        hung.start()
+        collateral.start()
+        hung.join(30)
+        collateral.join(30)
+
+        assert isinstance(results['hung'], render_service_module.RenderTimeout)
+        assert results['collateral'] is None
+        stats = service.get_stats()
+        assert (stats['timeouts'], stats['renders'], stats['resubmitted']) == (1, 1, 1)
@@ -0,0 +1,67 @@
+"""
+Unit Tests for the shared resume AST
+"""
+
+from backend.src.resume_ast import parse_resume, Span
+
+SAMPLE = """# Sarah Johnson
+**Senior Software Engineer** | sarah.johnson@email.com | (555) 123-4567 | linkedin.com/in/sarahjohnson
+San Francisco, CA
+
+## Professional Summary
+Engineer with **8+ years** of experience.
+
+## Technical Skills
+**Languages**: Python, Go
+
+## Work Experience
+### Senior Engineer
+- Cut latency by **45%** with caching
+* Mentored 5 engineers
+"""
+
+
+class TestParse:
+    """Test header, contact and section extraction"""
+
+    def test_header_and_contact(self):
+        doc = parse_resume(SAMPLE)
+        assert doc.name == 'Sarah Johnson'
+        assert doc.title == 'Senior Software Engineer'
+        # Same matches as the generators' original expressions, quirks included
+        assert doc.contact == {
+            'email': 'sarah.johnson@email.com',
+            'phone': '555) 123-4567',
+            'linkedin': 'linkedin.com/in/sarahjohnson',
+            'location': 'Francisco, CA'
+        }
+
+    def test_sections_keep_insertion_order_and_text(self):
+        doc = parse_resume(SAMPLE)
+        assert list(doc.sections) == ['name', 'title', 'contact', 'professional_summary',
+                                      'technical_skills', 'work_experience']
+        assert doc.sections['technical_skills'] == '**Languages**: Python, Go'
+
+    def test_defaults_without_header(self):
+        doc = parse_resume("## Skills\nPython")
+        assert (doc.name, doc.title, doc.contact) == ('Your Name', '', {})
+
+    def test_memoized_by_content(self):
+        assert parse_resume(SAMPLE) is parse_resume(SAMPLE)
+        assert parse_resume(SAMPLE) is not parse_resume(SAMPLE + "\n")
+
+
+class TestBlocks:
+    """Test block kinds, bold spans and section lookup"""
+
+    def test_block_kinds_and_spans(self):
+        blocks = parse_resume(SAMPLE).get_blocks(['experience'])
+        assert [b.kind for b in blocks] == ['heading', 'bullet', 'bullet']
+        assert blocks[1].spans == (Span('Cut latency by '), Span('45%', True), Span(' with caching'))
+        assert blocks[2].text == 'Mentored 5 engineers'
+
+    def test_fuzzy_lookup_is_optional(self):
+        doc = parse_resume(SAMPLE)
+        assert doc.resolve(['summary']) == 'professional_summary'
+        assert doc.get_blocks(['experience'], fuzzy=False) == ()
+        assert doc.get_section(['missing']) == ""
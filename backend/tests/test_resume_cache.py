@@ -0,0 +1,83 @@
+"""
+Unit Tests for the content-hash resume cache
+"""
+
+import os
+
+from backend.src.resume_cache import ResumeCache, normalize_text
+
+
+class TestResumeCache:
+    """Test keying, persistence and copy semantics"""
+
+    def test_normalized_text_shares_key(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        key1 = cache.generate_key("John  Smith\r\nPython", "candidate_info")
+        key2 = cache.generate_key("John Smith\nPython  ", "candidate_info")
+        assert key1 == key2
+        assert normalize_text("a\n\n\n\nb") == "a\n\nb"
+
+    def test_kind_and_version_change_key(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        assert cache.generate_key("text", "analysis", "v1") != cache.generate_key("text", "analysis", "v2")
+        assert cache.generate_key("text", "analysis") != cache.generate_key("text", "spacy_parse")
+
+    def test_get_or_compute_calls_once(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"skills": ["Python"]}
+
+        assert cache.get_or_compute("resume", "candidate_info", compute) == {"skills": ["Python"]}
+        assert cache.get_or_compute("resume", "candidate_info", compute) == {"skills": ["Python"]}
+        assert len(calls) == 1
+
+    def test_failed_results_not_stored(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        cache.get_or_compute("resume", "analysis", lambda: {"error": "rate limit"},
+                             should_cache=lambda r: "error" not in r)
+        assert cache.get(cache.generate_key("resume", "analysis")) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        ResumeCache(cache_dir=str(tmp_path)).get_or_compute("resume", "analysis", lambda: {"overall_score": 81})
+
+        fresh = ResumeCache(cache_dir=str(tmp_path))
+        assert fresh.get(fresh.generate_key("resume", "analysis")) == {"overall_score": 81}
+        assert fresh.stats['disk_hits'] == 1
+
+    def test_returned_values_are_copies(self, tmp_path):
+        cache = ResumeCache(cache_dir=None)
+        result = cache.get_or_compute("resume", "analysis", lambda: {"overall_score": 81})
+        result["original_filename"] = "cv"
+        assert "original_filename" not in cache.get(cache.generate_key("resume", "analysis"))
+
+    def test_expired_entries_deleted_from_disk(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path), ttl=-1)
+        key = cache.generate_key("resume", "analysis")
+        cache.set(key, {"overall_score": 81})
+        assert os.path.exists(cache._path_for(key))
+
+        assert cache.get(key) is None
+        assert not os.path.exists(cache._path_for(key))
+
+    def test_first_write_prunes_expired(self, tmp_path):
+        stale = ResumeCache(cache_dir=str(tmp_path), ttl=-1)
+        old_key = stale.generate_key("old resume", "analysis")
+        stale.set(old_key, {"overall_score": 50})
+
+        cache = ResumeCache(cache_dir=str(tmp_path))
+        assert os.path.exists(cache._path_for(old_key))  # Nothing scanned at startup
+        cache.set(cache.generate_key("resume", "analysis"), {"overall_score": 81})
+        assert not os.path.exists(cache._path_for(old_key))
+        assert cache.get_stats()['disk_entries'] == 1
+
+    def test_disk_entries_capped(self, tmp_path):
+        cache = ResumeCache(cache_dir=str(tmp_path), max_size=2, max_disk_entries=10)
+        for i in range(25):
+            cache.set(cache.generate_key(f"resume {i}", "analysis"), {"overall_score": i})
+        files = [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith('.json')]
+        assert len(files) <= 10
+        assert cache.get_stats()['disk_entries'] == len(files)
+        assert cache.get(cache.generate_key("resume 24", "analysis")) == {"overall_score": 24}
@@ -0,0 +1,69 @@
+"""
+Unit Tests for resume_parser section segmentation and skill matching
+"""
+
+from backend.src.resume_parser import (
+    KeywordMatcher, segment_sections, extract_candidate_info, extract_skills
+)
+
+SAMPLE_RESUME = """John Smith
+john.smith@example.com | +1 555-123-4567
+
+Technical Skills:
+Python, C++, Node.js, Docker, machine learning, GitHub
+
+Experience
+Acme Corp - Senior Engineer
+Software Engineer at Globex Inc
+
+Projects
+- Resume Parser: single pass section segmentation
+- Chat App using React and Redis
+
+Education
+B.Tech in Computer Science, XYZ University
+"""
+
+
+class TestSegmentSections:
+    """Test the single-pass segmenter"""
+
+    def test_splits_known_headings(self):
+        sections = segment_sections(SAMPLE_RESUME)
+        assert set(sections) == {'header', 'skills', 'experience', 'projects', 'education'}
+        assert sections['education'].startswith('B.Tech')
+
+    def test_inline_and_markdown_headings(self):
+        sections = segment_sections("## Skills\nPython\nSkills: Docker\nEducation: MBA in Finance")
+        assert sections['skills'] == "Python\nDocker"
+        assert sections['education'] == "MBA in Finance"
+
+
+class TestKeywordMatcher:
+    """Test the Aho-Corasick skill matcher"""
+
+    def test_whole_word_matches_only(self):
+        matcher = KeywordMatcher([('git', 'Git'), ('go', 'Go')])
+        found = [payload for _, _, payload in matcher.find_all("Used Git daily, not GitHub; good with Go")]
+        assert found == ['Git', 'Go']
+
+    def test_overlapping_keywords(self):
+        matcher = KeywordMatcher([('sql server', 'SQL Server'), ('server', 'Server')])
+        found = {payload for _, _, payload in matcher.find_all("MS SQL Server admin")}
+        assert found == {'SQL Server', 'Server'}
+
+
+class TestExtraction:
+    """Test end-to-end candidate extraction"""
+
+    def test_extract_candidate_info(self):
+        info = extract_candidate_info(SAMPLE_RESUME)
+        assert info['candidate_name'] == 'John Smith'
+        assert info['email'] == 'john.smith@example.com'
+        assert info['skills'] == ['Python', 'C++', 'Node.js', 'Docker', 'Machine Learning']
+        assert info['experience'] == ['Acme Corp - Senior Engineer', 'Software Engineer - Globex Inc']
+        assert info['projects'][0].startswith('Resume Parser')
+        assert info['education'] == ['B.Tech in Computer Science']
+
+    def test_skills_fall_back_to_full_text(self):
+        assert extract_skills("Built services in Python on AWS") == ['Python', 'AWS']
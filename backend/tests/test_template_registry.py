@@ -0,0 +1,67 @@
+"""
+Unit Tests for the template registry
+"""
+
+import os
+import json
+import pytest
+
+from backend.src.template_registry import TemplateRegistry, LAYOUT_SIDEBAR_LEFT, LAYOUT_SINGLE
+
+
+@pytest.fixture
+def sources(tmp_path):
+    json_path = tmp_path / 'templates.json'
+    json_path.write_text(json.dumps({"templates": {"modern": {"name": "Modern"}}}))
+    themes_dir = tmp_path / 'themes'
+    themes_dir.mkdir()
+    for i in (1, 2, 6):
+        (themes_dir / f'theme-{i}.css').write_text('')
+    return str(json_path), str(themes_dir)
+
+
+class TestTemplateRegistry:
+    """Test category indexes, payloads and reload"""
+
+    def test_category_index_is_case_insensitive(self, sources):
+        registry = TemplateRegistry(*sources, reload_interval=60)
+        assert [t['id'] for t in registry.get_templates_by_category('CREATIVE')] == ['theme-1', 'theme-6']
+        assert [t['id'] for t in registry.get_templates_by_category('creative')] == ['theme-1', 'theme-6']
+        assert [t['id'] for t in registry.get_all_templates()] == ['modern', 'theme-1', 'theme-2', 'theme-6']
+
+    def test_payload_matches_templates(self, sources):
+        registry = TemplateRegistry(*sources, reload_interval=60)
+        body, etag = registry.get_payload('classic')
+        assert json.loads(body) == {"templates": registry.get_templates_by_category('classic')}
+        assert registry.get_payload('Classic') == (body, etag)
+        assert json.loads(registry.get_payload('unknown')[0]) == {"templates": []}
+        assert registry.get_payload(None) == registry.get_payload('all')
+
+    def test_reloads_when_themes_change(self, sources):
+        registry = TemplateRegistry(*sources, reload_interval=0)
+        _, etag = registry.get_payload()
+
+        themes_dir = sources[1]
+        open(os.path.join(themes_dir, 'theme-7.css'), 'w').close()
+        stat = os.stat(themes_dir)
+        os.utime(themes_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert registry.get_template('theme-7') is not None
+        assert registry.get_payload()[1] != etag
+        assert registry.stats['builds'] == 2
+
+
+class TestRenderTemplates:
+    """Test the render template descriptor table"""
+
+    def test_descriptors_and_fallback(self, sources):
+        registry = TemplateRegistry(*sources, reload_interval=60)
+        assert len(registry.render_template_ids) == 20
+        assert registry.get_render_template('modern').name == 'Modern'
+        assert registry.get_render_template('template-4').layout == LAYOUT_SIDEBAR_LEFT
+        assert registry.get_render_template('template-3').layout == LAYOUT_SINGLE
+        assert registry.get_render_template('theme-1') is None
+        assert registry.resolve_render_template('template-9') == 'template-9'
+        assert registry.resolve_render_template('../etc') == 'modern'
+        assert registry.resolve_render_template(['modern']) == 'modern'
+        assert registry.get_render_template({'id': 'modern'}) is None
@@ -0,0 +1,84 @@
+"""
+Unit Tests for request tracing and latency histograms
+"""
+
+import asyncio
+import logging
+
+from backend.src.tracing import Tracer, LatencyHistogram, current_trace_id, run_in_thread
+
+
+class TestLatencyHistogram:
+    """Test bucketing and percentiles"""
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.observe(ms / 1000)
+        assert histogram.count == 100
+        assert 0.050 <= histogram.percentile(50) <= 0.050 * 1.25
+        assert 0.095 <= histogram.percentile(95) <= 0.095 * 1.25
+        assert LatencyHistogram().percentile(50) is None
+
+    def test_overflow_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.observe(10_000)
+        assert histogram.percentile(99) == float('inf')
+
+
+class TestTracer:
+    """Test spans, trace context and export"""
+
+    def test_spans_recorded_inside_trace(self):
+        tracer = Tracer(enabled=True)
+        with tracer.trace('process_voice', 'abc123'):
+            assert current_trace_id() == 'abc123'
+            with tracer.span('stt.whisper'):
+                pass
+            with tracer.span('llm.follow_up'):
+                pass
+        assert current_trace_id() is None
+        assert set(tracer.get_stats()) == {'process_voice', 'stt.whisper', 'llm.follow_up'}
+
+    def test_trace_id_follows_async_tasks(self):
+        tracer = Tracer(enabled=True)
+        seen = []
+
+        async def stage():
+            with tracer.span('tts.edge'):
+                seen.append(current_trace_id())
+
+        async def request():
+            with tracer.trace('channel_answer', 'task-trace'):
+                await asyncio.create_task(stage())
+                await run_in_thread(lambda: seen.append(current_trace_id()))
+
+        asyncio.run(request())
+        assert seen == ['task-trace', 'task-trace']
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        with tracer.trace('process_voice'):
+            with tracer.span('stt.whisper'):
+                assert current_trace_id() is None
+        assert tracer.get_stats() == {}
+        assert tracer.traced('x')(lambda: 42)() == 42
+
+    def test_errors_counted_and_exported(self):
+        tracer = Tracer(enabled=True)
+        try:
+            with tracer.trace('final_results'):
+                raise ValueError('boom')
+        except ValueError:
+            pass
+        text = tracer.render_prometheus()
+        assert '# TYPE interview_span_seconds histogram' in text
+        assert 'interview_span_seconds_bucket{span="final_results",le="+Inf"} 1' in text
+        assert 'interview_span_seconds_count{span="final_results"} 1' in text
+        assert 'interview_trace_errors_total{trace="final_results"} 1' in text
+
+    def test_log_records_carry_trace_id(self):
+        tracer = Tracer(enabled=True)
+        with tracer.trace('process_voice', 'log-trace'):
+            record = logging.getLogger('test').makeRecord('test', logging.INFO, __file__, 1, 'msg', (), None)
+        assert record.trace == '[trace log-trace] '
@@ -275,8 +275,7 @@ async function recreateResumeWithAI() {
     btn.disabled = true;
 
     try {
-        const response = await fetch('/api/recreate_resume', {
-            method: 'POST',
+        const result = await runBackgroundJob('/api/jobs/recreate_resume', {
             headers: {
                 'Content-Type': 'application/json'
             },
@@ -285,10 +284,10 @@ async function recreateResumeWithAI() {
                 current_score: currentAnalysisData.overall_score,
                 analysis: currentAnalysisData
             })
+        }, (progress, message) => {
+            btn.innerHTML = `<div class="spinner"></div> <span>${message || 'AI is recreating your resume'}... ${progress}%</span>`;
         });
 
-        const result = await response.json();
-
         if (result.error) {
             alert('Error: ' + result.error);
             btn.innerHTML = originalHTML;
@@ -0,0 +1,131 @@
+// Interview channel: one WebSocket per interview session (ASGI server mode).
+// Answers go up as JSON text or binary audio frames; responses come down as a JSON
+// event followed by binary MP3 frames, plus server-pushed timer and phase events.
+// connect() rejects when the server has no channel (sync mode), so callers fall
+// back to the /process_voice requests.
+
+class InterviewChannel {
+    constructor(sessionId, handlers = {}) {
+        this.sessionId = sessionId;
+        this.handlers = handlers;  // onReady, onTimer, onPhase, onTranscript, onResponse, onFinalResult, onError, onClose
+        this.socket = null;
+        this.pending = null;  // Response event whose audio frames are arriving
+        this.audioParts = [];
+    }
+
+    get isOpen() {
+        return this.socket !== null && this.socket.readyState === WebSocket.OPEN;
+    }
+
+    connect(timeoutMs = 3000) {
+        const scheme = window.location.protocol === 'https:' ? 'wss' : 'ws';
+        const url = `${scheme}://${window.location.host}/ws/interview?session_id=${encodeURIComponent(this.sessionId)}`;
+
+        return new Promise((resolve, reject) => {
+            let settled = false;
+            const socket = new WebSocket(url);
+            socket.binaryType = 'blob';
+            const timer = setTimeout(() => {
+                if (!settled) {
+                    settled = true;
+                    socket.close();
+                    reject(new Error('Interview channel timed out'));
+                }
+            }, timeoutMs);
+
+            socket.onmessage = (message) => {
+                if (!settled) {
+                    settled = true;
+                    clearTimeout(timer);
+                    this.socket = socket;
+                    resolve(this);
+                }
+                this._onMessage(message);
+            };
+            socket.onerror = () => {
+                if (!settled) {
+                    settled = true;
+                    clearTimeout(timer);
+                    reject(new Error('Interview channel unavailable'));
+                }
+            };
+            socket.onclose = () => {
+                if (this.socket === socket) {
+                    this.socket = null;
+                    this._emit('onClose');
+                }
+            };
+        });
+    }
+
+    sendText(text, durationSeconds = null) {
+        this._send({ type: 'answer', text: text, duration: durationSeconds });
+    }
+
+    async sendAudio(blob, durationSeconds = null, chunkSize = 64 * 1024) {
+        this._send({ type: 'audio_start' });
+        const buffer = await blob.arrayBuffer();
+        for (let offset = 0; offset < buffer.byteLength; offset += chunkSize) {
+            this.socket.send(buffer.slice(offset, offset + chunkSize));
+        }
+        this._send({ type: 'audio_end', duration: durationSeconds });
+    }
+
+    end() {
+        this._send({ type: 'end' });
+    }
+
+    close() {
+        if (this.socket) this.socket.close();
+    }
+
+    _send(event) {
+        this.socket.send(JSON.stringify(event));
+    }
+
+    _emit(name, ...args) {
+        if (this.handlers[name]) this.handlers[name](...args);
+    }
+
+    _onMessage(message) {
+        if (typeof message.data !== 'string') {
+            // Binary frame: TTS audio of the pending response
+            this.audioParts.push(message.data);
+            return;
+        }
+
+        const event = JSON.parse(message.data);
+        switch (event.type) {
+            case 'ready':
+                this._emit('onReady', event);
+                break;
+            case 'timer':
+                this._emit('onTimer', event);
+                break;
+            case 'phase':
+                this._emit('onPhase', event);
+                break;
+            case 'transcript':
+                this._emit('onTranscript', event.text);
+                break;
+            case 'response':
+                this.pending = event;
+                this.audioParts = [];
+                break;
+            case 'audio_end': {
+                const audio = this.audioParts.length ? new Blob(this.audioParts, { type: 'audio/mpeg' }) : null;
+                const response = this.pending;
+                this.pending = null;
+                this.audioParts = [];
+                this._emit('onResponse', response, audio);
+                break;
+            }
+            case 'final_result':
+                this._emit('onFinalResult', event);
+                break;
+            case 'error':
+                this._emit('onError', event.error);
+                break;
+        }
+    }
+}
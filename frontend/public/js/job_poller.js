@@ -0,0 +1,25 @@
+// Background job helper: submit to /api/jobs/*, then poll until the job finishes.
+
+const JOB_POLL_INTERVAL = 1000;
+const JOB_POLL_MAX_INTERVAL = 4000;
+
+async function runBackgroundJob(url, options = {}, onProgress = null) {
+    const response = await fetch(url, { method: 'POST', ...options });
+    let job = await response.json();
+
+    let delay = JOB_POLL_INTERVAL;
+    while (job.status === 'queued' || job.status === 'running') {
+        if (onProgress) onProgress(job.progress || 0, job.message || '');
+        await new Promise(resolve => setTimeout(resolve, delay));
+        delay = Math.min(delay * 1.5, JOB_POLL_MAX_INTERVAL);
+
+        const poll = await fetch(`${job.status_url}?events=0`);
+        job = await poll.json();
+    }
+
+    if (job.status === 'done') {
+        if (onProgress) onProgress(100, job.message || '');
+        return job.result;
+    }
+    return { error: job.error || 'Job failed' };
+}
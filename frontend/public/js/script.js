@@ -20,6 +20,11 @@ let interviewStartTime = null;
 let summaryTriggered = false;
 const QA_PHASE_DURATION = 2 * 60 * 1000; // 2 minutes in milliseconds
 
+// WebSocket session channel (ASGI server mode); null means per-turn HTTP requests
+let interviewChannel = null;
+// Last answer sent, resent when the server asks to retry
+let lastSentText = '';
+
 async function startInterview() {
     const mode = document.getElementById('mode').value;
     const jobRole = document.getElementById('jobRole') ? document.getElementById('jobRole').value : '';
@@ -49,18 +54,38 @@ async function startInterview() {
         }
     }
 
-    const response = await fetch('/start_call_interview', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-            mode: mode,
-            job_role: jobRole,
-            company: company,
-            resume_text: resumeText  // Send resume text to backend
-        })
-    });
+    const statusEl = document.getElementById('status');
+    let queueTicket = null;
+    let data;
+    while (true) {
+        const response = await fetch('/start_call_interview', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                mode: mode,
+                job_role: jobRole,
+                company: company,
+                resume_text: resumeText,  // Send resume text to backend
+                queue_ticket: queueTicket
+            })
+        });
+        data = await response.json();
+
+        // Server busy: wait our turn in the queue, retrying with the ticket
+        if (response.status === 503 && data.retry_after) {
+            queueTicket = data.queue_ticket || null;
+            if (statusEl) {
+                statusEl.innerText = data.queue_position
+                    ? `${data.error} Position ${data.queue_position}, about ${data.estimated_wait_seconds}s wait...`
+                    : data.error;
+            }
+            if (!queueTicket) return;  // Rejected outright
+            await new Promise(resolve => setTimeout(resolve, data.retry_after * 1000));
+            continue;
+        }
+        break;
+    }
 
-    const data = await response.json();
     if (data.session_id) {
         sessionId = data.session_id;
         const audioUrl = encodeURIComponent(data.audio_url);
@@ -82,6 +107,8 @@ if (window.location.pathname === '/interview') {
     const statusEl = document.getElementById('status');
     if (statusEl) statusEl.innerText = "AI is greeting you...";
 
+    openInterviewChannel();
+
     navigator.mediaDevices.getUserMedia({ audio: true })
         .then(stream => {
             initVAD(stream);
@@ -104,6 +131,55 @@ if (window.location.pathname === '/interview') {
         });
 }
 
+// Open the session channel; without one (sync server mode) turns use /process_voice
+function openInterviewChannel() {
+    if (typeof InterviewChannel === 'undefined' || !window.WebSocket) return;
+
+    const channel = new InterviewChannel(sessionId, {
+        onTimer: (event) => {
+            // Server clock is authoritative for the timer and phase
+            if (interviewStartTime) {
+                interviewStartTime = Date.now() - event.elapsed_seconds * 1000;
+            }
+        },
+        onPhase: (event) => {
+            if (event.phase === 'summary' && !summaryTriggered) {
+                summaryTriggered = true;
+                stopListeningForSummary();
+            }
+        },
+        onResponse: (data, audio) => {
+            if (data.real_time_feedback) {
+                window.lastFeedback = data.real_time_feedback;
+            }
+            const isSummary = data.phase === 'summary' || data.interview_complete === true;
+            playResponse(audio, data.full_text, isSummary, data.degraded);
+        },
+        onError: (error) => {
+            console.error('Channel error:', error);
+            if (error.retry_after && lastSentText) {
+                // Server busy: resend the same answer shortly
+                document.getElementById('status').innerText = "Server busy, retrying...";
+                setTimeout(() => sendText(lastSentText), error.retry_after * 1000);
+                return;
+            }
+            document.getElementById('status').innerText = "Error occurred";
+            isProcessing = false;
+        },
+        onClose: () => {
+            console.log('Interview channel closed, using HTTP requests');
+            interviewChannel = null;
+        }
+    });
+
+    channel.connect()
+        .then(() => {
+            interviewChannel = channel;
+            console.log('Interview channel open');
+        })
+        .catch(err => console.log('Interview channel unavailable, using HTTP requests:', err.message));
+}
+
 function playGreeting(audioUrl, text) {
     const statusEl = document.getElementById('status');
     statusEl.innerText = "AI: " + text;
@@ -156,8 +232,8 @@ function startSummaryCheck() {
         // Update timer display
         updateTimerDisplay(elapsedSeconds, TOTAL_DURATION, QA_PHASE_SECONDS);
 
-        // Trigger summary at 2 minutes
-        if (!summaryTriggered && elapsed >= QA_PHASE_DURATION) {
+        // Trigger summary at 2 minutes (the channel pushes it from the server instead)
+        if (!summaryTriggered && !interviewChannel && elapsed >= QA_PHASE_DURATION) {
             summaryTriggered = true;
             console.log('2 minutes elapsed - triggering summary');
             triggerSummary();
@@ -225,9 +301,8 @@ function updateTimerDisplay(elapsedSeconds, totalDuration, qaPhaseSeconds) {
     }
 }
 
-// Trigger the summary phase
-function triggerSummary() {
-    // Stop listening
+// Stop listening while the performance summary is generated
+function stopListeningForSummary() {
     if (recognition) {
         try {
             recognition.stop();
@@ -241,6 +316,12 @@ function triggerSummary() {
     if (statusEl) {
         statusEl.innerText = "Generating performance summary...";
     }
+}
+
+// Trigger the summary phase
+function triggerSummary() {
+    stopListeningForSummary();
+    const statusEl = document.getElementById('status');
 
     // Send trigger to backend
     console.log('Requesting performance summary from backend');
@@ -485,6 +566,13 @@ function sendText(text) {
 
     document.getElementById('status').innerText = "Processing...";
     console.log('Sending text:', text);
+    lastSentText = text;
+
+    if (interviewChannel && interviewChannel.isOpen) {
+        // Response arrives as a channel event (onResponse)
+        interviewChannel.sendText(text);
+        return;
+    }
 
     fetch('/process_voice', {
         method: 'POST',
@@ -498,6 +586,13 @@ function sendText(text) {
         .then(data => {
             console.log('Response:', data);
 
+            if (data.retry_after) {
+                // Server busy: resend the same answer shortly
+                document.getElementById('status').innerText = "Server busy, retrying...";
+                setTimeout(() => sendText(text), data.retry_after * 1000);
+                return;
+            }
+
             if (data.real_time_feedback) {
                 window.lastFeedback = data.real_time_feedback;
                 console.log('Real-time feedback:', data.real_time_feedback);
@@ -507,7 +602,7 @@ function sendText(text) {
             const isSummary = data.phase === 'summary' || data.interview_complete === true;
             console.log('Is summary phase:', isSummary, 'Phase:', data.phase, 'Complete:', data.interview_complete);
 
-            playResponse(data.audio_base64, data.full_text, isSummary);
+            playResponse(data.audio_base64, data.full_text, isSummary, data.degraded);
         })
         .catch(err => {
             console.error('Error:', err);
@@ -515,8 +610,8 @@ function sendText(text) {
         });
 }
 
-function playResponse(audioData, text, isSummary = false) {
-    console.log('playResponse called:', { hasAudio: !!audioData, isSummary });
+function playResponse(audioData, text, isSummary = false, degraded = false) {
+    console.log('playResponse called:', { hasAudio: !!audioData, isSummary, degraded });
 
     // CRITICAL: Stop any existing audio first to prevent double voice
     if (currentAudio) {
@@ -570,7 +665,8 @@ function playResponse(audioData, text, isSummary = false) {
     // Only play Edge TTS audio (no browser TTS fallback)
     if (audioData) {
         console.log('Playing audio...');
-        const audioSrc = "data:audio/mp3;base64," + audioData;
+        // Blob from the channel, base64 from /process_voice
+        const audioSrc = audioData instanceof Blob ? URL.createObjectURL(audioData) : "data:audio/mp3;base64," + audioData;
         currentAudio = new Audio(audioSrc);
         currentAudio.play()
             .then(() => {
@@ -581,6 +677,13 @@ function playResponse(audioData, text, isSummary = false) {
                 // If audio fails, just continue without speaking
                 onPlaybackComplete();
             });
+    } else if (degraded && text && window.speechSynthesis) {
+        // Degraded turn (server under load sends no audio): speak it in the browser
+        console.log('Speaking degraded turn with browser TTS');
+        const utterance = new SpeechSynthesisUtterance(text);
+        utterance.onend = onPlaybackComplete;
+        utterance.onerror = onPlaybackComplete;
+        speechSynthesis.speak(utterance);
     } else {
         // No audio available, just continue
         console.log("No audio data - completing immediately");
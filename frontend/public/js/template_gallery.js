@@ -0,0 +1,48 @@
+// Template gallery helper: render one resume in many templates with a single
+// request to /api/render_templates_batch, handling each template as it streams in.
+
+async function streamTemplateGallery(markdownText, templateIds = null, onResult = null, includeData = true) {
+    const response = await fetch('/api/render_templates_batch', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({
+            markdown_text: markdownText,
+            template_ids: templateIds,
+            include_data: includeData
+        })
+    });
+    if (!response.ok) {
+        const error = await response.json().catch(() => ({}));
+        throw new Error(error.error || 'Gallery rendering failed');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffered = '';
+    let summary = null;
+
+    const handleLine = (line) => {
+        if (!line.trim()) return;
+        const item = JSON.parse(line);
+        if (item.done) {
+            summary = item;
+        } else if (onResult) {
+            if (item.pdf_base64) {
+                const bytes = Uint8Array.from(atob(item.pdf_base64), c => c.charCodeAt(0));
+                item.url = URL.createObjectURL(new Blob([bytes], { type: 'application/pdf' }));
+            }
+            onResult(item);
+        }
+    };
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffered += decoder.decode(value, { stream: true });
+        const lines = buffered.split('\n');
+        buffered = lines.pop();
+        lines.forEach(handleLine);
+    }
+    handleLine(buffered);
+    return summary;
+}
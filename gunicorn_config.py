@@ -12,7 +12,10 @@ backlog = 2048
 
 # Worker processes
 workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = 'gevent'
+# SERVER_MODE=asgi serves backend/app/asgi.py (asgi:app) on uvicorn's asyncio workers;
+# the default serves the Flask app (app:app) on gevent
+SERVER_MODE = os.getenv('SERVER_MODE', 'wsgi')
+worker_class = 'uvicorn.workers.UvicornWorker' if SERVER_MODE == 'asgi' else 'gevent'
 worker_connections = 1000
 timeout = 120
 keepalive = 5
@@ -43,6 +46,9 @@ tmp_upload_dir = None
 # certfile = '/path/to/cert.pem'
 
 # Preload app for better performance
+# With PRELOAD_MODELS=1 the models are also loaded here, once, in the master and
+# shared copy-on-write by the workers; otherwise each worker warms them in the
+# background after it boots (post_worker_init) and /ready answers 503 until done.
 preload_app = True
 
 # Server hooks
@@ -58,6 +64,11 @@ def when_ready(server):
     """Called just after the server is started"""
     print(f"Gunicorn server is ready. Listening on {bind}")
 
+def post_worker_init(worker):
+    """Called just after a worker has initialized the application"""
+    from backend.src.components import components
+    components.warm_up()
+
 def worker_int(worker):
     """Called just after a worker exited on SIGINT or SIGQUIT"""
     print(f"Worker {worker.pid} received INT or QUIT signal")
@@ -0,0 +1,102 @@
+"""
+Download memory benchmark for /api/download_resume_pdf
+Runs concurrent PDF downloads against a running server and samples the
+resident memory of a server process (e.g. a gunicorn worker) while they run.
+Each request uses distinct markdown, so every download is a fresh render;
+--pad-kb grows the documents to check that peak memory does not follow
+document size.
+
+Linux only (reads /proc/<pid>/status).
+
+Usage:
+    python scripts/benchmark_download_memory.py --pid <worker pid> [--url http://localhost:5000]
+                                                [--clients 8] [--requests 5] [--pad-kb 0]
+"""
+import sys
+import os
+import json
+import time
+import uuid
+import argparse
+import threading
+import urllib.request
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.benchmark_pdf_templates import SAMPLE_MARKDOWN
+
+
+def rss_kb(pid):
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def make_markdown(pad_kb):
+    # Unique marker defeats the render cache; padding grows the experience section
+    bullet = "- Delivered measurable improvements across distributed services and tooling\n"
+    padding = bullet * (pad_kb * 1024 // len(bullet))
+    return SAMPLE_MARKDOWN + f"\n## Projects\n- Build {uuid.uuid4().hex}\n" + padding
+
+
+def download(url, pad_kb):
+    body = json.dumps({"markdown_text": make_markdown(pad_kb), "template_id": "modern"}).encode('utf-8')
+    request = urllib.request.Request(f"{url}/api/download_resume_pdf", data=body,
+                                     headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(request, timeout=120) as response:
+        return len(response.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Server memory under concurrent PDF downloads')
+    parser.add_argument('--pid', type=int, required=True, help='Server process to sample')
+    parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent clients (default: 8)')
+    parser.add_argument('--requests', type=int, default=5, help='Downloads per client (default: 5)')
+    parser.add_argument('--pad-kb', type=int, default=0, help='Extra markdown per document in KB (default: 0)')
+    args = parser.parse_args()
+
+    baseline = rss_kb(args.pid)
+    peak = [baseline]
+    sizes, errors = [], []
+    done = threading.Event()
+
+    def sampler():
+        while not done.is_set():
+            peak[0] = max(peak[0], rss_kb(args.pid))
+            time.sleep(0.02)
+
+    def client():
+        for _ in range(args.requests):
+            try:
+                sizes.append(download(args.url, args.pad_kb))
+            except Exception as e:
+                errors.append(str(e))
+
+    sampling = threading.Thread(target=sampler)
+    sampling.start()
+    started = time.perf_counter()
+    clients = [threading.Thread(target=client) for _ in range(args.clients)]
+    for thread in clients:
+        thread.start()
+    for thread in clients:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    done.set()
+    sampling.join()
+
+    avg_kb = sum(sizes) / len(sizes) / 1024 if sizes else 0
+    print(f"downloads: {len(sizes)} ok, {len(errors)} failed in {elapsed:.1f}s ({len(sizes) / elapsed:.1f}/s)")
+    print(f"document size: {avg_kb:.0f} KB average")
+    print(f"server RSS: {baseline / 1024:.1f} MB before, {peak[0] / 1024:.1f} MB peak "
+          f"(+{(peak[0] - baseline) / 1024:.1f} MB)")
+    if errors:
+        print(f"first error: {errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+"""
+Hot-path micro-benchmarks with a stored baseline and a regression gate
+Times the per-turn and per-document hot paths (answer analysis, local metrics,
+resume parsing, response cache, PDF/DOCX rendering per template, follow-up
+prompt construction, session store) in calibrated rounds, timeit-style.
+
+The gate uses the fastest round (least disturbed by other load) relative to a
+fixed pure-Python calibration workload timed in alternating rounds, so a baseline
+recorded on one machine stays meaningful on another (e.g. a CI runner).
+Benchmarks whose dependencies are not installed are reported as skipped, and so
+are benchmarks the baseline recorded as skipped (its machine lacked e.g.
+reportlab or python-docx) until it is re-recorded with them. Any other
+benchmark that runs without a baseline entry fails the gate.
+
+The baseline lives next to this script (benchmark_hot_paths_baseline.json);
+re-record it with `run --save` after an intended performance change. On a
+machine without some dependencies, `run --save --merge` records what runs and
+keeps the stored entries for the rest.
+
+Usage:
+    python scripts/benchmark_hot_paths.py run [--filter pdf] [--save [--merge]] [--json results.json]
+    python scripts/benchmark_hot_paths.py compare [--threshold 0.25] [--filter pdf] [--absolute]
+"""
+import sys
+import os
+import gc
+import re
+import json
+import time
+import argparse
+import platform
+import itertools
+import statistics
+from datetime import datetime
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_hot_paths_baseline.json')
+
+# Each round runs enough iterations to take at least this long
+ROUND_SECONDS = 0.05
+# REPEATS blocks of ROUNDS rounds, alternating with the calibration workload
+ROUNDS = 2
+REPEATS = 5
+CALIBRATION = 'calibration'
+
+RESUME_MARKDOWN = """# Priya Sharma
+Backend Engineer | priya.sharma@example.com | +91 98765 43210 | Pune, India
+
+## Summary
+Backend engineer with 5 years of experience building data pipelines and APIs in Python and Go.
+
+## Skills
+Python, Go, PostgreSQL, Redis, Kafka, Docker, Kubernetes, AWS, Flask, FastAPI, gRPC, Terraform
+
+## Experience
+**Senior Software Engineer** - Finlytics, Pune (2021 - Present)
+- Rebuilt the ingestion pipeline to batch writes, cutting p95 latency by 48%
+- Led a team of four migrating the billing monolith to services over six months
+- Introduced contract tests between 12 services, halving integration incidents
+
+**Software Engineer** - CloudKart, Bengaluru (2019 - 2021)
+- Built the order-tracking API serving 3M requests per day
+- Moved nightly reports from cron scripts to Airflow with retries and alerting
+
+## Projects
+**Rate Limiter Service** - Token-bucket rate limiter in Go backed by Redis, used by 30 services
+**Log Search** - Full-text search over application logs with Elasticsearch and Kafka consumers
+
+## Education
+**B.Tech in Computer Engineering** - College of Engineering, Pune (2015 - 2019), CGPA 8.7/10
+
+## Certifications
+- AWS Certified Solutions Architect - Associate
+"""
+RESUME_TEXT = re.sub(r'[#*]', '', RESUME_MARKDOWN)
+
+ANSWER = ("Um, so in my last role I was, like, responsible for the ingestion pipeline. Basically we had "
+          "a problem where writes were, you know, one row at a time, and the p95 latency was really high. "
+          "I profiled it, found that most of the time went into round trips, and I rebuilt it to batch "
+          "writes and use a bounded queue. Actually the tricky part was back-pressure, so we added a "
+          "circuit breaker. In the end we cut p95 latency by about half and reduced database load, and "
+          "I wrote a runbook so the on-call team could, um, tune the batch size.")
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a setup function returning the zero-argument callable to time"""
+    def decorate(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorate
+
+
+@benchmark(CALIBRATION)
+def _calibration():
+    # Fixed interpreter-bound work (arithmetic, dicts, strings) to normalise results
+    words = ANSWER.split()
+
+    def work():
+        counts = {}
+        for word in words * 4:
+            counts[word.lower()] = counts.get(word.lower(), 0) + 1
+        return sum(i * i for i in range(2000)) + len(counts)
+    return work
+
+
+@benchmark('audio_analyzer.analyze_text')
+def _analyze_text():
+    from backend.src.audio_analyzer import AudioAnalyzer
+    analyzer = AudioAnalyzer()
+    return lambda: analyzer.analyze_text(ANSWER, 42.0)
+
+
+@benchmark('scoring.calculate_local_metrics')
+def _local_metrics():
+    from backend.src.scoring import calculate_local_metrics
+    return lambda: calculate_local_metrics(ANSWER, 42.0)
+
+
+@benchmark('resume_parser.extract_candidate_info')
+def _extract_candidate_info():
+    from backend.src.resume_parser import extract_candidate_info
+    return lambda: extract_candidate_info(RESUME_TEXT)
+
+
+@benchmark('response_cache.get_hit')
+def _cache_get():
+    from backend.src.response_cache import ResponseCache
+    cache = ResponseCache(max_size=1000)
+    prompts = [f"Follow-up for answer {i}" for i in range(500)]
+    for prompt in prompts:
+        cache.set(cache.generate_key(prompt, 'interviewer'), '{"reaction": "I see."}')
+    cycle = itertools.cycle(prompts)
+    return lambda: cache.get(cache.generate_key(next(cycle), 'interviewer'))
+
+
+@benchmark('response_cache.set_evicting')
+def _cache_set():
+    from backend.src.response_cache import ResponseCache
+    cache = ResponseCache(max_size=1000)
+    # Twice the capacity, so steady state evicts on every set
+    cycle = itertools.cycle([f"Follow-up for answer {i}" for i in range(2000)])
+    return lambda: cache.set(cache.generate_key(next(cycle), 'interviewer'), '{"reaction": "I see."}')
+
+
+def _render_setup(module, function, template_id):
+    def setup():
+        render = getattr(__import__(f'backend.src.{module}', fromlist=[function]), function)
+        return lambda: render(RESUME_MARKDOWN, template_id)
+    return setup
+
+
+def _register_render_benchmarks():
+    from backend.src.template_registry import registry
+    for template_id in registry.render_template_ids:
+        benchmark(f'pdf_generator.markdown_to_pdf[{template_id}]')(
+            _render_setup('pdf_generator', 'markdown_to_pdf', template_id))
+        benchmark(f'docx_generator.markdown_to_docx[{template_id}]')(
+            _render_setup('docx_generator', 'markdown_to_docx', template_id))
+
+
+_register_render_benchmarks()
+
+
+@benchmark('interview_engine.build_follow_up_prompt')
+def _follow_up_prompt():
+    from backend.src.interview_engine import InterviewEngine
+    from backend.src.audio_analyzer import analyze_answer
+    from backend.src.resume_parser import extract_candidate_info, identify_topics
+
+    info = extract_candidate_info(RESUME_TEXT)
+    session = {
+        'mode': 'Technical', 'job_role': 'Backend Engineer', 'company': 'Google',
+        'history': [{'role': role, 'content': ANSWER if role == 'user' else 'Tell me about the pipeline.'}
+                    for role in ('ai', 'user') * 5],
+        'resume_context': {'candidate_name': 'Priya Sharma', **info},
+        'resume_topics': identify_topics(info),
+        'topic_question_count': {'project:Rate Limiter Service': 2, 'experience:Finlytics': 1, 'skill:Python': 1},
+        'total_questions_asked': 5,
+    }
+    audio_analysis = analyze_answer(ANSWER, 42.0)
+    mistake_analysis = {'all_feedback': ['Your answer is quite long.']}
+    engine = InterviewEngine()
+    return lambda: engine.build_follow_up_prompt(session, ANSWER, audio_analysis, mistake_analysis)
+
+
+@benchmark('question_packs.lookup_and_deal')
+def _question_packs():
+    from backend.src.question_packs import get_questions_for_role, get_company_style_prompt, QuestionDeck
+    deck = QuestionDeck('Senior Software Engineer')
+
+    def per_turn():
+        get_questions_for_role('Senior Software Engineer', 3)
+        get_company_style_prompt('google')
+        next(deck)
+    return per_turn
+
+
+@benchmark('question_selector.select')
+def _question_selector():
+    from backend.src.question_selector import QuestionSelector
+    from backend.src.resume_parser import extract_candidate_info, identify_topics
+
+    topics = identify_topics(extract_candidate_info(RESUME_TEXT))
+    session = {
+        'job_role': 'Backend Engineer', 'company': 'Google', 'resume_topics': topics,
+        'topic_question_count': {topic: 0 for topic in topics},
+        'history': [{'role': role, 'content': ANSWER if role == 'user' else 'I see. Tell me about the pipeline.'}
+                    for role in ('ai', 'user') * 5],
+    }
+    selector = QuestionSelector()
+    selector.plan(session)
+    return lambda: selector.select(session, 6.5)
+
+
+@benchmark('memory_store.session_10_turns')
+def _memory_store():
+    from backend.src.memory_store import MemoryStore
+    store = MemoryStore()
+    score = {'local_score': 6.5, 'ai_score': 7, 'confidence_score': 72}
+    analysis = {'audio': {'filler_count': 3, 'speaking_pace': 140, 'issues': ['Fillers'], 'tips': ['Pause']}}
+
+    def session_lifecycle():
+        store.create_session('bench')
+        for _ in range(10):
+            store.add_history('bench', 'ai', 'Tell me about the pipeline.')
+            store.add_history('bench', 'user', ANSWER)
+            store.add_score('bench', score)
+            store.add_analysis('bench', analysis)
+            store.get_aggregates('bench')
+        store.delete_session('bench')
+    return session_lifecycle
+
+
+def calibrate_iterations(func):
+    """Warm up, then find the iteration count that makes one round last ROUND_SECONDS"""
+    func()  # Lazy imports, caches
+    iterations = 1
+    while True:
+        elapsed = _timed(func, iterations)
+        if elapsed >= ROUND_SECONDS:
+            return iterations
+        iterations = max(iterations * 2, int(iterations * ROUND_SECONDS / max(elapsed, 1e-9) * 1.2))
+
+
+def timed_rounds(func, iterations, rounds):
+    """Per-call seconds of each round (GC paused, like timeit)"""
+    return [_timed(func, iterations) / iterations for _ in range(rounds)]
+
+
+def _timed(func, iterations):
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def run_suite(name_filter=None):
+    """
+    Run the benchmarks (optionally only names containing name_filter)
+
+    Returns:
+        Dict with environment info, results and skipped benchmarks
+    """
+    import logging
+    logging.disable(logging.INFO)  # Per-call INFO logs would dominate the timings
+
+    calibrate = BENCHMARKS[CALIBRATION]()
+    calibration_iterations = calibrate_iterations(calibrate)
+    timed_rounds(calibrate, calibration_iterations, ROUNDS * REPEATS)  # Let CPU clocks settle
+    best_calibration = None
+    results, skipped = {}, {}
+    for name, setup in BENCHMARKS.items():
+        if name == CALIBRATION or (name_filter and name_filter not in name):
+            continue
+        try:
+            func = setup()
+        except ImportError as e:
+            skipped[name] = f"missing dependency: {e.name or e}"
+            continue
+
+        iterations = calibrate_iterations(func)
+        calibration, samples = [], []
+        # Alternate calibration and benchmark rounds so both see the same machine load
+        for _ in range(REPEATS):
+            calibration += timed_rounds(calibrate, calibration_iterations, ROUNDS)
+            samples += timed_rounds(func, iterations, ROUNDS)
+        best_calibration = min(best_calibration or min(calibration), min(calibration))
+
+        results[name] = stats = {
+            'iterations': iterations,
+            'rounds': len(samples),
+            'min_us': round(min(samples) * 1e6, 3),
+            'median_us': round(statistics.median(samples) * 1e6, 3),
+            'mean_us': round(statistics.mean(samples) * 1e6, 3),
+            'stddev_us': round(statistics.stdev(samples) * 1e6, 3),
+            'relative': round(min(samples) / min(calibration), 4),
+        }
+        print(f"  {name:55s} {stats['min_us']:12.1f} us  (x{stats['relative']:.3f})", file=sys.stderr)
+
+    return {
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}",
+        'calibration_us': round(best_calibration * 1e6, 3) if best_calibration else None,
+        'benchmarks': results,
+        'skipped': skipped,
+    }
+
+
+def compare(baseline, current, threshold, absolute=False):
+    """
+    Compare current results to the baseline
+
+    Args:
+        baseline: Stored run_suite() output
+        current: Fresh run_suite() output
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+        absolute: Compare raw times instead of calibration-relative ones
+
+    Returns:
+        (rows, regressions, unbaselined): rows are (name, baseline us, current us,
+        change, status); unbaselined are benchmarks that ran without a baseline entry
+        and were not skipped when the baseline was recorded
+    """
+    key = 'min_us' if absolute else 'relative'
+    rows, regressions, unbaselined = [], [], []
+    for name in sorted(set(baseline['benchmarks']) | set(current['benchmarks']) | set(current['skipped'])):
+        old, new = baseline['benchmarks'].get(name), current['benchmarks'].get(name)
+        if new is None:
+            rows.append((name, old and old['min_us'], None, None,
+                         'skipped' if name in current['skipped'] else 'missing'))
+        elif old is None and name in baseline.get('skipped', {}):
+            rows.append((name, None, new['min_us'], None, 'skipped (not in baseline)'))
+        elif old is None:
+            unbaselined.append(name)
+            rows.append((name, None, new['min_us'], None, 'NO BASELINE'))
+        else:
+            change = new[key] / old[key] - 1
+            status = 'REGRESSED' if change > threshold else ('improved' if change < -threshold else 'ok')
+            if status == 'REGRESSED':
+                regressions.append(name)
+            rows.append((name, old['min_us'], new['min_us'], change, status))
+    return rows, regressions, unbaselined
+
+
+def merge_baseline(baseline, current):
+    """
+    Baseline from a fresh run, keeping stored entries for benchmarks it did not run
+
+    Args:
+        baseline: Stored run_suite() output
+        current: Fresh run_suite() output
+
+    Returns:
+        The merged run_suite() output
+    """
+    merged = dict(current)
+    merged['benchmarks'] = {**baseline['benchmarks'], **current['benchmarks']}
+    merged['skipped'] = {name: reason for name, reason in {**baseline['skipped'], **current['skipped']}.items()
+                         if name not in merged['benchmarks']}
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot-path micro-benchmarks with a regression gate')
+    parser.add_argument('command', choices=['run', 'compare'])
+    parser.add_argument('--filter', help='Only benchmarks whose name contains this')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file')
+    parser.add_argument('--save', action='store_true', help='run: write the results as the new baseline')
+    parser.add_argument('--merge', action='store_true',
+                        help='run --save: keep baseline entries for benchmarks not run (e.g. missing dependencies)')
+    parser.add_argument('--json', help='Also write the results to this file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='compare: allowed slowdown before failing (default: 0.25 = 25%%)')
+    parser.add_argument('--absolute', action='store_true',
+                        help='compare: raw times instead of calibration-relative (same machine only)')
+    args = parser.parse_args()
+
+    current = run_suite(args.filter)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.command == 'run':
+        for name, reason in current['skipped'].items():
+            print(f"  {name:55s} skipped ({reason})", file=sys.stderr)
+        if args.save:
+            if args.merge and os.path.exists(args.baseline):
+                with open(args.baseline) as f:
+                    current = merge_baseline(json.load(f), current)
+            with open(args.baseline, 'w') as f:
+                json.dump(current, f, indent=2)
+                f.write('\n')
+            print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.filter:
+        baseline['benchmarks'] = {name: stats for name, stats in baseline['benchmarks'].items()
+                                  if args.filter in name}
+    rows, regressions, unbaselined = compare(baseline, current, args.threshold, args.absolute)
+
+    print(f"\n{'benchmark':55s} {'baseline':>12s} {'current':>12s} {'change':>8s}  status")
+    for name, old, new, change, status in rows:
+        print(f"{name:55s} {f'{old:.1f} us' if old else '-':>12s} {f'{new:.1f} us' if new else '-':>12s} "
+              f"{f'{change:+.1%}' if change is not None else '-':>8s}  {status}")
+    if unbaselined:
+        print(f"\n{len(unbaselined)} benchmark(s) have no baseline entry: {', '.join(unbaselined)}\n"
+              f"Record them with `run --save --merge` where their dependencies are installed")
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+    if unbaselined or regressions:
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+Interview API capacity benchmark: sync (gevent) vs async (ASGI) server mode
+Starts a local stub Groq server (fixed latency) and one single-worker gunicorn
+server per mode with Edge TTS replaced by a stub (fixed latency, silent audio),
+then runs increasing numbers of concurrent interview sessions
+(start_call_interview -> N x process_voice -> final_results) and reports turn
+latency and throughput per level. One worker = one core, so the largest level
+whose p95 turn latency stays under --slo is the session capacity per core.
+
+Requires the server dependencies (gunicorn, gevent, backend/requirements_asgi.txt).
+
+Usage:
+    python scripts/benchmark_interview_capacity.py [--modes wsgi,asgi] [--levels 10,50,100,200]
+                                                   [--turns 3] [--think 0.5] [--llm-latency 0.8]
+                                                   [--tts-latency 0.3] [--slo 3.0]
+"""
+import sys
+import os
+import json
+import time
+import socket
+import asyncio
+import argparse
+import threading
+import subprocess
+import statistics
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+FOLLOW_UP = {"reaction": "I see.", "follow_up_question": "What was the hardest bug you fixed?",
+             "score": 7, "feedback": "Clear answer", "topic": "general:debugging"}
+
+# Runs in the server process: stub Edge TTS, then start gunicorn
+SERVER_BOOTSTRAP = r'''
+import sys, asyncio, edge_tts
+
+class StubCommunicate:
+    def __init__(self, text, voice=None):
+        self.text = text
+
+    async def stream(self):
+        await asyncio.sleep(TTS_LATENCY)
+        yield {"type": "audio", "data": b"\0" * 4096}
+
+    async def save(self, path):
+        async for chunk in self.stream():
+            with open(path, "wb") as f:
+                f.write(chunk["data"])
+
+edge_tts.Communicate = StubCommunicate
+
+from gunicorn.app.wsgiapp import run
+sys.argv = ["gunicorn", "--config", CONFIG, "--workers", "1", "--bind", BIND, "--log-level", "warning", APP]
+run()
+'''
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_llm_stub(latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            time.sleep(latency)
+            body = json.dumps({"choices": [{"message": {"content": json.dumps(FOLLOW_UP)}}]}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', free_port()), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_server(mode, port, llm_url, tts_latency):
+    app_module = 'asgi:app' if mode == 'asgi' else 'app:app'
+    code = (f"TTS_LATENCY = {tts_latency}\nCONFIG = {os.path.join(PROJECT_ROOT, 'gunicorn_config.py')!r}\n"
+            f"BIND = '127.0.0.1:{port}'\nAPP = {app_module!r}\n" + SERVER_BOOTSTRAP)
+    env = dict(os.environ, SERVER_MODE=mode, GROQ_API_KEY='stub', GROQ_BASE_URL=llm_url,
+               PYTHONPATH=PROJECT_ROOT)
+    process = subprocess.Popen([sys.executable, '-c', code], cwd=os.path.join(PROJECT_ROOT, 'backend', 'app'),
+                               env=env)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/live', timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+async def run_session(session, base_url, turns, think, latencies, errors):
+    async def post(path, payload):
+        started = time.perf_counter()
+        async with session.post(f'{base_url}{path}', json=payload) as response:
+            body = await response.json()
+            if response.status != 200:
+                raise RuntimeError(f"{path}: HTTP {response.status}")
+        latencies.setdefault(path, []).append(time.perf_counter() - started)
+        return body
+
+    try:
+        started = await post('/start_call_interview', {'mode': 'Technical', 'job_role': 'Backend Engineer'})
+        for _ in range(turns):
+            await asyncio.sleep(think)
+            await post('/process_voice', {'session_id': started['session_id'],
+                                          'user_text': 'I rebuilt our ingestion pipeline to batch writes '
+                                                       'and cut p95 latency by half.'})
+        await post('/final_results', {'session_id': started['session_id']})
+    except Exception as e:
+        errors.append(str(e))
+
+
+async def run_level(base_url, sessions, turns, think):
+    import aiohttp
+    latencies, errors = {}, []
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=300)) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(run_session(session, base_url, turns, think, latencies, errors)
+                               for _ in range(sessions)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def p95(values):
+    return statistics.quantiles(values, n=20)[18] if len(values) >= 2 else (values[0] if values else 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent interview sessions per core, sync vs ASGI')
+    parser.add_argument('--modes', default='wsgi,asgi', help='Server modes to run (default: wsgi,asgi)')
+    parser.add_argument('--levels', default='10,50,100,200', help='Concurrent sessions per level')
+    parser.add_argument('--turns', type=int, default=3, help='Answers per session (default: 3)')
+    parser.add_argument('--think', type=float, default=0.5, help='Seconds between answers (default: 0.5)')
+    parser.add_argument('--llm-latency', type=float, default=0.8, help='Stub Groq latency (default: 0.8s)')
+    parser.add_argument('--tts-latency', type=float, default=0.3, help='Stub Edge TTS latency (default: 0.3s)')
+    parser.add_argument('--slo', type=float, default=3.0, help='p95 turn latency target (default: 3.0s)')
+    args = parser.parse_args()
+
+    llm = start_llm_stub(args.llm_latency)
+    llm_url = f'http://127.0.0.1:{llm.server_address[1]}/v1/chat/completions'
+    levels = [int(level) for level in args.levels.split(',')]
+
+    for mode in args.modes.split(','):
+        port = free_port()
+        server = start_server(mode, port, llm_url, args.tts_latency)
+        capacity = 0
+        try:
+            print(f"\n{mode} (1 worker), stub LLM {args.llm_latency}s, stub TTS {args.tts_latency}s")
+            print(f"  {'sessions':>8s} {'turn p50':>9s} {'turn p95':>9s} {'turns/s':>8s} {'errors':>7s}")
+            for level in levels:
+                latencies, errors, elapsed = asyncio.run(
+                    run_level(f'http://127.0.0.1:{port}', level, args.turns, args.think))
+                turns = latencies.get('/process_voice', [])
+                turn_p95 = p95(turns)
+                print(f"  {level:8d} {statistics.median(turns) if turns else 0:8.2f}s {turn_p95:8.2f}s "
+                      f"{len(turns) / elapsed:8.1f} {len(errors):7d}")
+                if turns and not errors and turn_p95 <= args.slo:
+                    capacity = level
+            print(f"  capacity: {capacity} concurrent sessions per core at p95 <= {args.slo}s")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    llm.shutdown()
+
+
+if __name__ == "__main__":
+    main()
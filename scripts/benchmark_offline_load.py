@@ -0,0 +1,452 @@
+"""
+Offline end-to-end load test: full interview sessions against local stand-ins
+Starts local stand-ins for the Groq chat-completions API and the HuggingFace
+Inference API (HTTP servers in this process) and replaces Edge TTS, its gTTS
+fallback and Whisper inside the server process, so no quota or network access
+is used. Every stand-in has a configurable latency distribution and 429 rate.
+
+It then serves the app with gunicorn and runs full interview sessions
+(start_call_interview -> N x process_voice -> final_results -> resume PDF
+download) at the given concurrency, and prints a JSON report: session and
+request throughput, p50/p95/p99 and error rate per route, stand-in request and
+429 counts, and the server's own stage latencies (from /health, i.e. from the
+worker that answered; use --workers 1 for the full picture).
+
+Latency specs: "0.8" (fixed seconds), "uniform:0.2:1.2", "lognormal:0.8:0.5"
+(median seconds, sigma) or "exp:0.5" (mean seconds).
+
+In wsgi mode the interview routes call Groq directly; the provider manager
+(HuggingFace, then Groq) serves the async follow-up path of asgi mode.
+Requires the server dependencies (gunicorn, gevent, reportlab, edge-tts; for
+asgi mode backend/requirements_asgi.txt) and aiohttp.
+
+Usage:
+    python scripts/benchmark_offline_load.py [--mode wsgi] [--sessions 50] [--concurrency 10]
+                                             [--turns 3] [--audio-ratio 0.3] [--think 0]
+                                             [--groq-latency lognormal:0.6:0.4] [--groq-429-rate 0.02]
+                                             [--hf-latency lognormal:1.0:0.5] [--hf-429-rate 0.05]
+                                             [--tts-latency uniform:0.2:0.6] [--tts-429-rate 0.01]
+                                             [--stt-latency 0.4] [--seed 1] [--output report.json]
+"""
+import sys
+import os
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import threading
+import subprocess
+import urllib.request
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from scripts.benchmark_interview_capacity import free_port
+
+# One reply satisfies every JSON prompt: follow-up turns and final scoring
+JSON_REPLY = {
+    "reaction": "I see.", "follow_up_question": "What was the hardest bug you fixed?",
+    "score": 7, "feedback": "Clear answer", "topic": "general:debugging",
+    "overall_score": 72, "subscores": {"communication": 7, "technical": 7, "confidence": 8},
+    "strengths": ["Concrete examples"], "weaknesses": ["Could quantify impact more"],
+    "improvement_plan": ["Use the STAR structure"], "summary": "Solid, well structured answers.",
+}
+RELEVANCE_REPLY = "0.85"
+
+ANSWERS = [
+    "I rebuilt our ingestion pipeline to batch writes and cut p95 latency by half.",
+    "In my last role I led a team of four migrating a monolith to services over six months.",
+    "I usually start by reproducing the issue, then bisect recent changes and add a regression test.",
+    "My strength is turning vague requirements into small, shippable increments.",
+]
+
+# Edge TTS default output is 48 kbit/s MP3 (~6 KB/s); speech runs ~15 characters/s
+TTS_BYTES_PER_CHAR = 400
+TTS_CHUNK_BYTES = 4096
+FAKE_RECORDING = b'RIFF' + b'\0' * 32 * 1024
+
+
+class LatencyModel:
+    """Delay distribution of a stand-in, parsed from a spec string"""
+
+    KINDS = {'uniform': 2, 'lognormal': 2, 'exp': 1}
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        try:
+            self.kind, self.params = 'fixed', (float(spec),)
+        except ValueError:
+            kind, *params = spec.split(':')
+            if self.KINDS.get(kind) != len(params):
+                raise ValueError(f"Bad latency spec: {spec}")
+            self.kind, self.params = kind, tuple(float(p) for p in params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'lognormal':
+            median, sigma = self.params
+            return rng.lognormvariate(math.log(median), sigma)
+        if self.kind == 'exp':
+            return rng.expovariate(1 / self.params[0])
+        return self.params[0]
+
+
+class StandIn:
+    """Latency and rate-limit behaviour of one stand-in service"""
+
+    def __init__(self, name: str, latency: LatencyModel, rate_limit_rate: float, seed: int):
+        self.name = name
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.rng = random.Random(f'{seed}:{name}')
+        self.requests = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+
+    def next(self):
+        """Returns (delay seconds, rate limited) for the next request; 429s answer at once"""
+        with self._lock:
+            self.requests += 1
+            if self.rng.random() < self.rate_limit_rate:
+                self.rate_limited += 1
+                return 0.0, True
+            return self.latency.sample(self.rng), False
+
+    def get_stats(self):
+        return {'latency': self.latency.spec, 'requests': self.requests, 'rate_limited': self.rate_limited}
+
+
+def completion_content(request):
+    """Reply text for an OpenAI-style chat request"""
+    prompt = request.get('messages', [{}])[-1].get('content', '')
+    if 'ONLY a number' in prompt:
+        return RELEVANCE_REPLY
+    return json.dumps(JSON_REPLY)
+
+
+def start_chat_stand_in(stand_in: StandIn):
+    """OpenAI-compatible chat-completions server (answers every POST path)"""
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            delay, rate_limited = stand_in.next()
+            time.sleep(delay)
+            if rate_limited:
+                self._reply(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                            {'Retry-After': '1'})
+                return
+            self._reply(200, {
+                "id": f"chatcmpl-{stand_in.requests}", "object": "chat.completion", "created": int(time.time()),
+                "model": request.get('model', 'stand-in'), "system_fingerprint": "stand-in",
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": completion_content(request)},
+                             "logprobs": None, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            })
+
+        def _reply(self, status, payload, headers=None):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', free_port()), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ============================================
+# SERVER PROCESS
+# ============================================
+
+def install_in_process_stand_ins(args):
+    """Replaces Edge TTS, gTTS and the Whisper model before the app is imported"""
+    tts = StandIn('edge_tts', args.tts_latency, args.tts_429_rate, args.seed)
+    gtts_fallback = StandIn('gtts', args.tts_latency, 0.0, args.seed)
+    stt = StandIn('whisper', args.stt_latency, 0.0, args.seed)
+
+    def audio_for(text):
+        return b'\xff\xf3' * (len(text or '') * TTS_BYTES_PER_CHAR // 2)
+
+    import edge_tts
+
+    class Communicate:
+        def __init__(self, text, voice=None, **kwargs):
+            self.text = text
+
+        async def stream(self):
+            delay, rate_limited = tts.next()
+            await asyncio.sleep(delay)
+            if rate_limited:
+                # What edge_tts surfaces when the service rejects the handshake
+                raise RuntimeError("429, message='Invalid response status'")
+            audio = audio_for(self.text)
+            for offset in range(0, len(audio), TTS_CHUNK_BYTES):
+                yield {"type": "audio", "data": audio[offset:offset + TTS_CHUNK_BYTES]}
+
+        async def save(self, path):
+            with open(path, 'wb') as f:
+                async for chunk in self.stream():
+                    f.write(chunk["data"])
+
+    edge_tts.Communicate = Communicate
+
+    try:
+        import gtts
+
+        class GTTS:
+            def __init__(self, text, **kwargs):
+                self.text = text
+
+            def write_to_fp(self, fp):
+                time.sleep(gtts_fallback.next()[0])
+                fp.write(audio_for(self.text))
+
+            def save(self, path):
+                with open(path, 'wb') as f:
+                    self.write_to_fp(f)
+
+        gtts.gTTS = GTTS
+    except ImportError:
+        pass
+
+    class Whisper:
+        def transcribe(self, path, **kwargs):
+            time.sleep(stt.next()[0])
+            return {'text': stt.rng.choice(ANSWERS)}
+
+    # First registration wins, so whisper_stt's own loader is ignored
+    from backend.src.components import components
+    components.register('whisper', Whisper)
+
+
+def serve(args):
+    """Server process: install the stand-ins, set up the providers, run gunicorn"""
+    app_dir = os.path.join(PROJECT_ROOT, 'backend', 'app')
+    os.chdir(app_dir)
+    sys.path.insert(0, app_dir)
+    install_in_process_stand_ins(args)
+
+    # Registers the HuggingFace and Groq providers; preload_app loads everything
+    # in the master, before the workers fork
+    from backend.src.init_free_ai import initialize_free_ai_system
+    initialize_free_ai_system()
+
+    from gunicorn.app.wsgiapp import run
+    sys.argv = ['gunicorn', '--config', os.path.join(PROJECT_ROOT, 'gunicorn_config.py'),
+                '--workers', str(args.workers), '--bind', args.serve, '--log-level', 'warning',
+                'asgi:app' if args.mode == 'asgi' else 'app:app']
+    run()
+
+
+def start_server(args, port, groq_url, hf_url):
+    env = dict(os.environ, SERVER_MODE=args.mode, PYTHONPATH=PROJECT_ROOT, LOG_LEVEL='warning',
+               # grok_client, groq_client (keyed by GEMINI_API_KEY) and the Groq SDK provider.
+               # The SDK appends its own path to GROQ_BASE_URL; the stand-in answers any path
+               GROQ_API_KEY='stand-in', GEMINI_API_KEY='stand-in', GROQ_BASE_URL=groq_url,
+               HF_API_KEY='stand-in', HF_BASE_URL=hf_url)
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), *sys.argv[1:],
+                                '--serve', f'127.0.0.1:{port}'], env=env)
+    deadline = time.time() + 90
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/live', timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("Server did not start")
+
+
+# ============================================
+# LOAD GENERATOR
+# ============================================
+
+class Recorder:
+    """Latency samples and errors per route"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = Counter()
+        self.messages = Counter()
+        self.sessions = Counter()
+
+    def record(self, route, seconds, error=None):
+        self.latencies.setdefault(route, []).append(seconds)
+        if error:
+            self.errors[route] += 1
+            self.messages[f"{route}: {error}"] += 1
+
+
+async def run_session(http, base_url, index, args, rng, recorder):
+    import aiohttp
+
+    async def call(route, **kwargs):
+        started = time.perf_counter()
+        try:
+            async with http.post(f'{base_url}{route}', **kwargs) as response:
+                body = await response.read()
+        except Exception as e:
+            recorder.record(route, time.perf_counter() - started, type(e).__name__)
+            raise
+        recorder.record(route, time.perf_counter() - started,
+                        None if response.status == 200 else f"HTTP {response.status}")
+        if response.status != 200:
+            raise RuntimeError(route)
+        return body
+
+    try:
+        started = json.loads(await call('/start_call_interview',
+                                        json={'mode': 'Technical', 'job_role': 'Backend Engineer'}))
+        session_id = started['session_id']
+        for _ in range(args.turns):
+            await asyncio.sleep(args.think)
+            if rng.random() < args.audio_ratio:
+                form = aiohttp.FormData()
+                form.add_field('session_id', session_id)
+                form.add_field('audio', FAKE_RECORDING, filename='answer.wav', content_type='audio/wav')
+                await call('/process_voice', data=form)
+            else:
+                await call('/process_voice', json={'session_id': session_id, 'user_text': rng.choice(ANSWERS)})
+        await call('/final_results', json={'session_id': session_id})
+
+        from scripts.benchmark_pdf_templates import SAMPLE_MARKDOWN
+        # A distinct document per session, so downloads render instead of hitting the render cache
+        await call('/api/download_resume_pdf',
+                   json={'markdown_text': f"{SAMPLE_MARKDOWN}\n\nCandidate reference: {index}",
+                         'template_id': 'modern'})
+        recorder.sessions['completed'] += 1
+    except Exception:
+        recorder.sessions['failed'] += 1
+
+
+async def run_load(base_url, args):
+    import aiohttp
+    recorder = Recorder()
+    pending = iter(range(args.sessions))
+
+    async def worker(number):
+        rng = random.Random(f'{args.seed}:client:{number}')
+        for index in pending:
+            await run_session(http, base_url, index, args, rng, recorder)
+
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=300)) as http:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(number) for number in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        async with http.get(f'{base_url}/health') as response:
+            health = await response.json()
+    return recorder, elapsed, health
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of sorted samples"""
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def build_report(args, recorder, elapsed, health, stand_ins):
+    routes = {}
+    for route, samples in recorder.latencies.items():
+        ordered = sorted(samples)
+        routes[route] = {
+            'requests': len(ordered),
+            'errors': recorder.errors[route],
+            'error_rate': round(recorder.errors[route] / len(ordered), 4),
+            'throughput_rps': round(len(ordered) / elapsed, 2),
+            'mean_ms': round(sum(ordered) / len(ordered) * 1000, 1),
+            **{f'p{q}_ms': round(percentile(ordered, q) * 1000, 1) for q in (50, 95, 99)},
+            'max_ms': round(ordered[-1] * 1000, 1),
+        }
+    requests = sum(route['requests'] for route in routes.values())
+    server_spans = dict(health.get('components', {}).get('latency', {}))
+    server_spans.pop('status', None)
+
+    return {
+        'config': {key: getattr(value, 'spec', value) for key, value in vars(args).items()
+                   if key not in ('serve', 'output')},
+        'elapsed_seconds': round(elapsed, 2),
+        'sessions': {
+            'completed': recorder.sessions['completed'],
+            'failed': recorder.sessions['failed'],
+            'per_second': round(recorder.sessions['completed'] / elapsed, 3),
+        },
+        'requests': {
+            'total': requests,
+            'errors': sum(recorder.errors.values()),
+            'per_second': round(requests / elapsed, 2),
+        },
+        'routes': routes,
+        'stand_ins': {stand_in.name: stand_in.get_stats() for stand_in in stand_ins},
+        'server_spans': server_spans,
+        'top_errors': dict(recorder.messages.most_common(10)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline end-to-end interview load test with stand-in services')
+    parser.add_argument('--mode', default='wsgi', choices=['wsgi', 'asgi'], help='Server mode (default: wsgi)')
+    parser.add_argument('--workers', type=int, default=1, help='Gunicorn workers (default: 1)')
+    parser.add_argument('--sessions', type=int, default=50, help='Interview sessions to run (default: 50)')
+    parser.add_argument('--concurrency', type=int, default=10, help='Sessions in flight (default: 10)')
+    parser.add_argument('--turns', type=int, default=3, help='Answers per session (default: 3)')
+    parser.add_argument('--audio-ratio', type=float, default=0.3,
+                        help='Share of answers sent as recordings (Whisper) rather than text (default: 0.3)')
+    parser.add_argument('--think', type=float, default=0.0, help='Seconds between answers (default: 0)')
+    parser.add_argument('--groq-latency', type=LatencyModel, default=LatencyModel('lognormal:0.6:0.4'))
+    parser.add_argument('--groq-429-rate', type=float, default=0.02)
+    parser.add_argument('--hf-latency', type=LatencyModel, default=LatencyModel('lognormal:1.0:0.5'))
+    parser.add_argument('--hf-429-rate', type=float, default=0.05)
+    parser.add_argument('--tts-latency', type=LatencyModel, default=LatencyModel('uniform:0.2:0.6'))
+    parser.add_argument('--tts-429-rate', type=float, default=0.01)
+    parser.add_argument('--stt-latency', type=LatencyModel, default=LatencyModel('0.4'))
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for stand-ins and clients (default: 1)')
+    parser.add_argument('--output', help='Also write the JSON report to this file')
+    parser.add_argument('--serve', help=argparse.SUPPRESS)  # Internal: run as the server process
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    groq = StandIn('groq', args.groq_latency, args.groq_429_rate, args.seed)
+    huggingface = StandIn('huggingface', args.hf_latency, args.hf_429_rate, args.seed)
+    groq_server = start_chat_stand_in(groq)
+    hf_server = start_chat_stand_in(huggingface)
+
+    port = free_port()
+    server = start_server(args, port,
+                          f'http://127.0.0.1:{groq_server.server_address[1]}/openai/v1/chat/completions',
+                          f'http://127.0.0.1:{hf_server.server_address[1]}')
+    try:
+        recorder, elapsed, health = asyncio.run(run_load(f'http://127.0.0.1:{port}', args))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+        groq_server.shutdown()
+        hf_server.shutdown()
+
+    report = json.dumps(build_report(args, recorder, elapsed, health, [groq, huggingface]), indent=2)
+    print(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report + '\n')
+
+
+if __name__ == "__main__":
+    main()
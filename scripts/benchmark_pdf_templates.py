@@ -0,0 +1,95 @@
+"""
+Benchmark for pdf_generator.markdown_to_pdf across the allowed templates
+Reports renders per second for every template with a cold layout cache
+(stylesheet, colors and frames rebuilt per render, the previous behaviour)
+and with the shared per-template layout cache.
+
+Requires reportlab.
+
+Usage:
+    python scripts/benchmark_pdf_templates.py [--repeat 20]
+"""
+import sys
+import os
+import time
+import argparse
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from backend.src.pdf_generator import markdown_to_pdf, get_template_layout
+from backend.src.template_registry import registry
+
+TEMPLATE_IDS = registry.render_template_ids
+
+SAMPLE_MARKDOWN = """# Sarah Johnson
+**Senior Software Engineer** | sarah.johnson@email.com | (555) 123-4567 | linkedin.com/in/sarahjohnson
+
+## Professional Summary
+Results-driven Senior Software Engineer with 8+ years of experience in full-stack development and cloud architecture.
+
+## Technical Skills
+**Languages**: Python, JavaScript, TypeScript, Java, Go
+**Cloud & DevOps**: AWS, Docker, Kubernetes, CI/CD
+
+## Professional Experience
+
+### Senior Software Engineer
+*TechCorp Inc. | San Francisco, CA | 2020 - Present*
+
+- Led development of microservices architecture serving 2M+ daily active users
+- Reduced system latency by 45% through optimization and caching strategies
+- Mentored team of 5 junior engineers, improving code quality by 60%
+
+### Software Engineer
+*StartupXYZ | San Francisco, CA | 2018 - 2020*
+
+- Built RESTful APIs handling 100K+ requests per day
+- Implemented automated testing achieving 85% code coverage
+
+## Projects
+- **Analytics Dashboard**: Real-time dashboard using React and WebSockets
+
+## Education
+**Bachelor of Science in Computer Science**
+University of California, Berkeley | 2012 - 2016
+"""
+
+
+def renders_per_second(template_id, repeat, cold):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if cold:
+            get_template_layout.cache_clear()
+        markdown_to_pdf(SAMPLE_MARKDOWN, template_id)
+    return repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark PDF rendering per template')
+    parser.add_argument('--repeat', type=int, default=20, help='Renders per template and mode (default: 20)')
+    args = parser.parse_args()
+
+    # Warm imports and fonts so the first template is not penalised
+    markdown_to_pdf(SAMPLE_MARKDOWN, 'modern')
+
+    print(f"{'template':<16} {'cold/s':>9} {'cached/s':>9} {'speedup':>8}")
+    print("-" * 46)
+    total_cold = total_cached = 0.0
+    for template_id in TEMPLATE_IDS:
+        cold = renders_per_second(template_id, args.repeat, cold=True)
+        get_template_layout(template_id)
+        cached = renders_per_second(template_id, args.repeat, cold=False)
+        total_cold += args.repeat / cold
+        total_cached += args.repeat / cached
+        print(f"{template_id:<16} {cold:>9.1f} {cached:>9.1f} {cached / cold:>7.2f}x")
+
+    renders = args.repeat * len(TEMPLATE_IDS)
+    print("-" * 46)
+    print(f"{'all templates':<16} {renders / total_cold:>9.1f} {renders / total_cached:>9.1f} "
+          f"{total_cold / total_cached:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
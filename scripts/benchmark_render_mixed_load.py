@@ -0,0 +1,107 @@
+"""
+Mixed-load benchmark: interview turn latency while documents render
+Runs a steady stream of simulated interview turns (network wait plus a little
+CPU, like /process_voice) alongside concurrent PDF renders, and reports turn
+latency with no renders, with renders on the request thread (the previous
+behaviour) and with renders in the render_service process pool.
+
+Pass --gevent to run turns and renders as greenlets with monkey patching, as
+under the gunicorn gevent worker; otherwise OS threads are used. Requires
+reportlab (and gevent for --gevent).
+
+Usage:
+    python scripts/benchmark_render_mixed_load.py [--renders 4] [--seconds 10] [--gevent]
+"""
+import sys
+
+if '--gevent' in sys.argv:
+    from gevent import monkey
+    monkey.patch_all()
+
+import os
+import json
+import time
+import argparse
+import threading
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from backend.src.render_service import RenderService
+from scripts.benchmark_pdf_templates import SAMPLE_MARKDOWN, TEMPLATE_IDS
+
+# Simulated turn: STT/LLM/TTS round trips dominate, plus response assembly
+TURN_IO_SECONDS = 0.05
+TURN_INTERVAL_SECONDS = 0.1
+
+
+def simulated_turn():
+    time.sleep(TURN_IO_SECONDS)
+    json.dumps({"history": [{"q": "Tell me about a project", "a": "x" * 200}] * 20})
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_scenario(service, renders, seconds):
+    """Run turns (and renders if a service is given) for `seconds`; return turn latencies and render count."""
+    stop = threading.Event()
+    latencies = []
+    rendered = [0]
+
+    def turn_loop():
+        while not stop.is_set():
+            start = time.perf_counter()
+            simulated_turn()
+            latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(TURN_INTERVAL_SECONDS)
+
+    def render_loop(index):
+        i = index
+        while not stop.is_set():
+            service.render('pdf', SAMPLE_MARKDOWN, TEMPLATE_IDS[i % len(TEMPLATE_IDS)])
+            rendered[0] += 1
+            i += 1
+
+    workers = [threading.Thread(target=turn_loop)]
+    if service is not None:
+        workers += [threading.Thread(target=render_loop, args=(i,)) for i in range(renders)]
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return latencies, rendered[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Turn latency under concurrent document rendering')
+    parser.add_argument('--renders', type=int, default=4, help='Concurrent render loops (default: 4)')
+    parser.add_argument('--seconds', type=float, default=10, help='Duration per scenario (default: 10)')
+    parser.add_argument('--workers', type=int, default=2, help='Render pool processes (default: 2)')
+    parser.add_argument('--gevent', action='store_true', help='Monkey-patch with gevent (as in production)')
+    args = parser.parse_args()
+
+    scenarios = [
+        ('idle', None),
+        ('inline renders', RenderService(workers=0, max_pending=args.renders)),
+        ('pooled renders', RenderService(workers=args.workers, max_pending=args.renders)),
+    ]
+    # Start the pool before timing so process spawn is not counted
+    scenarios[2][1].render('pdf', SAMPLE_MARKDOWN, 'modern')
+
+    print(f"mode={'gevent' if args.gevent else 'threads'}  turn io={TURN_IO_SECONDS * 1000:.0f}ms")
+    print(f"{'scenario':<16} {'turns':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'renders/s':>10}")
+    print("-" * 62)
+    for name, service in scenarios:
+        latencies, rendered = run_scenario(service, args.renders, args.seconds)
+        print(f"{name:<16} {len(latencies):>6} {percentile(latencies, 50):>8.1f} {percentile(latencies, 95):>8.1f} "
+              f"{max(latencies):>8.1f} {rendered / args.seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
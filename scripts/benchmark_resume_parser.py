@@ -0,0 +1,98 @@
+"""
+Benchmark for resume_parser.extract_candidate_info
+Times the single-pass parser against the sample PDFs in the project root and a
+synthetic 50-page resume, alongside the legacy per-section regex scans.
+
+Usage:
+    python scripts/benchmark_resume_parser.py [--repeat 20]
+"""
+import sys
+import os
+import re
+import glob
+import time
+import argparse
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from backend.src.resume_parser import extract_candidate_info
+
+# The section regexes used before the segmenter, kept here for comparison only
+LEGACY_SECTION_PATTERNS = [
+    (r'(?:Skills|Technical Skills|Technologies|Expertise)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|$)',
+     re.IGNORECASE | re.MULTILINE),
+    (r'(?:Projects|Personal Projects|Academic Projects)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Experience|Education|$)',
+     re.IGNORECASE | re.MULTILINE | re.DOTALL),
+    (r'(?:Experience|Work Experience|Professional Experience|Employment)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Projects|Education|Skills|$)',
+     re.IGNORECASE | re.MULTILINE | re.DOTALL),
+    (r'(?:Education|Academic Background|Qualifications)\s*:?\s*\n((?:.+\n?)+?)(?:\n\n|Experience|Projects|Skills|$)',
+     re.IGNORECASE | re.MULTILINE | re.DOTALL),
+]
+
+
+def legacy_section_scan(text):
+    for pattern, flags in LEGACY_SECTION_PATTERNS:
+        re.search(pattern, text, flags)
+
+
+def load_pdf_fixtures():
+    """Extract text from test_resume_*.pdf (requires pypdf)."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        print("pypdf not installed - skipping PDF fixtures")
+        return {}
+
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, 'test_resume_*.pdf'))):
+        reader = PdfReader(path)
+        fixtures[os.path.basename(path)] = "\n".join(page.extract_text() or "" for page in reader.pages)
+    return fixtures
+
+
+def synthetic_resume(pages=50):
+    """Build a long resume with roughly one page of content per iteration."""
+    parts = ["Jane Candidate", "jane.candidate@example.com | +1 555 123 4567", ""]
+    parts.append("Technical Skills")
+    parts.append("Python, Java, C++, React, Django, PostgreSQL, Redis, AWS, Docker, Kubernetes, Machine Learning")
+    for page in range(pages):
+        parts.append("Work Experience")
+        for job in range(4):
+            parts.append(f"Company{page}x{job} Inc - Senior Engineer")
+            for bullet in range(6):
+                parts.append(f"- Improved throughput of service {page}-{job}-{bullet} by 35% using Python and Redis caching")
+        parts.append("Projects")
+        for project in range(3):
+            parts.append(f"- Project {page}.{project}: distributed pipeline built with Kafka, Spark and Terraform on AWS")
+        parts.append("Education")
+        parts.append(f"B.Tech in Computer Science, University {page}")
+    return "\n".join(parts)
+
+
+def time_call(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark resume_parser')
+    parser.add_argument('--repeat', type=int, default=20, help='Iterations per document (default: 20)')
+    args = parser.parse_args()
+
+    documents = load_pdf_fixtures()
+    documents['synthetic_50_pages'] = synthetic_resume(50)
+
+    print(f"{'document':<32} {'chars':>8} {'parser ms':>10} {'legacy scan ms':>15}")
+    print("-" * 68)
+    for name, text in documents.items():
+        parser_ms = time_call(extract_candidate_info, text, args.repeat)
+        legacy_ms = time_call(legacy_section_scan, text, max(1, args.repeat // 4))
+        print(f"{name:<32} {len(text):>8} {parser_ms:>10.2f} {legacy_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
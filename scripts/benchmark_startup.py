@@ -0,0 +1,70 @@
+"""
+Worker startup benchmark
+Measures, in a fresh interpreter per run, how long importing the Flask app takes
+and how long the first requests take afterwards, with lazy component loading
+(default) and with PRELOAD_MODELS=1 (everything loaded at import, as the
+gunicorn master does with preload_app). Per-component load times come from the
+component registry.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 3]
+"""
+import sys
+import os
+import json
+import argparse
+import subprocess
+import statistics
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Runs in the child interpreter; prints one JSON line
+CHILD = r'''
+import sys, json, time
+sys.path.insert(0, PROJECT_ROOT)
+started = time.perf_counter()
+from backend.app.app import app
+from backend.src.components import components
+import_seconds = time.perf_counter() - started
+
+from scripts.benchmark_pdf_templates import SAMPLE_MARKDOWN
+client = app.test_client()
+timings = {}
+for label, call in (
+    ('live', lambda: client.get('/live')),
+    ('first_pdf', lambda: client.post('/api/download_resume_pdf',
+                                      json={'markdown_text': SAMPLE_MARKDOWN, 'template_id': 'modern'})),
+    ('first_parse', lambda: components.get('spacy')),
+):
+    t0 = time.perf_counter()
+    call()
+    timings[label] = time.perf_counter() - t0
+print(json.dumps({'import': import_seconds, **timings, 'components': components.get_status()}))
+'''
+
+
+def run_once(preload):
+    env = dict(os.environ, PRELOAD_MODELS='1' if preload else '0')
+    output = subprocess.run([sys.executable, '-c', f"PROJECT_ROOT = {PROJECT_ROOT!r}\n" + CHILD],
+                            env=env, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='App import and first-request latency')
+    parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters per mode (default: 3)')
+    args = parser.parse_args()
+
+    for preload in (False, True):
+        results = [run_once(preload) for _ in range(args.runs)]
+        print(f"\n{'PRELOAD_MODELS=1' if preload else 'lazy (default)'}: median of {args.runs} runs")
+        for label in ('import', 'live', 'first_pdf', 'first_parse'):
+            print(f"  {label:12s} {statistics.median(r[label] for r in results) * 1000:9.1f} ms")
+        for name, status in results[-1]['components'].items():
+            print(f"  component {name:14s} {status['state']:12s} {status['load_seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Evaluation of the local ATS scorer against the LLM analyzer
+Scores each resume with ats_scorer.score_resume and with the analyzer's
+overall_score, then reports Pearson/Spearman correlation and how often the two
+rank a pair of resumes the same way (what recreation relies on).
+
+LLM scores come from a JSONL dataset ({"text" | "path", "llm_score"}) or, with
+--live, from analyze_resume_content on the test_resume_*.pdf fixtures
+(requires GROQ_API_KEY and pypdf). --save writes the live scores as a dataset.
+
+Usage:
+    python scripts/evaluate_ats_scorer.py --dataset scores.jsonl
+    python scripts/evaluate_ats_scorer.py --live --save scores.jsonl
+"""
+import sys
+import os
+import json
+import glob
+import time
+import argparse
+from itertools import combinations
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from backend.src.ats_scorer import score_resume
+
+
+def read_text(path):
+    if path.lower().endswith('.pdf'):
+        from pypdf import PdfReader
+        return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def load_dataset(path):
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            text = row.get('text') or read_text(os.path.join(PROJECT_ROOT, row['path']))
+            rows.append({'name': row.get('name') or row.get('path') or f"row{len(rows)}",
+                         'text': text, 'llm_score': float(row['llm_score'])})
+    return rows
+
+
+def load_live():
+    from backend.src.resume_analyzer import analyze_resume_content
+
+    rows = []
+    for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, 'test_resume_*.pdf'))):
+        text = read_text(path)
+        analysis = analyze_resume_content(text)
+        if 'error' in analysis or 'overall_score' not in analysis:
+            print(f"skipping {os.path.basename(path)}: {analysis.get('error', 'no score')}")
+            continue
+        rows.append({'name': os.path.basename(path), 'text': text, 'llm_score': float(analysis['overall_score'])})
+    return rows
+
+
+def pearson(xs, ys):
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    return cov / (var_x * var_y) ** 0.5 if var_x and var_y else float('nan')
+
+
+def ranks(values):
+    # Average ranks for ties
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    result = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            result[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return result
+
+
+def pairwise_agreement(xs, ys):
+    """Fraction of pairs (with distinct LLM scores) ordered the same way by both scorers."""
+    agree = total = 0
+    for i, j in combinations(range(len(xs)), 2):
+        if ys[i] == ys[j]:
+            continue
+        total += 1
+        agree += (xs[i] - xs[j]) * (ys[i] - ys[j]) > 0
+    return agree / total if total else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluate the local ATS scorer against LLM scores')
+    parser.add_argument('--dataset', help='JSONL file with text/path and llm_score')
+    parser.add_argument('--live', action='store_true', help='Score the PDF fixtures with the LLM analyzer')
+    parser.add_argument('--save', help='Write live scores to this JSONL file')
+    args = parser.parse_args()
+
+    if args.dataset:
+        rows = load_dataset(args.dataset)
+    elif args.live:
+        rows = load_live()
+        if args.save:
+            with open(args.save, 'w', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps({'name': row['name'], 'text': row['text'], 'llm_score': row['llm_score']}) + '\n')
+    else:
+        parser.error('pass --dataset or --live')
+
+    if len(rows) < 3:
+        print(f"Need at least 3 scored resumes, got {len(rows)}")
+        return
+
+    print(f"{'resume':<36} {'llm':>6} {'local':>6} {'ms':>7}")
+    print("-" * 58)
+    local_scores, llm_scores = [], []
+    for row in rows:
+        start = time.perf_counter()
+        local = score_resume(row['text'])['overall_score']
+        elapsed = (time.perf_counter() - start) * 1000
+        local_scores.append(local)
+        llm_scores.append(row['llm_score'])
+        print(f"{row['name'][:36]:<36} {row['llm_score']:>6.0f} {local:>6} {elapsed:>7.2f}")
+
+    mean_abs_error = sum(abs(a - b) for a, b in zip(local_scores, llm_scores)) / len(rows)
+    print("-" * 58)
+    print(f"Pearson r:            {pearson(local_scores, llm_scores):.3f}")
+    print(f"Spearman rho:         {pearson(ranks(local_scores), ranks(llm_scores)):.3f}")
+    print(f"Pairwise agreement:   {pairwise_agreement(local_scores, llm_scores):.1%}")
+    print(f"Mean absolute error:  {mean_abs_error:.1f} points")
+
+
+if __name__ == "__main__":
+    main()
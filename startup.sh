@@ -22,6 +22,11 @@ if [ -f "backend/requirements_free_ai.txt" ]; then
     pip install --no-cache-dir -r backend/requirements_free_ai.txt
 fi
 
+if [ "$SERVER_MODE" = "asgi" ] && [ -f "backend/requirements_asgi.txt" ]; then
+    echo "Installing ASGI server dependencies..."
+    pip install --no-cache-dir -r backend/requirements_asgi.txt
+fi
+
 # Initialize free AI system
 echo "Initializing Free AI System..."
 python -c "from backend.src.init_free_ai import initialize_free_ai_system; initialize_free_ai_system()" || echo "Free AI initialization skipped"
@@ -33,6 +38,12 @@ cd backend/app
 # Use environment variable for workers, default to 4
 WORKERS=${GUNICORN_WORKERS:-4}
 
+# SERVER_MODE=asgi serves the interview API on asyncio (asgi:app)
+APP_MODULE="app:app"
+if [ "$SERVER_MODE" = "asgi" ]; then
+    APP_MODULE="asgi:app"
+fi
+
 exec gunicorn \
     --config ../../gunicorn_config.py \
     --workers $WORKERS \
@@ -41,4 +52,4 @@ exec gunicorn \
     --access-logfile - \
     --error-logfile - \
     --log-level info \
-    app:app
+    $APP_MODULE